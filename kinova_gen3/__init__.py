@@ -0,0 +1,114 @@
+"""Kinematics and dynamics of the Kinova Gen3 robot
+
+The functions and classes of the kinematics, dynamics, performance_criteria,
+control, planning and collision modules are available from the package
+itself, e.g. ``kinova_gen3.mass_matrix``, together with the ``KinovaGen3``
+class caching them for the current state.
+Submodules are imported on first access of one of their names, so importing
+the package is cheap and the large generated dynamics modules are only loaded
+by the processes that use them.
+
+"""
+
+import importlib
+
+# Public name -> module defining it, relative to this package
+_EXPORTS = {
+    "forward_kinematics": ".kinematics.forward_kinematics",
+    "forward_kinematics_batch": ".kinematics.forward_kinematics",
+    "jacobian": ".kinematics.jacobian",
+    "jacobian_batch": ".kinematics.jacobian",
+    "jacobian_time_derivative": ".kinematics.jacobian",
+    "jacobian_time_derivative_batch": ".kinematics.jacobian",
+    "jacobian_hessian": ".kinematics.jacobian",
+    "jacobian_hessian_batch": ".kinematics.jacobian",
+    "link_frames": ".kinematics.link_frames",
+    "link_frames_batch": ".kinematics.link_frames",
+    "inverse_kinematics": ".kinematics.inverse_kinematics",
+    "inverse_kinematics_dls": ".kinematics.inverse_kinematics",
+    "multicriteria_ik": ".kinematics.inverse_kinematics",
+    "multicriteria_ik_damped": ".kinematics.inverse_kinematics",
+    "mass_matrix": ".dynamics.mass_matrix",
+    "mass_matrix_batch": ".dynamics.mass_matrix",
+    "mass_matrix_derivative": ".dynamics.mass_matrix",
+    "mass_matrix_derivative_batch": ".dynamics.mass_matrix",
+    "mass_matrix_packed": ".dynamics.mass_matrix_packed",
+    "mass_matrix_packed_batch": ".dynamics.mass_matrix_packed",
+    "unpack_mass_matrix": ".dynamics.mass_matrix_packed",
+    "packed_cholesky": ".dynamics.mass_matrix_packed",
+    "packed_quadratic_form": ".dynamics.mass_matrix_packed",
+    "coriolis": ".dynamics.coriolis",
+    "coriolis_batch": ".dynamics.coriolis",
+    "gravity": ".dynamics.gravity",
+    "gravity_batch": ".dynamics.gravity",
+    "gravity_derivative": ".dynamics.gravity",
+    "gravity_derivative_batch": ".dynamics.gravity",
+    "GravityTable": ".dynamics.gravity_table",
+    "dynamics_terms": ".dynamics.terms",
+    "dynamics_terms_batch": ".dynamics.terms",
+    "forward_dynamics_derivatives": ".dynamics.derivatives",
+    "forward_dynamics_derivatives_batch": ".dynamics.derivatives",
+    "operational_space": ".dynamics.operational_space",
+    "operational_space_batch": ".dynamics.operational_space",
+    "MomentumObserver": ".dynamics.momentum_observer",
+    "momentum_residuals": ".dynamics.momentum_observer",
+    "external_wrench_batch": ".dynamics.wrench_estimation",
+    "wrench_from_torques_batch": ".dynamics.wrench_estimation",
+    "forward_dynamics_batch": ".dynamics.simulation",
+    "Simulator": ".dynamics.simulation",
+    "joint_limits": ".performance_criteria.joint_limits",
+    "joint_limits_batch": ".performance_criteria.joint_limits",
+    "joint_limits_gradient": ".performance_criteria.joint_limits",
+    "manipulability": ".performance_criteria.manipulability",
+    "manipulability_batch": ".performance_criteria.manipulability",
+    "manipulability_gradient": ".performance_criteria.manipulability",
+    "iterative_lqr": ".planning.ilqr",
+    "time_optimal_parameterization": ".planning.topp",
+    "rrt_connect": ".planning.rrt",
+    "slerp": ".planning.streaming",
+    "interpolate_poses": ".planning.streaming",
+    "stream_joint_commands": ".planning.streaming",
+    "WorkspaceMap": ".planning.workspace",
+    "memoized": ".memoization",
+    "parallel_evaluate": ".parallel",
+    "segment_closest_points": ".collision.geometry",
+    "capsule_segments": ".collision.self_collision",
+    "capsule_segments_batch": ".collision.self_collision",
+    "self_collision_distance": ".collision.self_collision",
+    "self_collision_distance_batch": ".collision.self_collision",
+    "Environment": ".collision.environment",
+    "KinovaGen3": ".robot",
+    "ComputedTorqueController": ".control.computed_torque",
+}
+
+_SUBMODULES = (
+    "kinematics",
+    "dynamics",
+    "control",
+    "planning",
+    "collision",
+    "performance_criteria",
+    "benchmark",
+    "instrumentation",
+    "memoization",
+    "parallel",
+    "robot",
+)
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
@@ -0,0 +1,222 @@
+"""Batched evaluation of the generated kinematic and dynamic expressions
+
+The closed-form expressions of this package are written for a single joint
+configuration. They only use elementwise arithmetic, sine and cosine and a
+final ``numpy.array`` assembly of nested lists. The same code objects can
+therefore evaluate a whole batch of configurations when they are executed with
+numpy ufuncs in place of ``math`` and an assembly routine that stacks the
+entries along a leading batch axis.
+
+Functions
+---------
+batched(function)
+
+"""
+
+import inspect
+import types
+import numpy
+
+
+class _BatchArray(numpy.ndarray):
+    """Assembled batch whose ``flatten`` keeps the leading batch axis"""
+
+    def flatten(self, order="C"):
+        return numpy.asarray(self).reshape(self.shape[0], -1, order=order)
+
+
+def _shape(nested):
+    """Shape of a nested list of entries"""
+
+    shape = []
+
+    while isinstance(nested, (list, tuple)):
+        shape.append(len(nested))
+        nested = nested[0]
+
+    return tuple(shape)
+
+
+def _leaves(nested):
+    """Entries of a nested list in row-major order"""
+
+    if isinstance(nested, (list, tuple)):
+        for element in nested:
+            yield from _leaves(element)
+    else:
+        yield nested
+
+
+def _assemble(nested, out=None):
+    """Stack the entries of a nested list behind a leading batch axis
+
+    With ``out`` the entries are written into that array, which must hold
+    them without a copy, i.e. be C-contiguous.
+
+    """
+
+    entries = list(_leaves(nested))
+    batch_shape = numpy.broadcast_shapes(*(numpy.shape(entry) for entry in entries))
+
+    if out is None:
+        dtype = numpy.result_type(*entries)
+        result = numpy.empty(batch_shape + (len(entries),), dtype=dtype)
+    else:
+        # Raises instead of writing into a copy if out is not contiguous
+        result = out.view()
+        result.shape = batch_shape + (len(entries),)
+    for i, entry in enumerate(entries):
+        result[..., i] = entry
+
+    return result.reshape(batch_shape + _shape(nested)).view(_BatchArray)
+
+
+_math = types.SimpleNamespace(
+    sin=numpy.sin, cos=numpy.cos, sqrt=numpy.sqrt, copysign=numpy.copysign
+)
+_numpy = types.SimpleNamespace(array=_assemble, sin=numpy.sin, cos=numpy.cos)
+
+
+def _assembler(destinations):
+    """Assembly routine writing the results into the given arrays in turn"""
+
+    destinations = iter(destinations)
+
+    def assemble(nested):
+        return _assemble(nested, next(destinations))
+
+    return assemble
+
+
+def _recorder(shapes):
+    """Assembly routine recording the shapes of the assembled results"""
+
+    def record(nested):
+        shapes.append(_shape(nested))
+        return _assemble(nested)
+
+    return record
+
+
+def _check_destinations(destinations, batch_shape, shapes):
+    """Check the arrays given for the results before anything is written
+
+    Each array must have the batch shape as leading axes and as many entries
+    per configuration as the corresponding result, which it receives in
+    row-major order, e.g. a column vector may be written into a flat array.
+
+    Arguments
+    ---------
+    destinations (tuple): The arrays given for the results
+    batch_shape (tuple): The shape of the batch of configurations
+    shapes (list): The shapes of the results for one configuration, in
+                   assembly order
+
+    """
+
+    if len(destinations) != len(shapes):
+        raise ValueError(
+            "Expected {} output arrays, got {}".format(len(shapes), len(destinations))
+        )
+    for destination, shape in zip(destinations, shapes):
+        if not isinstance(destination, numpy.ndarray):
+            raise ValueError("The output arrays must be numpy arrays")
+        leading = destination.shape[: len(batch_shape)]
+        trailing = destination.shape[len(batch_shape) :]
+        if leading != batch_shape or numpy.prod(trailing) != numpy.prod(shape):
+            raise ValueError(
+                "Expected an output array of shape {}, got {}".format(
+                    batch_shape + shape, destination.shape
+                )
+            )
+        if not destination.flags.c_contiguous:
+            raise ValueError("The output arrays must be C-contiguous")
+
+
+def _unwrap(result):
+    """Convert assembled batches back to plain arrays"""
+
+    if isinstance(result, tuple):
+        return tuple(numpy.asarray(element) for element in result)
+
+    return numpy.asarray(result)
+
+
+def batched(function):
+    """Batched version of a generated single-configuration function
+
+    The code of ``function`` is rebound to globals in which ``math`` and
+    ``numpy`` resolve to vectorised equivalents, so every temporary of the
+    generated expression becomes an array over the batch. Decorators applied
+    with ``functools.wraps`` are unwrapped first.
+
+    Arguments
+    ---------
+    function (callable): Generated function taking joint vectors of length 7
+
+    Returns
+    -------
+    callable: Function taking arrays of shape (N, 7) and returning the stacked
+              results with a leading axis of length N. The keyword ``dtype``
+              converts the arrays first, the expressions then run in that
+              floating-point type since their constants are Python scalars.
+              The keyword ``out`` takes preallocated C-contiguous arrays
+              with as many entries as the results, one or a tuple in the
+              order they are assembled, which are filled and returned. They
+              are checked before anything is written, and a ``ValueError`` is
+              raised if they do not match the results. Other keywords are
+              passed on to the function.
+
+    """
+
+    # Rebind the generated code itself, not an instrumentation wrapper
+    function = inspect.unwrap(function)
+    namespace = dict(function.__globals__, math=_math, numpy=_numpy)
+    vectorised = types.FunctionType(
+        function.__code__, namespace, function.__name__, function.__defaults__
+    )
+
+    def rebound(assemble):
+        """The vectorised code with the given assembly routine"""
+
+        assembling = types.SimpleNamespace(**vars(_numpy))
+        assembling.array = assemble
+
+        return types.FunctionType(
+            function.__code__,
+            dict(namespace, numpy=assembling),
+            function.__name__,
+            function.__defaults__,
+        )
+
+    # Shapes of the assembled results for one configuration, per options
+    result_shapes = {}
+
+    def shapes(columns, options):
+        key = tuple(sorted(options.items()))
+        if key not in result_shapes:
+            recorded = []
+            rebound(_recorder(recorded))(
+                *(numpy.zeros(column.shape[:1] + (1,)) for column in columns), **options
+            )
+            result_shapes[key] = recorded
+
+        return result_shapes[key]
+
+    def evaluate(*arrays, dtype=None, out=None, **options):
+        columns = [numpy.asarray(array, dtype=dtype).T for array in arrays]
+        if out is None:
+            return _unwrap(vectorised(*columns, **options))
+
+        destinations = out if isinstance(out, tuple) else (out,)
+        _check_destinations(
+            destinations, columns[0].shape[1:], shapes(columns, options)
+        )
+        rebound(_assembler(destinations))(*columns, **options)
+
+        return out
+
+    evaluate.__name__ = function.__name__ + "_batch"
+    evaluate.__doc__ = function.__doc__
+
+    return evaluate
@@ -0,0 +1,430 @@
+"""Forward-mode differentiation of the generated kinematic and dynamic expressions
+
+The generated expressions are straight-line code: assignments of temporaries
+built from addition, subtraction, multiplication, integer powers, sine and
+cosine, followed by a ``numpy.array`` assembly of nested lists. Their source
+is transformed once, on first use, into a function that computes after every
+temporary its partial derivatives with respect to the joint variables,
+
+    x7 = x3 * x5
+    d2_x7 = d2_x3 * x5 + x3 * d2_x5
+    ...
+
+so the derivatives share all temporaries with the evaluation itself and
+involve no finite-difference step. The dependencies of every temporary are
+tracked during the transformation, and derivatives that vanish identically
+are never computed, e.g. those of the dynamics with respect to the first
+joint angle. Where the derivative of a sine or cosine needs the cosine or
+sine of the same argument and the expressions already compute it, that
+temporary is reused.
+
+Like the expressions themselves, the transformed code runs on Python floats
+for a single configuration and on arrays for a batch, with the vectorised
+namespaces of ``_batch``.
+
+Functions
+---------
+differentiated(function)
+
+"""
+
+import ast
+import inspect
+import textwrap
+import numpy
+from kinova_gen3._batch import _math, _numpy
+
+
+def _constant(value):
+    return ast.Constant(value=value)
+
+
+def _name(identifier):
+    return ast.Name(id=identifier, ctx=ast.Load())
+
+
+def _is_constant(node, value):
+    return isinstance(node, ast.Constant) and node.value == value
+
+
+def _add(a, b):
+    if isinstance(b, ast.UnaryOp) and isinstance(b.op, ast.USub):
+        return ast.BinOp(left=a, op=ast.Sub(), right=b.operand)
+
+    return ast.BinOp(left=a, op=ast.Add(), right=b)
+
+
+def _negate(a):
+    if isinstance(a, ast.Constant):
+        return _constant(-a.value)
+    if isinstance(a, ast.UnaryOp) and isinstance(a.op, ast.USub):
+        return a.operand
+
+    return ast.UnaryOp(op=ast.USub(), operand=a)
+
+
+def _multiply(a, b):
+    """Product of expressions, folding unit factors"""
+
+    if _is_constant(a, 1.0):
+        return b
+    if _is_constant(b, 1.0):
+        return a
+    if _is_constant(a, -1.0):
+        return _negate(b)
+    if _is_constant(b, -1.0):
+        return _negate(a)
+
+    return ast.BinOp(left=a, op=ast.Mult(), right=b)
+
+
+def _sum(terms):
+    result = terms[0]
+    for term in terms[1:]:
+        result = _add(result, term)
+
+    return result
+
+
+class _Transformer:
+    """Source transformation of one generated function
+
+    Every expression is differentiated with respect to its operands first.
+    These local partial derivatives do not depend on the direction, so they
+    are computed once, and the derivative in every direction is the sum of
+    the partials times the derivatives of the operands in that direction.
+    The derivatives of a temporary are kept as a dict from direction to an
+    expression, where absent directions vanish.
+
+    """
+
+    def __init__(self, arguments):
+        self.arguments = {argument: k for k, argument in enumerate(arguments)}
+        self.n_directions = 7 * len(arguments)
+        self.derivatives = {}
+        # Temporaries by the dump of the expression they hold
+        self.temporaries = {}
+        self.body = []
+
+    def _temporary(self, value):
+        """Name of a temporary holding an expression, added if necessary"""
+
+        if isinstance(value, (ast.Name, ast.Constant)):
+            return value
+
+        key = ast.dump(value)
+        if key not in self.temporaries:
+            identifier = "_a{}".format(len(self.temporaries))
+            self.body.append(
+                ast.Assign(
+                    targets=[ast.Name(id=identifier, ctx=ast.Store())], value=value
+                )
+            )
+            self.temporaries[key] = identifier
+
+        return _name(self.temporaries[key])
+
+    def _operand(self, node):
+        """Derivatives of a name or joint variable, empty for constants"""
+
+        if isinstance(node, ast.Name):
+            return self.derivatives.get(node.id, {})
+        if isinstance(node, ast.Subscript):
+            # A joint variable, e.g. q[3]
+            k = self.arguments[node.value.id]
+            index = node.slice
+            if not isinstance(index, ast.Constant):
+                # Python 3.8 wraps the index in an ast.Index node
+                index = index.value
+            return {7 * k + index.value: _constant(1.0)}
+
+        return {}
+
+    def partials(self, node):
+        """Partial derivatives of an expression by the dump of its operands"""
+
+        if isinstance(node, ast.Constant):
+            return {}
+
+        if isinstance(node, (ast.Name, ast.Subscript)):
+            return {ast.dump(node): _constant(1.0)} if self._operand(node) else {}
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self.partials(node.operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            return {key: _negate(d) for key, d in operand.items()}
+
+        if isinstance(node, ast.BinOp):
+            left = self.partials(node.left)
+            right = self.partials(node.right)
+
+            if isinstance(node.op, (ast.Add, ast.Sub)):
+                result = dict(left)
+                for key, d in right.items():
+                    if isinstance(node.op, ast.Sub):
+                        d = _negate(d)
+                    result[key] = _add(result[key], d) if key in result else d
+                return result
+
+            if isinstance(node.op, ast.Mult):
+                result = {key: _multiply(d, node.right) for key, d in left.items()}
+                for key, d in right.items():
+                    d = _multiply(node.left, d)
+                    result[key] = _add(result[key], d) if key in result else d
+                return result
+
+            if isinstance(node.op, ast.Pow) and isinstance(node.right, ast.Constant):
+                exponent = node.right.value
+                if exponent == 2:
+                    factor = _multiply(_constant(2.0), node.left)
+                else:
+                    factor = _multiply(
+                        _constant(float(exponent)),
+                        ast.BinOp(
+                            left=node.left, op=ast.Pow(), right=_constant(exponent - 1)
+                        ),
+                    )
+                return {key: _multiply(factor, d) for key, d in left.items()}
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            if node.func.attr in ("sin", "cos") and len(node.args) == 1:
+                argument = self.partials(node.args[0])
+                if not argument:
+                    return {}
+                # The cosine or sine of the same argument, shared with the
+                # expressions where they compute it too
+                other = "cos" if node.func.attr == "sin" else "sin"
+                factor = self._temporary(
+                    ast.Call(
+                        func=ast.Attribute(
+                            value=node.func.value, attr=other, ctx=ast.Load()
+                        ),
+                        args=node.args,
+                        keywords=[],
+                    )
+                )
+                if node.func.attr == "cos":
+                    factor = _negate(factor)
+                return {key: _multiply(factor, d) for key, d in argument.items()}
+
+        raise NotImplementedError("Cannot differentiate {}".format(ast.dump(node)))
+
+    def derivative(self, node):
+        """Derivatives of an expression in every direction it depends on"""
+
+        operands = {}
+        for child in ast.walk(node):
+            if isinstance(child, (ast.Name, ast.Subscript)):
+                operands[ast.dump(child)] = self._operand(child)
+
+        partials = self.partials(node)
+        terms = {}
+        for key, partial in partials.items():
+            # Partials needed in several directions are computed once
+            if len(operands[key]) > 1:
+                partial = self._temporary(partial)
+            for i, d in operands[key].items():
+                terms.setdefault(i, []).append(_multiply(partial, d))
+
+        return {i: _sum(terms[i]) for i in sorted(terms)}
+
+    def assign(self, identifier, value):
+        """Append an assignment and the assignments of its derivatives"""
+
+        self.body.append(
+            ast.Assign(targets=[ast.Name(id=identifier, ctx=ast.Store())], value=value)
+        )
+        self.temporaries.setdefault(ast.dump(value), identifier)
+
+        derivatives = {}
+        for i, d in self.derivative(value).items():
+            # Plain copies need no temporary of their own
+            if isinstance(d, (ast.Name, ast.Constant)):
+                derivatives[i] = d
+                continue
+            name = "d{}_{}".format(i, identifier)
+            self.body.append(
+                ast.Assign(targets=[ast.Name(id=name, ctx=ast.Store())], value=d)
+            )
+            derivatives[i] = _name(name)
+        self.derivatives[identifier] = derivatives
+
+    def assembly(self, node):
+        """Assembly of the derivatives of a ``numpy.array`` of nested lists
+
+        The derivative array has the directions on a leading axis, so that it
+        follows the batch axis in the batched evaluation. A trailing
+        ``.flatten()`` of the value flattens the nested list of every
+        direction instead.
+
+        """
+
+        flatten = (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "flatten"
+        )
+        call = node.func.value if flatten else node
+        nested = call.args[0]
+
+        def entries(element):
+            if isinstance(element, ast.List):
+                for item in element.elts:
+                    yield from entries(item)
+            else:
+                yield element
+
+        def direction(element, derivatives):
+            if isinstance(element, ast.List):
+                return ast.List(
+                    elts=[direction(item, derivatives) for item in element.elts],
+                    ctx=ast.Load(),
+                )
+            return derivatives[id(element)].get(i, _constant(0.0))
+
+        derivatives = {id(entry): self.derivative(entry) for entry in entries(nested)}
+        lists = []
+        for i in range(self.n_directions):
+            if flatten:
+                lists.append(
+                    ast.List(
+                        elts=[
+                            derivatives[id(entry)].get(i, _constant(0.0))
+                            for entry in entries(nested)
+                        ],
+                        ctx=ast.Load(),
+                    )
+                )
+            else:
+                lists.append(direction(nested, derivatives))
+
+        return ast.Call(
+            func=call.func, args=[ast.List(elts=lists, ctx=ast.Load())], keywords=[]
+        )
+
+
+def _is_assembly(node):
+    """Whether an expression is a ``numpy.array`` call, possibly flattened"""
+
+    if not isinstance(node, ast.Call):
+        return False
+    if isinstance(node.func, ast.Attribute) and node.func.attr == "flatten":
+        node = node.func.value
+
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "array"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "numpy"
+    )
+
+
+def _transform(function):
+    """Code of a function returning (value, derivative) pairs"""
+
+    source = textwrap.dedent(inspect.getsource(function))
+    definition = ast.parse(source).body[0]
+    arguments = [argument.arg for argument in definition.args.args]
+    transformer = _Transformer(arguments)
+    assembled = {}
+
+    for statement in definition.body:
+        if isinstance(statement, ast.Expr):
+            # Docstring
+            continue
+        if isinstance(statement, ast.Assign):
+            identifier = statement.targets[0].id
+            value = statement.value
+            if _is_assembly(value):
+                transformer.body.append(statement)
+                derivative = "d_" + identifier
+                transformer.body.append(
+                    ast.Assign(
+                        targets=[ast.Name(id=derivative, ctx=ast.Store())],
+                        value=transformer.assembly(value),
+                    )
+                )
+                assembled[identifier] = derivative
+            else:
+                transformer.assign(identifier, value)
+        elif isinstance(statement, ast.Return):
+            values = statement.value
+            if isinstance(values, ast.Tuple):
+                pairs = [
+                    ast.Tuple(elts=[value, _name(assembled[value.id])], ctx=ast.Load())
+                    for value in values.elts
+                ]
+                result = ast.Tuple(elts=pairs, ctx=ast.Load())
+            else:
+                result = ast.Tuple(
+                    elts=[values, _name(assembled[values.id])], ctx=ast.Load()
+                )
+            transformer.body.append(ast.Return(value=result))
+        else:
+            raise NotImplementedError(
+                "Cannot differentiate {}".format(ast.dump(statement))
+            )
+
+    definition.body = transformer.body
+    definition.decorator_list = []
+    definition.name = function.__name__ + "_derivative"
+    module = ast.fix_missing_locations(ast.Module(body=[definition], type_ignores=[]))
+
+    return compile(module, inspect.getsourcefile(function), "exec")
+
+
+def _unwrap(result):
+    """Convert assembled batches back to plain arrays"""
+
+    if isinstance(result, tuple):
+        return tuple(_unwrap(element) for element in result)
+
+    return numpy.asarray(result)
+
+
+def differentiated(function):
+    """Value and exact partial derivatives of a generated function
+
+    Arguments
+    ---------
+    function (callable): Generated function taking joint vectors of length 7
+
+    Returns
+    -------
+    callable: Function taking the same arguments, either of shape (7,) or
+              batches of shape (N, 7), and returning a (value, derivative)
+              pair for every output. The derivative has one more axis than
+              the value, placed after the batch axis, which runs over the
+              7 joint variables of the first argument, then of the second
+              argument and so on.
+
+    """
+
+    function = inspect.unwrap(function)
+    compiled = {}
+
+    def evaluate(*arrays):
+        if not compiled:
+            code = _transform(function)
+            name = function.__name__ + "_derivative"
+            single = dict(function.__globals__)
+            batch = dict(function.__globals__, math=_math, numpy=_numpy)
+            exec(code, single)
+            exec(code, batch)
+            compiled["single"], compiled["batch"] = single[name], batch[name]
+
+        if numpy.ndim(arrays[0]) == 1:
+            # Python floats are faster than numpy scalars in the expressions
+            return compiled["single"](
+                *(numpy.asarray(array, dtype=float).tolist() for array in arrays)
+            )
+
+        columns = [numpy.asarray(array, dtype=float).T for array in arrays]
+
+        return _unwrap(compiled["batch"](*columns))
+
+    evaluate.__name__ = function.__name__ + "_derivative"
+
+    return evaluate
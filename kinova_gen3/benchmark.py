@@ -0,0 +1,357 @@
+"""Benchmark suite for the kinematics and dynamics of Kinova Gen3
+
+Measure the per-call latency distribution of the single-configuration
+functions and the throughput of the batched functions, store the results as
+JSON and compare them against a stored baseline.
+
+Run from the command line with
+
+    python -m kinova_gen3.benchmark --output results.json --baseline baseline.json
+
+The command exits with a non-zero status when a gated metric (median latency
+or batched throughput) regresses by more than the threshold.
+
+Functions
+---------
+latency_cases()
+throughput_cases(batch_size)
+measure_latency(function, args, repeats, warmup)
+measure_throughput(function, args, batch_size, repeats)
+run_benchmarks(repeats, batch_size)
+compare(results, baseline, threshold)
+main(argv)
+
+"""
+
+import argparse
+import functools
+import json
+import platform
+import sys
+import time
+import numpy as np
+from kinova_gen3.kinematics.forward_kinematics import (
+    forward_kinematics,
+    forward_kinematics_batch,
+)
+from kinova_gen3.kinematics.jacobian import (
+    jacobian,
+    jacobian_batch,
+    jacobian_time_derivative,
+    jacobian_time_derivative_batch,
+)
+from kinova_gen3.kinematics.inverse_kinematics import (
+    inverse_kinematics,
+    inverse_kinematics_dls,
+    multicriteria_ik,
+    multicriteria_ik_damped,
+)
+from kinova_gen3.dynamics.mass_matrix import (
+    mass_matrix,
+    mass_matrix_batch,
+    mass_matrix_derivative,
+    mass_matrix_derivative_batch,
+)
+from kinova_gen3.dynamics.mass_matrix_packed import (
+    mass_matrix_packed,
+    mass_matrix_packed_batch,
+)
+from kinova_gen3.dynamics.coriolis import coriolis, coriolis_batch
+from kinova_gen3.dynamics.gravity import (
+    gravity,
+    gravity_batch,
+    gravity_derivative,
+    gravity_derivative_batch,
+)
+from kinova_gen3.dynamics.terms import dynamics_terms, dynamics_terms_batch
+from kinova_gen3.collision.self_collision import self_collision_distance_batch
+from kinova_gen3.collision.environment import Environment
+
+# Joint state used for the single-configuration measurements
+_JOINT_POSITION = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+_JOINT_VELOCITY = np.array([0.2, -0.1, 0.3, 0.1, -0.4, 0.2, 0.5])
+_END_EFFECTOR_VEL = np.array([0.05, -0.02, 0.01, 0.0, 0.1, -0.05])
+
+# Table below the robot and two fixtures next to it, as centers and half extents
+_CELL_BOXES = np.array(
+    [
+        [0.0, 0.0, -0.06, 1.0, 1.0, 0.05],
+        [0.5, 0.3, 0.2, 0.05, 0.2, 0.2],
+        [-0.4, -0.5, 0.4, 0.1, 0.1, 0.3],
+    ]
+)
+
+
+def latency_cases():
+    """Single-configuration functions and their arguments
+
+    Returns
+    -------
+    dict: Case name mapped to a (function, arguments) pair
+
+    """
+
+    q = _JOINT_POSITION
+    qp = _JOINT_VELOCITY
+    v = _END_EFFECTOR_VEL
+
+    return {
+        "forward_kinematics": (forward_kinematics, (q,)),
+        "forward_kinematics_pose": (
+            functools.partial(forward_kinematics, output="pose"), (q,)),
+        "jacobian": (jacobian, (q,)),
+        "jacobian_time_derivative": (jacobian_time_derivative, (q, qp)),
+        "mass_matrix": (mass_matrix, (q,)),
+        "mass_matrix_packed": (mass_matrix_packed, (q,)),
+        "coriolis": (coriolis, (q, qp)),
+        "gravity": (gravity, (q,)),
+        "dynamics_terms": (dynamics_terms, (q, qp)),
+        "mass_matrix_derivative": (mass_matrix_derivative, (q,)),
+        "gravity_derivative": (gravity_derivative, (q,)),
+        "inverse_kinematics": (inverse_kinematics, (q, v)),
+        "inverse_kinematics_dls": (inverse_kinematics_dls, (q, v)),
+        "multicriteria_ik": (multicriteria_ik, (q, v)),
+        "multicriteria_ik_damped": (multicriteria_ik_damped, (q, v)),
+    }
+
+
+def throughput_cases(batch_size):
+    """Batched functions and their arguments
+
+    Arguments
+    ---------
+    batch_size (int): Number of configurations per call
+
+    Returns
+    -------
+    dict: Case name mapped to a (function, arguments) pair
+
+    """
+
+    rng = np.random.default_rng(0)
+    q = rng.uniform(-np.pi, np.pi, (batch_size, 7))
+    qp = rng.uniform(-1.0, 1.0, (batch_size, 7))
+
+    # Trajectory sampled at 1 kHz with joint velocities below 1 rad/s
+    trajectory = q[0] + np.cumsum(rng.uniform(-1e-3, 1e-3, (batch_size, 7)), axis=0)
+
+    return {
+        "forward_kinematics_batch": (forward_kinematics_batch, (q,)),
+        "jacobian_batch": (jacobian_batch, (q,)),
+        "jacobian_time_derivative_batch": (jacobian_time_derivative_batch, (q, qp)),
+        "mass_matrix_batch": (mass_matrix_batch, (q,)),
+        "mass_matrix_packed_batch": (mass_matrix_packed_batch, (q,)),
+        "coriolis_batch": (coriolis_batch, (q, qp)),
+        "gravity_batch": (gravity_batch, (q,)),
+        "dynamics_terms_batch": (dynamics_terms_batch, (q, qp)),
+        "mass_matrix_derivative_batch": (mass_matrix_derivative_batch, (q,)),
+        "gravity_derivative_batch": (gravity_derivative_batch, (q,)),
+        "forward_kinematics_batch_float32": (
+            functools.partial(forward_kinematics_batch, dtype=np.float32), (q,)),
+        "mass_matrix_batch_float32": (
+            functools.partial(mass_matrix_batch, dtype=np.float32), (q,)),
+        "forward_kinematics_batch_pose": (
+            functools.partial(forward_kinematics_batch, output="pose",
+                              out=np.empty((batch_size, 7))), (q,)),
+        "self_collision_distance_batch": (self_collision_distance_batch, (q,)),
+        "environment_distance_batch": (
+            Environment(boxes=_CELL_BOXES).distance_batch, (trajectory,)),
+    }
+
+
+def measure_latency(function, args, repeats=1000, warmup=10):
+    """Latency distribution of repeated single calls
+
+    Arguments
+    ---------
+    function (callable): Function to measure
+    args (tuple): Arguments of the function
+    repeats (int): Number of timed calls
+    warmup (int): Number of untimed calls before the measurement
+
+    Returns
+    -------
+    dict: Median, 99th percentile, maximum and mean latency [s]
+
+    """
+
+    for _ in range(warmup):
+        function(*args)
+
+    samples = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        function(*args)
+        samples[i] = time.perf_counter() - start
+
+    return {
+        "p50": float(np.percentile(samples, 50)),
+        "p99": float(np.percentile(samples, 99)),
+        "max": float(samples.max()),
+        "mean": float(samples.mean()),
+        "calls": repeats,
+    }
+
+
+def measure_throughput(function, args, batch_size, repeats=5):
+    """Throughput of a batched function
+
+    Arguments
+    ---------
+    function (callable): Batched function to measure
+    args (tuple): Arguments of the function
+    batch_size (int): Number of configurations per call
+    repeats (int): Number of timed calls, the fastest one is reported
+
+    Returns
+    -------
+    dict: Samples per second and batch size
+
+    """
+
+    function(*args)
+
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+
+    return {"samples_per_second": batch_size / best, "batch_size": batch_size}
+
+
+def run_benchmarks(repeats=1000, batch_size=10000):
+    """Run the full benchmark suite
+
+    Arguments
+    ---------
+    repeats (int): Number of timed calls per latency case
+    batch_size (int): Number of configurations per batched call
+
+    Returns
+    -------
+    dict: Metadata, latency and throughput results
+
+    """
+
+    latency = {
+        name: measure_latency(function, args, repeats)
+        for name, (function, args) in latency_cases().items()
+    }
+    throughput = {
+        name: measure_throughput(function, args, batch_size)
+        for name, (function, args) in throughput_cases(batch_size).items()
+    }
+
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "latency": latency,
+        "throughput": throughput,
+    }
+
+
+def compare(results, baseline, threshold=0.2):
+    """Find the regressions of a benchmark run against a baseline
+
+    The median latency and the batched throughput are gated. Cases missing
+    from either run are ignored.
+
+    Arguments
+    ---------
+    results (dict): Output of run_benchmarks
+    baseline (dict): Output of an earlier run_benchmarks
+    threshold (float): Allowed relative slowdown [non-dimensional]
+
+    Returns
+    -------
+    list: Human-readable description of every regression
+
+    """
+
+    regressions = []
+
+    for name, current in results.get("latency", {}).items():
+        reference = baseline.get("latency", {}).get(name)
+        if reference is None:
+            continue
+        ratio = current["p50"] / reference["p50"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                "{}: median latency {:.3g} s vs {:.3g} s ({:+.0%})".format(
+                    name, current["p50"], reference["p50"], ratio - 1
+                )
+            )
+
+    for name, current in results.get("throughput", {}).items():
+        reference = baseline.get("throughput", {}).get(name)
+        if reference is None:
+            continue
+        ratio = current["samples_per_second"] / reference["samples_per_second"]
+        if ratio < 1 / (1 + threshold):
+            regressions.append(
+                "{}: throughput {:.3g}/s vs {:.3g}/s ({:+.0%})".format(
+                    name,
+                    current["samples_per_second"],
+                    reference["samples_per_second"],
+                    ratio - 1,
+                )
+            )
+
+    return regressions
+
+
+def main(argv=None):
+    """Command line entry point
+
+    Arguments
+    ---------
+    argv (list): Command line arguments, defaults to sys.argv
+
+    Returns
+    -------
+    int: Exit status, 1 if a regression exceeds the threshold
+
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative slowdown (default: 0.2)")
+    parser.add_argument("--repeats", type=int, default=1000,
+                        help="timed calls per latency case (default: 1000)")
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="configurations per batched call (default: 10000)")
+    arguments = parser.parse_args(argv)
+
+    results = run_benchmarks(arguments.repeats, arguments.batch_size)
+
+    for name, latency in results["latency"].items():
+        print("{:32s} p50 {:9.2f} us  p99 {:9.2f} us  max {:9.2f} us".format(
+            name, 1e6 * latency["p50"], 1e6 * latency["p99"], 1e6 * latency["max"]))
+    for name, throughput in results["throughput"].items():
+        print("{:32s} {:12.0f} samples/s".format(name, throughput["samples_per_second"]))
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            regressions = compare(results, json.load(file), arguments.threshold)
+        for regression in regressions:
+            print("REGRESSION " + regression)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""Static obstacles around Kinova Gen3 and their distance to the links
+
+An environment holds spheres, which also represent point clouds, and
+axis-aligned boxes. Its spatial index is a uniform grid over the obstacles,
+stored as compressed rows: every cell lists the obstacles whose bounding box,
+grown by the indexing margin, overlaps the cell.
+
+A query samples the link capsules at half the cell size and collects the
+obstacles listed in the cells of the samples. These candidates include every
+obstacle within the margin of a capsule. Those beyond the margin of the
+sphere around a capsule are discarded, and only the rest are evaluated
+exactly, all capsules and configurations together. Distances beyond the
+margin are reported as the margin, so a small margin keeps the queries fast.
+
+The distance of a capsule to a sphere follows from the closest point of its
+segment. The signed distance of a point to a box is convex, so along a
+segment its minimum is found by a golden-section search.
+
+Classes
+-------
+Environment
+
+"""
+
+import numpy as np
+from kinova_gen3.collision.geometry import segment_closest_points
+from kinova_gen3.collision.self_collision import CAPSULE_RADII, capsule_segments_batch
+
+# Iterations of the golden-section search, shrinking the interval to 1e-7 of
+# the segment
+_GOLDEN_ITERATIONS = 34
+_GOLDEN_RATIO = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+def _box_distance(point, center, half_extent):
+    """Signed distance of points to axis-aligned boxes"""
+
+    excess = np.abs(point - center) - half_extent
+    outside = np.linalg.norm(np.maximum(excess, 0.0), axis=-1)
+
+    return outside + np.minimum(np.max(excess, axis=-1), 0.0)
+
+
+def _segment_box_distance(start, end, center, half_extent):
+    """Minimum signed distance of segments to axis-aligned boxes"""
+
+    direction = end - start
+
+    def evaluate(fraction):
+        return _box_distance(
+            start + fraction[..., None] * direction, center, half_extent
+        )
+
+    # Golden-section search keeping one inner point and its value
+    lower = np.zeros(start.shape[:-1])
+    upper = np.ones(start.shape[:-1])
+    left, right = 1.0 - _GOLDEN_RATIO + lower, _GOLDEN_RATIO + lower
+    left_distance, right_distance = evaluate(left), evaluate(right)
+
+    for _ in range(_GOLDEN_ITERATIONS):
+        closer = left_distance <= right_distance
+        lower = np.where(closer, lower, left)
+        upper = np.where(closer, right, upper)
+        inner = np.where(closer, left, right)
+        inner_distance = np.where(closer, left_distance, right_distance)
+        new = np.where(
+            closer,
+            upper - _GOLDEN_RATIO * (upper - lower),
+            lower + _GOLDEN_RATIO * (upper - lower),
+        )
+        new_distance = evaluate(new)
+        left = np.where(closer, new, inner)
+        right = np.where(closer, inner, new)
+        left_distance = np.where(closer, new_distance, inner_distance)
+        right_distance = np.where(closer, inner_distance, new_distance)
+
+    return np.minimum(
+        np.minimum(left_distance, right_distance),
+        np.minimum(evaluate(lower), evaluate(upper)),
+    )
+
+
+class Environment:
+    """Spheres and boxes with a uniform grid index
+
+    Attributes
+    ----------
+    spheres (ndarray): The centers and radii of the spheres, shape (S, 4) [m]
+    boxes (ndarray): The centers and half extents of the axis-aligned boxes,
+                     shape (B, 6) [m]
+    cell_size (float): The edge length of a grid cell [m]
+    margin (float): The distance up to which obstacles are found [m]
+    max_radius (float): The largest capsule radius the index covers [m]
+
+    Methods
+    -------
+    from_point_cloud(points, radius, resolution, ...)
+        An environment of equal spheres around measured points
+    capsule_distance(start, end, radius)
+        The clearance of arbitrary capsules
+    distance(joint_position)
+        The clearance of the links of a configuration
+    distance_batch(joint_position)
+        The clearance of the links of a batch, e.g. a whole trajectory
+
+    """
+
+    def __init__(
+        self, spheres=None, boxes=None, cell_size=0.1, margin=0.05, max_radius=None
+    ):
+        """Index a set of obstacles
+
+        Arguments
+        ---------
+        spheres (array_like): The centers and radii of the spheres, shape (S, 4) [m]
+        boxes (array_like): The centers and half extents of the axis-aligned
+                            boxes, shape (B, 6) [m]
+        cell_size (float): The edge length of a grid cell [m]
+        margin (float): The distance up to which obstacles are found [m]
+        max_radius (float): The largest capsule radius the index covers, the
+                            largest link capsule if omitted [m]
+
+        """
+
+        self.spheres = (
+            np.zeros((0, 4)) if spheres is None else np.array(spheres, dtype=float)
+        )
+        self.boxes = np.zeros((0, 6)) if boxes is None else np.array(boxes, dtype=float)
+        self.cell_size = float(cell_size)
+        self.margin = float(margin)
+        self.max_radius = float(
+            CAPSULE_RADII.max() if max_radius is None else max_radius
+        )
+
+        # Bounding boxes of the obstacles, grown by everything a sample may be
+        # away from an obstacle within the margin of its capsule
+        reach = self.margin + self.max_radius + 0.25 * self.cell_size
+        self._center = np.concatenate([self.spheres[:, :3], self.boxes[:, :3]])
+        self._half_extent = np.concatenate(
+            [np.repeat(self.spheres[:, 3:], 3, axis=1), self.boxes[:, 3:]]
+        )
+        lower = self._center - self._half_extent - reach
+        upper = self._center + self._half_extent + reach
+
+        if self._center.shape[0] == 0:
+            self._origin = np.zeros(3)
+            self._shape = np.ones(3, dtype=np.intp)
+        else:
+            self._origin = lower.min(axis=0)
+            self._shape = np.ceil((upper.max(axis=0) - self._origin) / self.cell_size)
+            self._shape = np.maximum(self._shape.astype(np.intp), 1)
+
+        # Cells overlapped by every grown bounding box, in compressed rows
+        first = np.floor((lower - self._origin) / self.cell_size).astype(np.intp)
+        last = np.floor((upper - self._origin) / self.cell_size).astype(np.intp)
+        first = np.clip(first, 0, self._shape - 1)
+        extent = np.clip(last, 0, self._shape - 1) - first + 1
+
+        count = np.prod(extent, axis=-1)
+        obstacles = np.repeat(np.arange(count.size), count)
+        offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        block = np.empty((offset.size, 3), dtype=np.intp)
+        for axis in (2, 1, 0):
+            size = extent[obstacles, axis]
+            block[:, axis] = first[obstacles, axis] + offset % size
+            offset //= size
+        cells = np.ravel_multi_index(tuple(block.T), tuple(self._shape))
+
+        order = np.argsort(cells, kind="stable")
+        self._cell_obstacles = obstacles[order]
+        self._cell_start = np.zeros(int(np.prod(self._shape)) + 1, dtype=np.intp)
+        np.cumsum(
+            np.bincount(cells, minlength=self._cell_start.size - 1),
+            out=self._cell_start[1:],
+        )
+
+    @classmethod
+    def from_point_cloud(
+        cls,
+        points,
+        radius=0.01,
+        resolution=None,
+        cell_size=0.1,
+        margin=0.05,
+        max_radius=None,
+    ):
+        """An environment of equal spheres around measured points
+
+        Dense clouds list many points in every cell and slow the queries
+        down. With a resolution, the points are replaced by one sphere per
+        occupied voxel, around its center and covering its points.
+
+        Arguments
+        ---------
+        points (array_like): The points, shape (S, 3) [m]
+        radius (float): The radius around every point [m]
+        resolution (float): The edge length of the voxels merging the points,
+                            no merging if omitted [m]
+        cell_size (float): The edge length of a grid cell [m]
+        margin (float): The distance up to which obstacles are found [m]
+        max_radius (float): The largest capsule radius the index covers [m]
+
+        Returns
+        -------
+        Environment: The indexed point cloud
+
+        """
+
+        points = np.asarray(points, dtype=float)
+        if resolution is not None:
+            voxel = np.unique(np.floor(points / resolution), axis=0)
+            points = (voxel + 0.5) * resolution
+            radius = radius + 0.5 * np.sqrt(3.0) * resolution
+        spheres = np.column_stack([points, np.full(points.shape[0], radius)])
+
+        return cls(spheres, None, cell_size, margin, max_radius)
+
+    def _candidates(self, start, end):
+        """Pairs of capsules and obstacles listed in the cells of capsule samples"""
+
+        length = np.linalg.norm(end - start, axis=-1).max(initial=0.0)
+        n_samples = int(np.ceil(2.0 * length / self.cell_size)) + 1
+        fraction = np.linspace(0.0, 1.0, n_samples)[:, None]
+
+        sample = start[:, None] + fraction * (end - start)[:, None]
+        index = np.floor((sample - self._origin) / self.cell_size).astype(np.intp)
+        inside = np.all((index >= 0) & (index < self._shape), axis=-1)
+        cell = np.ravel_multi_index(
+            tuple(np.moveaxis(index, -1, 0)), tuple(self._shape), mode="clip"
+        )
+
+        # Consecutive samples of a capsule mostly share their cell. A sample
+        # outside the grid clips to a border cell, so only a sample inside
+        # the grid may stand in for the next one
+        keep = inside.copy()
+        keep[:, 1:] &= ~(inside[:, :-1] & (cell[:, 1:] == cell[:, :-1]))
+        capsule = np.broadcast_to(np.arange(start.shape[0])[:, None], keep.shape)[keep]
+        cell = cell[keep]
+
+        count = self._cell_start[cell + 1] - self._cell_start[cell]
+        offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        obstacle = self._cell_obstacles[
+            np.repeat(self._cell_start[cell], count) + offset
+        ]
+
+        return np.repeat(capsule, count), obstacle
+
+    def capsule_distance(self, start, end, radius):
+        """Clearance of capsules from the obstacles
+
+        Arguments
+        ---------
+        start (array_like): The start points of the segments, shape (..., 3) [m]
+        end (array_like): The end points of the segments, shape (..., 3) [m]
+        radius (array_like): The radii of the capsules, at most max_radius,
+                             shape (...) [m]
+
+        Returns
+        -------
+        ndarray: The smallest distances to an obstacle, negative for overlaps
+                 and at most the margin, shape (...) [m]
+
+        """
+
+        start, end = np.broadcast_arrays(
+            np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+        )
+        batch_shape = start.shape[:-1]
+        radius = np.broadcast_to(radius, batch_shape).ravel()
+        if np.any(radius > self.max_radius):
+            raise ValueError("The capsule radii must not exceed max_radius")
+        start, end = start.reshape(-1, 3), end.reshape(-1, 3)
+
+        clearance = np.full(start.shape[0], self.margin)
+        if self._cell_obstacles.size == 0:
+            return clearance.reshape(batch_shape)
+        capsule, obstacle = self._candidates(start, end)
+
+        # Discard the candidates beyond the margin of the sphere around a
+        # capsule, using the bounding boxes of the obstacles
+        middle = 0.5 * (start + end)
+        half_length = 0.5 * np.linalg.norm(end - start, axis=-1)
+        bound = _box_distance(
+            middle[capsule], self._center[obstacle], self._half_extent[obstacle]
+        )
+        keep = bound - half_length[capsule] - radius[capsule] < self.margin
+        capsule, obstacle = capsule[keep], obstacle[keep]
+
+        n_spheres = self.spheres.shape[0]
+        is_sphere = obstacle < n_spheres
+        sphere_capsule = capsule[is_sphere]
+        sphere = self.spheres[obstacle[is_sphere]]
+        _, closest = segment_closest_points(
+            sphere[:, :3], sphere[:, :3], start[sphere_capsule], end[sphere_capsule]
+        )
+        sphere_distance = (
+            np.linalg.norm(closest - sphere[:, :3], axis=-1) - sphere[:, 3]
+        )
+        np.minimum.at(
+            clearance, sphere_capsule, sphere_distance - radius[sphere_capsule]
+        )
+
+        box_capsule = capsule[~is_sphere]
+        box = self.boxes[obstacle[~is_sphere] - n_spheres]
+        box_distance = _segment_box_distance(
+            start[box_capsule], end[box_capsule], box[:, :3], box[:, 3:]
+        )
+        np.minimum.at(clearance, box_capsule, box_distance - radius[box_capsule])
+
+        return np.minimum(clearance, self.margin).reshape(batch_shape)
+
+    def distance_batch(self, joint_position):
+        """Clearance of the moving links for a batch of configurations
+
+        The base is fixed and not checked.
+
+        Arguments
+        ---------
+        joint_position (array_like): The joint angles, shape (N, 7) [rad]
+
+        Returns
+        -------
+        ndarray: The smallest clearance of every configuration, shape (N,) [m]
+        ndarray: The clearance of the seven links, shape (N, 7) [m]
+
+        """
+
+        start, end = capsule_segments_batch(joint_position)
+        clearance = self.capsule_distance(start[:, 1:], end[:, 1:], CAPSULE_RADII[1:])
+
+        return clearance.min(axis=-1, initial=self.margin), clearance
+
+    def distance(self, joint_position):
+        """Clearance of the moving links
+
+        Arguments
+        ---------
+        joint_position (array_like): The joint angles of the robot [rad]
+
+        Returns
+        -------
+        float: The smallest clearance [m]
+        ndarray: The clearance of the seven links, shape (7,) [m]
+
+        """
+
+        distance, clearance = self.distance_batch(
+            np.asarray(joint_position, dtype=float)[None]
+        )
+
+        return distance[0], clearance[0]
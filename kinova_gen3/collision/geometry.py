@@ -0,0 +1,76 @@
+"""Vectorized distance geometry for collision checking
+
+All functions broadcast over leading axes, so that many pairs of primitives
+are evaluated in one call without Python loops.
+
+Functions
+---------
+segment_closest_points(start_a, end_a, start_b, end_b)
+
+"""
+
+import numpy as np
+
+# Squared length below which a segment is treated as a point [m^2]
+_EPSILON = 1e-12
+
+
+def _divide(numerator, denominator):
+    """Elementwise quotient, zero where the denominator vanishes"""
+
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(numerator.shape),
+        where=denominator > _EPSILON,
+    )
+
+
+def segment_closest_points(start_a, end_a, start_b, end_b):
+    """Closest points between pairs of line segments
+
+    Arguments
+    ---------
+    start_a (array_like): The start points of the first segments, shape (..., 3)
+    end_a (array_like): The end points of the first segments, shape (..., 3)
+    start_b (array_like): The start points of the second segments, shape (..., 3)
+    end_b (array_like): The end points of the second segments, shape (..., 3)
+
+    Returns
+    -------
+    ndarray: The closest points on the first segments, shape (..., 3)
+    ndarray: The closest points on the second segments, shape (..., 3)
+
+    """
+
+    start_a, end_a, start_b, end_b = (
+        np.asarray(point, dtype=float) for point in (start_a, end_a, start_b, end_b)
+    )
+    direction_a = end_a - start_a
+    direction_b = end_b - start_b
+    offset = start_a - start_b
+
+    length_a = np.einsum("...i,...i->...", direction_a, direction_a)
+    length_b = np.einsum("...i,...i->...", direction_b, direction_b)
+    dot_ab = np.einsum("...i,...i->...", direction_a, direction_b)
+    dot_a = np.einsum("...i,...i->...", direction_a, offset)
+    dot_b = np.einsum("...i,...i->...", direction_b, offset)
+
+    # Parameters of the closest points of the infinite lines, with the
+    # parameter on a clamped first and the one on b clamped after it
+    s = np.clip(
+        _divide(dot_ab * dot_b - dot_a * length_b, length_a * length_b - dot_ab**2),
+        0.0,
+        1.0,
+    )
+    t = _divide(dot_ab * s + dot_b, length_b)
+    s = np.where(t < 0.0, np.clip(_divide(-dot_a, length_a), 0.0, 1.0), s)
+    s = np.where(t > 1.0, np.clip(_divide(dot_ab - dot_a, length_a), 0.0, 1.0), s)
+    t = np.clip(t, 0.0, 1.0)
+
+    # The second segment degenerates to a point
+    s = np.where(length_b <= _EPSILON, np.clip(_divide(-dot_a, length_a), 0.0, 1.0), s)
+
+    return start_a + s[..., None] * direction_a, start_b + t[..., None] * direction_b
@@ -0,0 +1,167 @@
+"""Capsule model and self-collision distance of Kinova Gen3
+
+Every link, from the base to the bracelet, is approximated by a capsule
+around the segment between the origin of its frame and the origin of the next
+frame of the kinematic chain, see ``kinova_gen3.kinematics.link_frames``. The
+distance between two capsules is the distance between their segments minus
+their radii, negative when they overlap.
+
+Adjacent links always touch at their common joint, and links two apart are
+held at a nearly constant distance by the short link between them, so only
+the pairs at least three links apart are checked. All pairs of a batch of
+configurations are evaluated with one vectorized segment-segment distance.
+
+The gradient of a pair distance follows from the motion of its closest
+points, which moves them along the unit vector n between them,
+
+    d(distance)/dq_j = n . (z_j x (p_a - o_j)) - n . (z_j x (p_b - o_j))
+
+with the axis z_j and origin o_j of every joint j moving the link of the
+point. The minimum over the pairs is differentiated through the closest pair,
+and the gradient is zero where two segments intersect.
+
+Functions
+---------
+capsule_segments(joint_position)
+capsule_segments_batch(joint_position)
+self_collision_distance(joint_position)
+self_collision_distance_batch(joint_position)
+
+"""
+
+import numpy as np
+from kinova_gen3.collision.geometry import segment_closest_points
+from kinova_gen3.instrumentation import instrumented
+from kinova_gen3.kinematics.link_frames import link_frames_batch
+
+# Radii of the capsules of the base and the seven links [m]
+CAPSULE_RADII = np.array([0.05, 0.05, 0.05, 0.05, 0.045, 0.04, 0.04, 0.04])
+
+# Checked pairs of capsules, at least three links apart
+CAPSULE_PAIRS = np.array([(a, b) for a in range(8) for b in range(a + 3, 8)])
+
+# Whether joint j moves the capsule of link k, shape (8, 7)
+_MOVED_BY = np.arange(1, 8) <= np.arange(8)[:, None]
+
+
+def _capsule_segments(joint_position):
+    """Segments of the capsules and the joint axes and origins"""
+
+    position, rotation = link_frames_batch(joint_position)
+
+    return position[:, :-1], position[:, 1:], rotation[:, 1:8, :, 2], position[:, 1:8]
+
+
+def _point_gradient(normal, point, axis, origin, moved):
+    """Rate of a point along a normal per joint, shape (N, P, 7)"""
+
+    lever = point[:, :, None, :] - origin[:, None, :, :]
+    rate = np.einsum("npi,npji->npj", normal, np.cross(axis[:, None, :, :], lever))
+
+    return np.where(moved, rate, 0.0)
+
+
+@instrumented
+def capsule_segments_batch(joint_position):
+    """Segments of the link capsules for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: The start points of the segments, shape (N, 8, 3) [m]
+    ndarray: The end points of the segments, shape (N, 8, 3) [m]
+
+    """
+
+    start, end, _, _ = _capsule_segments(np.asarray(joint_position, dtype=float))
+
+    return start, end
+
+
+@instrumented
+def capsule_segments(joint_position):
+    """Segments of the link capsules
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+
+    Returns
+    -------
+    ndarray: The start points of the segments, shape (8, 3) [m]
+    ndarray: The end points of the segments, shape (8, 3) [m]
+
+    """
+
+    start, end = capsule_segments_batch(np.asarray(joint_position, dtype=float)[None])
+
+    return start[0], end[0]
+
+
+@instrumented
+def self_collision_distance_batch(joint_position):
+    """Minimum distance between checked link capsules for a batch
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: The minimum distances, negative for overlaps, shape (N,) [m]
+    ndarray: The gradients of the minimum distances, shape (N, 7) [m/rad]
+    ndarray: The distances of all pairs of CAPSULE_PAIRS, shape (N, P) [m]
+
+    """
+
+    start, end, axis, origin = _capsule_segments(np.asarray(joint_position, dtype=float))
+    a, b = CAPSULE_PAIRS.T
+
+    point_a, point_b = segment_closest_points(start[:, a], end[:, a], start[:, b], end[:, b])
+    separation = point_a - point_b
+    length = np.linalg.norm(separation, axis=-1)
+    distance = length - CAPSULE_RADII[a] - CAPSULE_RADII[b]
+
+    closest = np.argmin(distance, axis=-1)
+    rows = np.arange(distance.shape[0])
+    pair = CAPSULE_PAIRS[closest]
+
+    normal = np.divide(
+        separation[rows, closest],
+        length[rows, closest, None],
+        out=np.zeros((distance.shape[0], 3)),
+        where=length[rows, closest, None] > 0.0,
+    )[:, None]
+    gradient = _point_gradient(
+        normal, point_a[rows, closest][:, None], axis, origin, _MOVED_BY[pair[:, 0]][:, None]
+    ) - _point_gradient(
+        normal, point_b[rows, closest][:, None], axis, origin, _MOVED_BY[pair[:, 1]][:, None]
+    )
+
+    return distance[rows, closest], gradient[:, 0], distance
+
+
+@instrumented
+def self_collision_distance(joint_position):
+    """Minimum distance between checked link capsules
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+
+    Returns
+    -------
+    float: The minimum distance, negative for overlaps [m]
+    ndarray: The gradient of the minimum distance, shape (7,) [m/rad]
+    ndarray: The distances of all pairs of CAPSULE_PAIRS, shape (P,) [m]
+
+    """
+
+    distance, gradient, pair_distance = self_collision_distance_batch(
+        np.asarray(joint_position, dtype=float)[None]
+    )
+
+    return distance[0], gradient[0], pair_distance[0]
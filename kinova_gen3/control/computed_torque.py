@@ -0,0 +1,154 @@
+"""Computed-torque control of Kinova Gen3
+
+Classes
+-------
+ComputedTorqueController
+
+"""
+
+import time
+import numpy as np
+from kinova_gen3.dynamics.terms import dynamics_terms
+
+
+class ComputedTorqueController:
+    """Joint-space computed-torque controller
+
+    The commanded torque is
+
+        tau = M(q) (qdd_ref + Kd (qp_ref - qp) + Kp (q_ref - q)) + C(q, qp) + g(q)
+
+    The dynamic terms are written by one fused ``dynamics_terms`` call and the
+    control law is evaluated in buffers allocated at construction, so a call
+    allocates no arrays, only the Python floats of the generated expressions.
+    The returned torque array is reused by the next call, copy it to keep it.
+
+    Every call is timed into a ring buffer of the last ``history`` samples,
+    summarised by ``timing_statistics``.
+
+    Attributes
+    ----------
+    kp (ndarray): The proportional gains [1/s^2]
+    kd (ndarray): The derivative gains [1/s]
+    budget (float): The time budget of a control cycle [s]
+
+    Methods
+    -------
+    torque(joint_position, joint_velocity, position_ref, velocity_ref, acceleration_ref)
+        Compute the joint torques for the current state and reference
+    timing_statistics()
+        Summarise the durations of the recent calls
+    reset_timing()
+        Clear the recorded durations
+
+    """
+
+    def __init__(self, kp, kd, budget=1e-3, history=10000):
+        """Create the controller
+
+        Arguments
+        ---------
+        kp (array_like): The proportional gains, scalar or one per joint [1/s^2]
+        kd (array_like): The derivative gains, scalar or one per joint [1/s]
+        budget (float): The time budget of a control cycle [s]
+        history (int): The number of recent calls kept for the statistics
+
+        """
+
+        self.kp = np.broadcast_to(np.asarray(kp, dtype=float), (7,)).copy()
+        self.kd = np.broadcast_to(np.asarray(kd, dtype=float), (7,)).copy()
+        self.budget = budget
+
+        self._terms = np.empty((7, 7)), np.empty(7), np.empty(7)
+        self._error = np.empty(7)
+        self._acceleration = np.empty(7)
+        self._torque = np.empty(7)
+
+        self._durations = np.zeros(history)
+        self._calls = 0
+
+    def torque(self, joint_position, joint_velocity, position_ref,
+               velocity_ref=None, acceleration_ref=None):
+        """Compute the joint torques for the current state and reference
+
+        Arguments
+        ---------
+        joint_position (array_like): The joint angles of the robot [rad]
+        joint_velocity (array_like): The joint velocities of the robot [rad/s]
+        position_ref (array_like): The reference joint angles [rad]
+        velocity_ref (array_like): The reference joint velocities [rad/s],
+                                   zero if omitted
+        acceleration_ref (array_like): The reference joint accelerations
+                                       [rad/s^2], zero if omitted
+
+        Returns
+        -------
+        ndarray: The joint torques [Nm], overwritten by the next call
+
+        """
+
+        start = time.perf_counter()
+
+        mass, coriolis_term, gravity_term = dynamics_terms(
+            joint_position, joint_velocity, out=self._terms
+        )
+
+        error = self._error
+        acceleration = self._acceleration
+
+        # Kd (qp_ref - qp)
+        if velocity_ref is None:
+            np.negative(joint_velocity, out=error)
+        else:
+            np.subtract(velocity_ref, joint_velocity, out=error)
+        np.multiply(self.kd, error, out=acceleration)
+
+        # + Kp (q_ref - q)
+        np.subtract(position_ref, joint_position, out=error)
+        error *= self.kp
+        acceleration += error
+
+        if acceleration_ref is not None:
+            acceleration += acceleration_ref
+
+        np.dot(mass, acceleration, out=self._torque)
+        self._torque += coriolis_term
+        self._torque += gravity_term
+
+        self._durations[self._calls % self._durations.shape[0]] = (
+            time.perf_counter() - start
+        )
+        self._calls += 1
+
+        return self._torque
+
+    def timing_statistics(self):
+        """Summarise the durations of the recent calls
+
+        Returns
+        -------
+        dict: Number of calls, median, 99th percentile, maximum and mean
+              duration [s] over the recent calls and the fraction of them
+              exceeding the budget
+
+        """
+
+        durations = self._durations[: min(self._calls, self._durations.shape[0])]
+
+        if durations.size == 0:
+            return {"calls": 0}
+
+        return {
+            "calls": self._calls,
+            "p50": float(np.percentile(durations, 50)),
+            "p99": float(np.percentile(durations, 99)),
+            "max": float(durations.max()),
+            "mean": float(durations.mean()),
+            "over_budget": float(np.mean(durations > self.budget)),
+        }
+
+    def reset_timing(self):
+        """Clear the recorded durations"""
+
+        self._durations[:] = 0.0
+        self._calls = 0
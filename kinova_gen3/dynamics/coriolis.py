@@ -3,13 +3,17 @@
 Functions
 ---------
 coriolis(joint_position, joint_velocity)
+coriolis_batch(joint_position, joint_velocity)
 
 """
 
 import math
 import numpy
+from kinova_gen3._batch import batched
+from kinova_gen3.instrumentation import instrumented
 
 
+@instrumented
 def coriolis(q, qp):
     """The Coriolis term of the Kinova Gen3 robot
 
@@ -3481,3 +3485,24 @@ def coriolis(q, qp):
     ).flatten()
 
     return coriolis_term
+
+
+_coriolis_batch = batched(coriolis)
+
+
+@instrumented
+def coriolis_batch(q, qp):
+    """The Coriolis term of the Kinova Gen3 robot for a batch of states
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot, shape (N, 7) [rad]
+    joint_velocity (array_like): The joint velocities of the robot, shape (N, 7) [rad/s]
+
+    Returns
+    -------
+    ndarray: The Coriolis terms of the robot, shape (N, 7)
+
+    """
+
+    return _coriolis_batch(q, qp)
@@ -0,0 +1,102 @@
+"""Partial derivatives of the forward dynamics of Kinova Gen3
+
+The joint accelerations f = M^-1 (tau - C - g) are differentiated exactly by
+forward-mode derivatives of the generated mass matrix, Coriolis and gravity
+expressions, which share their temporaries:
+
+    df/dtau = M^-1
+    df/dq_k = -M^-1 (dM/dq_k f + dC/dq_k + dg/dq_k)
+    df/dqp  = -M^-1 dC/dqp
+
+Functions
+---------
+forward_dynamics_derivatives(joint_position, joint_velocity, joint_torque)
+forward_dynamics_derivatives_batch(joint_position, joint_velocity, joint_torque)
+
+"""
+
+import numpy as np
+from kinova_gen3._dual import differentiated
+from kinova_gen3.instrumentation import instrumented
+from kinova_gen3.dynamics.mass_matrix import mass_matrix
+from kinova_gen3.dynamics.coriolis import coriolis
+from kinova_gen3.dynamics.gravity import gravity
+
+_mass_matrix_derivative = differentiated(mass_matrix)
+_coriolis_derivative = differentiated(coriolis)
+_gravity_derivative = differentiated(gravity)
+
+
+def _forward_dynamics_derivatives(joint_position, joint_velocity, joint_torque):
+    """Accelerations and their derivatives for one configuration or a stack"""
+
+    mass, mass_derivative = _mass_matrix_derivative(joint_position)
+    coriolis_term, coriolis_derivative = _coriolis_derivative(joint_position, joint_velocity)
+    gravity_term, gravity_derivative = _gravity_derivative(joint_position)
+
+    # One factorisation of M per configuration serves every right-hand side
+    inverse_mass = np.linalg.inv(mass)
+    acceleration = inverse_mass @ (joint_torque - coriolis_term - gravity_term)[..., None]
+
+    # Columns k of the bracketed terms, directions are on axis -2
+    position_terms = (
+        (mass_derivative @ acceleration[..., None, :, :])[..., 0]
+        + coriolis_derivative[..., :7, :]
+        + gravity_derivative
+    )
+    velocity_terms = coriolis_derivative[..., 7:, :]
+
+    return (
+        acceleration[..., 0],
+        -inverse_mass @ np.swapaxes(position_terms, -1, -2),
+        -inverse_mass @ np.swapaxes(velocity_terms, -1, -2),
+        inverse_mass,
+    )
+
+
+@instrumented
+def forward_dynamics_derivatives(joint_position, joint_velocity, joint_torque):
+    """Joint accelerations and their partial derivatives
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+    joint_velocity (array_like): The joint velocities of the robot [rad/s]
+    joint_torque (array_like): The joint torques of the robot [Nm]
+
+    Returns
+    -------
+    ndarray: The joint accelerations qdd, shape (7,) [rad/s^2]
+    ndarray: The derivatives d(qdd)_i/dq_j, shape (7, 7)
+    ndarray: The derivatives d(qdd)_i/dqp_j, shape (7, 7)
+    ndarray: The derivatives d(qdd)_i/dtau_j, shape (7, 7)
+
+    """
+
+    return _forward_dynamics_derivatives(
+        joint_position, joint_velocity, np.asarray(joint_torque, dtype=float)
+    )
+
+
+@instrumented
+def forward_dynamics_derivatives_batch(joint_position, joint_velocity, joint_torque):
+    """Joint accelerations and their partial derivatives for a batch
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+    joint_velocity (array_like): The joint velocities, shape (N, 7) [rad/s]
+    joint_torque (array_like): The joint torques, shape (N, 7) [Nm]
+
+    Returns
+    -------
+    ndarray: The joint accelerations, shape (N, 7) [rad/s^2]
+    ndarray: The derivatives with respect to the joint angles, shape (N, 7, 7)
+    ndarray: The derivatives with respect to the joint velocities, shape (N, 7, 7)
+    ndarray: The derivatives with respect to the joint torques, shape (N, 7, 7)
+
+    """
+
+    return _forward_dynamics_derivatives(
+        joint_position, joint_velocity, np.asarray(joint_torque, dtype=float)
+    )
@@ -3,13 +3,20 @@
 Functions
 ---------
 gravity(joint_position)
+gravity_batch(joint_position)
+gravity_derivative(joint_position)
+gravity_derivative_batch(joint_position)
 
 """
 
 import math
 import numpy
+from kinova_gen3._batch import batched
+from kinova_gen3._dual import differentiated
+from kinova_gen3.instrumentation import instrumented
 
 
+@instrumented
 def gravity(q):
     """The gravity term of the Kinova Gen3 robot
 
@@ -406,3 +413,66 @@ def gravity(q):
     ).flatten()
 
     return gravity_term
+
+
+_gravity_batch = batched(gravity)
+
+
+@instrumented
+def gravity_batch(q, dtype=None):
+    """The gravity term of the Kinova Gen3 robot for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot, shape (N, 7) [rad]
+    dtype (data-type): The floating-point type of the evaluation, that of the
+                       joint angles if omitted. In float32 the entries
+                       deviate from float64 by less than 1e-4 [Nm]
+
+    Returns
+    -------
+    ndarray: The gravity terms of the robot, shape (N, 7)
+
+    """
+
+    return _gravity_batch(q, dtype=dtype)
+
+
+_gravity_derivative = differentiated(gravity)
+
+
+@instrumented
+def gravity_derivative(q):
+    """The derivative of the gravity term with respect to the joint angles
+
+    The derivatives are propagated exactly through the temporaries of the
+    gravity term expressions.
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+
+    Returns
+    -------
+    ndarray: The derivatives dg_i/dq_j, shape (7, 7)
+
+    """
+
+    return numpy.swapaxes(_gravity_derivative(q)[1], -1, -2)
+
+
+@instrumented
+def gravity_derivative_batch(q):
+    """The derivative of the gravity term for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: The derivatives dg_i/dq_j, shape (N, 7, 7)
+
+    """
+
+    return numpy.swapaxes(_gravity_derivative(q)[1], -1, -2)
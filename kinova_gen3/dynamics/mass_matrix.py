@@ -3,13 +3,20 @@
 Functions
 ---------
 mass_matrix(joint_position)
+mass_matrix_batch(joint_position)
+mass_matrix_derivative(joint_position)
+mass_matrix_derivative_batch(joint_position)
 
 """
 
 import math
 import numpy
+from kinova_gen3._batch import batched
+from kinova_gen3._dual import differentiated
+from kinova_gen3.instrumentation import instrumented
 
 
+@instrumented
 def mass_matrix(q):
     """The mass matrix of the Kinova Gen3 robot
 
@@ -4419,3 +4426,66 @@ def mass_matrix(q):
     )
 
     return mass
+
+
+_mass_matrix_batch = batched(mass_matrix)
+
+
+@instrumented
+def mass_matrix_batch(q, dtype=None):
+    """The mass matrix of the Kinova Gen3 robot for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot, shape (N, 7) [rad]
+    dtype (data-type): The floating-point type of the evaluation, that of the
+                       joint angles if omitted. In float32 the entries
+                       deviate from float64 by less than 1e-5
+
+    Returns
+    -------
+    ndarray: The mass matrices of the robot, shape (N, 7, 7)
+
+    """
+
+    return _mass_matrix_batch(q, dtype=dtype)
+
+
+_mass_matrix_derivative = differentiated(mass_matrix)
+
+
+@instrumented
+def mass_matrix_derivative(q):
+    """The derivatives of the mass matrix with respect to the joint angles
+
+    The derivatives are propagated exactly through the temporaries of the
+    mass matrix expressions.
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+
+    Returns
+    -------
+    ndarray: The derivatives dM/dq_k stacked along the first axis, shape (7, 7, 7)
+
+    """
+
+    return _mass_matrix_derivative(q)[1]
+
+
+@instrumented
+def mass_matrix_derivative_batch(q):
+    """The derivatives of the mass matrix for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: The derivatives dM/dq_k stacked along the second axis, shape (N, 7, 7, 7)
+
+    """
+
+    return _mass_matrix_derivative(q)[1]
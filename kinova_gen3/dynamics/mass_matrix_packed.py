@@ -0,0 +1,3508 @@
+"""Packed mass matrix for Kinova Gen3 robot
+
+The mass matrix is symmetric, so only its 28 upper-triangle entries are
+evaluated, in row-major order, together with the temporaries they use. The
+expressions are those of ``mass_matrix`` with the lower-triangle entries and
+the temporaries only they depend on removed, which saves about a quarter of
+the arithmetic. In batched mode the packed stacks also take 28 instead of 49
+values per configuration.
+
+Functions
+---------
+mass_matrix_packed(joint_position)
+mass_matrix_packed_batch(joint_position)
+unpack_mass_matrix(packed)
+packed_cholesky(packed)
+packed_quadratic_form(packed, vector)
+
+"""
+
+import math
+import numpy
+from kinova_gen3._batch import batched
+from kinova_gen3.instrumentation import instrumented
+
+# Row and column of every packed entry
+PACKED_ROWS, PACKED_COLUMNS = numpy.triu_indices(7)
+
+# Packed index of every entry of the full matrix
+_UNPACK_INDEX = numpy.empty((7, 7), dtype=numpy.intp)
+_UNPACK_INDEX[PACKED_ROWS, PACKED_COLUMNS] = numpy.arange(28)
+_UNPACK_INDEX[PACKED_COLUMNS, PACKED_ROWS] = numpy.arange(28)
+
+# Packed index of the entry (i, j), i <= j, as a nested list for scalar loops
+_INDEX = _UNPACK_INDEX.tolist()
+
+# Off-diagonal entries appear twice in quadratic forms
+_WEIGHTS = numpy.where(PACKED_ROWS == PACKED_COLUMNS, 1.0, 2.0)
+
+
+@instrumented
+def mass_matrix_packed(q):
+    """The upper triangle of the mass matrix of the Kinova Gen3 robot
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+
+    Returns
+    -------
+    ndarray: The upper-triangle entries of the mass matrix in row-major
+             order, shape (28,)
+
+    """
+
+    # q1 = q[0]
+    q2 = q[1]
+    q3 = q[2]
+    q4 = q[3]
+    q5 = q[4]
+    q6 = q[5]
+    q7 = q[6]
+
+    x0 = q2
+    x1 = math.sin(x0)
+    x2 = x1**2
+    x3 = math.cos(x0)
+    x4 = q3
+    x5 = math.cos(x4)
+    x6 = x5**2
+    x7 = math.sin(x4)
+    x8 = x1 * x7
+    x9 = x3 * x5
+    x10 = x1 * x5
+    x11 = 0.010932 * x10 - 7.0e-6 * x3
+    x12 = -0.006641 * x10 - 4.4e-5 * x8
+    x13 = 0.000606 * x3 - 0.011127 * x8
+    x14 = 0.006641 * x3 + 0.117892 * x8
+    x15 = x14 * x5
+    x16 = 0.0125087 * x3
+    x17 = 0.006375 * x3
+    x18 = 0.21038 * x8
+    x19 = -x17 + x18
+    x20 = x19 * x5
+    x21 = 0.117892 * x10 - 4.4e-5 * x3
+    x22 = x21 * x7
+    x23 = q4
+    x24 = math.sin(x23)
+    x25 = x24 * x3
+    x26 = math.cos(x23)
+    x27 = x10 * x26
+    x28 = x25 + x27
+    x29 = -x25 - x27
+    x30 = 0.21038 * x10
+    x31 = x17 * x7
+    x32 = x30 + x31
+    x33 = 0.20843 * x25
+    x34 = 0.20843 * x27
+    x35 = -x33 - x34
+    x36 = x35 * x7
+    x37 = 0.390633584 * x33 + 0.390633584 * x34
+    x38 = x26 * x3
+    x39 = x10 * x24
+    x40 = -x17 * x5 + x18
+    x41 = 0.21038 * x6
+    x42 = 0.017767125 * x3
+    x43 = -0.0005 * x38 + 0.0005 * x39 + 0.008316 * x8
+    x44 = q5
+    x45 = math.cos(x44)
+    x46 = x25 * x45
+    x47 = math.sin(x44)
+    x48 = x47 * x7
+    x49 = x45 * x5
+    x50 = x26 * x49
+    x51 = -x48 + x50
+    x52 = x1 * x51
+    x53 = x46 + x52
+    x54 = -x30 - x31
+    x55 = x1 * x26
+    x56 = x25 * x5
+    x57 = -x55 - x56
+    x58 = 0.006375 * x25
+    x59 = 0.006375 * x27
+    x60 = x58 + x59
+    x61 = 0.005375 * x55 + 0.005375 * x56
+    x62 = 1.8568 * x60
+    x63 = 0.00741795 * x3
+    x64 = 0.244798168 * x1
+    x65 = 0.075478 * x25
+    x66 = 1.8e-5 * x38
+    x67 = 1.8e-5 * x24
+    x68 = x10 * x67
+    x69 = 0.075478 * x26
+    x70 = x10 * x69
+    x71 = -x65 + x66 - x68 - x70
+    x72 = 0.195695476 * x10
+    x73 = x7 * x71
+    x74 = x65 - x66 + x68 + x70
+    x75 = -0.015006 * x38 + 0.015006 * x39 + 0.075478 * x8
+    x76 = x1 * x24
+    x77 = x38 * x5
+    x78 = -x76 + x77
+    x79 = 0.004999825 * x78
+    x80 = 0.006375 * x38
+    x81 = 0.006375 * x39
+    x82 = 0.20843 * x8 - x80 + x81
+    x83 = 0.0099803 * x78
+    x84 = 0.005375 * x76
+    x85 = -0.005375 * x77 + x84
+    x86 = 0.9302 * x75
+    x87 = 1.8568 * x82
+    x88 = 0.015006 * x25 + 0.015006 * x27 - 1.8e-5 * x8
+    x89 = 0.004999825 * x57
+    x90 = 0.9302 * x88
+    x91 = x19 * x24
+    x92 = x59 - x91
+    x93 = -x18 * x24 + x5 * x58 + 0.006375 * x55
+    x94 = 0.00017505 * x46 + 0.00017505 * x52
+    x95 = 0.0063355125 * x57
+    x96 = 1.1787 * x94
+    x97 = 0.9302 * x71
+    x98 = 1.0e-6 * x38
+    x99 = 1.0e-6 * x24
+    x100 = x10 * x99
+    x101 = x100 + 0.008147 * x25 + 0.008147 * x27 - x98
+    x102 = x25 * x47
+    x103 = x45 * x7
+    x104 = x47 * x5
+    x105 = x104 * x26
+    x106 = -x103 - x105
+    x107 = x1 * x106
+    x108 = x102 - x107
+    x109 = x19 * x26
+    x110 = x109 + x81
+    x111 = 0.006375 * x76
+    x112 = x111 + x18 * x26 - x5 * x80
+    x113 = x26 * x60
+    x114 = x113 + x24 * x82
+    x115 = 0.0118371 * x1
+    x116 = 0.0118371 * x10
+    x117 = q6
+    x118 = math.sin(x117)
+    x119 = x118 * x26
+    x120 = math.cos(x117)
+    x121 = x120 * x24
+    x122 = x121 * x45
+    x123 = x119 + x122
+    x124 = x123 * x3
+    x125 = x120 * x48
+    x126 = x118 * x24
+    x127 = x120 * x26
+    x128 = x127 * x45
+    x129 = -x126 + x128
+    x130 = x129 * x5
+    x131 = -x125 + x130
+    x132 = x1 * x131
+    x133 = x124 + x132
+    x134 = x38 - x39
+    x135 = 0.0005 * x8
+    x136 = 1.0e-6 * x26
+    x137 = -x10 * x136 - x135 - 1.0e-6 * x25 + 0.000631 * x38 - 0.000631 * x39
+    x138 = -x124 - x132
+    x139 = x24 * x75 + x26 * x88
+    x140 = 0.005930025 * x1
+    x141 = 0.001596 * x46 + 0.001596 * x52
+    x142 = 0.10593 * x45
+    x143 = x142 * x25
+    x144 = 0.10593 * x52
+    x145 = x143 + x144
+    x146 = x47 * x76
+    x147 = x106 * x3
+    x148 = x146 + x147
+    x149 = 0.0063355125 * x148
+    x150 = 0.005930025 * x10
+    x151 = x24 * x60
+    x152 = x26 * x82
+    x153 = -x151 + x152
+    x154 = 1.8568 * x19
+    x155 = x47 * x84
+    x156 = -0.005375 * x147 - x155
+    x157 = 1.1787 * x145
+    x158 = -0.000256 * x102 + 0.000256 * x107 + 0.000399 * x38 - 0.000399 * x39
+    x159 = x26 * x75
+    x160 = x24 * x88
+    x161 = x159 - x160
+    x162 = 0.9302 * x19
+    x163 = x30 * x45
+    x164 = x24 * x47
+    x165 = 0.006375 * x10
+    x166 = x164 * x165
+    x167 = x109 * x47
+    x168 = x163 - x166 - x167
+    x169 = -x100 + 0.063883 * x46 + 0.063883 * x52 + x98
+    x170 = 0.0036447875 * x148
+    x171 = 0.10593 * x102
+    x172 = -0.10593 * x107 + x171 - 0.00017505 * x38 + 0.00017505 * x39
+    x173 = x45 * x76
+    x174 = x3 * x51
+    x175 = -x173 + x174
+    x176 = 0.0063355125 * x175
+    x177 = 0.063883 * x102 - 0.063883 * x107 + 0.009432 * x38 - 0.009432 * x39
+    x178 = 0.0036447875 * x175
+    x179 = -x102 + x107
+    x180 = -0.001607 * x102 + 0.001607 * x107 + 0.000256 * x38 - 0.000256 * x39
+    x181 = x151 * x5
+    x182 = x152 * x5
+    x183 = 0.0118371 * x3
+    x184 = 0.390633584 * x1
+    x185 = -0.005375 * x174 + x45 * x84
+    x186 = 1.1787 * x172
+    x187 = 0.6781 * x177
+    x188 = 0.6781 * x169
+    x189 = 1.0e-6 * x47
+    x190 = x189 * x25
+    x191 = 0.009432 * x45
+    x192 = -1.0e-6 * x107 + x190 - x191 * x25 - 0.009432 * x52
+    x193 = 0.0036447875 * x57
+    x194 = 0.6781 * x192
+    x195 = x35 * x45
+    x196 = x47 * x82
+    x197 = -x195 - x196
+    x198 = x111 * x47
+    x199 = x26 * x48
+    x200 = x199 - x49
+    x201 = 0.21038 * x1
+    x202 = -x106 * x17 - x198 - x200 * x201
+    x203 = 0.10593 * x124
+    x204 = 0.10593 * x132
+    x205 = -x203 - x204
+    x206 = x103 + x105
+    x207 = x206 * x3
+    x208 = -x146 + x207
+    x209 = 0.002690725 * x208
+    x210 = x1 * x206
+    x211 = x155 - 0.005375 * x207
+    x212 = 0.5006 * x205
+    x213 = x118 * x48
+    x214 = x119 * x45
+    x215 = -x121 - x214
+    x216 = x215 * x5
+    x217 = x213 + x216
+    x218 = x1 * x217
+    x219 = x126 * x45
+    x220 = x127 - x219
+    x221 = x220 * x3
+    x222 = x102 + x210
+    x223 = -x143 - x144
+    x224 = x203 + x204
+    x225 = 0.5006 * x145
+    x226 = x24 * x45
+    x227 = x109 * x45
+    x228 = x165 * x226 + x227 + x30 * x47
+    x229 = x145 * x45
+    x230 = x172 * x47
+    x231 = x229 + x230
+    x232 = 0.247974906 * x10
+    x233 = -x163 + x166 + x167
+    x234 = x35 * x47
+    x235 = x45 * x82
+    x236 = -x234 + x235
+    x237 = x103 * x26
+    x238 = -x104 - x237
+    x239 = x111 * x45 - x17 * x51 - x201 * x238
+    x240 = 0.195695476 * x1
+    x241 = x159 * x5
+    x242 = x160 * x5
+    x243 = 0.005930025 * x3
+    x244 = x195 + x196
+    x245 = -x229 - x230
+    x246 = 1.1787 * x35
+    x247 = -x199 + x49
+    x248 = -x17 * x206 + x198 - x201 * x247
+    x249 = 0.001641 * x124 + 0.001641 * x132
+    x250 = x169 * x45
+    x251 = x177 * x47
+    x252 = x250 + x251
+    x253 = 0.142658678 * x10
+    x254 = 0.00017505 * x124 + 0.00017505 * x132
+    x255 = x1 * x220
+    x256 = x217 * x3
+    x257 = -x255 + x256
+    x258 = 0.002690725 * x257
+    x259 = 0.005375 * x255 - 0.005375 * x256
+    x260 = 0.5006 * x259
+    x261 = x145 * x47
+    x262 = x172 * x45
+    x263 = -x261 + x262
+    x264 = 1.1787 * x82
+    x265 = 0.001641 * x102 + 0.001641 * x210 - 0.000278 * x218 - 0.000278 * x221
+    x266 = x118 * x47
+    x267 = x19 * x215
+    x268 = x165 * x220 - x266 * x30 + x267
+    x269 = 0.5006 * x254
+    x270 = -x250 - x251
+    x271 = 0.6781 * x35
+    x272 = x169 * x47
+    x273 = x177 * x45
+    x274 = -x272 + x273
+    x275 = 0.6781 * x82
+    x276 = x26 * x94
+    x277 = -x24 * x261 + x24 * x262 + x276
+    x278 = 0.0075142125 * x1
+    x279 = x120 * x60
+    x280 = x118 * x234
+    x281 = x118 * x235
+    x282 = x279 + x280 - x281
+    x283 = 0.0075142125 * x10
+    x284 = x218 + x221
+    x285 = -0.000278 * x102 - 0.000278 * x210 + 0.00041 * x218 + 0.00041 * x221
+    x286 = 0.045483 * x102 + 0.045483 * x210 - 0.00965 * x218 - 0.00965 * x221
+    x287 = x1 * x123
+    x288 = x131 * x3
+    x289 = -x287 + x288
+    x290 = 0.0036447875 * x289
+    x291 = x171 + 0.10593 * x210 - 0.00017505 * x218 - 0.00017505 * x221
+    x292 = 0.002690725 * x289
+    x293 = 0.00965 * x124 + 0.00965 * x132 + x190 + 1.0e-6 * x210
+    x294 = 0.0036447875 * x257
+    x295 = 0.045483 * x124
+    x296 = 1.0e-6 * x221
+    x297 = 0.045483 * x132
+    x298 = 1.0e-6 * x218
+    x299 = -x295 - x296 - x297 - x298
+    x300 = 0.0036447875 * x208
+    x301 = 0.005375 * x287 - 0.005375 * x288
+    x302 = 0.6781 * x286
+    x303 = 0.5006 * x291
+    x304 = 0.6781 * x293
+    x305 = 0.6781 * x299
+    x306 = x24 * x94
+    x307 = x26 * x261
+    x308 = x26 * x262
+    x309 = -x306 - x307 + x308
+    x310 = 1.1787 * x19
+    x311 = x295 + x296 + x297 + x298
+    x312 = 0.6781 * x145
+    x313 = x120 * x94
+    x314 = x118 * x172
+    x315 = x313 - x314
+    x316 = 0.5006 * x315
+    x317 = x104 * x118
+    x318 = x215 * x7
+    x319 = x317 - x318
+    x320 = -x17 * x217 - x201 * x319 + 0.006375 * x255
+    x321 = q7
+    x322 = math.cos(x321)
+    x323 = x119 * x322
+    x324 = math.sin(x321)
+    x325 = x324 * x47
+    x326 = x322 * x45
+    x327 = x120 * x326
+    x328 = -x325 + x327
+    x329 = x24 * x328
+    x330 = x323 + x329
+    x331 = x3 * x330
+    x332 = x324 * x45
+    x333 = x322 * x47
+    x334 = x120 * x333
+    x335 = x332 + x334
+    x336 = x335 * x7
+    x337 = x126 * x322
+    x338 = x26 * x328
+    x339 = -x337 + x338
+    x340 = x339 * x5
+    x341 = -x336 + x340
+    x342 = x1 * x341
+    x343 = x331 + x342
+    x344 = x120 * x47
+    x345 = x129 * x19
+    x346 = x123 * x165 + x30 * x344 + x345
+    x347 = x119 * x324
+    x348 = x120 * x332
+    x349 = -x333 - x348
+    x350 = x24 * x349
+    x351 = -x347 + x350
+    x352 = x3 * x351
+    x353 = x120 * x325
+    x354 = x326 - x353
+    x355 = x354 * x7
+    x356 = x126 * x324
+    x357 = x26 * x349
+    x358 = x356 + x357
+    x359 = x358 * x5
+    x360 = -x355 + x359
+    x361 = x1 * x360
+    x362 = 0.247974906 * x1
+    x363 = x306 * x5
+    x364 = x106 * x145
+    x365 = x172 * x51
+    x366 = 0.0075142125 * x3
+    x367 = x118 * x60
+    x368 = x120 * x234
+    x369 = x120 * x235
+    x370 = x367 - x368 + x369
+    x371 = x120 * x254
+    x372 = x118 * x291 + x371
+    x373 = 0.5006 * x372
+    x374 = x118 * x94
+    x375 = x120 * x172
+    x376 = x374 + x375
+    x377 = x104 * x120
+    x378 = x129 * x7
+    x379 = -x377 - x378
+    x380 = -x131 * x17 - x201 * x379 + 0.006375 * x287
+    x381 = x192 * x26
+    x382 = -x24 * x272 + x24 * x273 + x381
+    x383 = 0.0043228875 * x1
+    x384 = 0.0043228875 * x10
+    x385 = x26 * x272
+    x386 = x26 * x273
+    x387 = x192 * x24
+    x388 = -x385 + x386 - x387
+    x389 = 0.6781 * x19
+    x390 = x118 * x286 + x120 * x293
+    x391 = 0.6781 * x390
+    x392 = x118 * x254
+    x393 = x120 * x291
+    x394 = -x392 + x393
+    x395 = 0.5006 * x172
+    x396 = 0.142658678 * x1
+    x397 = x177 * x51
+    x398 = x106 * x169
+    x399 = x387 * x5
+    x400 = 0.0043228875 * x3
+    x401 = x205 * x45
+    x402 = x392 * x47
+    x403 = x393 * x47
+    x404 = -x401 - x402 + x403
+    x405 = 0.105316228 * x10
+    x406 = x118 * x293
+    x407 = x120 * x286
+    x408 = -x406 + x407
+    x409 = 0.6781 * x172
+    x410 = x401 + x402 - x403
+    x411 = 0.5006 * x35
+    x412 = x205 * x47
+    x413 = x392 * x45
+    x414 = x393 * x45
+    x415 = x412 - x413 + x414
+    x416 = 0.5006 * x82
+    x417 = x123 * x291 + x220 * x254 + x24 * x412
+    x418 = 0.003191325 * x1
+    x419 = 0.003191325 * x10
+    x420 = 0.011402 * x218 + 0.011402 * x221 - 0.029798 * x352 - 0.029798 * x361
+    x421 = x1 * x330
+    x422 = x3 * x341
+    x423 = -x421 + x422
+    x424 = 0.002690725 * x423
+    x425 = -0.000281 * x218 - 0.000281 * x221 + 0.029798 * x331 + 0.029798 * x342
+    x426 = x1 * x351
+    x427 = x3 * x360
+    x428 = -x426 + x427
+    x429 = 0.002690725 * x428
+    x430 = -0.011402 * x331 - 0.011402 * x342 + 0.000281 * x352 + 0.000281 * x361
+    x431 = 0.005375 * x421 - 0.005375 * x422
+    x432 = 0.5006 * x420
+    x433 = 0.005375 * x426 - 0.005375 * x427
+    x434 = 0.5006 * x425
+    x435 = x26 * x412
+    x436 = x215 * x254
+    x437 = x129 * x291
+    x438 = x435 + x436 + x437
+    x439 = 0.5006 * x19
+    x440 = x324 * x367
+    x441 = -x326 + x353
+    x442 = x35 * x441
+    x443 = x349 * x82
+    x444 = -x440 + x442 + x443
+    x445 = x322 * x367
+    x446 = -x332 - x334
+    x447 = x35 * x446
+    x448 = x328 * x82
+    x449 = x445 + x447 + x448
+    x450 = x19 * x339
+    x451 = x165 * x330 + x30 * x335 + x450
+    x452 = x19 * x358
+    x453 = x165 * x351 + x30 * x354 + x452
+    x454 = 0.5006 * x430
+    x455 = x145 * x322
+    x456 = x324 * x374
+    x457 = x324 * x375
+    x458 = x455 - x456 - x457
+    x459 = x205 * x206
+    x460 = x217 * x254
+    x461 = x131 * x291
+    x462 = 0.003191325 * x3
+    x463 = x145 * x324
+    x464 = x322 * x374
+    x465 = x322 * x375
+    x466 = x463 + x464 + x465
+    x467 = 0.105316228 * x1
+    x468 = 3.0e-6 * x331 + 3.0e-6 * x342
+    x469 = 0.000609 * x218 + 0.000609 * x221 + 0.000118 * x352 + 0.000118 * x361 + x468
+    x470 = x205 * x322
+    x471 = x291 * x324
+    x472 = -x470 - x471
+    x473 = x205 * x324
+    x474 = x291 * x322
+    x475 = -x473 + x474
+    x476 = x335 * x5
+    x477 = x339 * x7
+    x478 = -x476 - x477
+    x479 = -x17 * x341 - x201 * x478 + 0.006375 * x421
+    x480 = x406 * x47
+    x481 = x407 * x47
+    x482 = x299 * x45
+    x483 = -x480 + x481 - x482
+    x484 = x354 * x5
+    x485 = x358 * x7
+    x486 = -x484 - x485
+    x487 = -x17 * x360 - x201 * x486 + 0.006375 * x426
+    x488 = x480 - x481 + x482
+    x489 = x406 * x45
+    x490 = x407 * x45
+    x491 = x299 * x47
+    x492 = -x489 + x490 + x491
+    x493 = x123 * x286 + x220 * x293 + x24 * x491
+    x494 = (
+        3.0e-6 * x218
+        + 3.0e-6 * x221
+        + 0.000587 * x331
+        + 0.000587 * x342
+        + 3.0e-6 * x352
+        + 3.0e-6 * x361
+    )
+    x495 = x129 * x286
+    x496 = x215 * x293
+    x497 = x26 * x491
+    x498 = x495 + x496 + x497
+    x499 = x352 + x361
+    x500 = 0.000118 * x218 + 0.000118 * x221 + 0.000369 * x352 + 0.000369 * x361 + x468
+    x501 = x322 * x425
+    x502 = x324 * x420
+    x503 = x501 + x502
+    x504 = x217 * x293
+    x505 = x131 * x286
+    x506 = x206 * x299
+    x507 = -x501 - x502
+    x508 = x324 * x425
+    x509 = x322 * x420
+    x510 = -x508 + x509
+    x511 = x120 * x430
+    x512 = -x118 * x508 + x118 * x509 + x511
+    x513 = 0.5006 * x512
+    x514 = x118 * x430
+    x515 = x47 * x514
+    x516 = x335 * x420 + x354 * x425 - x515
+    x517 = x420 * x446 + x425 * x441 + x515
+    x518 = x120 * x508
+    x519 = x120 * x509
+    x520 = -x514 - x518 + x519
+    x521 = x349 * x425
+    x522 = x328 * x420
+    x523 = x45 * x514
+    x524 = x521 + x522 - x523
+    x525 = x220 * x430 + x330 * x420 + x351 * x425
+    x526 = x358 * x425
+    x527 = x339 * x420
+    x528 = x215 * x430
+    x529 = x526 + x527 + x528
+    x530 = x360 * x425
+    x531 = x341 * x420
+    x532 = x217 * x430
+    x533 = 0.00017505 * x104
+    x534 = 0.00017505 * x26
+    x535 = x103 * x534
+    x536 = -x533 - x535
+    x537 = x24 * x536
+    x538 = 0.10593 * x104
+    x539 = 0.10593 * x237
+    x540 = -x538 - x539
+    x541 = x47 * x540
+    x542 = x26 * x541
+    x543 = x24 * x7
+    x544 = -0.10593 * x199 + 0.10593 * x49
+    x545 = -0.00017505 * x543 + x544
+    x546 = x45 * x545
+    x547 = x26 * x546
+    x548 = -x537 - x542 + x547
+    x549 = 0.20843 * x5
+    x550 = -0.006375 * x543
+    x551 = x549 + x550
+    x552 = x45 * x551
+    x553 = -0.20843 * x199 + x552
+    x554 = -x541 + x546
+    x555 = 0.20843 * x237
+    x556 = x47 * x551
+    x557 = -x555 - x556
+    x558 = x45 * x540
+    x559 = x47 * x545
+    x560 = -x558 - x559
+    x561 = x26 * x7
+    x562 = 0.006375 * x561
+    x563 = 0.21038 * x5
+    x564 = -x24 * x563 - x562
+    x565 = 0.21038 * x103
+    x566 = 0.21038 * x105
+    x567 = -x565 - x566
+    x568 = 0.006375 * x24
+    x569 = x48 * x568
+    x570 = x567 + x569
+    x571 = -0.21038 * x48 + 0.21038 * x50
+    x572 = -x103 * x568 + x571
+    x573 = 0.011402 * x317 - 0.011402 * x318 + 0.029798 * x484 + 0.029798 * x485
+    x574 = -0.000281 * x317 + 0.000281 * x318 - 0.029798 * x476 - 0.029798 * x477
+    x575 = 0.011402 * x476
+    x576 = 0.000281 * x484
+    x577 = 0.011402 * x477
+    x578 = 0.000281 * x485
+    x579 = x575 - x576 + x577 - x578
+    x580 = x220 * x579 + x330 * x573 + x351 * x574
+    x581 = 0.10593 * x377
+    x582 = 0.10593 * x378
+    x583 = x581 + x582
+    x584 = x47 * x583
+    x585 = -0.00017505 * x377 - 0.00017505 * x378
+    x586 = -0.00017505 * x317 + 0.00017505 * x318 + x544
+    x587 = x123 * x586 + x220 * x585 + x24 * x584
+    x588 = x26**2
+    x589 = 0.006375 * x588
+    x590 = x589 * x7
+    x591 = x24 * x551 - x590
+    x592 = x26 * x551
+    x593 = x24 * x562 + x592
+    x594 = x26 * x563 + x550
+    x595 = x358 * x574
+    x596 = x339 * x573
+    x597 = x215 * x579
+    x598 = x595 + x596 + x597
+    x599 = x26 * x584
+    x600 = x215 * x585
+    x601 = x129 * x586
+    x602 = x599 + x600 + x601
+    x603 = x555 + x556
+    x604 = x120 * x585
+    x605 = x118 * x586 + x604
+    x606 = 0.5006 * x605
+    x607 = x120 * x536
+    x608 = x118 * x545
+    x609 = x607 - x608
+    x610 = x118 * x536
+    x611 = x120 * x545
+    x612 = x610 + x611
+    x613 = x322 * x574
+    x614 = x324 * x573
+    x615 = x613 + x614
+    x616 = x118 * x585
+    x617 = x120 * x586
+    x618 = -x616 + x617
+    x619 = x324 * x583
+    x620 = x322 * x586
+    x621 = -x619 + x620
+    x622 = x324 * x574
+    x623 = x322 * x573
+    x624 = -x622 + x623
+    x625 = x322 * x583
+    x626 = x324 * x586
+    x627 = -x625 - x626
+    x628 = -x613 - x614
+    x629 = -0.21038 * x355 + 0.21038 * x359
+    x630 = -0.21038 * x336 + 0.21038 * x340
+    x631 = 0.21038 * x213 + 0.21038 * x216
+    x632 = -0.21038 * x125 + 0.21038 * x130
+    x633 = x565 + x566
+    x634 = 0.006375 * x7
+    x635 = -x220 * x634 + x631
+    x636 = 0.20843 * x48
+    x637 = x118 * x552
+    x638 = x119 * x636 - x127 * x634 - x637
+    x639 = x120 * x579
+    x640 = -x118 * x622 + x118 * x623 + x639
+    x641 = 0.5006 * x640
+    x642 = -x581 - x582
+    x643 = x538 + x539
+    x644 = x118 * x579
+    x645 = x47 * x644
+    x646 = x441 * x574 + x446 * x573 + x645
+    x647 = x45 * x583
+    x648 = x47 * x616
+    x649 = x47 * x617
+    x650 = x647 + x648 - x649
+    x651 = -x569 + x633
+    x652 = 0.20843 * x561
+    x653 = x349 * x551
+    x654 = x347 * x634 + x441 * x652 + x653
+    x655 = x328 * x551
+    x656 = -x323 * x634 + x446 * x652 + x655
+    x657 = x328 * x573
+    x658 = x349 * x574
+    x659 = x45 * x644
+    x660 = x657 + x658 - x659
+    x661 = x45 * x616
+    x662 = x45 * x617
+    x663 = x584 - x661 + x662
+    x664 = x322 * x540
+    x665 = x324 * x610
+    x666 = x324 * x611
+    x667 = x664 - x665 - x666
+    x668 = x324 * x540
+    x669 = x322 * x610
+    x670 = x322 * x611
+    x671 = x668 + x669 + x670
+    x672 = x120 * x622
+    x673 = x120 * x623
+    x674 = -x644 - x672 + x673
+    x675 = -x351 * x634 + x629
+    x676 = -x330 * x634 + x630
+    x677 = -x123 * x634 + x632
+    x678 = x120 * x552
+    x679 = -x119 * x634 - x127 * x636 + x678
+    x680 = 1.0e-6 * x49
+    x681 = x136 * x48
+    x682 = x680 - x681
+    x683 = -0.00965 * x377 - 0.00965 * x378 + x682
+    x684 = -0.045483 * x199 - 0.00965 * x317 + 0.00965 * x318 + 0.045483 * x49
+    x685 = 1.0e-6 * x118
+    x686 = x104 * x685
+    x687 = 0.045483 * x120
+    x688 = x104 * x687
+    x689 = 0.045483 * x378
+    x690 = 1.0e-6 * x318
+    x691 = -x686 + x688 + x689 + x690
+    x692 = x47 * x691
+    x693 = x123 * x684 + x220 * x683 + x24 * x692
+    x694 = -0.063883 * x199 + 0.063883 * x49 + 0.009432 * x543
+    x695 = x45 * x694
+    x696 = x7 * x99
+    x697 = -0.063883 * x104 - 0.063883 * x237 + x696
+    x698 = x47 * x697
+    x699 = 0.009432 * x104
+    x700 = 0.009432 * x26
+    x701 = x103 * x700
+    x702 = x682 + x699 + x701
+    x703 = x26 * x702
+    x704 = x24 * x695 - x24 * x698 + x703
+    x705 = x129 * x684
+    x706 = x215 * x683
+    x707 = x26 * x692
+    x708 = x705 + x706 + x707
+    x709 = x26 * x695
+    x710 = x26 * x698
+    x711 = x24 * x702
+    x712 = x709 - x710 - x711
+    x713 = x695 - x698
+    x714 = x118 * x684 + x120 * x683
+    x715 = 0.6781 * x714
+    x716 = x118 * x683
+    x717 = x120 * x684
+    x718 = -x716 + x717
+    x719 = x45 * x697
+    x720 = x47 * x694
+    x721 = -x719 - x720
+    x722 = x686 - x688 - x689 - x690
+    x723 = x47 * x716
+    x724 = x47 * x717
+    x725 = x45 * x691
+    x726 = x723 - x724 + x725
+    x727 = x45 * x716
+    x728 = x45 * x717
+    x729 = x692 - x727 + x728
+    x730 = 0.075478 * x5
+    x731 = -0.015006 * x543 + x730
+    x732 = 1.8e-5 * x5
+    x733 = -0.015006 * x561 - x732
+    x734 = x24 * x731 + x26 * x733
+    x735 = x26 * x731
+    x736 = x24 * x733
+    x737 = x735 - x736
+    x738 = x26 * x536
+    x739 = -x24 * x541 + x24 * x546 + x738
+    x740 = x7**2
+    x741 = x217 * x579
+    x742 = x341 * x573
+    x743 = x360 * x574
+    x744 = x206 * x583
+    x745 = x217 * x585
+    x746 = x131 * x586
+    x747 = x26 * x740
+    x748 = x24 * x5
+    x749 = x5 * x592
+    x750 = x217 * x683
+    x751 = x206 * x691
+    x752 = x131 * x684
+    x753 = x5 * x711
+    x754 = x51 * x694
+    x755 = x106 * x697
+    x756 = x67 * x7
+    x757 = x69 * x7
+    x758 = x756 + x757
+    x759 = x7 * x758
+    x760 = x5 * x735
+    x761 = x5 * x736
+    x762 = x5 * x537
+    x763 = x106 * x540
+    x764 = x51 * x545
+    x765 = x335 * x573 + x354 * x574 - x645
+    x766 = -x647 - x648 + x649
+    x767 = x719 + x720
+    x768 = -x723 + x724 - x725
+    x769 = -x756 - x757
+    x770 = x558 + x559
+    x771 = x5 * x8
+    x772 = 1.1787 * x536
+    x773 = 0.006641 * x7
+    x774 = 4.4e-5 * x5
+    x775 = x773 - x774
+    x776 = 0.6781 * x60
+    x777 = 0.0038888565277 * x3
+    x778 = 0.004999825 * x3
+    x779 = 0.0118371 * x7
+    x780 = 0.0043228875 * x7
+    x781 = 0.0075142125 * x7
+    x782 = x26 * x5
+    x783 = (
+        0.0136723 * x1 * x775
+        - 9.550037552e-7 * x1
+        - x113 * x779
+        + 1.1636 * x12 * x775
+        + 0.3819772992 * x15
+        + x157 * x540
+        - 0.390633584 * x181
+        + 0.390633584 * x182
+        + x186 * x545
+        + x187 * x694
+        + x188 * x697
+        + x194 * x702
+        + 1.17265812 * x20
+        + x212 * x583
+        - 0.3819772992 * x22
+        + 0.195695476 * x241
+        - 0.195695476 * x242
+        + 0.387012824 * x26 * x36
+        + x269 * x579
+        + x269 * x585
+        - x276 * x781
+        - 0.012618092064064 * x3
+        + x302 * x684
+        + x303 * x586
+        + x304 * x683
+        + x305 * x691
+        - 0.247974906 * x363
+        - 0.002080193929 * x38 * x740
+        - x381 * x780
+        - 0.142658678 * x399
+        + x432 * x573
+        + x434 * x574
+        + x454 * x579
+        + x454 * x585
+        + x536 * x96
+        + x551 * x87
+        - x6 * x777
+        + x60 * x772
+        + x702 * x776
+        + x731 * x86
+        + x733 * x90
+        - x740 * x777
+        + x758 * x97
+        - x759 * x778
+        - 0.08141975791312 * x782 * x8
+        - 0.00020876371875 * x8
+    )
+    x784 = x24**2
+    x785 = x45 * x784
+    x786 = x142 * x164
+    x787 = 0.10593 * x164
+    x788 = -x534 + x787
+    x789 = x45 * x788
+    x790 = x26 * x789
+    x791 = -x26 * x786 - 0.00017505 * x785 + x790
+    x792 = -x786 + x789
+    x793 = x45**2
+    x794 = 0.10593 * x793
+    x795 = x24 * x794
+    x796 = x47 * x788
+    x797 = -x795 - x796
+    x798 = 0.20843 * x226
+    x799 = 0.006375 * x26
+    x800 = x47 * x799
+    x801 = x798 + x800
+    x802 = 0.20843 * x164 - x45 * x799
+    x803 = 0.011402 * x127 - 0.011402 * x219 + 0.029798 * x347 - 0.029798 * x350
+    x804 = -0.000281 * x127 + 0.000281 * x219 + 0.029798 * x323 + 0.029798 * x329
+    x805 = 0.000281 * x324
+    x806 = x119 * x805
+    x807 = 0.011402 * x322
+    x808 = x119 * x807
+    x809 = 0.011402 * x329
+    x810 = 0.000281 * x350
+    x811 = -x806 - x808 - x809 + x810
+    x812 = x220 * x811 + x330 * x803 + x351 * x804
+    x813 = 0.10593 * x119
+    x814 = x121 * x142
+    x815 = -x813 - x814
+    x816 = x47 * x815
+    x817 = 0.00017505 * x122
+    x818 = 0.00017505 * x119 + x817
+    x819 = 0.00017505 * x219
+    x820 = -0.00017505 * x127 + x787 + x819
+    x821 = x123 * x820 + x220 * x818 + x24 * x816
+    x822 = 0.006375 * x784
+    x823 = -x589 - x822
+    x824 = x358 * x804
+    x825 = x339 * x803
+    x826 = x215 * x811
+    x827 = x824 + x825 + x826
+    x828 = x26 * x816
+    x829 = x215 * x818
+    x830 = x129 * x820
+    x831 = x828 + x829 + x830
+    x832 = x120 * x788
+    x833 = x819 + x832
+    x834 = x120 * x818
+    x835 = x118 * x820 + x834
+    x836 = 0.5006 * x835
+    x837 = x118 * x818
+    x838 = x120 * x820
+    x839 = -x837 + x838
+    x840 = x324 * x815
+    x841 = x322 * x820
+    x842 = -x840 + x841
+    x843 = x324 * x804
+    x844 = x322 * x803
+    x845 = -x843 + x844
+    x846 = x322 * x804
+    x847 = x324 * x803
+    x848 = x846 + x847
+    x849 = x118 * x788
+    x850 = x817 - x849
+    x851 = x322 * x815
+    x852 = x324 * x820
+    x853 = -x851 - x852
+    x854 = -x846 - x847
+    x855 = 0.006375 * x121 + 0.006375 * x214
+    x856 = 0.20843 * x47
+    x857 = -x126 * x856 + x855
+    x858 = x120 * x811
+    x859 = -x118 * x843 + x118 * x844 + x858
+    x860 = 0.5006 * x859
+    x861 = x813 + x814
+    x862 = 0.006375 * x126 - 0.006375 * x128
+    x863 = x118 * x811
+    x864 = x47 * x863
+    x865 = x441 * x804 + x446 * x803 + x864
+    x866 = x45 * x815
+    x867 = x47 * x837
+    x868 = x47 * x838
+    x869 = x866 + x867 - x868
+    x870 = -x798 - x800
+    x871 = -0.006375 * x356 - 0.006375 * x357
+    x872 = 0.006375 * x337 - 0.006375 * x338
+    x873 = x328 * x803
+    x874 = x349 * x804
+    x875 = x45 * x863
+    x876 = x873 + x874 - x875
+    x877 = x45 * x837
+    x878 = x45 * x838
+    x879 = x816 - x877 + x878
+    x880 = x120 * x843
+    x881 = x120 * x844
+    x882 = -x863 - x880 + x881
+    x883 = x121 * x856 + x862
+    x884 = 0.20843 * x24
+    x885 = -x441 * x884 + x871
+    x886 = -x446 * x884 + x872
+    x887 = 0.10593 * x24
+    x888 = 0.00017505 * x126
+    x889 = x322 * x832
+    x890 = x326 * x888 + x332 * x887 + x889
+    x891 = x324 * x832
+    x892 = x326 * x887 - x332 * x888 - x891
+    x893 = 0.045483 * x119
+    x894 = 1.0e-6 * x127
+    x895 = 1.0e-6 * x45
+    x896 = x126 * x895
+    x897 = 0.045483 * x45
+    x898 = x121 * x897
+    x899 = -x893 - x894 + x896 - x898
+    x900 = x47 * x899
+    x901 = -0.00965 * x127 + 0.045483 * x164 + 0.00965 * x219
+    x902 = x189 * x24
+    x903 = 0.00965 * x119 + 0.00965 * x122 + x902
+    x904 = x123 * x901 + x220 * x903 + x24 * x900
+    x905 = x191 * x24
+    x906 = x902 - x905
+    x907 = x26 * x906
+    x908 = 0.063883 * x164 + x700
+    x909 = x45 * x908
+    x910 = x136 + 0.063883 * x226
+    x911 = x47 * x910
+    x912 = x24 * x909 - x24 * x911 + x907
+    x913 = x26 * x900
+    x914 = x129 * x901
+    x915 = x215 * x903
+    x916 = x913 + x914 + x915
+    x917 = x26 * x909
+    x918 = x24 * x906
+    x919 = x26 * x911
+    x920 = x917 - x918 - x919
+    x921 = x909 - x911
+    x922 = x118 * x901 + x120 * x903
+    x923 = 0.6781 * x94
+    x924 = x120 * x901
+    x925 = x118 * x903
+    x926 = x924 - x925
+    x927 = x47 * x908
+    x928 = x45 * x910
+    x929 = -x927 - x928
+    x930 = x893 + x894 - x896 + x898
+    x931 = x47 * x925
+    x932 = x47 * x924
+    x933 = x45 * x899
+    x934 = x931 - x932 + x933
+    x935 = x45 * x924
+    x936 = x45 * x925
+    x937 = x900 + x935 - x936
+    x938 = 0.015006 * x784
+    x939 = 0.015006 * x588
+    x940 = -x938 - x939
+    x941 = -x142 * x47 * x784 + x226 * x534 + x24 * x789
+    x942 = x217 * x811
+    x943 = x341 * x803
+    x944 = x360 * x804
+    x945 = x206 * x815
+    x946 = x217 * x818
+    x947 = x131 * x820
+    x948 = x3 * x7
+    x949 = x5 * x918
+    x950 = x51 * x908
+    x951 = x106 * x910
+    x952 = x206 * x899
+    x953 = x131 * x901
+    x954 = x217 * x903
+    x955 = 0.075478 * x24
+    x956 = 1.8e-5 * x26
+    x957 = -x955 + x956
+    x958 = x7 * x957
+    x959 = 0.00017505 * x784
+    x960 = x142 * x24
+    x961 = x51 * x788
+    x962 = x335 * x803 + x354 * x804 - x864
+    x963 = -x866 - x867 + x868
+    x964 = x927 + x928
+    x965 = -x931 + x932 - x933
+    x966 = x955 - x956
+    x967 = x795 + x796
+    x968 = 0.053028558 * x24
+    x969 = 0.071831133 * x24
+    x970 = 1.109031463125e-6 * x57
+    x971 = 0.387012824 * x24
+    x972 = 0.000206331435 * x45
+    x973 = 0.124859691 * x24
+    x974 = (
+        x151 * x972
+        + 0.0236742 * x151
+        - 0.0236742 * x152
+        - 0.0198886062 * x159
+        + 0.0198886062 * x160
+        + x186 * x788
+        + x187 * x908
+        + x188 * x910
+        + x194 * x906
+        + x212 * x815
+        + x229 * x973
+        + 0.002080193929 * x25 * x7
+        + x269 * x811
+        + x269 * x818
+        + 0.0012075857869362 * x3
+        + x302 * x901
+        + x303 * x820
+        + x304 * x903
+        + x305 * x899
+        + x306 * x972
+        + 0.015028425 * x306
+        + 0.0075142125 * x307
+        - 0.0075142125 * x308
+        - x35 * x971
+        + 0.0043228875 * x385
+        - 0.0043228875 * x386
+        + 0.008645775 * x387
+        + 0.08141975791312 * x39
+        + x432 * x803
+        + x434 * x804
+        - 0.003191325 * x435
+        + x454 * x811
+        + x454 * x818
+        - 0.0043228875 * x497
+        + x776 * x906
+        - x778 * x958
+        + x957 * x97
+    )
+    x975 = x47**2
+    x976 = 0.10593 * x975
+    x977 = x794 + x976
+    x978 = 0.00017505 * x164 + x26 * x794 + x26 * x976
+    x979 = 0.00017505 * x344
+    x980 = -0.00017505 * x266
+    x981 = x142 + x980
+    x982 = x121 * x976 + x123 * x981 - x220 * x979
+    x983 = 0.011402 * x332
+    x984 = 0.000281 * x326
+    x985 = 0.000281 * x120
+    x986 = x325 * x985
+    x987 = 0.011402 * x120
+    x988 = x333 * x987
+    x989 = x983 - x984 + x986 + x988
+    x990 = 0.011402 * x266 + 0.029798 * x326 - 0.029798 * x353
+    x991 = -0.000281 * x266 - 0.029798 * x332 - 0.029798 * x334
+    x992 = x220 * x989 + x330 * x990 + x351 * x991
+    x993 = x129 * x981
+    x994 = x127 * x976 - x215 * x979 + x993
+    x995 = x215 * x989
+    x996 = x339 * x990
+    x997 = x358 * x991
+    x998 = x995 + x996 + x997
+    x999 = x120 * x981
+    x1000 = x118 * x979 + x999
+    x1001 = x322 * x981
+    x1002 = x1001 - 0.10593 * x353
+    x1003 = x120**2
+    x1004 = 0.00017505 * x1003
+    x1005 = x1004 * x47
+    x1006 = -x1005
+    x1007 = x1006 + x118 * x981
+    x1008 = 0.5006 * x1007
+    x1009 = x322 * x990
+    x1010 = x324 * x991
+    x1011 = x1009 - x1010
+    x1012 = x322 * x991
+    x1013 = x324 * x990
+    x1014 = x1012 + x1013
+    x1015 = x324 * x981
+    x1016 = -x1015 - 0.10593 * x334
+    x1017 = -x1012 - x1013
+    x1018 = x118 * x142
+    x1019 = -x1018
+    x1020 = x1019 - x979
+    x1021 = x120 * x989
+    x1022 = x1009 * x118 - x1010 * x118 + x1021
+    x1023 = 0.5006 * x1022
+    x1024 = x120 * x142 + x980
+    x1025 = x118 * x989
+    x1026 = x1025 * x47
+    x1027 = x1026 + x441 * x991 + x446 * x990
+    x1028 = x142 * x344
+    x1029 = 0.00017505 * x118
+    x1030 = x120 * x975
+    x1031 = x1029 * x1030
+    x1032 = x47 * x999
+    x1033 = x1028 - x1031 - x1032
+    x1034 = -0.20843 * x333 - 0.20843 * x348
+    x1035 = -0.20843 * x325 + 0.20843 * x327
+    x1036 = x1025 * x45
+    x1037 = x328 * x990
+    x1038 = x349 * x991
+    x1039 = -x1036 + x1037 + x1038
+    x1040 = x1009 * x120
+    x1041 = x1010 * x120
+    x1042 = -x1025 + x1040 - x1041
+    x1043 = x118 * x45
+    x1044 = x45 * x999
+    x1045 = x1043 * x979 + x1044 + x120 * x976
+    x1046 = x1029 * x325 - 0.10593 * x333 - 0.10593 * x348
+    x1047 = -x1029 * x333 - 0.10593 * x325 + 0.10593 * x327
+    x1048 = 0.063883 * x975
+    x1049 = 0.063883 * x793
+    x1050 = 0.009432 * x47
+    x1051 = x1050 + x895
+    x1052 = x1051 * x26
+    x1053 = x1048 * x24 + x1049 * x24 + x1052
+    x1054 = x118 * x189
+    x1055 = x47 * x687
+    x1056 = -x1054 + x1055
+    x1057 = x1056 * x47
+    x1058 = -0.00965 * x266 + x897
+    x1059 = -0.00965 * x344 + x895
+    x1060 = x1057 * x24 + x1058 * x123 + x1059 * x220
+    x1061 = x1048 + x1049
+    x1062 = x1057 * x26
+    x1063 = x1058 * x129
+    x1064 = x1059 * x215
+    x1065 = x1062 + x1063 + x1064
+    x1066 = x1051 * x24
+    x1067 = x1048 * x26 + x1049 * x26 - x1066
+    x1068 = x1058 * x118 + x1059 * x120
+    x1069 = x1058 * x120
+    x1070 = x1059 * x118
+    x1071 = x1069 - x1070
+    x1072 = x1054 - x1055
+    x1073 = x1056 * x45
+    x1074 = x1070 * x47
+    x1075 = x1069 * x47
+    x1076 = x1073 + x1074 - x1075
+    x1077 = x1069 * x45
+    x1078 = x1070 * x45
+    x1079 = x1057 + x1077 - x1078
+    x1080 = x67 + x69
+    x1081 = x24 * x976 - x47 * x534 + x795
+    x1082 = 0.10593 * x344
+    x1083 = x131 * x981
+    x1084 = x217 * x989
+    x1085 = x341 * x990
+    x1086 = x360 * x991
+    x1087 = x1056 * x206
+    x1088 = x1058 * x131
+    x1089 = x1059 * x217
+    x1090 = x1066 * x5
+    x1091 = 0.063883 * x45
+    x1092 = 0.063883 * x47
+    x1093 = 0.10593 * x47
+    x1094 = 0.00017505 * x48
+    x1095 = x26 * x8
+    x1096 = -x1026 + x335 * x990 + x354 * x991
+    x1097 = -x1028 + x1031 + x1032
+    x1098 = -x1073 - x1074 + x1075
+    x1099 = 0.00028502849925 * x208
+    x1100 = 0.053028558 * x120
+    x1101 = 0.000206331435 * x47
+    x1102 = 8.763003e-5 * x47
+    x1103 = (
+        x1051 * x194
+        + x1051 * x776
+        + x1056 * x305
+        + x1058 * x302
+        + x1059 * x304
+        + x1100 * x412
+        - x1101 * x60
+        - x1101 * x94
+        - x1102 * x371
+        - x1102 * x511
+        - 2.512544616e-7 * x25
+        - 0.370536132 * x261
+        + 0.370536132 * x262
+        + x269 * x989
+        - 0.1846554453 * x272
+        + 0.1846554453 * x273
+        + x303 * x981
+        - 0.0040207725448136 * x38
+        - 0.104340058 * x413
+        + 0.104340058 * x414
+        + x432 * x990
+        + x434 * x991
+        + x454 * x989
+        - 0.141336383 * x489
+        + 0.141336383 * x490
+        - 0.104340058 * x523
+        + 0.0942803660835216 * x8
+    )
+    x1104 = 0.053028558 * x118
+    x1105 = x118 * x805
+    x1106 = x118 * x807
+    x1107 = -x1105 - x1106
+    x1108 = x118 * x324
+    x1109 = 0.029798 * x1108 + x987
+    x1110 = x118 * x322
+    x1111 = 0.029798 * x1110 - x985
+    x1112 = x1107 * x220 + x1109 * x330 + x1111 * x351
+    x1113 = 0.00017505 * x120
+    x1114 = x1029 * x220 - x1093 * x126 - x1113 * x123
+    x1115 = x118**2
+    x1116 = 0.00017505 * x1115
+    x1117 = -x1004 - x1116
+    x1118 = x1107 * x215
+    x1119 = x1109 * x339
+    x1120 = x1111 * x358
+    x1121 = x1118 + x1119 + x1120
+    x1122 = x1029 * x215 - x1113 * x129 - x47 * x813
+    x1123 = x1109 * x322
+    x1124 = x1111 * x324
+    x1125 = x1123 - x1124
+    x1126 = x1109 * x324
+    x1127 = x1111 * x322
+    x1128 = x1126 + x1127
+    x1129 = -x1126 - x1127
+    x1130 = x1107 * x120
+    x1131 = x1123 * x118 - x1124 * x118 + x1130
+    x1132 = 0.5006 * x1131
+    x1133 = 0.10593 * x1110 + x1113 * x324
+    x1134 = 0.10593 * x1108 - x1113 * x322
+    x1135 = x1107 * x118
+    x1136 = x1135 * x47
+    x1137 = x1109 * x446 + x1111 * x441 + x1136
+    x1138 = x1116 * x47
+    x1139 = x1005 + x1019 + x1138
+    x1140 = x1135 * x45
+    x1141 = x1109 * x328
+    x1142 = x1111 * x349
+    x1143 = -x1140 + x1141 + x1142
+    x1144 = x1123 * x120
+    x1145 = x1124 * x120
+    x1146 = -x1135 + x1144 - x1145
+    x1147 = -x1004 * x45 - x1116 * x45 - 0.10593 * x266
+    x1148 = -x902 + x905
+    x1149 = 0.045483 * x118
+    x1150 = 1.0e-6 * x120
+    x1151 = -x1149 - x1150
+    x1152 = x1151 * x47
+    x1153 = 0.00965 * x120
+    x1154 = 0.00965 * x118
+    x1155 = x1152 * x24 - x1153 * x123 + x1154 * x220
+    x1156 = -x189 + x191
+    x1157 = x1149 + x1150
+    x1158 = -x1050 - x895
+    x1159 = 0.00965 * x1115
+    x1160 = 0.00965 * x1003
+    x1161 = -x1159 - x1160
+    x1162 = -x136 * x47 + x45 * x700
+    x1163 = x1152 * x26
+    x1164 = -x1153 * x129 + x1154 * x215 + x1163
+    x1165 = x1159 * x47
+    x1166 = x1160 * x47
+    x1167 = x1151 * x45
+    x1168 = x1165 + x1166 + x1167
+    x1169 = x1152 - x1159 * x45 - x1160 * x45
+    x1170 = x1107 * x217
+    x1171 = x1109 * x341
+    x1172 = x1111 * x360
+    x1173 = 0.10593 * x118
+    x1174 = x1151 * x206
+    x1175 = x1109 * x335 + x1111 * x354 - x1136
+    x1176 = x1006 + x1018 - x1138
+    x1177 = -x1165 - x1166 - x1167
+    x1178 = x10 * x47
+    x1179 = x10 * x226
+    x1180 = (
+        0.00013072870670405 * x102
+        - 0.00013072870670405 * x107
+        - x1104 * x205
+        + x1107 * x269
+        + x1107 * x454
+        + x1109 * x432
+        + x1111 * x434
+        + x1151 * x305
+        + 0.000459361674330197 * x38
+        - 0.000459361674330197 * x39
+        + 0.00017526006 * x392
+        - 0.00017526006 * x393
+        + 0.006662366405 * x406
+        - 0.006662366405 * x407
+        + 4.33190623e-8 * x46
+        + 0.00017526006 * x514
+        + 8.763003e-5 * x518
+        - 8.763003e-5 * x519
+        + 4.33190623e-8 * x52
+    )
+    x1181 = 0.011402 * x324
+    x1182 = 0.000281 * x322
+    x1183 = x1181 - x1182
+    x1184 = 0.029798 * x322
+    x1185 = 0.029798 * x324
+    x1186 = x1183 * x220 + x1184 * x330 - x1185 * x351
+    x1187 = x324**2
+    x1188 = 0.029798 * x1187
+    x1189 = x322**2
+    x1190 = 0.029798 * x1189
+    x1191 = x1188 + x1190
+    x1192 = -0.10593 * x126 + x127 * x142
+    x1193 = x1183 * x215
+    x1194 = x1184 * x339 - x1185 * x358 + x1193
+    x1195 = x1183 * x120
+    x1196 = x118 * x1188 + x118 * x1190 + x1195
+    x1197 = 0.5006 * x1196
+    x1198 = x118 * x1183
+    x1199 = x1198 * x47
+    x1200 = x1184 * x446 - x1185 * x441 + x1199
+    x1201 = x1188 * x120 + x1190 * x120 - x1198
+    x1202 = x1198 * x45
+    x1203 = x1184 * x328 - x1185 * x349 - x1202
+    x1204 = -x685 + x687
+    x1205 = -x119 * x895 - 1.0e-6 * x121 - 0.045483 * x126 + x127 * x897
+    x1206 = -x118 * x895 + x120 * x897
+    x1207 = x1183 * x217
+    x1208 = x1184 * x335 - x1185 * x354 - x1199
+    x1209 = x10 * x344
+    x1210 = (
+        0.008661102849889 * x102
+        + x1183 * x269
+        + x1183 * x454
+        + 6.543665e-9 * x124
+        + 6.543665e-9 * x132
+        + 0.008661102849889 * x210
+        - 0.0005849081642729 * x218
+        - 0.0005849081642729 * x221
+        - 0.0679454368 * x508
+        + 0.0679454368 * x509
+    )
+    x1211 = x806 + x808 + x809 - x810
+    x1212 = -x1181 + x1182
+    x1213 = x805 + x807
+    x1214 = -x126 * x805 - x126 * x807 + 0.011402 * x338 - 0.000281 * x357
+    x1215 = x322 * x987 + x324 * x985
+    x1216 = x1105 + x1106
+    x1217 = 0.5006 * x1216
+    x1218 = -x983 + x984 - x986 - x988
+    x1219 = -0.011402 * x325 + x326 * x987 + x332 * x985 + 0.000281 * x333
+    x1220 = (
+        0.000674120333239 * x218
+        + 0.000674120333239 * x221
+        - 1.1916429428e-6 * x331
+        - 1.1916429428e-6 * x342
+        - 5.20822520776e-5 * x352
+        - 5.20822520776e-5 * x361
+    )
+    x1221 = -3.0e-6 * x476 - 3.0e-6 * x477
+    x1222 = (
+        x1221 + 0.000118 * x317 - 0.000118 * x318 - 0.000369 * x484 - 0.000369 * x485
+    )
+    x1223 = (
+        3.0e-6 * x317
+        - 3.0e-6 * x318
+        - 0.000587 * x476
+        - 0.000587 * x477
+        - 3.0e-6 * x484
+        - 3.0e-6 * x485
+    )
+    x1224 = 0.000278 * x199 + 0.00041 * x317 - 0.00041 * x318 - 0.000278 * x49
+    x1225 = (
+        x1221 + 0.000609 * x317 - 0.000609 * x318 - 0.000118 * x484 - 0.000118 * x485
+    )
+    x1226 = -0.001641 * x377 - 0.001641 * x378
+    x1227 = -0.001641 * x199 - 0.000278 * x317 + 0.000278 * x318 + 0.001641 * x49
+    x1228 = 0.001607 * x199 - 0.001607 * x49 + 0.000256 * x543
+    x1229 = -0.001596 * x104 - 0.001596 * x237
+    x1230 = 0.0005 * x5
+    x1231 = -x1230 + x136 * x7 + 0.000631 * x543
+    x1232 = 0.000256 * x26
+    x1233 = x1232 * x48 - 0.000256 * x49 + 0.000399 * x543
+    x1234 = -0.008147 * x561 - x696
+    x1235 = 1.1787 * x551
+    x1236 = 1.1787 * x545
+    x1237 = 1.1787 * x540
+    x1238 = 0.105316228 * x5
+    x1239 = 0.390633584 * x5
+    x1240 = 1.8568 * x551
+    x1241 = 0.5006 * x551
+    x1242 = 0.5006 * x586
+    x1243 = 0.5006 * x583
+    x1244 = 0.5006 * x545
+    x1245 = 0.5006 * x573
+    x1246 = 0.5006 * x540
+    x1247 = 0.5006 * x574
+    x1248 = 0.5006 * x585
+    x1249 = 0.5006 * x579
+    x1250 = 0.142658678 * x5
+    x1251 = 0.6781 * x551
+    x1252 = 0.6781 * x683
+    x1253 = 0.6781 * x684
+    x1254 = 0.6781 * x691
+    x1255 = 0.6781 * x694
+    x1256 = 0.6781 * x545
+    x1257 = 0.6781 * x702
+    x1258 = 0.6781 * x697
+    x1259 = 0.6781 * x540
+    x1260 = 0.195695476 * x5
+    x1261 = 0.9302 * x731
+    x1262 = 0.9302 * x733
+    x1263 = 0.9302 * x758
+    x1264 = 0.247974906 * x5
+    x1265 = 0.003191325 * x7
+    x1266 = 0.105316228 * x7
+    x1267 = 0.142658678 * x7
+    x1268 = 0.005930025 * x7
+    x1269 = 0.195695476 * x7
+    x1270 = 0.247974906 * x7
+    x1271 = 0.008316 * x5 - 0.0005 * x543
+    x1272 = 0.104340058 * x561
+    x1273 = 0.141336383 * x561
+    x1274 = 0.245676441 * x561
+    x1275 = 0.003191325 * x561
+    x1276 = 0.0118371 * x561
+    x1277 = 0.0043228875 * x561
+    x1278 = x377 + x378
+    x1279 = 0.6781 * x536
+    x1280 = 0.005426895410856 * x5
+    x1281 = (
+        x1236 * x788
+        + x1242 * x820
+        + x1243 * x815
+        + x1245 * x803
+        + x1247 * x804
+        + x1248 * x811
+        + x1248 * x818
+        + x1249 * x811
+        + x1249 * x818
+        + x1252 * x903
+        + x1253 * x901
+        + x1254 * x899
+        + x1255 * x908
+        + x1257 * x906
+        + x1258 * x910
+        + x1263 * x957
+        - x1280 * x588
+        - x1280 * x784
+        - 1.315362898125e-6 * x237 * x24
+        - 0.08081600593132 * x24 * x561
+        - 4.34080072953e-5 * x49 * x784
+        - 0.0055449842710128 * x5
+        + x537 * x972
+        + 0.015028425 * x537
+        + 0.0075142125 * x542
+        - 0.16283951582624 * x543
+        - 0.0075142125 * x547
+        + x558 * x973
+        - 0.0236742 * x592
+        - 0.003191325 * x599
+        + 2.38070011648e-5 * x7
+        - 0.0043228875 * x707
+        - 0.0043228875 * x709
+        + 0.0043228875 * x710
+        + 0.008645775 * x711
+        - 0.0198886062 * x735
+        + 0.0198886062 * x736
+        - x780 * x907
+        - 0.142658678 * x949
+    )
+    x1282 = 0.01115614803204 * x206
+    x1283 = (
+        4.34080072953e-5 * x104 * x24
+        + x1051 * x1257
+        - x1052 * x780
+        + x1056 * x1254
+        + x1058 * x1253
+        + x1059 * x1252
+        - 0.142658678 * x1090
+        + x1100 * x584
+        - x1101 * x536
+        - x1102 * x604
+        - x1102 * x639
+        + x1242 * x981
+        + x1245 * x990
+        + x1247 * x991
+        + x1248 * x989
+        + x1249 * x989
+        + 1.315362898125e-6 * x199
+        + 0.0942803660835216 * x5
+        - 0.370536132 * x541
+        + 0.370536132 * x546
+        - 0.104340058 * x659
+        - 0.104340058 * x661
+        + 0.104340058 * x662
+        + 0.1846554453 * x695
+        - 0.1846554453 * x698
+        - 0.141336383 * x727
+        + 0.141336383 * x728
+    )
+    x1284 = x103 * x24
+    x1285 = (
+        -4.33190623e-8 * x104
+        - x1104 * x583
+        + x1107 * x1248
+        + x1107 * x1249
+        + x1109 * x1245
+        + x1111 * x1247
+        + x1151 * x1254
+        + 0.00013072870670405 * x49
+        + 0.000459361674330197 * x543
+        + 0.00017526006 * x616
+        - 0.00017526006 * x617
+        + 0.00017526006 * x644
+        + 8.763003e-5 * x672
+        - 8.763003e-5 * x673
+        + 0.006662366405 * x716
+        - 0.006662366405 * x717
+    )
+    x1286 = 0.00033805705725 * x119
+    x1287 = x127 * x48
+    x1288 = (
+        x1183 * x1248
+        + x1183 * x1249
+        - 0.008661102849889 * x199
+        - 0.0005849081642729 * x317
+        + 0.0005849081642729 * x318
+        - 6.543665e-9 * x377
+        - 6.543665e-9 * x378
+        + 0.008661102849889 * x49
+        - 0.0679454368 * x622
+        + 0.0679454368 * x623
+    )
+    x1289 = (
+        0.000674120333239 * x317
+        - 0.000674120333239 * x318
+        + 1.1916429428e-6 * x476
+        + 1.1916429428e-6 * x477
+        + 5.20822520776e-5 * x484
+        + 5.20822520776e-5 * x485
+    )
+    x1290 = 0.000631 * x26 - x99
+    x1291 = -x136 + 0.008147 * x24
+    x1292 = x1232 - 0.001607 * x164
+    x1293 = -0.000256 * x164 + 0.000399 * x26
+    x1294 = 3.0e-6 * x322
+    x1295 = x119 * x1294 + 3.0e-6 * x329
+    x1296 = (
+        0.000118 * x127 + x1295 - 0.000118 * x219 - 0.000369 * x347 + 0.000369 * x350
+    )
+    x1297 = 3.0e-6 * x324
+    x1298 = (
+        -x119 * x1297
+        + 3.0e-6 * x127
+        - 3.0e-6 * x219
+        + 0.000587 * x323
+        + 0.000587 * x329
+        + 3.0e-6 * x350
+    )
+    x1299 = 0.00041 * x127 - 0.000278 * x164 - 0.00041 * x219
+    x1300 = (
+        0.000609 * x127 + x1295 - 0.000609 * x219 - 0.000118 * x347 + 0.000118 * x350
+    )
+    x1301 = 0.001641 * x45
+    x1302 = 0.001641 * x119 + x121 * x1301
+    x1303 = 0.000278 * x45
+    x1304 = x126 * x1303 - 0.000278 * x127 + 0.001641 * x164
+    x1306 = 1.1787 * x788
+    x1307 = 0.003191325 * x24
+    x1308 = 0.5006 * x788
+    x1309 = 0.5006 * x820
+    x1310 = 0.5006 * x815
+    x1311 = 0.5006 * x803
+    x1312 = 0.5006 * x804
+    x1313 = 0.5006 * x818
+    x1314 = 0.5006 * x811
+    x1315 = 0.0043228875 * x24
+    x1316 = 0.6781 * x908
+    x1317 = 0.6781 * x910
+    x1318 = 0.6781 * x788
+    x1319 = 0.6781 * x903
+    x1320 = 0.6781 * x901
+    x1321 = 0.6781 * x899
+    x1322 = 0.6781 * x906
+    x1323 = 0.104340058 * x24
+    x1325 = 0.003191325 * x26
+    x1326 = 0.141336383 * x24
+    x1327 = 0.245676441 * x24
+    x1328 = 0.0043228875 * x26
+    x1329 = 0.0075142125 * x26
+    x1330 = 0.053028558 * x226
+    x1332 = 0.000118701405 * x226
+    x1333 = 0.071831133 * x226
+    x1334 = 8.763003e-5 * x226
+    x1336 = 0.124859691 * x226
+    x1337 = x26 * x45
+    x1338 = -x119 - x122
+    x1339 = x164 * x45
+    x1340 = 0.0010721395522875 * x26
+    x1341 = (
+        x1051 * x1322
+        + x1056 * x1321
+        + x1058 * x1320
+        + x1059 * x1319
+        - 0.0043228875 * x1062
+        + 0.008645775 * x1066
+        + x1100 * x816
+        - x1102 * x834
+        - x1102 * x858
+        - 0.00561731514894 * x122 * x47
+        - 0.00033805705725 * x127 * x975
+        + x1309 * x981
+        + x1311 * x990
+        + x1312 * x991
+        + x1313 * x989
+        + x1314 * x989
+        - x1340 * x793
+        - x1340 * x975
+        - 2.63072579625e-6 * x164
+        - 3.579949116e-7 * x24
+        - 0.0069355657247636 * x26
+        + 0.370536132 * x789
+        - 0.104340058 * x875
+        - 0.104340058 * x877
+        + 0.104340058 * x878
+        + 0.1846554453 * x909
+        - 0.1846554453 * x911
+        + 0.141336383 * x935
+        - 0.141336383 * x936
+    )
+    x1342 = x26 * x47
+    x1343 = (
+        -x1104 * x815
+        + x1107 * x1313
+        + x1107 * x1314
+        + x1109 * x1311
+        + x1111 * x1312
+        + x1151 * x1321
+        - 0.0043228875 * x1163
+        + x1286 * x47
+        + 0.00561731514894 * x219
+        + 0.000459361674330197 * x26
+        + 0.00017526006 * x837
+        - 0.00017526006 * x838
+        + 0.00017526006 * x863
+        + 8.763003e-5 * x880
+        - 8.763003e-5 * x881
+        - 0.006662366405 * x924
+        + 0.006662366405 * x925
+    )
+    x1344 = x121 * x47
+    x1345 = (
+        x1183 * x1313
+        + x1183 * x1314
+        + 6.543665e-9 * x119
+        - 0.0005849081642729 * x127
+        + 0.008661102849889 * x164
+        - 0.0679454368 * x843
+        + 0.0679454368 * x844
+    )
+    x1346 = (
+        0.000674120333239 * x127
+        - 0.000674120333239 * x219
+        - 1.1916429428e-6 * x323
+        - 1.1916429428e-6 * x329
+        + 5.20822520776e-5 * x347
+        - 5.20822520776e-5 * x350
+    )
+    x1347 = x1301 - 0.000278 * x266
+    x1348 = -x1303 + 0.00041 * x266
+    x1349 = 3.0e-6 * x120
+    x1350 = -x1349 * x333 - 3.0e-6 * x332
+    x1351 = x1350 + 0.000118 * x266 - 0.000369 * x326 + 0.000369 * x353
+    x1352 = (
+        x1349 * x325 + 3.0e-6 * x266 - 3.0e-6 * x326 - 0.000587 * x332 - 0.000587 * x334
+    )
+    x1353 = 0.000118 * x120
+    x1354 = x1350 + x1353 * x325 + 0.000609 * x266 - 0.000118 * x326
+    x1355 = 0.053028558 * x45
+    x1356 = 0.5006 * x981
+    x1357 = 0.5006 * x990
+    x1358 = 0.5006 * x991
+    x1359 = 0.5006 * x989
+    x1360 = 0.071831133 * x45
+    x1363 = 0.6781 * x1059
+    x1364 = 0.6781 * x1058
+    x1365 = 0.6781 * x1056
+    x1366 = 0.053028558 * x47
+    x1368 = 0.000118701405 * x47
+    x1369 = 0.071831133 * x47
+    x1372 = 0.053028558 * x344
+    x1374 = 8.763003e-5 * x344
+    x1375 = x118 * x344
+    x1376 = 0.0013821608231029 * x45
+    x1377 = (
+        -x1003 * x1376
+        + 0.00017526006 * x1025
+        - 8.763003e-5 * x1040
+        + 8.763003e-5 * x1041
+        - 0.006662366405 * x1069
+        + 0.006662366405 * x1070
+        - x1102 * x1130
+        + x1107 * x1359
+        + x1109 * x1357
+        + x1111 * x1358
+        - x1115 * x1376
+        - 0.104340058 * x1140
+        + x1151 * x1365
+        - 0.01667005749288 * x266
+        + 0.001420807810163 * x45
+        - 1.846554453e-7 * x47
+        - 0.00017526006 * x999
+    )
+    x1378 = x120 * x45
+    x1379 = (
+        0.0679454368 * x1009
+        - 0.0679454368 * x1010
+        - x1102 * x1195
+        + x1183 * x1359
+        - 0.104340058 * x1202
+        + 0.008661102849889 * x45
+    )
+    x1380 = 0.000674120333239 * x266 + 5.20822520776e-5 * x326 + 1.1916429428e-6 * x332
+    x1381 = 3.0e-6 * x1110
+    x1382 = -0.000369 * x1108 + x1353 + x1381
+    x1383 = -3.0e-6 * x1108 + 0.000587 * x1110 + x1349
+    x1384 = -0.000118 * x1108 + 0.000609 * x120 + x1381
+    x1387 = 0.5006 * x1109
+    x1388 = 0.5006 * x1111
+    x1389 = 0.5006 * x1107
+    x1394 = 8.763003e-5 * x120
+    x1397 = 2.61119963394e-6 * x120
+    x1398 = (
+        0.0679454368 * x1123
+        - 0.0679454368 * x1124
+        + 6.662366405e-9 * x118
+        + x1183 * x1389
+        - x1187 * x1397
+        - x1189 * x1397
+        + 0.00017526006 * x1198
+        - 0.000599589709354415 * x120
+    )
+    x1399 = 0.000674120333239 * x120
+    x1400 = x120 * x324
+    x1401 = x120 * x322
+    x1402 = -x1294 - 0.000587 * x324
+    x1403 = -x1297
+    x1405 = x1403 - 0.000369 * x322
+    x1411 = 0.0006567138703936 * x322 + 1.60926677408e-5 * x324
+
+    mass_packed = numpy.array(
+        [
+            0.0273446 * x1 * x12
+            + x1 * (0.011088 * x1 + 5.0e-6 * x3)
+            - 0.58632906 * x1 * (-x1 * x41 - x19 * x7)
+            + x10 * x11
+            + 0.58632906 * x10 * x32
+            - 0.390633584 * x10 * x35
+            + x10 * x37
+            + x101 * x28
+            + x110 * x86
+            + x110 * x87
+            + x112 * x86
+            + x112 * x87
+            + x114 * x115
+            + x114 * x116
+            - x13 * x8
+            + 1.53396367515e-8 * x133**2
+            + x133 * x249
+            + x134 * x137
+            + x134 * x158
+            + 0.00561731514894 * x138**2
+            + x139 * x140
+            + x139 * x150
+            + 1.1636 * x14 * x40
+            + x141 * x53
+            - x145 * x149
+            - x15 * x16
+            + x153 * x154
+            + x156 * x157
+            + x156 * x188
+            + x157 * x168
+            + x157 * x197
+            + x157 * x202
+            + x16 * x22
+            + x161 * x162
+            + x168 * x188
+            - x169 * x170
+            - x172 * x176
+            - x177 * x178
+            + x179 * x180
+            - x183 * (-x181 + x182 + x36)
+            - x184 * (x151 * x7 - x152 * x7 + x35 * x5)
+            + x185 * x186
+            + x185 * x187
+            + x186 * x228
+            + x186 * x236
+            + x186 * x239
+            + x187 * x228
+            + x187 * x236
+            + x187 * x239
+            + x188 * x197
+            + x188 * x202
+            + 2.787 * x19 * x40
+            - x192 * x193
+            + 1.3562 * x192 * x60
+            + x194 * x61
+            + x194 * x92
+            + x194 * x93
+            + 0.0004175274375 * x2 * x5
+            + 0.123465173064675 * x2 * x6
+            + 0.175655079983077 * x2
+            - 0.02996025 * x20 * x3
+            - x205 * x209
+            + 1.1636 * x21 * x32
+            + x211 * x212
+            + x211 * x305
+            + x212 * x223
+            + x212 * x233
+            + x212 * x244
+            + x212 * x248
+            + x212 * x507
+            + x222 * x265
+            + x223 * x305
+            + x224 * x225
+            + x225 * x503
+            + x231 * x232
+            + x233 * x305
+            - x240 * (-x159 * x7 + x160 * x7 + x5 * x71)
+            - x243 * (x241 - x242 + x73)
+            + x244 * x305
+            + x245 * x246
+            + x248 * x305
+            + x252 * x253
+            + x253 * x483
+            - x254 * x258
+            + x254 * x260
+            + x254 * x316
+            + 1.0012 * x254 * x430
+            - x258 * x430
+            + x259 * x304
+            + x260 * x430
+            + x263 * x264
+            + x268 * x269
+            + x268 * x304
+            + x268 * x454
+            + x269 * x282
+            + x269 * x320
+            + x270 * x271
+            + x271 * x488
+            + x274 * x275
+            + x275 * x492
+            + x277 * x278
+            + x277 * x283
+            + 7.54615125e-5 * x28**2
+            + x282 * x304
+            + x282 * x454
+            + x284 * x285
+            + x284 * x469
+            - x286 * x290
+            + 0.08066508290632 * x29**2
+            - x291 * x292
+            - x293 * x294
+            - x299 * x300
+            + 0.0008025337564374 * x3**2
+            - 0.0199606 * x3 * x36
+            - 0.00999965 * x3 * x73
+            + x3 * (5.0e-6 * x1 + 0.001072 * x3)
+            + x3 * (-7.0e-6 * x10 + 0.001043 * x3 - 0.000606 * x8)
+            + x301 * x302
+            + x301 * x303
+            + x302 * x346
+            + x302 * x370
+            + x302 * x376
+            + x302 * x380
+            + x303 * x346
+            + x303 * x370
+            + x303 * x376
+            + x303 * x380
+            + x303 * x510
+            + x304 * x315
+            + x304 * x320
+            + x309 * x310
+            + x311 * x312
+            + x316 * x430
+            + x320 * x454
+            + x343 * x494
+            + 1.8568 * x35 * x54
+            - x362 * (x145 * x200 + x172 * x238 + x306 * x7)
+            - x366 * (-x363 + x364 + x365)
+            + x373 * x60
+            + x373 * x94
+            + x382 * x383
+            + x382 * x384
+            + x383 * x493
+            + x384 * x493
+            + x388 * x389
+            + x389 * x498
+            + x391 * x60
+            + x391 * x94
+            + x394 * x395
+            + x395 * x520
+            - x396 * (x169 * x200 + x177 * x238 + x387 * x7)
+            - x396 * (x247 * x299 + x286 * x379 + x293 * x319)
+            - x400 * (x397 + x398 - x399)
+            - x400 * (x504 + x505 + x506)
+            + x404 * x405
+            + x405 * x516
+            + x408 * x409
+            + x410 * x411
+            + x411 * x517
+            + x415 * x416
+            + x416 * x524
+            + x417 * x418
+            + x417 * x419
+            + x418 * x525
+            + x419 * x525
+            - x42 * (-x18 * x5 + x20)
+            - x420 * x424
+            - x425 * x429
+            + x43 * x8
+            + x431 * x432
+            + x432 * x449
+            + x432 * x451
+            + x432 * x466
+            + x432 * x475
+            + x432 * x479
+            + x433 * x434
+            + x434 * x444
+            + x434 * x453
+            + x434 * x458
+            + x434 * x472
+            + x434 * x487
+            + x438 * x439
+            + x439 * x529
+            - x462 * (x459 + x460 + x461)
+            - x462 * (x530 + x531 + x532)
+            - x467 * (x205 * x247 + x254 * x319 + x291 * x379)
+            - x467 * (x319 * x430 + x420 * x478 + x425 * x486)
+            + x499 * x500
+            + x513 * x60
+            + x513 * x94
+            + 0.0132264231859477 * x53**2
+            + x54 * x97
+            - 0.0099803 * x57 * x60
+            + 2.3574 * x60 * x94
+            + x61 * x62
+            + x61 * x90
+            + x61 * x96
+            + x62 * x92
+            + x62 * x93
+            - x63 * (x15 - x22)
+            - x64 * (-x14 * x7 - x21 * x5)
+            - x71 * x72
+            + x72 * x74
+            - x75 * x79
+            + 0.006303037395 * x8 * x9
+            - x82 * x83
+            + x85 * x86
+            + x85 * x87
+            - x88 * x89
+            + x90 * x92
+            + x90 * x93
+            + x92 * x96
+            + x93 * x96
+            - x94 * x95
+            + 0.01153846285904 * (-x1 + 0.000441855794336212 * x3) ** 2
+            + 5.13181123316e-5 * (-x10 - 0.00662550820659539 * x8) ** 2
+            + 0.0161723221354304 * (x10 - 0.000373222949818478 * x3) ** 2
+            + 0.0002094624694872 * (x28 - 0.00119952019192323 * x8) ** 2
+            + 0.1233519076428 * (-0.0303023101055233 * x3 + x8) ** 2
+            + 0.0161723221354304 * (0.0563312184032844 * x3 + x8) ** 2
+            + 6.314636725e-5
+            * (0.000103626943005181 * x102 + x133 + 0.000103626943005181 * x210) ** 2
+            + 0.01322638706763
+            * (x108 - 0.00165250637213254 * x38 + 0.00165250637213254 * x39) ** 2
+            + 0.0027673516569109
+            * (x108 + 0.147644913357231 * x38 - 0.147644913357231 * x39) ** 2
+            + 0.0014027877002709
+            * (x138 - 2.19862366158785e-5 * x218 - 2.19862366158785e-5 * x221) ** 2
+            + 0.0014027877002709
+            * (-0.212167183343227 * x218 - 0.212167183343227 * x221 + x222) ** 2
+            + 0.0004444931544824
+            * (-0.00943016309819451 * x218 - 0.00943016309819451 * x221 + x343) ** 2
+            + 0.00561731514894
+            * (-0.00165250637213254 * x218 - 0.00165250637213254 * x221 + x222) ** 2
+            + 0.0052992828758168
+            * (x29 + 0.000238480086912743 * x38 - 0.000238480086912743 * x39) ** 2
+            + 0.0052992828758168
+            * (-0.198812899122923 * x38 + 0.198812899122923 * x39 + x8) ** 2
+            + 0.08066508290632
+            * (-0.0305858081850022 * x38 + 0.0305858081850022 * x39 + x8) ** 2
+            + 0.0027673516569109
+            * (1.56536167681543e-5 * x38 - 1.56536167681543e-5 * x39 + x53) ** 2
+            + 6.03255553344e-5
+            * (0.000106022052586938 * x102 - 0.000106022052586938 * x107 - x46 - x52)
+            ** 2
+            + 0.0004444931544824
+            * (0.382643130411437 * x218 + 0.382643130411437 * x221 - x352 - x361) ** 2
+            + 6.50808053624e-5
+            * (-x331 - x342 + 0.0246447991580424 * x352 + 0.0246447991580424 * x361)
+            ** 2
+            + 0.0017046923937075,
+            -x101 * x561
+            - x11 * x7
+            + x115 * x591
+            + x116 * x591
+            - x13 * x5
+            + x137 * x543
+            + x140 * x734
+            + x141 * x238
+            - x149 * x540
+            + x150 * x734
+            + x154 * x593
+            + x157 * x557
+            + x157 * x567
+            + x157 * x570
+            + x158 * x543
+            + x162 * x737
+            - x170 * x697
+            - x176 * x545
+            - x178 * x694
+            + x180 * x200
+            - x183 * (x562 * x748 + 0.20843 * x747 + x749)
+            - x184 * (x549 * x561 - x568 * x747 - x592 * x7)
+            + x186 * x553
+            + x186 * x571
+            + x186 * x572
+            + x187 * x553
+            + x187 * x571
+            + x187 * x572
+            + x188 * x557
+            + x188 * x567
+            + x188 * x570
+            - x193 * x702
+            + x194 * x564
+            - x209 * x583
+            + x212 * x603
+            + x212 * x628
+            + x212 * x633
+            + x212 * x643
+            + x212 * x651
+            + x225 * x615
+            + x225 * x642
+            + x232 * x770
+            - x240 * (x5 * x758 - x7 * x735 + x7 * x736)
+            - x243 * (x759 + x760 - x761)
+            + x246 * x560
+            + x247 * x265
+            + x249 * x379
+            + x253 * x767
+            + x253 * x768
+            - x258 * x579
+            - x258 * x585
+            + x264 * x554
+            + x269 * x609
+            + x269 * x631
+            + x269 * x635
+            + x269 * x638
+            + x271 * x721
+            + x271 * x726
+            + x275 * x713
+            + x275 * x729
+            + x278 * x739
+            + x283 * x739
+            + x285 * x319
+            - x290 * x684
+            - x292 * x586
+            - x294 * x683
+            - x300 * x691
+            + x302 * x612
+            + x302 * x632
+            + x302 * x677
+            + x302 * x679
+            + x303 * x612
+            + x303 * x624
+            + x303 * x632
+            + x303 * x677
+            + x303 * x679
+            + x304 * x609
+            + x304 * x631
+            + x304 * x635
+            + x304 * x638
+            + x305 * x603
+            + x305 * x633
+            + x305 * x643
+            + x305 * x651
+            + x310 * x548
+            + x312 * x722
+            + x319 * x469
+            + 0.781267168 * x36
+            - x362 * (x200 * x540 + x238 * x545 + x537 * x7)
+            - x366 * (-x762 + x763 + x764)
+            + x383 * x693
+            + x383 * x704
+            + x384 * x693
+            + x384 * x704
+            + x389 * x708
+            + x389 * x712
+            + x395 * x618
+            + x395 * x674
+            - x396 * (x200 * x697 + x238 * x694 + x7 * x711)
+            - x396 * (x247 * x691 + x319 * x683 + x379 * x684)
+            - x400 * (x750 + x751 + x752)
+            - x400 * (-x753 + x754 + x755)
+            + x405 * x765
+            + x405 * x766
+            + x409 * x718
+            + x411 * x646
+            + x411 * x650
+            + x416 * x660
+            + x416 * x663
+            + x418 * x580
+            + x418 * x587
+            + x419 * x580
+            + x419 * x587
+            - x42 * (x41 + 0.21038 * x740)
+            - x424 * x573
+            - x429 * x574
+            + x43 * x5
+            + x432 * x621
+            + x432 * x630
+            + x432 * x656
+            + x432 * x671
+            + x432 * x676
+            + x434 * x627
+            + x434 * x629
+            + x434 * x654
+            + x434 * x667
+            + x434 * x675
+            + x439 * x598
+            + x439 * x602
+            + x454 * x609
+            + x454 * x631
+            + x454 * x635
+            + x454 * x638
+            - x462 * (x741 + x742 + x743)
+            - x462 * (x744 + x745 + x746)
+            - x467 * (x247 * x583 + x319 * x585 + x379 * x586)
+            - x467 * (x319 * x579 + x478 * x573 + x486 * x574)
+            + x478 * x494
+            + x486 * x500
+            - x536 * x95
+            - x551 * x83
+            + 6.36244125e-5 * x561 * x57
+            + x564 * x62
+            + x564 * x90
+            + x564 * x96
+            + x594 * x86
+            + x594 * x87
+            + x60 * x606
+            + x60 * x641
+            + x60 * x715
+            + x606 * x94
+            - x63 * (0.117892 * x6 + 0.117892 * x740)
+            + x641 * x94
+            + x715 * x94
+            + x72 * x769
+            + 0.391390952 * x73
+            - x731 * x79
+            - x733 * x89
+            - 0.246817080707475 * x771
+            + x783,
+            -1.30358817728e-5 * x10
+            + x101 * x24
+            + x123 * x249
+            + x137 * x26
+            + x141 * x226
+            - 0.000671120839125 * x148 * x226
+            + x154 * x823
+            + x157 * x801
+            + x158 * x26
+            + x162 * x940
+            - x164 * x180
+            + x164 * x265
+            - x170 * x910
+            - x176 * x788
+            - x178 * x908
+            - x183 * (-x5 * x589 - x5 * x822 - 0.20843 * x543)
+            - x184 * (-x24 * x549 + x590 + x7 * x822)
+            + x186 * x802
+            + x187 * x802
+            + x188 * x801
+            - x193 * x906
+            - x209 * x815
+            + x212 * x854
+            + x212 * x870
+            + x220 * x285
+            + x220 * x469
+            + x225 * x848
+            + x225 * x861
+            - x226 * x970
+            + x232 * x967
+            - 0.00013865178645 * x24 * x57
+            - x240 * (x5 * x957 + x7 * x938 + x7 * x939)
+            - x243 * (-x5 * x938 - x5 * x939 + x958)
+            + x246 * x797
+            + x253 * x964
+            + x253 * x965
+            - x258 * x811
+            - x258 * x818
+            + 0.00013865178645 * x26 * x78
+            + x264 * x792
+            + x269 * x850
+            + x269 * x855
+            + x269 * x857
+            + x271 * x929
+            + x271 * x934
+            + x275 * x921
+            + x275 * x937
+            + x278 * x941
+            + x283 * x941
+            - x290 * x901
+            - x292 * x820
+            - x294 * x903
+            - x300 * x899
+            + x302 * x833
+            + x302 * x862
+            + x302 * x883
+            + x303 * x833
+            + x303 * x845
+            + x303 * x862
+            + x303 * x883
+            + x304 * x850
+            + x304 * x855
+            + x304 * x857
+            + x305 * x870
+            + x310 * x791
+            + x312 * x930
+            + x330 * x494
+            + x351 * x500
+            - x362 * (x103 * x959 + x200 * x960 + x238 * x788)
+            - x366 * (x106 * x960 - x49 * x959 + x961)
+            + x383 * x904
+            + x383 * x912
+            + x384 * x904
+            + x384 * x912
+            + x389 * x916
+            + x389 * x920
+            + x395 * x839
+            + x395 * x882
+            - x396 * (x200 * x910 + x238 * x908 + x7 * x918)
+            - x396 * (x247 * x899 + x319 * x903 + x379 * x901)
+            - x400 * (-x949 + x950 + x951)
+            - x400 * (x952 + x953 + x954)
+            - x401 * x968
+            + x405 * x962
+            + x405 * x963
+            + x409 * x926
+            + x411 * x865
+            + x411 * x869
+            + x416 * x876
+            + x416 * x879
+            + x418 * x812
+            + x418 * x821
+            + x419 * x812
+            + x419 * x821
+            - x424 * x803
+            - x429 * x804
+            + x432 * x842
+            + x432 * x872
+            + x432 * x886
+            + x432 * x890
+            + x434 * x853
+            + x434 * x871
+            + x434 * x885
+            + x434 * x892
+            + x439 * x827
+            + x439 * x831
+            + x454 * x850
+            + x454 * x855
+            + x454 * x857
+            - x462 * (x942 + x943 + x944)
+            - x462 * (x945 + x946 + x947)
+            - x467 * (x247 * x815 + x319 * x818 + x379 * x820)
+            - x467 * (x319 * x811 + x478 * x803 + x486 * x804)
+            - x482 * x969
+            + x60 * x836
+            + x60 * x860
+            - x63 * (0.006641 * x5 + 4.4e-5 * x7)
+            - x64 * (-x773 + x774)
+            + x72 * x966
+            + x776 * x922
+            - 0.0071706889047008 * x8
+            + x836 * x94
+            + x860 * x94
+            + 0.0001672285804 * x9
+            + x922 * x923
+            - 2.751914e-7 * x948
+            + x974,
+            x1000 * x395
+            + x1002 * x432
+            + x1008 * x60
+            + x1008 * x94
+            + x1011 * x303
+            + x1014 * x225
+            + x1016 * x434
+            + x1017 * x212
+            + x1020 * x269
+            + x1020 * x304
+            + x1020 * x454
+            + x1023 * x60
+            + x1023 * x94
+            + x1024 * x302
+            + x1024 * x303
+            + x1027 * x411
+            + x1033 * x411
+            + x1034 * x434
+            + x1035 * x432
+            + x1039 * x416
+            + x1042 * x395
+            + x1045 * x416
+            + x1046 * x434
+            + x1047 * x432
+            - x1051 * x193
+            + x1053 * x383
+            + x1053 * x384
+            - x1056 * x300
+            - x1058 * x290
+            - x1059 * x294
+            + x1060 * x383
+            + x1060 * x384
+            + x1061 * x275
+            + x1065 * x389
+            + x1067 * x389
+            + x1068 * x776
+            + x1068 * x923
+            + x1071 * x409
+            + x1072 * x312
+            + x1076 * x271
+            + x1079 * x275
+            + x1080 * x162
+            + x1081 * x278
+            + x1081 * x283
+            + 0.387012824 * x109
+            + 0.08141975791312 * x1095
+            + x1096 * x405
+            + x1097 * x405
+            + x1098 * x253
+            - x1099 * x344
+            - x1100 * x261
+            + x1103
+            + x140 * x966
+            - x141 * x47
+            + 0.0009039607989875 * x148 * x47
+            + x150 * x966
+            - 0.0009039607989875 * x175 * x45
+            - x180 * x45
+            - x240 * x769
+            - x243 * (x24 * x732 + x26 * x730)
+            - x249 * x344
+            + 4.7101141125e-7 * x257 * x344
+            - x258 * x989
+            + x264 * x977
+            + x265 * x45
+            + x266 * x285
+            + x266 * x469
+            - 2.512544616e-7 * x27
+            - x292 * x981
+            + x310 * x978
+            - x362 * (-x1093 * x200 - x1094 * x24 + x142 * x238)
+            - x366 * (-x106 * x1093 + x142 * x51 + x24 * x533)
+            + 0.0064879792978136 * x39
+            - x396 * (x1056 * x247 + x1058 * x379 + x1059 * x319)
+            - x396 * (x1066 * x7 + x1091 * x238 - x1092 * x200)
+            - x400 * (x1087 + x1088 + x1089)
+            - x400 * (-x106 * x1092 - x1090 + x1091 * x51)
+            + 0.157368616 * x412
+            + x418 * x982
+            + x418 * x992
+            + x419 * x982
+            + x419 * x992
+            - x424 * x990
+            - x429 * x991
+            + x439 * x994
+            + x439 * x998
+            + x441 * x500
+            + x446 * x494
+            - x462 * (x1084 + x1085 + x1086)
+            - x462 * (x1082 * x206 + x1083 - x217 * x979)
+            - x467 * (x1082 * x247 - x319 * x979 + x379 * x981)
+            - x467 * (x319 * x989 + x478 * x990 + x486 * x991)
+            + x47 * x970
+            + 0.213167516 * x491
+            - 8.999685e-8 * x55
+            - 8.999685e-8 * x56
+            + 0.00492477747335 * x76
+            - 0.00492477747335 * x77,
+            x1051 * x253
+            + x1099 * x118
+            + x1104 * x145
+            - x1107 * x258
+            - x1108 * x500
+            - x1109 * x424
+            + x1110 * x494
+            - x1111 * x429
+            + x1112 * x418
+            + x1112 * x419
+            + x1114 * x418
+            + x1114 * x419
+            + x1117 * x395
+            + x1121 * x439
+            + x1122 * x439
+            + x1125 * x303
+            + x1128 * x225
+            + x1129 * x212
+            + x1132 * x60
+            + x1132 * x94
+            + x1133 * x434
+            + x1134 * x432
+            + x1137 * x411
+            + x1139 * x411
+            + x1143 * x416
+            + x1146 * x395
+            + x1147 * x416
+            + x1148 * x383
+            + x1148 * x384
+            - x1151 * x300
+            + x1155 * x383
+            + x1155 * x384
+            + x1156 * x275
+            + x1157 * x312
+            + x1158 * x271
+            + x1161 * x409
+            + x1162 * x389
+            + x1164 * x389
+            + x1168 * x271
+            + x1169 * x275
+            + x1175 * x405
+            + x1176 * x405
+            + x1177 * x253
+            - 4.34080072953e-5 * x1178
+            - 1.315362898125e-6 * x1179
+            + x118 * x249
+            - 3.564321078625e-5 * x118 * x257
+            + x1180
+            + x120 * x285
+            + 3.564321078625e-5 * x120 * x289
+            + x120 * x469
+            - 3.6447875e-9 * x146
+            - 3.6447875e-9 * x147
+            + 3.195324133875e-5 * x173
+            - 3.3268604236875e-5 * x174
+            - 0.000206331435 * x227
+            + 0.000206331435 * x234
+            - 0.000206331435 * x235
+            - x362 * (x533 + x535)
+            - x366 * (x1094 - x49 * x534)
+            - x396 * (x1151 * x247 - x1153 * x379 + x1154 * x319)
+            - x396 * (-x680 + x681 - x699 - x701)
+            - x400 * (-x1153 * x131 + x1154 * x217 + x1174)
+            - x400 * (-1.0e-6 * x103 - x104 * x136 - 0.009432 * x48 + x49 * x700)
+            - x462 * (x1170 + x1171 + x1172)
+            - x462 * (x1029 * x217 - x1113 * x131 - x1173 * x206)
+            - x467 * (x1029 * x319 - x1113 * x379 - x1173 * x247)
+            - x467 * (x1107 * x319 + x1109 * x478 + x1111 * x486),
+            x1056 * x253
+            + x1072 * x271
+            + x1157 * x776
+            + x1157 * x923
+            - x1183 * x258
+            + x1186 * x418
+            + x1186 * x419
+            + x1191 * x303
+            + x1192 * x439
+            + x1194 * x439
+            + x1197 * x60
+            + x1197 * x94
+            + x1200 * x411
+            + x1201 * x395
+            + x1203 * x416
+            + x1204 * x409
+            + x1205 * x389
+            + x1206 * x275
+            + x1208 * x405
+            + 0.01115614803204 * x1209
+            + x1210
+            + 3.6447875e-9 * x255
+            - 3.6447875e-9 * x256
+            + 0.0004508043691125 * x287
+            - 0.0004508043691125 * x288
+            - 8.017822355e-5 * x322 * x423
+            - x322 * x500
+            + 8.017822355e-5 * x324 * x428
+            - x324 * x494
+            + 0.053028558 * x367
+            - 0.053028558 * x368
+            + 0.053028558 * x369
+            + 0.053028558 * x374
+            + 0.053028558 * x375
+            + x383 * x930
+            + x384 * x930
+            - x396 * x722
+            - x400 * (0.045483 * x130 + 1.0e-6 * x216 + x48 * x685 - x48 * x687)
+            + x418 * x861
+            + x419 * x861
+            - x462 * (-0.10593 * x125 + 0.10593 * x130)
+            - x462 * (x1184 * x341 - x1185 * x360 + x1207)
+            - x467 * x642
+            - x467 * (x1183 * x319 + x1184 * x478 - x1185 * x486),
+            x1183 * x225
+            + x1211 * x418
+            + x1211 * x419
+            + x1212 * x212
+            + x1213 * x303
+            + x1214 * x439
+            + x1215 * x395
+            + x1217 * x60
+            + x1217 * x94
+            + x1218 * x411
+            + x1219 * x416
+            + x1220
+            + x405 * x989
+            + 3.067964645e-5 * x421
+            - 3.067964645e-5 * x422
+            - 7.56093725e-7 * x426
+            + 7.56093725e-7 * x427
+            - x462
+            * (-0.011402 * x336 + 0.011402 * x340 + 0.000281 * x355 - 0.000281 * x359)
+            - x467 * (-x575 + x576 - x577 + x578),
+            x1222 * x486
+            + x1223 * x478
+            + x1224 * x319
+            + x1225 * x319
+            + x1226 * x379
+            + x1227 * x247
+            + x1228 * x200
+            + x1229 * x238
+            + x1231 * x543
+            + x1233 * x543
+            - x1234 * x561
+            + x1235 * x554
+            + x1236 * x553
+            + x1236 * x571
+            + x1236 * x572
+            + x1237 * x557
+            + x1237 * x567
+            + x1237 * x570
+            + x1238 * x598
+            + x1238 * x602
+            + x1239 * x593
+            + x1240 * x594
+            + x1241 * x660
+            + x1241 * x663
+            + x1242 * x612
+            + x1242 * x624
+            + x1242 * x632
+            + x1242 * x677
+            + x1242 * x679
+            + x1243 * x603
+            + x1243 * x628
+            + x1243 * x633
+            + x1243 * x643
+            + x1243 * x651
+            + x1244 * x618
+            + x1244 * x674
+            + x1245 * x621
+            + x1245 * x630
+            + x1245 * x656
+            + x1245 * x671
+            + x1245 * x676
+            + x1246 * x615
+            + x1246 * x642
+            + x1247 * x627
+            + x1247 * x629
+            + x1247 * x654
+            + x1247 * x667
+            + x1247 * x675
+            + x1248 * x609
+            + x1248 * x631
+            + x1248 * x635
+            + x1248 * x638
+            + x1249 * x609
+            + x1249 * x631
+            + x1249 * x635
+            + x1249 * x638
+            + x1250 * x708
+            + x1250 * x712
+            + x1251 * x713
+            + x1251 * x729
+            + x1252 * x609
+            + x1252 * x631
+            + x1252 * x635
+            + x1252 * x638
+            + x1253 * x612
+            + x1253 * x632
+            + x1253 * x677
+            + x1253 * x679
+            + x1254 * x603
+            + x1254 * x633
+            + x1254 * x643
+            + x1254 * x651
+            + x1255 * x553
+            + x1255 * x571
+            + x1255 * x572
+            + x1256 * x718
+            + x1257 * x564
+            + x1258 * x557
+            + x1258 * x567
+            + x1258 * x570
+            + x1259 * x722
+            + x1260 * x737
+            + x1261 * x594
+            + x1262 * x564
+            + x1264 * x548
+            - x1265 * x580
+            - x1265 * x587
+            - x1266 * x765
+            - x1266 * x766
+            - x1267 * x767
+            - x1267 * x768
+            - x1268 * x734
+            - x1269 * x769
+            - x1270 * x770
+            + x1271 * x5
+            + x1272 * x646
+            + x1272 * x650
+            + x1273 * x721
+            + x1273 * x726
+            + x1274 * x560
+            - x1275 * x605
+            - x1275 * x640
+            - x1276 * x564
+            - x1277 * x714
+            + 0.00561731514894 * x1278**2
+            + 0.0132264231859477 * x238**2
+            + 1.53396367515e-8 * x379**2
+            + x536 * x606
+            + x536 * x641
+            + x536 * x715
+            + 0.004980578196 * x561 * x748
+            + x564 * x772
+            + 1.0012 * x579 * x585
+            + 0.08074054441882 * x588 * x740
+            - x591 * x779
+            + 0.455074536307542 * x6
+            - x693 * x780
+            - 0.008645775 * x7 * x703
+            - 0.015028425 * x7 * x738
+            - x704 * x780
+            - x739 * x781
+            + 0.454992801729417 * x740
+            + 0.105316228 * x741
+            + 0.105316228 * x742
+            + 0.105316228 * x743
+            + 0.105316228 * x744
+            + 0.105316228 * x745
+            + 0.105316228 * x746
+            + 0.32567903165248 * x747
+            + 0.781267168 * x749
+            + 0.142658678 * x750
+            + 0.142658678 * x751
+            + 0.142658678 * x752
+            - 0.285317356 * x753
+            + 0.142658678 * x754
+            + 0.142658678 * x755
+            + 0.587086428 * x759
+            + 0.391390952 * x760
+            - 0.391390952 * x761
+            - 0.495949812 * x762
+            + 0.247974906 * x763
+            + 0.247974906 * x764
+            + 0.0027673516569109 * (x238 + 1.56536167681543e-5 * x543) ** 2
+            + 0.01322638706763 * (x247 - 0.00165250637213254 * x543) ** 2
+            + 0.0027673516569109 * (x247 + 0.147644913357231 * x543) ** 2
+            + 5.13181123316e-5 * (-0.00662550820659539 * x5 + x7) ** 2
+            + 0.0002094624694872 * (-0.00119952019192323 * x5 - x561) ** 2
+            + 0.0052992828758168 * (x5 - 0.198812899122923 * x543) ** 2
+            + 0.08066508290632 * (x5 - 0.0305858081850022 * x543) ** 2
+            + 0.0052992828758168 * (0.000238480086912743 * x543 + x561) ** 2
+            + 0.0014027877002709
+            * (x1278 - 2.19862366158785e-5 * x317 + 2.19862366158785e-5 * x318) ** 2
+            + 6.314636725e-5
+            * (-0.000103626943005181 * x199 + x379 + 0.000103626943005181 * x49) ** 2
+            + 0.0014027877002709
+            * (x247 - 0.212167183343227 * x317 + 0.212167183343227 * x318) ** 2
+            + 0.00561731514894
+            * (x247 - 0.00165250637213254 * x317 + 0.00165250637213254 * x318) ** 2
+            + 0.0004444931544824
+            * (-0.00943016309819451 * x317 + 0.00943016309819451 * x318 + x478) ** 2
+            + 6.03255553344e-5
+            * (x104 - 0.000106022052586938 * x199 + x237 + 0.000106022052586938 * x49)
+            ** 2
+            + 0.0004444931544824
+            * (0.382643130411437 * x317 - 0.382643130411437 * x318 + x484 + x485) ** 2
+            + 6.50808053624e-5
+            * (x476 + x477 - 0.0246447991580424 * x484 - 0.0246447991580424 * x485) ** 2
+            + 0.19764601133841,
+            0.02626798179258 * x106 * x226
+            + x1222 * x351
+            + x1223 * x330
+            + x1224 * x220
+            + x1225 * x220
+            + x1226 * x123
+            + x1227 * x164
+            - x1228 * x164
+            + x1229 * x226
+            + x1231 * x26
+            + x1233 * x26
+            + x1234 * x24
+            + x1235 * x792
+            + x1236 * x802
+            + x1237 * x801
+            + x1238 * x827
+            + x1238 * x831
+            + x1239 * x823
+            + x1241 * x876
+            + x1241 * x879
+            + x1242 * x833
+            + x1242 * x845
+            + x1242 * x862
+            + x1242 * x883
+            + x1243 * x854
+            + x1243 * x870
+            + x1244 * x839
+            + x1244 * x882
+            + x1245 * x842
+            + x1245 * x872
+            + x1245 * x886
+            + x1245 * x890
+            + x1246 * x848
+            + x1246 * x861
+            + x1247 * x853
+            + x1247 * x871
+            + x1247 * x885
+            + x1247 * x892
+            + x1248 * x850
+            + x1248 * x855
+            + x1248 * x857
+            + x1249 * x850
+            + x1249 * x855
+            + x1249 * x857
+            + x1250 * x916
+            + x1250 * x920
+            + x1251 * x921
+            + x1251 * x937
+            + x1252 * x850
+            + x1252 * x855
+            + x1252 * x857
+            + x1253 * x833
+            + x1253 * x862
+            + x1253 * x883
+            + x1254 * x870
+            + x1255 * x802
+            + x1256 * x926
+            + x1258 * x801
+            + x1259 * x930
+            + x1260 * x940
+            + x1264 * x791
+            - x1265 * x812
+            - x1265 * x821
+            - x1266 * x962
+            - x1266 * x963
+            - x1267 * x964
+            - x1267 * x965
+            - x1269 * x966
+            - x1270 * x967
+            + x1272 * x865
+            + x1272 * x869
+            + x1273 * x929
+            + x1273 * x934
+            + x1274 * x797
+            - x1275 * x835
+            - x1275 * x859
+            - x1277 * x922
+            + x1279 * x922
+            + x1281
+            + x536 * x836
+            + x536 * x860
+            - x647 * x968
+            - x725 * x969
+            - x780 * x904
+            - x780 * x912
+            - x781 * x941
+            + 0.105316228 * x942
+            + 0.105316228 * x943
+            + 0.105316228 * x944
+            + 0.105316228 * x945
+            + 0.105316228 * x946
+            + 0.105316228 * x947
+            + 0.142658678 * x950
+            + 0.142658678 * x951
+            + 0.142658678 * x952
+            + 0.142658678 * x953
+            + 0.142658678 * x954
+            + 0.195695476 * x958
+            + 0.247974906 * x961,
+            x1000 * x1244
+            + x1002 * x1245
+            - x1007 * x1275
+            + x1008 * x536
+            + x1011 * x1242
+            + x1014 * x1246
+            + x1016 * x1247
+            + x1017 * x1243
+            + x1020 * x1248
+            + x1020 * x1249
+            + x1020 * x1252
+            - x1022 * x1275
+            + x1023 * x536
+            + x1024 * x1242
+            + x1024 * x1253
+            + x1027 * x1272
+            + x1033 * x1272
+            + x1034 * x1247
+            + x1035 * x1245
+            + x1039 * x1241
+            + x1042 * x1244
+            + x1045 * x1241
+            + x1046 * x1247
+            + x1047 * x1245
+            - x1053 * x780
+            - 0.035381446119254 * x106 * x47
+            - x1060 * x780
+            + x1061 * x1251
+            + x1065 * x1250
+            + x1067 * x1250
+            - x1068 * x1277
+            + x1068 * x1279
+            + x1071 * x1256
+            + x1072 * x1259
+            + x1076 * x1273
+            + x1079 * x1251
+            + x1080 * x1260
+            - x1081 * x781
+            + 0.105316228 * x1083
+            + 0.105316228 * x1084
+            + 0.105316228 * x1085
+            + 0.105316228 * x1086
+            + 0.142658678 * x1087
+            + 0.142658678 * x1088
+            + 0.142658678 * x1089
+            - x1096 * x1266
+            - x1097 * x1266
+            - x1098 * x1267
+            - x1100 * x541
+            + x1222 * x441
+            + x1223 * x446
+            + x1224 * x266
+            + x1225 * x266
+            - x1226 * x344
+            + x1227 * x45
+            - x1228 * x45
+            - x1229 * x47
+            + x1235 * x977
+            + x1238 * x994
+            + x1238 * x998
+            + x1264 * x978
+            - x1265 * x982
+            - x1265 * x992
+            - x1268 * x966
+            + x1282 * x344
+            + x1283
+            - 1.84356057114e-5 * x217 * x344
+            + 0.035381446119254 * x45 * x51
+            - 0.0064879792978136 * x543
+            + 2.512544616e-7 * x561
+            + 0.157368616 * x584
+            + 0.213167516 * x692
+            + 3.522518568e-6 * x748
+            + 0.177610218963768 * x782,
+            -1.42658678e-7 * x103
+            - 1.42658678e-7 * x105
+            - x1051 * x1267
+            + x1104 * x540
+            - x1108 * x1222
+            + x1110 * x1223
+            - x1112 * x1265
+            - x1114 * x1265
+            + x1117 * x1244
+            + x1121 * x1238
+            + x1122 * x1238
+            + x1125 * x1242
+            + x1128 * x1246
+            + x1129 * x1243
+            - x1131 * x1275
+            + x1132 * x536
+            + x1133 * x1247
+            + x1134 * x1245
+            + x1137 * x1272
+            + x1139 * x1272
+            + x1143 * x1241
+            + x1146 * x1244
+            + x1147 * x1241
+            - x1148 * x780
+            - x1155 * x780
+            + x1156 * x1251
+            + x1157 * x1259
+            + x1158 * x1273
+            + x1161 * x1256
+            + x1162 * x1250
+            + x1164 * x1250
+            + x1168 * x1273
+            + x1169 * x1251
+            + 0.105316228 * x1170
+            + 0.105316228 * x1171
+            + 0.105316228 * x1172
+            + 0.142658678 * x1174
+            - x1175 * x1266
+            - x1176 * x1266
+            - x1177 * x1267
+            + x118 * x1226
+            - x118 * x1282
+            + 0.0013950918484114 * x118 * x217
+            + x120 * x1224
+            + x120 * x1225
+            - 0.0013950918484114 * x120 * x131
+            + 1.315362898125e-6 * x1284
+            + x1285
+            - 8.7723045707e-5 * x199
+            - 4.33190623e-8 * x237
+            - 0.0012587406363054 * x48
+            + 0.0012587406363054 * x50
+            - 0.000206331435 * x552,
+            -x1056 * x1267
+            + x1072 * x1273
+            - x1157 * x1277
+            + x1157 * x1279
+            - x1186 * x1265
+            + x1191 * x1242
+            + x1192 * x1238
+            + x1194 * x1238
+            - x1196 * x1275
+            + x1197 * x536
+            + x1200 * x1272
+            + x1201 * x1244
+            + x1203 * x1241
+            + x1204 * x1256
+            + x1205 * x1250
+            + x1206 * x1251
+            + 0.105316228 * x1207
+            - x1208 * x1266
+            - x1222 * x322
+            - x1223 * x324
+            - 0.028800840715554 * x125
+            - x1265 * x861
+            - x1286 * x7
+            - 0.01105274234394 * x1287
+            + x1288
+            + 0.017644692683514 * x130
+            + 1.42658678e-7 * x213
+            + 1.42658678e-7 * x216
+            + 0.003138212961944 * x322 * x341
+            - 0.003138212961944 * x324 * x360
+            + 0.053028558 * x610
+            + 0.053028558 * x611
+            + 0.053028558 * x678
+            - x780 * x930,
+            x1183 * x1246
+            - x1211 * x1265
+            + x1212 * x1243
+            + x1213 * x1242
+            + x1214 * x1238
+            + x1215 * x1244
+            - x1216 * x1275
+            + x1217 * x536
+            + x1218 * x1272
+            + x1219 * x1241
+            - x1266 * x989
+            + x1289
+            - 0.001200815631656 * x336
+            + 0.001200815631656 * x340
+            + 2.9593860068e-5 * x355
+            - 2.9593860068e-5 * x359,
+            1.53396367515e-8 * x123**2
+            + x123 * x1302
+            + x1290 * x26
+            + x1291 * x24
+            - x1292 * x164
+            + x1293 * x26
+            + x1296 * x351
+            + x1298 * x330
+            + x1299 * x220
+            + x1300 * x220
+            + x1304 * x164
+            + x1306 * x802
+            + x1307 * x835
+            + x1307 * x859
+            + x1308 * x839
+            + x1308 * x882
+            + x1309 * x833
+            + x1309 * x845
+            + x1309 * x862
+            + x1309 * x883
+            + x1310 * x854
+            + x1310 * x870
+            + x1311 * x842
+            + x1311 * x872
+            + x1311 * x886
+            + x1311 * x890
+            + x1312 * x853
+            + x1312 * x871
+            + x1312 * x885
+            + x1312 * x892
+            + x1313 * x850
+            + x1313 * x855
+            + x1313 * x857
+            + x1314 * x850
+            + x1314 * x855
+            + x1314 * x857
+            + x1315 * x922
+            + x1316 * x802
+            + x1317 * x801
+            + x1318 * x926
+            + x1319 * x850
+            + x1319 * x855
+            + x1319 * x857
+            + x1320 * x833
+            + x1320 * x862
+            + x1320 * x883
+            + x1321 * x870
+            - x1323 * x865
+            - x1323 * x869
+            - x1325 * x876
+            - x1325 * x879
+            - x1326 * x929
+            - x1326 * x934
+            - x1327 * x797
+            - x1328 * x921
+            - x1328 * x937
+            - x1329 * x792
+            + x1330 * x848
+            + x1330 * x861
+            + x1332 * x922
+            + x1333 * x930
+            + x1334 * x835
+            + x1334 * x859
+            + x1336 * x801
+            + 0.00159196106025 * x1337 * x164
+            + 0.00561731514894 * x1338**2
+            + 0.0006138189172872 * x588
+            + 0.0148224231859477 * x784 * x793
+            + 0.0812789018236072 * x784
+            + 5.2614515925e-6 * x785
+            - 0.015028425 * x790
+            + 1.0012 * x811 * x818
+            - 0.003191325 * x824
+            - 0.003191325 * x825
+            - 0.003191325 * x826
+            - 0.00638265 * x828
+            - 0.003191325 * x829
+            - 0.003191325 * x830
+            - x866 * x968
+            - 0.008645775 * x913
+            - 0.0043228875 * x914
+            - 0.0043228875 * x915
+            - 0.008645775 * x917
+            + 0.01729155 * x918
+            + 0.008645775 * x919
+            - x933 * x969
+            + 6.314636725e-5 * (x123 + 0.000103626943005181 * x164) ** 2
+            + 6.03255553344e-5 * (0.000106022052586938 * x164 - x226) ** 2
+            + 0.01322638706763 * (x164 - 0.00165250637213254 * x26) ** 2
+            + 0.0027673516569109 * (x164 + 0.147644913357231 * x26) ** 2
+            + 0.0027673516569109 * (x226 + 1.56536167681543e-5 * x26) ** 2
+            + 0.0052992828758168 * (-x24 + 0.000238480086912743 * x26) ** 2
+            + 0.0014027877002709
+            * (-0.212167183343227 * x127 + x164 + 0.212167183343227 * x219) ** 2
+            + 0.0004444931544824
+            * (-0.00943016309819451 * x127 + 0.00943016309819451 * x219 + x330) ** 2
+            + 0.00561731514894
+            * (-0.00165250637213254 * x127 + x164 + 0.00165250637213254 * x219) ** 2
+            + 0.0014027877002709
+            * (-2.19862366158785e-5 * x127 + x1338 + 2.19862366158785e-5 * x219) ** 2
+            + 0.0004444931544824
+            * (0.382643130411437 * x127 - 0.382643130411437 * x219 + x347 - x350) ** 2
+            + 6.50808053624e-5
+            * (-x323 - x329 - 0.0246447991580424 * x347 + 0.0246447991580424 * x350)
+            ** 2
+            + 0.0012075857869362,
+            x1000 * x1308
+            + x1002 * x1311
+            + x1007 * x1307
+            + x1007 * x1334
+            + x1011 * x1309
+            + x1014 * x1330
+            + x1016 * x1312
+            + x1017 * x1310
+            + x1020 * x1313
+            + x1020 * x1314
+            + x1020 * x1319
+            + x1022 * x1307
+            + x1022 * x1334
+            + x1024 * x1309
+            + x1024 * x1320
+            - x1027 * x1323
+            - x1033 * x1323
+            + x1034 * x1312
+            + x1035 * x1311
+            - x1039 * x1325
+            + x1042 * x1308
+            - x1045 * x1325
+            + x1046 * x1312
+            + x1047 * x1311
+            - x1061 * x1328
+            - 0.0043228875 * x1063
+            - 0.0043228875 * x1064
+            + x1068 * x1315
+            + x1068 * x1332
+            + x1071 * x1318
+            + x1072 * x1333
+            - x1076 * x1326
+            - x1079 * x1328
+            - x1292 * x45
+            + x1296 * x441
+            + x1298 * x446
+            + x1299 * x266
+            + x1300 * x266
+            - x1302 * x344
+            + x1304 * x45
+            - x1329 * x977
+            - 0.0408469285810777 * x1339
+            + x1341
+            + 5.5864144125e-7 * x215 * x344
+            + 0.157368616 * x816
+            + 0.213167516 * x900
+            - 0.003191325 * x993
+            - 0.003191325 * x995
+            - 0.003191325 * x996
+            - 0.003191325 * x997,
+            -x1108 * x1296
+            + x1110 * x1298
+            + x1117 * x1308
+            - 0.003191325 * x1118
+            - 0.003191325 * x1119
+            - 0.003191325 * x1120
+            + x1125 * x1309
+            + x1128 * x1330
+            + x1129 * x1310
+            + x1131 * x1307
+            + x1131 * x1334
+            + x1133 * x1312
+            + x1134 * x1311
+            - x1137 * x1323
+            - x1139 * x1323
+            - x1143 * x1325
+            + x1146 * x1308
+            - x1147 * x1325
+            - x1156 * x1328
+            + x1157 * x1333
+            - x1158 * x1326
+            + x1161 * x1318
+            - x1168 * x1326
+            - x1169 * x1328
+            + x118 * x1302
+            - 4.227450581625e-5 * x118 * x215
+            + 4.227450581625e-5 * x120 * x129
+            + x120 * x1299
+            + x120 * x1300
+            - 3.814274910375e-5 * x1337
+            + 4.3228875e-9 * x1342
+            + x1343
+            + 8.7723045707e-5 * x164
+            + 4.33190623e-8 * x226,
+            -x1072 * x1326
+            + x1157 * x1315
+            + x1157 * x1332
+            + x1191 * x1309
+            - 0.003191325 * x1193
+            + x1196 * x1307
+            + x1196 * x1334
+            - x1200 * x1323
+            + x1201 * x1308
+            - x1203 * x1325
+            + x1204 * x1318
+            - x1206 * x1328
+            + 4.3228875e-9 * x121
+            + 6.543665e-9 * x122
+            + 0.0008727320066625 * x126
+            - 0.0008727320066625 * x128
+            - x1296 * x322
+            - x1298 * x324
+            + 0.01105274234394 * x1344
+            + x1345
+            + 4.3228875e-9 * x214
+            + 0.0005941908133508 * x219
+            - 9.509510235e-5 * x322 * x339
+            + 9.509510235e-5 * x324 * x358
+            + 0.053028558 * x832,
+            x1183 * x1330
+            + x1212 * x1310
+            + x1213 * x1309
+            + x1215 * x1308
+            + x1216 * x1307
+            + x1216 * x1334
+            - x1218 * x1323
+            - x1219 * x1325
+            + x1346
+            + 3.638748765e-5 * x337
+            - 3.638748765e-5 * x338
+            + 8.96762325e-7 * x356
+            + 8.96762325e-7 * x357,
+            x1000 * x1355
+            + x1002 * x1357
+            + 0.00725833048857675 * x1003 * x975
+            - x1007 * x1102
+            + x1011 * x1356
+            - x1014 * x1366
+            + x1016 * x1358
+            + x1017 * x1372
+            + x1020 * x1359
+            + x1020 * x1363
+            - x1020 * x1374
+            - 0.00017526006 * x1021 * x47
+            - x1022 * x1102
+            + x1024 * x1356
+            + x1024 * x1364
+            + 0.03334011498576 * x1030
+            + x1034 * x1358
+            + x1035 * x1357
+            - 0.208680116 * x1036
+            + 0.104340058 * x1037
+            + 0.104340058 * x1038
+            + x1042 * x1355
+            + 3.65294543058e-5 * x1043 * x344
+            + 0.208680116 * x1044
+            + x1046 * x1358
+            + x1047 * x1357
+            + 0.354503899 * x1057
+            - x1068 * x1368
+            + x1071 * x1360
+            - x1072 * x1369
+            + 0.282672766 * x1077
+            - 0.282672766 * x1078
+            + x1347 * x45
+            + x1348 * x266
+            + x1351 * x441
+            + x1352 * x446
+            + x1354 * x266
+            + 0.0877077338251789 * x793
+            + 0.0876967699434966 * x975
+            + 0.0014027877002709 * (-0.212167183343227 * x266 + x45) ** 2
+            + 0.0004444931544824 * (-0.00943016309819451 * x266 + x446) ** 2
+            + 0.00561731514894 * (-0.00165250637213254 * x266 + x45) ** 2
+            + 0.0014027877002709 * (-2.19862366158785e-5 * x266 + x344) ** 2
+            + 0.0004444931544824 * (0.382643130411437 * x266 + x354) ** 2
+            + 6.314636725e-5 * (-x344 + 0.000103626943005181 * x45) ** 2
+            + 6.03255553344e-5 * (0.000106022052586938 * x45 + x47) ** 2
+            + 6.50808053624e-5
+            * (-0.0246447991580424 * x326 + x335 + 0.0246447991580424 * x353) ** 2
+            + 0.0942803660835216,
+            -x1102 * x1131
+            - x1108 * x1351
+            + x1110 * x1352
+            + x1117 * x1355
+            + x1125 * x1356
+            - x1128 * x1366
+            + x1129 * x1372
+            + x1133 * x1358
+            + x1134 * x1357
+            + 0.104340058 * x1141
+            + 0.104340058 * x1142
+            + x1146 * x1355
+            + 0.141336383 * x1152
+            - x1157 * x1369
+            + x1161 * x1360
+            + x120 * x1348
+            + x120 * x1354
+            - 0.0072583458282135 * x1375
+            + x1377,
+            -1.41336383e-7 * x1043
+            - x1102 * x1196
+            - x1157 * x1368
+            + x1191 * x1356
+            + x1201 * x1355
+            + x1204 * x1360
+            - x1351 * x322
+            - x1352 * x324
+            + 0.023098460200869 * x1378
+            + x1379
+            - 0.0005941908133508 * x266
+            + 0.003109125048284 * x322 * x328
+            - 0.003109125048284 * x324 * x349
+            - 6.543665e-9 * x344,
+            -x1102 * x1216
+            - x1183 * x1366
+            + x1212 * x1372
+            + x1213 * x1356
+            + x1215 * x1355
+            + x1380
+            - 0.001189685341316 * x325
+            + 0.001189685341316 * x327
+            + 2.9319556298e-5 * x333
+            + 1.1916429428e-6 * x334
+            + 2.9319556298e-5 * x348
+            - 5.20822520776e-5 * x353,
+            0.000475483323276755 * x1003
+            - x1104 * x1129
+            - x1108 * x1382
+            + x1110 * x1383
+            + 0.00732379847221675 * x1115
+            - x1125 * x1394
+            + x1133 * x1388
+            + x1134 * x1387
+            + 0.00035052012 * x1135
+            - 0.00017526006 * x1144
+            + 0.00017526006 * x1145
+            + x120 * x1384
+            + 6.50808053624e-5 * (-0.0246447991580424 * x1108 - x1110) ** 2
+            + 0.0004444931544824 * (x1108 + 0.382643130411437 * x120) ** 2
+            + 0.0004444931544824 * (x1110 - 0.00943016309819451 * x120) ** 2
+            + 0.0014027877002709 * (-x118 - 2.19862366158785e-5 * x120) ** 2
+            + 0.000459361674330197,
+            -x1191 * x1394 - x1382 * x322 - x1383 * x324 + x1398,
+            -x1104 * x1212
+            + 5.20822520776e-5 * x1108
+            - 1.1916429428e-6 * x1110
+            - x1213 * x1394
+            + x1399
+            - 2.462403843e-8 * x1400
+            - 9.9915760206e-7 * x1401,
+            0.0036047830970504 * x1187
+            + 0.0036047830970504 * x1189
+            - x1402 * x324
+            - x1405 * x322
+            + 6.50808053624e-5 * (-0.0246447991580424 * x322 + x324) ** 2
+            + 0.008661102849889,
+            x1411,
+            0.000674120333239,
+        ]
+    )
+
+    return mass_packed
+
+
+_mass_matrix_packed_batch = batched(mass_matrix_packed)
+
+
+@instrumented
+def mass_matrix_packed_batch(q):
+    """The packed mass matrix for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: The upper-triangle entries of the mass matrices in row-major
+             order, shape (N, 28)
+
+    """
+
+    return _mass_matrix_packed_batch(q)
+
+
+def unpack_mass_matrix(packed):
+    """Full mass matrices from packed ones
+
+    Arguments
+    ---------
+    packed (array_like): Packed mass matrices, shape (..., 28)
+
+    Returns
+    -------
+    ndarray: The full symmetric mass matrices, shape (..., 7, 7)
+
+    """
+
+    return numpy.asarray(packed)[..., _UNPACK_INDEX]
+
+
+def packed_cholesky(packed):
+    """Cholesky factors of packed mass matrices
+
+    The factorisation reads the packed entries directly, vectorised over the
+    leading axes, without forming the full matrices. As numpy.linalg.cholesky,
+    it raises numpy.linalg.LinAlgError if any matrix is not positive definite.
+
+    Arguments
+    ---------
+    packed (array_like): Packed mass matrices, shape (..., 28)
+
+    Returns
+    -------
+    ndarray: The lower-triangular factors L with M = L L^T, shape (..., 7, 7)
+
+    """
+
+    # One contiguous array per packed entry, the recursion runs entrywise
+    entries = numpy.moveaxis(numpy.asarray(packed), -1, 0).copy()
+    lower = [[None] * 7 for _ in range(7)]
+
+    for j in range(7):
+        diagonal = entries[_INDEX[j][j]]
+        for k in range(j):
+            diagonal = diagonal - lower[j][k] * lower[j][k]
+        if not numpy.all(diagonal > 0.0):
+            raise numpy.linalg.LinAlgError("Matrix is not positive definite")
+        lower[j][j] = numpy.sqrt(diagonal)
+        reciprocal = 1.0 / lower[j][j]
+
+        for i in range(j + 1, 7):
+            entry = entries[_INDEX[j][i]]
+            for k in range(j):
+                entry = entry - lower[i][k] * lower[j][k]
+            lower[i][j] = entry * reciprocal
+
+    factor = numpy.zeros(entries.shape[1:] + (7, 7), dtype=entries.dtype)
+    for i, j in zip(PACKED_COLUMNS, PACKED_ROWS):
+        factor[..., i, j] = lower[i][j]
+
+    return factor
+
+
+def packed_quadratic_form(packed, vector):
+    """Inertia-weighted squared norms v^T M v from packed mass matrices
+
+    E.g. twice the kinetic energy for the joint velocities.
+
+    Arguments
+    ---------
+    packed (array_like): Packed mass matrices, shape (..., 28)
+    vector (array_like): Joint-space vectors, shape (..., 7)
+
+    Returns
+    -------
+    ndarray: The quadratic forms, shape (...)
+
+    """
+
+    vector = numpy.asarray(vector)
+    products = vector[..., PACKED_ROWS] * vector[..., PACKED_COLUMNS]
+
+    return numpy.sum(_WEIGHTS * numpy.asarray(packed) * products, axis=-1)
@@ -0,0 +1,153 @@
+"""Generalized-momentum observer for external torque estimation
+
+The residual of the observer
+
+    r = K (p - p(0) - integral(tau + C^T qp - g + r) dt),  p = M qp
+
+converges to the external joint torques with the time constant 1/K. The
+Coriolis term of this package is the vector C qp, so C^T qp is written as
+Mdot qp - C qp and the integral of Mdot qp is accumulated from consecutive
+mass matrices with the trapezoidal rule.
+
+Functions
+---------
+momentum_residuals(joint_position, joint_velocity, joint_torque, gain, time_step)
+
+Classes
+-------
+MomentumObserver
+
+"""
+
+import numpy as np
+from kinova_gen3.dynamics.terms import dynamics_terms, dynamics_terms_batch
+
+
+class MomentumObserver:
+    """Sample-by-sample generalized-momentum observer
+
+    Attributes
+    ----------
+    gain (ndarray): The observer gains, one per joint [1/s]
+    threshold (ndarray): The residual magnitudes signalling a collision [Nm]
+    time_step (float): The sampling period [s]
+    residual (ndarray): The estimated external joint torques [Nm]
+    collision (bool): Whether a residual exceeds its threshold
+
+    Methods
+    -------
+    update(joint_position, joint_velocity, joint_torque)
+        Process one sample and return the residual
+    reset()
+        Restart the observer at the next sample
+
+    """
+
+    def __init__(self, gain, threshold, time_step=1e-3):
+        """Create the observer
+
+        Arguments
+        ---------
+        gain (array_like): The observer gains, scalar or one per joint [1/s]
+        threshold (array_like): The collision thresholds, scalar or one per
+                                joint [Nm]
+        time_step (float): The sampling period [s]
+
+        """
+
+        self.gain = np.broadcast_to(np.asarray(gain, dtype=float), (7,)).copy()
+        self.threshold = np.broadcast_to(np.asarray(threshold, dtype=float), (7,)).copy()
+        self.time_step = time_step
+
+        self.residual = np.zeros(7)
+        self._initial_momentum = np.empty(7)
+        self._integral = np.empty(7)
+        self._previous_mass = None
+        self._previous_velocity = np.empty(7)
+
+    @property
+    def collision(self):
+        return bool(np.any(np.abs(self.residual) > self.threshold))
+
+    def reset(self):
+        """Restart the observer at the next sample"""
+
+        self.residual[:] = 0.0
+        self._previous_mass = None
+
+    def update(self, joint_position, joint_velocity, joint_torque):
+        """Process one sample
+
+        Arguments
+        ---------
+        joint_position (array_like): The measured joint angles [rad]
+        joint_velocity (array_like): The measured joint velocities [rad/s]
+        joint_torque (array_like): The commanded motor torques [Nm]
+
+        Returns
+        -------
+        ndarray: The estimated external joint torques [Nm], overwritten by
+                 the next update
+
+        """
+
+        mass, coriolis_term, gravity_term = dynamics_terms(joint_position, joint_velocity)
+
+        if self._previous_mass is None:
+            self._initial_momentum[:] = mass @ joint_velocity
+            self._integral[:] = 0.0
+        else:
+            self._integral += self.time_step * (
+                joint_torque - coriolis_term - gravity_term + self.residual
+            )
+            self._integral += 0.5 * (mass - self._previous_mass) @ (
+                joint_velocity + self._previous_velocity
+            )
+            self.residual[:] = self.gain * (
+                mass @ joint_velocity - self._initial_momentum - self._integral
+            )
+
+        self._previous_mass = mass
+        self._previous_velocity[:] = joint_velocity
+
+        return self.residual
+
+
+def momentum_residuals(joint_position, joint_velocity, joint_torque, gain, time_step=1e-3):
+    """Observer residuals over a recorded log
+
+    The dynamic terms of all samples are evaluated in one batched call, only
+    the observer recursion runs sample by sample. The result equals feeding
+    the samples to ``MomentumObserver.update`` in order.
+
+    Arguments
+    ---------
+    joint_position (array_like): The measured joint angles, shape (T, 7) [rad]
+    joint_velocity (array_like): The measured joint velocities, shape (T, 7) [rad/s]
+    joint_torque (array_like): The commanded motor torques, shape (T, 7) [Nm]
+    gain (array_like): The observer gains, scalar or one per joint [1/s]
+    time_step (float): The sampling period [s]
+
+    Returns
+    -------
+    ndarray: The estimated external joint torques, shape (T, 7) [Nm]
+
+    """
+
+    joint_velocity = np.asarray(joint_velocity, dtype=float)
+    gain = np.broadcast_to(np.asarray(gain, dtype=float), (7,))
+
+    mass, coriolis_term, gravity_term = dynamics_terms_batch(joint_position, joint_velocity)
+    momentum = np.einsum("tij,tj->ti", mass, joint_velocity)
+    beta = time_step * (np.asarray(joint_torque) - coriolis_term - gravity_term)
+    beta[1:] += 0.5 * np.einsum(
+        "tij,tj->ti", mass[1:] - mass[:-1], joint_velocity[1:] + joint_velocity[:-1]
+    )
+
+    residuals = np.zeros_like(momentum)
+    integral = np.zeros(7)
+    for t in range(1, momentum.shape[0]):
+        integral += beta[t] + time_step * residuals[t - 1]
+        residuals[t] = gain * (momentum[t] - momentum[0] - integral)
+
+    return residuals
@@ -0,0 +1,105 @@
+"""Operational space dynamics of Kinova Gen3
+
+The operational space inertia, the dynamically consistent pseudoinverse of
+the Jacobian and the corresponding nullspace projector share the factor
+Y = L^-1 J^T, where M = L L^T is the Cholesky factorisation of the mass
+matrix:
+
+    Lambda = (J M^-1 J^T)^-1 = (Y^T Y)^-1
+    Jbar   = M^-1 J^T Lambda = L^-T Y Lambda
+    N      = I - Jbar J
+
+so one Jacobian, one mass matrix and one Cholesky factorisation are needed
+per configuration. Torques are projected to the nullspace with N^T.
+
+Functions
+---------
+operational_space(joint_position)
+operational_space_batch(joint_position)
+
+"""
+
+import numpy as np
+from kinova_gen3.instrumentation import instrumented
+from kinova_gen3.kinematics.jacobian import jacobian, jacobian_batch
+from kinova_gen3.dynamics.mass_matrix import mass_matrix, mass_matrix_batch
+
+
+def _solve_triangular(factor, rhs, transposed=False):
+    """Solve L X = B, or L^T X = B, for (stacks of) lower-triangular L"""
+
+    if factor.ndim == 2:
+        # scipy is only loaded by the processes that evaluate single configurations
+        from scipy.linalg import solve_triangular
+
+        return solve_triangular(
+            factor, rhs, trans=int(transposed), lower=True, check_finite=False
+        )
+
+    # scipy loops over stacks of matrices, substitution is vectorised over them
+    solution = np.array(rhs, dtype=float)
+    size = factor.shape[-1]
+    for i in reversed(range(size)) if transposed else range(size):
+        solution[..., i, :] /= factor[..., i, i, None]
+        if transposed:
+            # The column of L^T above the diagonal is the row of L
+            solution[..., :i, :] -= factor[..., i, :i, None] * solution[..., i, None, :]
+        else:
+            solution[..., i + 1 :, :] -= (
+                factor[..., i + 1 :, i, None] * solution[..., i, None, :]
+            )
+
+    return solution
+
+
+def _operational_space(jacobian_matrix, mass):
+    """Operational space terms from (stacks of) Jacobians and mass matrices"""
+
+    cholesky_factor = np.linalg.cholesky(mass)
+    y = _solve_triangular(cholesky_factor, np.swapaxes(jacobian_matrix, -1, -2))
+
+    inertia = np.linalg.inv(np.swapaxes(y, -1, -2) @ y)
+    pseudoinverse = _solve_triangular(cholesky_factor, y, transposed=True) @ inertia
+    projector = np.eye(7) - pseudoinverse @ jacobian_matrix
+
+    return inertia, pseudoinverse, projector
+
+
+@instrumented
+def operational_space(joint_position):
+    """Operational space inertia, dynamically consistent pseudoinverse and projector
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+
+    Returns
+    -------
+    ndarray: The operational space inertia matrix Lambda, shape (6, 6)
+    ndarray: The dynamically consistent pseudoinverse Jbar, shape (7, 6)
+    ndarray: The nullspace projector I - Jbar J, shape (7, 7)
+
+    """
+
+    return _operational_space(jacobian(joint_position), mass_matrix(joint_position))
+
+
+@instrumented
+def operational_space_batch(joint_position):
+    """Operational space terms for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: The operational space inertia matrices, shape (N, 6, 6)
+    ndarray: The dynamically consistent pseudoinverses, shape (N, 7, 6)
+    ndarray: The nullspace projectors, shape (N, 7, 7)
+
+    """
+
+    return _operational_space(
+        jacobian_batch(joint_position), mass_matrix_batch(joint_position)
+    )
@@ -0,0 +1,182 @@
+"""Fixed-step simulation of batches of Kinova Gen3 robots
+
+Functions
+---------
+forward_dynamics_batch(joint_position, joint_velocity, joint_torque)
+
+Classes
+-------
+Simulator
+
+"""
+
+import numpy as np
+from kinova_gen3.dynamics.terms import dynamics_terms_batch
+
+
+def forward_dynamics_batch(joint_position, joint_velocity, joint_torque):
+    """Joint accelerations of a batch of robots
+
+    Solve M(q) qdd = tau - C(q, qp) - g(q) for every robot of the batch.
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+    joint_velocity (array_like): The joint velocities, shape (N, 7) [rad/s]
+    joint_torque (array_like): The joint torques, shape (N, 7) or (7,) [Nm]
+
+    Returns
+    -------
+    ndarray: The joint accelerations, shape (N, 7) [rad/s^2]
+
+    """
+
+    mass, coriolis_term, gravity_term = dynamics_terms_batch(joint_position, joint_velocity)
+    rhs = joint_torque - coriolis_term - gravity_term
+
+    return np.linalg.solve(mass, rhs[..., None])[..., 0]
+
+
+class Simulator:
+    """Fixed-step integrator advancing a batch of robots in place
+
+    The state of all robots is kept in preallocated (N, 7) arrays that are
+    updated in place at every step. The joint torques are held constant over
+    a step.
+
+    Attributes
+    ----------
+    joint_position (ndarray): The joint angles of the robots, shape (N, 7) [rad]
+    joint_velocity (ndarray): The joint velocities of the robots, shape (N, 7) [rad/s]
+    time (float): The simulated time [s]
+    time_step (float): The integration step [s]
+    method (str): "semi_implicit_euler" or "rk4"
+
+    Methods
+    -------
+    step(joint_torque)
+        Advance the robots by one time step
+    run(duration, controller, joint_torque, record_every)
+        Advance the robots over a duration, optionally recording the states
+
+    """
+
+    METHODS = ("semi_implicit_euler", "rk4")
+
+    def __init__(self, joint_position, joint_velocity=None, time_step=1e-3,
+                 method="semi_implicit_euler"):
+        """Create the simulator
+
+        Arguments
+        ---------
+        joint_position (array_like): The initial joint angles, shape (N, 7) [rad]
+        joint_velocity (array_like): The initial joint velocities, shape (N, 7)
+                                     [rad/s], zero by default
+        time_step (float): The integration step [s]
+        method (str): "semi_implicit_euler" or "rk4"
+
+        """
+
+        if method not in self.METHODS:
+            raise ValueError("Unknown integration method {!r}".format(method))
+
+        self.joint_position = np.array(joint_position, dtype=float, ndmin=2)
+        self.joint_velocity = np.zeros_like(self.joint_position)
+        if joint_velocity is not None:
+            self.joint_velocity[...] = joint_velocity
+
+        self.time = 0.0
+        self.time_step = time_step
+        self.method = method
+
+        # Scratch buffers of the Runge-Kutta stages
+        if method == "rk4":
+            shape = (4,) + self.joint_position.shape
+            self._velocity_stages = np.empty(shape)
+            self._acceleration_stages = np.empty(shape)
+            self._position_stage = np.empty_like(self.joint_position)
+            self._velocity_stage = np.empty_like(self.joint_position)
+
+    def step(self, joint_torque=0.0):
+        """Advance the robots by one time step
+
+        Arguments
+        ---------
+        joint_torque (array_like): The joint torques, shape (N, 7) or (7,) [Nm]
+
+        """
+
+        q = self.joint_position
+        qp = self.joint_velocity
+        dt = self.time_step
+
+        if self.method == "semi_implicit_euler":
+            qp += dt * forward_dynamics_batch(q, qp, joint_torque)
+            q += dt * qp
+        else:
+            k_q = self._velocity_stages
+            k_qp = self._acceleration_stages
+            q_stage = self._position_stage
+            qp_stage = self._velocity_stage
+
+            k_q[0] = qp
+            k_qp[0] = forward_dynamics_batch(q, qp, joint_torque)
+            for i, fraction in ((1, 0.5), (2, 0.5), (3, 1.0)):
+                np.multiply(fraction * dt, k_q[i - 1], out=q_stage)
+                q_stage += q
+                np.multiply(fraction * dt, k_qp[i - 1], out=qp_stage)
+                qp_stage += qp
+                k_q[i] = qp_stage
+                k_qp[i] = forward_dynamics_batch(q_stage, qp_stage, joint_torque)
+
+            q += dt / 6 * (k_q[0] + 2 * k_q[1] + 2 * k_q[2] + k_q[3])
+            qp += dt / 6 * (k_qp[0] + 2 * k_qp[1] + 2 * k_qp[2] + k_qp[3])
+
+        self.time += dt
+
+    def run(self, duration, controller=None, joint_torque=0.0, record_every=0):
+        """Advance the robots over a duration
+
+        Arguments
+        ---------
+        duration (float): The simulated duration [s]
+        controller (callable): Called as controller(time, joint_position,
+                               joint_velocity) before every step, returns the
+                               joint torques [Nm]. The state arrays passed to
+                               it must not be modified.
+        joint_torque (array_like): Constant joint torques used without a
+                                   controller [Nm]
+        record_every (int): Record the state every this many steps, including
+                            the initial state, 0 disables the recording
+
+        Returns
+        -------
+        ndarray: The recorded times, shape (R,) [s]
+        ndarray: The recorded joint angles, shape (R, N, 7) [rad]
+        ndarray: The recorded joint velocities, shape (R, N, 7) [rad/s]
+
+        """
+
+        n_steps = int(round(duration / self.time_step))
+        n_records = n_steps // record_every + 1 if record_every else 0
+
+        times = np.empty(n_records)
+        positions = np.empty((n_records,) + self.joint_position.shape)
+        velocities = np.empty((n_records,) + self.joint_velocity.shape)
+
+        for i in range(n_steps + 1):
+            if record_every and i % record_every == 0:
+                record = i // record_every
+                times[record] = self.time
+                positions[record] = self.joint_position
+                velocities[record] = self.joint_velocity
+
+            if i == n_steps:
+                break
+
+            if controller is not None:
+                joint_torque = controller(self.time, self.joint_position, self.joint_velocity)
+
+            self.step(joint_torque)
+
+        return times, positions, velocities
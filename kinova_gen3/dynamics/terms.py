@@ -0,0 +1,7941 @@
+"""Fused evaluation of the dynamic terms of Kinova Gen3
+
+The mass matrix, Coriolis and gravity terms are evaluated by one generated
+expression, in which the sines, cosines and subexpressions common to the
+three terms are computed once, and the entries are written into given
+arrays. The results equal those of ``mass_matrix``, ``coriolis`` and
+``gravity``. The body of ``_dynamics_terms`` is generated from these
+functions by tools/generate_dynamics_terms.py.
+
+Functions
+---------
+dynamics_terms(joint_position, joint_velocity, out)
+dynamics_terms_batch(joint_position, joint_velocity, out)
+
+"""
+
+import math
+import types
+import numpy
+from kinova_gen3._batch import _math
+from kinova_gen3.instrumentation import instrumented
+
+
+def _dynamics_terms(q, qp, mass, coriolis_term, gravity_term):
+    """Write the dynamic terms into the given arrays
+
+    The entries are written as ``array[..., i, j]``, so the arrays hold either
+    a single set of terms or a batch of them.
+
+    Arguments
+    ---------
+    q (array_like): The joint angles of the robot [rad]
+    qp (array_like): The joint velocities of the robot [rad/s]
+    mass (ndarray): The mass matrix, shape (..., 7, 7)
+    coriolis_term (ndarray): The Coriolis term, shape (..., 7)
+    gravity_term (ndarray): The gravity term, shape (..., 7)
+
+    """
+
+    q2 = q[1]
+    q3 = q[2]
+    q4 = q[3]
+    q5 = q[4]
+    q6 = q[5]
+    q7 = q[6]
+    x0 = math.sin(q2)
+    x1 = x0**2
+    x2 = math.cos(q2)
+    x3 = math.cos(q3)
+    x4 = x3**2
+    x5 = math.sin(q3)
+    x6 = x0 * x5
+    x7 = x2 * x3
+    x8 = x0 * x3
+    x9 = 0.010932 * x8 - 7e-06 * x2
+    x10 = -0.006641 * x8 - 4.4e-05 * x6
+    x11 = 0.000606 * x2 - 0.011127 * x6
+    x12 = 0.006641 * x2 + 0.117892 * x6
+    x13 = x12 * x3
+    x14 = 0.0125087 * x2
+    x15 = 0.006375 * x2
+    x16 = 0.21038 * x6
+    x17 = -x15 + x16
+    x18 = x17 * x3
+    x19 = 0.117892 * x8 - 4.4e-05 * x2
+    x20 = x19 * x5
+    x21 = math.sin(q4)
+    x22 = x21 * x2
+    x23 = math.cos(q4)
+    x24 = x8 * x23
+    x25 = x22 + x24
+    x26 = -x22 - x24
+    x27 = 0.21038 * x8
+    x28 = x15 * x5
+    x29 = x27 + x28
+    x30 = 0.20843 * x22
+    x31 = 0.20843 * x24
+    x32 = -x30 - x31
+    x33 = x32 * x5
+    x34 = 0.390633584 * x30 + 0.390633584 * x31
+    x35 = x23 * x2
+    x36 = x8 * x21
+    x37 = -x15 * x3 + x16
+    x38 = 0.21038 * x4
+    x39 = 0.017767125 * x2
+    x40 = -0.0005 * x35 + 0.0005 * x36 + 0.008316 * x6
+    x41 = math.cos(q5)
+    x42 = x22 * x41
+    x43 = math.sin(q5)
+    x44 = x43 * x5
+    x45 = x41 * x3
+    x46 = x23 * x45
+    x47 = -x44 + x46
+    x48 = x0 * x47
+    x49 = x42 + x48
+    x50 = -x27 - x28
+    x51 = x0 * x23
+    x52 = x22 * x3
+    x53 = -x51 - x52
+    x54 = 0.006375 * x22
+    x55 = 0.006375 * x24
+    x56 = x54 + x55
+    x57 = 0.005375 * x51 + 0.005375 * x52
+    x58 = 1.8568 * x56
+    x59 = 0.00741795 * x2
+    x60 = 0.244798168 * x0
+    x61 = 0.075478 * x22
+    x62 = 1.8e-05 * x35
+    x63 = 1.8e-05 * x21
+    x64 = x8 * x63
+    x65 = 0.075478 * x23
+    x66 = x8 * x65
+    x67 = -x61 + x62 - x64 - x66
+    x68 = 0.195695476 * x8
+    x69 = x5 * x67
+    x70 = x61 - x62 + x64 + x66
+    x71 = -0.015006 * x35 + 0.015006 * x36 + 0.075478 * x6
+    x72 = x0 * x21
+    x73 = x35 * x3
+    x74 = -x72 + x73
+    x75 = 0.004999825 * x74
+    x76 = 0.006375 * x35
+    x77 = 0.006375 * x36
+    x78 = 0.20843 * x6 - x76 + x77
+    x79 = 0.0099803 * x74
+    x80 = 0.005375 * x72
+    x81 = -0.005375 * x73 + x80
+    x82 = 0.9302 * x71
+    x83 = 1.8568 * x78
+    x84 = 0.015006 * x22 + 0.015006 * x24 - 1.8e-05 * x6
+    x85 = 0.004999825 * x53
+    x86 = 0.9302 * x84
+    x87 = x17 * x21
+    x88 = x55 - x87
+    x89 = -x16 * x21 + x3 * x54 + 0.006375 * x51
+    x90 = 0.00017505 * x42 + 0.00017505 * x48
+    x91 = 0.0063355125 * x53
+    x92 = 1.1787 * x90
+    x93 = 0.9302 * x67
+    x94 = 1e-06 * x35
+    x95 = 1e-06 * x21
+    x96 = x8 * x95
+    x97 = x96 + 0.008147 * x22 + 0.008147 * x24 - x94
+    x98 = x22 * x43
+    x99 = x41 * x5
+    x100 = x43 * x3
+    x101 = x100 * x23
+    x102 = -x99 - x101
+    x103 = x0 * x102
+    x104 = x98 - x103
+    x105 = x17 * x23
+    x106 = x105 + x77
+    x107 = 0.006375 * x72
+    x108 = x107 + x16 * x23 - x3 * x76
+    x109 = x23 * x56
+    x110 = x109 + x21 * x78
+    x111 = 0.0118371 * x0
+    x112 = 0.0118371 * x8
+    x113 = math.sin(q6)
+    x114 = x113 * x23
+    x115 = math.cos(q6)
+    x116 = x115 * x21
+    x117 = x116 * x41
+    x118 = x114 + x117
+    x119 = x118 * x2
+    x120 = x115 * x44
+    x121 = x113 * x21
+    x122 = x115 * x23
+    x123 = x122 * x41
+    x124 = -x121 + x123
+    x125 = x124 * x3
+    x126 = -x120 + x125
+    x127 = x0 * x126
+    x128 = x119 + x127
+    x129 = x35 - x36
+    x130 = 0.0005 * x6
+    x131 = 1e-06 * x23
+    x132 = -x8 * x131 - x130 - 1e-06 * x22 + 0.000631 * x35 - 0.000631 * x36
+    x133 = -x119 - x127
+    x134 = x21 * x71 + x23 * x84
+    x135 = 0.005930025 * x0
+    x136 = 0.001596 * x42 + 0.001596 * x48
+    x137 = 0.10593 * x41
+    x138 = x137 * x22
+    x139 = 0.10593 * x48
+    x140 = x138 + x139
+    x141 = x43 * x72
+    x142 = x102 * x2
+    x143 = x141 + x142
+    x144 = 0.0063355125 * x143
+    x145 = 0.005930025 * x8
+    x146 = x21 * x56
+    x147 = x23 * x78
+    x148 = -x146 + x147
+    x149 = 1.8568 * x17
+    x150 = x43 * x80
+    x151 = -0.005375 * x142 - x150
+    x152 = 1.1787 * x140
+    x153 = -0.000256 * x98 + 0.000256 * x103 + 0.000399 * x35 - 0.000399 * x36
+    x154 = x23 * x71
+    x155 = x21 * x84
+    x156 = x154 - x155
+    x157 = 0.9302 * x17
+    x158 = x27 * x41
+    x159 = x21 * x43
+    x160 = 0.006375 * x8
+    x161 = x159 * x160
+    x162 = x105 * x43
+    x163 = x158 - x161 - x162
+    x164 = -x96 + 0.063883 * x42 + 0.063883 * x48 + x94
+    x165 = 0.0036447875 * x143
+    x166 = 0.10593 * x98
+    x167 = -0.10593 * x103 + x166 - 0.00017505 * x35 + 0.00017505 * x36
+    x168 = x41 * x72
+    x169 = x2 * x47
+    x170 = -x168 + x169
+    x171 = 0.0063355125 * x170
+    x172 = 0.063883 * x98 - 0.063883 * x103 + 0.009432 * x35 - 0.009432 * x36
+    x173 = 0.0036447875 * x170
+    x174 = -x98 + x103
+    x175 = -0.001607 * x98 + 0.001607 * x103 + 0.000256 * x35 - 0.000256 * x36
+    x176 = x146 * x3
+    x177 = x147 * x3
+    x178 = 0.0118371 * x2
+    x179 = 0.390633584 * x0
+    x180 = -0.005375 * x169 + x41 * x80
+    x181 = 1.1787 * x167
+    x182 = 0.6781 * x172
+    x183 = 0.6781 * x164
+    x184 = 1e-06 * x43
+    x185 = x184 * x22
+    x186 = 0.009432 * x41
+    x187 = -1e-06 * x103 + x185 - x186 * x22 - 0.009432 * x48
+    x188 = 0.0036447875 * x53
+    x189 = 0.6781 * x187
+    x190 = x32 * x41
+    x191 = x43 * x78
+    x192 = -x190 - x191
+    x193 = x107 * x43
+    x194 = x23 * x44
+    x195 = x194 - x45
+    x196 = 0.21038 * x0
+    x197 = -x102 * x15 - x193 - x195 * x196
+    x198 = 0.10593 * x119
+    x199 = 0.10593 * x127
+    x200 = -x198 - x199
+    x201 = x99 + x101
+    x202 = x201 * x2
+    x203 = -x141 + x202
+    x204 = 0.002690725 * x203
+    x205 = x0 * x201
+    x206 = x150 - 0.005375 * x202
+    x207 = 0.5006 * x200
+    x208 = x113 * x44
+    x209 = x114 * x41
+    x210 = -x116 - x209
+    x211 = x210 * x3
+    x212 = x208 + x211
+    x213 = x0 * x212
+    x214 = x121 * x41
+    x215 = x122 - x214
+    x216 = x215 * x2
+    x217 = x98 + x205
+    x218 = -x138 - x139
+    x219 = x198 + x199
+    x220 = 0.5006 * x140
+    x221 = x21 * x41
+    x222 = x105 * x41
+    x223 = x160 * x221 + x222 + x27 * x43
+    x224 = x140 * x41
+    x225 = x167 * x43
+    x226 = x224 + x225
+    x227 = 0.247974906 * x8
+    x228 = -x158 + x161 + x162
+    x229 = x32 * x43
+    x230 = x41 * x78
+    x231 = -x229 + x230
+    x232 = x99 * x23
+    x233 = -x100 - x232
+    x234 = x107 * x41 - x15 * x47 - x196 * x233
+    x235 = 0.195695476 * x0
+    x236 = x154 * x3
+    x237 = x155 * x3
+    x238 = 0.005930025 * x2
+    x239 = x190 + x191
+    x240 = -x224 - x225
+    x241 = 1.1787 * x32
+    x242 = -x194 + x45
+    x243 = -x15 * x201 + x193 - x196 * x242
+    x244 = 0.001641 * x119 + 0.001641 * x127
+    x245 = x164 * x41
+    x246 = x172 * x43
+    x247 = x245 + x246
+    x248 = 0.142658678 * x8
+    x249 = 0.00017505 * x119 + 0.00017505 * x127
+    x250 = x0 * x215
+    x251 = x212 * x2
+    x252 = -x250 + x251
+    x253 = 0.002690725 * x252
+    x254 = 0.005375 * x250 - 0.005375 * x251
+    x255 = 0.5006 * x254
+    x256 = x140 * x43
+    x257 = x167 * x41
+    x258 = -x256 + x257
+    x259 = 1.1787 * x78
+    x260 = 0.001641 * x98 + 0.001641 * x205 - 0.000278 * x213 - 0.000278 * x216
+    x261 = x113 * x43
+    x262 = x17 * x210
+    x263 = x160 * x215 - x261 * x27 + x262
+    x264 = 0.5006 * x249
+    x265 = -x245 - x246
+    x266 = 0.6781 * x32
+    x267 = x164 * x43
+    x268 = x172 * x41
+    x269 = -x267 + x268
+    x270 = 0.6781 * x78
+    x271 = x23 * x90
+    x272 = -x21 * x256 + x21 * x257 + x271
+    x273 = 0.0075142125 * x0
+    x274 = x115 * x56
+    x275 = x113 * x229
+    x276 = x113 * x230
+    x277 = x274 + x275 - x276
+    x278 = 0.0075142125 * x8
+    x279 = x213 + x216
+    x280 = -0.000278 * x98 - 0.000278 * x205 + 0.00041 * x213 + 0.00041 * x216
+    x281 = 0.045483 * x98 + 0.045483 * x205 - 0.00965 * x213 - 0.00965 * x216
+    x282 = x0 * x118
+    x283 = x126 * x2
+    x284 = -x282 + x283
+    x285 = 0.0036447875 * x284
+    x286 = x166 + 0.10593 * x205 - 0.00017505 * x213 - 0.00017505 * x216
+    x287 = 0.002690725 * x284
+    x288 = 0.00965 * x119 + 0.00965 * x127 + x185 + 1e-06 * x205
+    x289 = 0.0036447875 * x252
+    x290 = 0.045483 * x119
+    x291 = 1e-06 * x216
+    x292 = 0.045483 * x127
+    x293 = 1e-06 * x213
+    x294 = -x290 - x291 - x292 - x293
+    x295 = 0.0036447875 * x203
+    x296 = 0.005375 * x282 - 0.005375 * x283
+    x297 = 0.6781 * x281
+    x298 = 0.5006 * x286
+    x299 = 0.6781 * x288
+    x300 = 0.6781 * x294
+    x301 = x21 * x90
+    x302 = x23 * x256
+    x303 = x23 * x257
+    x304 = -x301 - x302 + x303
+    x305 = 1.1787 * x17
+    x306 = x290 + x291 + x292 + x293
+    x307 = 0.6781 * x140
+    x308 = x115 * x90
+    x309 = x113 * x167
+    x310 = x308 - x309
+    x311 = 0.5006 * x310
+    x312 = x100 * x113
+    x313 = x210 * x5
+    x314 = x312 - x313
+    x315 = -x15 * x212 - x196 * x314 + 0.006375 * x250
+    x316 = math.cos(q7)
+    x317 = x114 * x316
+    x318 = math.sin(q7)
+    x319 = x318 * x43
+    x320 = x316 * x41
+    x321 = x115 * x320
+    x322 = -x319 + x321
+    x323 = x21 * x322
+    x324 = x317 + x323
+    x325 = x2 * x324
+    x326 = x318 * x41
+    x327 = x316 * x43
+    x328 = x115 * x327
+    x329 = x326 + x328
+    x330 = x329 * x5
+    x331 = x121 * x316
+    x332 = x23 * x322
+    x333 = -x331 + x332
+    x334 = x333 * x3
+    x335 = -x330 + x334
+    x336 = x0 * x335
+    x337 = x325 + x336
+    x338 = x115 * x43
+    x339 = x124 * x17
+    x340 = x118 * x160 + x27 * x338 + x339
+    x341 = x114 * x318
+    x342 = x115 * x326
+    x343 = -x327 - x342
+    x344 = x21 * x343
+    x345 = -x341 + x344
+    x346 = x2 * x345
+    x347 = x115 * x319
+    x348 = x320 - x347
+    x349 = x348 * x5
+    x350 = x121 * x318
+    x351 = x23 * x343
+    x352 = x350 + x351
+    x353 = x352 * x3
+    x354 = -x349 + x353
+    x355 = x0 * x354
+    x356 = 0.247974906 * x0
+    x357 = x301 * x3
+    x358 = x102 * x140
+    x359 = x167 * x47
+    x360 = 0.0075142125 * x2
+    x361 = x113 * x56
+    x362 = x115 * x229
+    x363 = x115 * x230
+    x364 = x361 - x362 + x363
+    x365 = x115 * x249
+    x366 = x113 * x286 + x365
+    x367 = 0.5006 * x366
+    x368 = x113 * x90
+    x369 = x115 * x167
+    x370 = x368 + x369
+    x371 = x100 * x115
+    x372 = x124 * x5
+    x373 = -x371 - x372
+    x374 = -x126 * x15 - x196 * x373 + 0.006375 * x282
+    x375 = x187 * x23
+    x376 = -x21 * x267 + x21 * x268 + x375
+    x377 = 0.0043228875 * x0
+    x378 = 0.0043228875 * x8
+    x379 = x23 * x267
+    x380 = x23 * x268
+    x381 = x187 * x21
+    x382 = -x379 + x380 - x381
+    x383 = 0.6781 * x17
+    x384 = x113 * x281 + x115 * x288
+    x385 = 0.6781 * x384
+    x386 = x113 * x249
+    x387 = x115 * x286
+    x388 = -x386 + x387
+    x389 = 0.5006 * x167
+    x390 = 0.142658678 * x0
+    x391 = x172 * x47
+    x392 = x102 * x164
+    x393 = x381 * x3
+    x394 = 0.0043228875 * x2
+    x395 = x200 * x41
+    x396 = x386 * x43
+    x397 = x387 * x43
+    x398 = -x395 - x396 + x397
+    x399 = 0.105316228 * x8
+    x400 = x113 * x288
+    x401 = x115 * x281
+    x402 = -x400 + x401
+    x403 = 0.6781 * x167
+    x404 = x395 + x396 - x397
+    x405 = 0.5006 * x32
+    x406 = x200 * x43
+    x407 = x386 * x41
+    x408 = x387 * x41
+    x409 = x406 - x407 + x408
+    x410 = 0.5006 * x78
+    x411 = x118 * x286 + x215 * x249 + x21 * x406
+    x412 = 0.003191325 * x0
+    x413 = 0.003191325 * x8
+    x414 = 0.011402 * x213 + 0.011402 * x216 - 0.029798 * x346 - 0.029798 * x355
+    x415 = x0 * x324
+    x416 = x2 * x335
+    x417 = -x415 + x416
+    x418 = 0.002690725 * x417
+    x419 = -0.000281 * x213 - 0.000281 * x216 + 0.029798 * x325 + 0.029798 * x336
+    x420 = x0 * x345
+    x421 = x2 * x354
+    x422 = -x420 + x421
+    x423 = 0.002690725 * x422
+    x424 = -0.011402 * x325 - 0.011402 * x336 + 0.000281 * x346 + 0.000281 * x355
+    x425 = 0.005375 * x415 - 0.005375 * x416
+    x426 = 0.5006 * x414
+    x427 = 0.005375 * x420 - 0.005375 * x421
+    x428 = 0.5006 * x419
+    x429 = x23 * x406
+    x430 = x210 * x249
+    x431 = x124 * x286
+    x432 = x429 + x430 + x431
+    x433 = 0.5006 * x17
+    x434 = x318 * x361
+    x435 = -x320 + x347
+    x436 = x32 * x435
+    x437 = x343 * x78
+    x438 = -x434 + x436 + x437
+    x439 = x316 * x361
+    x440 = -x326 - x328
+    x441 = x32 * x440
+    x442 = x322 * x78
+    x443 = x439 + x441 + x442
+    x444 = x17 * x333
+    x445 = x160 * x324 + x27 * x329 + x444
+    x446 = x17 * x352
+    x447 = x160 * x345 + x27 * x348 + x446
+    x448 = 0.5006 * x424
+    x449 = x140 * x316
+    x450 = x318 * x368
+    x451 = x318 * x369
+    x452 = x449 - x450 - x451
+    x453 = x200 * x201
+    x454 = x212 * x249
+    x455 = x126 * x286
+    x456 = 0.003191325 * x2
+    x457 = x140 * x318
+    x458 = x316 * x368
+    x459 = x316 * x369
+    x460 = x457 + x458 + x459
+    x461 = 0.105316228 * x0
+    x462 = 3e-06 * x325 + 3e-06 * x336
+    x463 = 0.000609 * x213 + 0.000609 * x216 + 0.000118 * x346 + 0.000118 * x355 + x462
+    x464 = x200 * x316
+    x465 = x286 * x318
+    x466 = -x464 - x465
+    x467 = x200 * x318
+    x468 = x286 * x316
+    x469 = -x467 + x468
+    x470 = x329 * x3
+    x471 = x333 * x5
+    x472 = -x470 - x471
+    x473 = -x15 * x335 - x196 * x472 + 0.006375 * x415
+    x474 = x400 * x43
+    x475 = x401 * x43
+    x476 = x294 * x41
+    x477 = -x474 + x475 - x476
+    x478 = x348 * x3
+    x479 = x352 * x5
+    x480 = -x478 - x479
+    x481 = -x15 * x354 - x196 * x480 + 0.006375 * x420
+    x482 = x474 - x475 + x476
+    x483 = x400 * x41
+    x484 = x401 * x41
+    x485 = x294 * x43
+    x486 = -x483 + x484 + x485
+    x487 = x118 * x281 + x215 * x288 + x21 * x485
+    x488 = (
+        3e-06 * x213
+        + 3e-06 * x216
+        + 0.000587 * x325
+        + 0.000587 * x336
+        + 3e-06 * x346
+        + 3e-06 * x355
+    )
+    x489 = x124 * x281
+    x490 = x210 * x288
+    x491 = x23 * x485
+    x492 = x489 + x490 + x491
+    x493 = x346 + x355
+    x494 = 0.000118 * x213 + 0.000118 * x216 + 0.000369 * x346 + 0.000369 * x355 + x462
+    x495 = x316 * x419
+    x496 = x318 * x414
+    x497 = x495 + x496
+    x498 = x212 * x288
+    x499 = x126 * x281
+    x500 = x201 * x294
+    x501 = -x495 - x496
+    x502 = x318 * x419
+    x503 = x316 * x414
+    x504 = -x502 + x503
+    x505 = x115 * x424
+    x506 = -x113 * x502 + x113 * x503 + x505
+    x507 = 0.5006 * x506
+    x508 = x113 * x424
+    x509 = x43 * x508
+    x510 = x329 * x414 + x348 * x419 - x509
+    x511 = x414 * x440 + x419 * x435 + x509
+    x512 = x115 * x502
+    x513 = x115 * x503
+    x514 = -x508 - x512 + x513
+    x515 = x343 * x419
+    x516 = x322 * x414
+    x517 = x41 * x508
+    x518 = x515 + x516 - x517
+    x519 = x215 * x424 + x324 * x414 + x345 * x419
+    x520 = x352 * x419
+    x521 = x333 * x414
+    x522 = x210 * x424
+    x523 = x520 + x521 + x522
+    x524 = x354 * x419
+    x525 = x335 * x414
+    x526 = x212 * x424
+    x527 = 0.00017505 * x100
+    x528 = 0.00017505 * x23
+    x529 = x99 * x528
+    x530 = -x527 - x529
+    x531 = x21 * x530
+    x532 = 0.10593 * x100
+    x533 = 0.10593 * x232
+    x534 = -x532 - x533
+    x535 = x43 * x534
+    x536 = x23 * x535
+    x537 = x21 * x5
+    x538 = -0.10593 * x194 + 0.10593 * x45
+    x539 = -0.00017505 * x537 + x538
+    x540 = x41 * x539
+    x541 = x23 * x540
+    x542 = -x531 - x536 + x541
+    x543 = 0.20843 * x3
+    x544 = -0.006375 * x537
+    x545 = x543 + x544
+    x546 = x41 * x545
+    x547 = -0.20843 * x194 + x546
+    x548 = -x535 + x540
+    x549 = 0.20843 * x232
+    x550 = x43 * x545
+    x551 = -x549 - x550
+    x552 = x41 * x534
+    x553 = x43 * x539
+    x554 = -x552 - x553
+    x555 = x23 * x5
+    x556 = 0.006375 * x555
+    x557 = 0.21038 * x3
+    x558 = -x21 * x557 - x556
+    x559 = 0.21038 * x99
+    x560 = 0.21038 * x101
+    x561 = -x559 - x560
+    x562 = 0.006375 * x21
+    x563 = x44 * x562
+    x564 = x561 + x563
+    x565 = -0.21038 * x44 + 0.21038 * x46
+    x566 = -x99 * x562 + x565
+    x567 = 0.011402 * x312 - 0.011402 * x313 + 0.029798 * x478 + 0.029798 * x479
+    x568 = -0.000281 * x312 + 0.000281 * x313 - 0.029798 * x470 - 0.029798 * x471
+    x569 = 0.011402 * x470
+    x570 = 0.000281 * x478
+    x571 = 0.011402 * x471
+    x572 = 0.000281 * x479
+    x573 = x569 - x570 + x571 - x572
+    x574 = x215 * x573 + x324 * x567 + x345 * x568
+    x575 = 0.10593 * x371
+    x576 = 0.10593 * x372
+    x577 = x575 + x576
+    x578 = x43 * x577
+    x579 = -0.00017505 * x371 - 0.00017505 * x372
+    x580 = -0.00017505 * x312 + 0.00017505 * x313 + x538
+    x581 = x118 * x580 + x215 * x579 + x21 * x578
+    x582 = x23**2
+    x583 = 0.006375 * x582
+    x584 = x583 * x5
+    x585 = x21 * x545 - x584
+    x586 = x23 * x545
+    x587 = x21 * x556 + x586
+    x588 = x23 * x557 + x544
+    x589 = x352 * x568
+    x590 = x333 * x567
+    x591 = x210 * x573
+    x592 = x589 + x590 + x591
+    x593 = x23 * x578
+    x594 = x210 * x579
+    x595 = x124 * x580
+    x596 = x593 + x594 + x595
+    x597 = x549 + x550
+    x598 = x115 * x579
+    x599 = x113 * x580 + x598
+    x600 = 0.5006 * x599
+    x601 = x115 * x530
+    x602 = x113 * x539
+    x603 = x601 - x602
+    x604 = x113 * x530
+    x605 = x115 * x539
+    x606 = x604 + x605
+    x607 = x316 * x568
+    x608 = x318 * x567
+    x609 = x607 + x608
+    x610 = x113 * x579
+    x611 = x115 * x580
+    x612 = -x610 + x611
+    x613 = x318 * x577
+    x614 = x316 * x580
+    x615 = -x613 + x614
+    x616 = x318 * x568
+    x617 = x316 * x567
+    x618 = -x616 + x617
+    x619 = x316 * x577
+    x620 = x318 * x580
+    x621 = -x619 - x620
+    x622 = -x607 - x608
+    x623 = -0.21038 * x349 + 0.21038 * x353
+    x624 = -0.21038 * x330 + 0.21038 * x334
+    x625 = 0.21038 * x208 + 0.21038 * x211
+    x626 = -0.21038 * x120 + 0.21038 * x125
+    x627 = x559 + x560
+    x628 = 0.006375 * x5
+    x629 = -x215 * x628 + x625
+    x630 = 0.20843 * x44
+    x631 = x113 * x546
+    x632 = x114 * x630 - x122 * x628 - x631
+    x633 = x115 * x573
+    x634 = -x113 * x616 + x113 * x617 + x633
+    x635 = 0.5006 * x634
+    x636 = -x575 - x576
+    x637 = x532 + x533
+    x638 = x113 * x573
+    x639 = x43 * x638
+    x640 = x435 * x568 + x440 * x567 + x639
+    x641 = x41 * x577
+    x642 = x43 * x610
+    x643 = x43 * x611
+    x644 = x641 + x642 - x643
+    x645 = -x563 + x627
+    x646 = 0.20843 * x555
+    x647 = x343 * x545
+    x648 = x341 * x628 + x435 * x646 + x647
+    x649 = x322 * x545
+    x650 = -x317 * x628 + x440 * x646 + x649
+    x651 = x322 * x567
+    x652 = x343 * x568
+    x653 = x41 * x638
+    x654 = x651 + x652 - x653
+    x655 = x41 * x610
+    x656 = x41 * x611
+    x657 = x578 - x655 + x656
+    x658 = x316 * x534
+    x659 = x318 * x604
+    x660 = x318 * x605
+    x661 = x658 - x659 - x660
+    x662 = x318 * x534
+    x663 = x316 * x604
+    x664 = x316 * x605
+    x665 = x662 + x663 + x664
+    x666 = x115 * x616
+    x667 = x115 * x617
+    x668 = -x638 - x666 + x667
+    x669 = -x345 * x628 + x623
+    x670 = -x324 * x628 + x624
+    x671 = -x118 * x628 + x626
+    x672 = x115 * x546
+    x673 = -x114 * x628 - x122 * x630 + x672
+    x674 = 1e-06 * x45
+    x675 = x131 * x44
+    x676 = x674 - x675
+    x677 = -0.00965 * x371 - 0.00965 * x372 + x676
+    x678 = -0.045483 * x194 - 0.00965 * x312 + 0.00965 * x313 + 0.045483 * x45
+    x679 = 1e-06 * x113
+    x680 = x100 * x679
+    x681 = 0.045483 * x115
+    x682 = x100 * x681
+    x683 = 0.045483 * x372
+    x684 = 1e-06 * x313
+    x685 = -x680 + x682 + x683 + x684
+    x686 = x43 * x685
+    x687 = x118 * x678 + x215 * x677 + x21 * x686
+    x688 = -0.063883 * x194 + 0.063883 * x45 + 0.009432 * x537
+    x689 = x41 * x688
+    x690 = x5 * x95
+    x691 = -0.063883 * x100 - 0.063883 * x232 + x690
+    x692 = x43 * x691
+    x693 = 0.009432 * x100
+    x694 = 0.009432 * x23
+    x695 = x99 * x694
+    x696 = x676 + x693 + x695
+    x697 = x23 * x696
+    x698 = x21 * x689 - x21 * x692 + x697
+    x699 = x124 * x678
+    x700 = x210 * x677
+    x701 = x23 * x686
+    x702 = x699 + x700 + x701
+    x703 = x23 * x689
+    x704 = x23 * x692
+    x705 = x21 * x696
+    x706 = x703 - x704 - x705
+    x707 = x689 - x692
+    x708 = x113 * x678 + x115 * x677
+    x709 = 0.6781 * x708
+    x710 = x113 * x677
+    x711 = x115 * x678
+    x712 = -x710 + x711
+    x713 = x41 * x691
+    x714 = x43 * x688
+    x715 = -x713 - x714
+    x716 = x680 - x682 - x683 - x684
+    x717 = x43 * x710
+    x718 = x43 * x711
+    x719 = x41 * x685
+    x720 = x717 - x718 + x719
+    x721 = x41 * x710
+    x722 = x41 * x711
+    x723 = x686 - x721 + x722
+    x724 = 0.075478 * x3
+    x725 = -0.015006 * x537 + x724
+    x726 = 1.8e-05 * x3
+    x727 = -0.015006 * x555 - x726
+    x728 = x21 * x725 + x23 * x727
+    x729 = x23 * x725
+    x730 = x21 * x727
+    x731 = x729 - x730
+    x732 = x23 * x530
+    x733 = -x21 * x535 + x21 * x540 + x732
+    x734 = x5**2
+    x735 = x212 * x573
+    x736 = x335 * x567
+    x737 = x354 * x568
+    x738 = x201 * x577
+    x739 = x212 * x579
+    x740 = x126 * x580
+    x741 = x23 * x734
+    x742 = x21 * x3
+    x743 = x3 * x586
+    x744 = x212 * x677
+    x745 = x201 * x685
+    x746 = x126 * x678
+    x747 = x3 * x705
+    x748 = x47 * x688
+    x749 = x102 * x691
+    x750 = x63 * x5
+    x751 = x65 * x5
+    x752 = x750 + x751
+    x753 = x5 * x752
+    x754 = x3 * x729
+    x755 = x3 * x730
+    x756 = x3 * x531
+    x757 = x102 * x534
+    x758 = x47 * x539
+    x759 = x329 * x567 + x348 * x568 - x639
+    x760 = -x641 - x642 + x643
+    x761 = x713 + x714
+    x762 = -x717 + x718 - x719
+    x763 = -x750 - x751
+    x764 = x552 + x553
+    x765 = x3 * x6
+    x766 = 1.1787 * x530
+    x767 = 0.006641 * x5
+    x768 = 4.4e-05 * x3
+    x769 = x767 - x768
+    x770 = 0.6781 * x56
+    x771 = 0.0038888565277 * x2
+    x772 = 0.004999825 * x2
+    x773 = 0.0118371 * x5
+    x774 = 0.0043228875 * x5
+    x775 = 0.0075142125 * x5
+    x776 = x23 * x3
+    x777 = (
+        0.0136723 * x0 * x769
+        - 9.550037552e-07 * x0
+        - x109 * x773
+        + 1.1636 * x10 * x769
+        + 0.3819772992 * x13
+        + x152 * x534
+        - 0.390633584 * x176
+        + 0.390633584 * x177
+        + x181 * x539
+        + x182 * x688
+        + x183 * x691
+        + x189 * x696
+        + 1.17265812 * x18
+        + x207 * x577
+        - 0.3819772992 * x20
+        + 0.195695476 * x236
+        - 0.195695476 * x237
+        + 0.387012824 * x23 * x33
+        + x264 * x573
+        + x264 * x579
+        - x271 * x775
+        - 0.012618092064064 * x2
+        + x297 * x678
+        + x298 * x580
+        + x299 * x677
+        + x300 * x685
+        - 0.247974906 * x357
+        - 0.002080193929 * x35 * x734
+        - x375 * x774
+        - 0.142658678 * x393
+        + x426 * x567
+        + x428 * x568
+        + x448 * x573
+        + x448 * x579
+        + x530 * x92
+        + x545 * x83
+        - x4 * x771
+        + x56 * x766
+        + x696 * x770
+        + x725 * x82
+        + x727 * x86
+        - x734 * x771
+        + x752 * x93
+        - x753 * x772
+        - 0.08141975791312 * x776 * x6
+        - 0.00020876371875 * x6
+    )
+    x778 = x21**2
+    x779 = x41 * x778
+    x780 = x137 * x159
+    x781 = 0.10593 * x159
+    x782 = -x528 + x781
+    x783 = x41 * x782
+    x784 = x23 * x783
+    x785 = -x23 * x780 - 0.00017505 * x779 + x784
+    x786 = -x780 + x783
+    x787 = x41**2
+    x788 = 0.10593 * x787
+    x789 = x21 * x788
+    x790 = x43 * x782
+    x791 = -x789 - x790
+    x792 = 0.20843 * x221
+    x793 = 0.006375 * x23
+    x794 = x43 * x793
+    x795 = x792 + x794
+    x796 = 0.20843 * x159 - x41 * x793
+    x797 = 0.011402 * x122 - 0.011402 * x214 + 0.029798 * x341 - 0.029798 * x344
+    x798 = -0.000281 * x122 + 0.000281 * x214 + 0.029798 * x317 + 0.029798 * x323
+    x799 = 0.000281 * x318
+    x800 = x114 * x799
+    x801 = 0.011402 * x316
+    x802 = x114 * x801
+    x803 = 0.011402 * x323
+    x804 = 0.000281 * x344
+    x805 = -x800 - x802 - x803 + x804
+    x806 = x215 * x805 + x324 * x797 + x345 * x798
+    x807 = 0.10593 * x114
+    x808 = x116 * x137
+    x809 = -x807 - x808
+    x810 = x43 * x809
+    x811 = 0.00017505 * x117
+    x812 = 0.00017505 * x114 + x811
+    x813 = 0.00017505 * x214
+    x814 = -0.00017505 * x122 + x781 + x813
+    x815 = x118 * x814 + x215 * x812 + x21 * x810
+    x816 = 0.006375 * x778
+    x817 = -x583 - x816
+    x818 = x352 * x798
+    x819 = x333 * x797
+    x820 = x210 * x805
+    x821 = x818 + x819 + x820
+    x822 = x23 * x810
+    x823 = x210 * x812
+    x824 = x124 * x814
+    x825 = x822 + x823 + x824
+    x826 = x115 * x782
+    x827 = x813 + x826
+    x828 = x115 * x812
+    x829 = x113 * x814 + x828
+    x830 = 0.5006 * x829
+    x831 = x113 * x812
+    x832 = x115 * x814
+    x833 = -x831 + x832
+    x834 = x318 * x809
+    x835 = x316 * x814
+    x836 = -x834 + x835
+    x837 = x318 * x798
+    x838 = x316 * x797
+    x839 = -x837 + x838
+    x840 = x316 * x798
+    x841 = x318 * x797
+    x842 = x840 + x841
+    x843 = x113 * x782
+    x844 = x811 - x843
+    x845 = x316 * x809
+    x846 = x318 * x814
+    x847 = -x845 - x846
+    x848 = -x840 - x841
+    x849 = 0.006375 * x116 + 0.006375 * x209
+    x850 = 0.20843 * x43
+    x851 = -x121 * x850 + x849
+    x852 = x115 * x805
+    x853 = -x113 * x837 + x113 * x838 + x852
+    x854 = 0.5006 * x853
+    x855 = x807 + x808
+    x856 = 0.006375 * x121 - 0.006375 * x123
+    x857 = x113 * x805
+    x858 = x43 * x857
+    x859 = x435 * x798 + x440 * x797 + x858
+    x860 = x41 * x809
+    x861 = x43 * x831
+    x862 = x43 * x832
+    x863 = x860 + x861 - x862
+    x864 = -x792 - x794
+    x865 = -0.006375 * x350 - 0.006375 * x351
+    x866 = 0.006375 * x331 - 0.006375 * x332
+    x867 = x322 * x797
+    x868 = x343 * x798
+    x869 = x41 * x857
+    x870 = x867 + x868 - x869
+    x871 = x41 * x831
+    x872 = x41 * x832
+    x873 = x810 - x871 + x872
+    x874 = x115 * x837
+    x875 = x115 * x838
+    x876 = -x857 - x874 + x875
+    x877 = x116 * x850 + x856
+    x878 = 0.20843 * x21
+    x879 = -x435 * x878 + x865
+    x880 = -x440 * x878 + x866
+    x881 = 0.10593 * x21
+    x882 = 0.00017505 * x121
+    x883 = x316 * x826
+    x884 = x320 * x882 + x326 * x881 + x883
+    x885 = x318 * x826
+    x886 = x320 * x881 - x326 * x882 - x885
+    x887 = 0.045483 * x114
+    x888 = 1e-06 * x122
+    x889 = 1e-06 * x41
+    x890 = x121 * x889
+    x891 = 0.045483 * x41
+    x892 = x116 * x891
+    x893 = -x887 - x888 + x890 - x892
+    x894 = x43 * x893
+    x895 = -0.00965 * x122 + 0.045483 * x159 + 0.00965 * x214
+    x896 = x184 * x21
+    x897 = 0.00965 * x114 + 0.00965 * x117 + x896
+    x898 = x118 * x895 + x215 * x897 + x21 * x894
+    x899 = x186 * x21
+    x900 = x896 - x899
+    x901 = x23 * x900
+    x902 = 0.063883 * x159 + x694
+    x903 = x41 * x902
+    x904 = x131 + 0.063883 * x221
+    x905 = x43 * x904
+    x906 = x21 * x903 - x21 * x905 + x901
+    x907 = x23 * x894
+    x908 = x124 * x895
+    x909 = x210 * x897
+    x910 = x907 + x908 + x909
+    x911 = x23 * x903
+    x912 = x21 * x900
+    x913 = x23 * x905
+    x914 = x911 - x912 - x913
+    x915 = x903 - x905
+    x916 = x113 * x895 + x115 * x897
+    x917 = 0.6781 * x90
+    x918 = x115 * x895
+    x919 = x113 * x897
+    x920 = x918 - x919
+    x921 = x43 * x902
+    x922 = x41 * x904
+    x923 = -x921 - x922
+    x924 = x887 + x888 - x890 + x892
+    x925 = x43 * x919
+    x926 = x43 * x918
+    x927 = x41 * x893
+    x928 = x925 - x926 + x927
+    x929 = x41 * x918
+    x930 = x41 * x919
+    x931 = x894 + x929 - x930
+    x932 = 0.015006 * x778
+    x933 = 0.015006 * x582
+    x934 = -x932 - x933
+    x935 = -x137 * x43 * x778 + x221 * x528 + x21 * x783
+    x936 = x212 * x805
+    x937 = x335 * x797
+    x938 = x354 * x798
+    x939 = x201 * x809
+    x940 = x212 * x812
+    x941 = x126 * x814
+    x942 = x2 * x5
+    x943 = x3 * x912
+    x944 = x47 * x902
+    x945 = x102 * x904
+    x946 = x201 * x893
+    x947 = x126 * x895
+    x948 = x212 * x897
+    x949 = 0.075478 * x21
+    x950 = 1.8e-05 * x23
+    x951 = -x949 + x950
+    x952 = x5 * x951
+    x953 = 0.00017505 * x778
+    x954 = x137 * x21
+    x955 = x47 * x782
+    x956 = x329 * x797 + x348 * x798 - x858
+    x957 = -x860 - x861 + x862
+    x958 = x921 + x922
+    x959 = -x925 + x926 - x927
+    x960 = x949 - x950
+    x961 = x789 + x790
+    x962 = 0.053028558 * x21
+    x963 = 0.071831133 * x21
+    x964 = 1.109031463125e-06 * x53
+    x965 = 0.387012824 * x21
+    x966 = 0.000206331435 * x41
+    x967 = 0.124859691 * x21
+    x968 = (
+        x146 * x966
+        + 0.0236742 * x146
+        - 0.0236742 * x147
+        - 0.0198886062 * x154
+        + 0.0198886062 * x155
+        + x181 * x782
+        + x182 * x902
+        + x183 * x904
+        + x189 * x900
+        + x207 * x809
+        + x224 * x967
+        + 0.002080193929 * x22 * x5
+        + x264 * x805
+        + x264 * x812
+        + 0.0012075857869362 * x2
+        + x297 * x895
+        + x298 * x814
+        + x299 * x897
+        + x300 * x893
+        + x301 * x966
+        + 0.015028425 * x301
+        + 0.0075142125 * x302
+        - 0.0075142125 * x303
+        - x32 * x965
+        + 0.0043228875 * x379
+        - 0.0043228875 * x380
+        + 0.008645775 * x381
+        + 0.08141975791312 * x36
+        + x426 * x797
+        + x428 * x798
+        - 0.003191325 * x429
+        + x448 * x805
+        + x448 * x812
+        - 0.0043228875 * x491
+        + x770 * x900
+        - x772 * x952
+        + x951 * x93
+    )
+    x969 = x43**2
+    x970 = 0.10593 * x969
+    x971 = x788 + x970
+    x972 = 0.00017505 * x159 + x23 * x788 + x23 * x970
+    x973 = 0.00017505 * x338
+    x974 = -0.00017505 * x261
+    x975 = x137 + x974
+    x976 = x116 * x970 + x118 * x975 - x215 * x973
+    x977 = 0.011402 * x326
+    x978 = 0.000281 * x320
+    x979 = 0.000281 * x115
+    x980 = x319 * x979
+    x981 = 0.011402 * x115
+    x982 = x327 * x981
+    x983 = x977 - x978 + x980 + x982
+    x984 = 0.011402 * x261 + 0.029798 * x320 - 0.029798 * x347
+    x985 = -0.000281 * x261 - 0.029798 * x326 - 0.029798 * x328
+    x986 = x215 * x983 + x324 * x984 + x345 * x985
+    x987 = x124 * x975
+    x988 = x122 * x970 - x210 * x973 + x987
+    x989 = x210 * x983
+    x990 = x333 * x984
+    x991 = x352 * x985
+    x992 = x989 + x990 + x991
+    x993 = x115 * x975
+    x994 = x113 * x973 + x993
+    x995 = x316 * x975
+    x996 = x995 - 0.10593 * x347
+    x997 = x115**2
+    x998 = 0.00017505 * x997
+    x999 = x998 * x43
+    x1000 = -x999
+    x1001 = x1000 + x113 * x975
+    x1002 = 0.5006 * x1001
+    x1003 = x316 * x984
+    x1004 = x318 * x985
+    x1005 = x1003 - x1004
+    x1006 = x316 * x985
+    x1007 = x318 * x984
+    x1008 = x1006 + x1007
+    x1009 = x318 * x975
+    x1010 = -x1009 - 0.10593 * x328
+    x1011 = -x1006 - x1007
+    x1012 = x113 * x137
+    x1013 = -x1012
+    x1014 = x1013 - x973
+    x1015 = x115 * x983
+    x1016 = x1003 * x113 - x1004 * x113 + x1015
+    x1017 = 0.5006 * x1016
+    x1018 = x115 * x137 + x974
+    x1019 = x113 * x983
+    x1020 = x1019 * x43
+    x1021 = x1020 + x435 * x985 + x440 * x984
+    x1022 = x137 * x338
+    x1023 = 0.00017505 * x113
+    x1024 = x115 * x969
+    x1025 = x1023 * x1024
+    x1026 = x43 * x993
+    x1027 = x1022 - x1025 - x1026
+    x1028 = -0.20843 * x327 - 0.20843 * x342
+    x1029 = -0.20843 * x319 + 0.20843 * x321
+    x1030 = x1019 * x41
+    x1031 = x322 * x984
+    x1032 = x343 * x985
+    x1033 = -x1030 + x1031 + x1032
+    x1034 = x1003 * x115
+    x1035 = x1004 * x115
+    x1036 = -x1019 + x1034 - x1035
+    x1037 = x113 * x41
+    x1038 = x41 * x993
+    x1039 = x1037 * x973 + x1038 + x115 * x970
+    x1040 = x1023 * x319 - 0.10593 * x327 - 0.10593 * x342
+    x1041 = -x1023 * x327 - 0.10593 * x319 + 0.10593 * x321
+    x1042 = 0.063883 * x969
+    x1043 = 0.063883 * x787
+    x1044 = 0.009432 * x43
+    x1045 = x1044 + x889
+    x1046 = x1045 * x23
+    x1047 = x1042 * x21 + x1043 * x21 + x1046
+    x1048 = x113 * x184
+    x1049 = x43 * x681
+    x1050 = -x1048 + x1049
+    x1051 = x1050 * x43
+    x1052 = -0.00965 * x261 + x891
+    x1053 = -0.00965 * x338 + x889
+    x1054 = x1051 * x21 + x1052 * x118 + x1053 * x215
+    x1055 = x1042 + x1043
+    x1056 = x1051 * x23
+    x1057 = x1052 * x124
+    x1058 = x1053 * x210
+    x1059 = x1056 + x1057 + x1058
+    x1060 = x1045 * x21
+    x1061 = x1042 * x23 + x1043 * x23 - x1060
+    x1062 = x1052 * x113 + x1053 * x115
+    x1063 = x1052 * x115
+    x1064 = x1053 * x113
+    x1065 = x1063 - x1064
+    x1066 = x1048 - x1049
+    x1067 = x1050 * x41
+    x1068 = x1064 * x43
+    x1069 = x1063 * x43
+    x1070 = x1067 + x1068 - x1069
+    x1071 = x1063 * x41
+    x1072 = x1064 * x41
+    x1073 = x1051 + x1071 - x1072
+    x1074 = x63 + x65
+    x1075 = x21 * x970 - x43 * x528 + x789
+    x1076 = 0.10593 * x338
+    x1077 = x126 * x975
+    x1078 = x212 * x983
+    x1079 = x335 * x984
+    x1080 = x354 * x985
+    x1081 = x1050 * x201
+    x1082 = x1052 * x126
+    x1083 = x1053 * x212
+    x1084 = x1060 * x3
+    x1085 = 0.063883 * x41
+    x1086 = 0.063883 * x43
+    x1087 = 0.10593 * x43
+    x1088 = 0.00017505 * x44
+    x1089 = x23 * x6
+    x1090 = -x1020 + x329 * x984 + x348 * x985
+    x1091 = -x1022 + x1025 + x1026
+    x1092 = -x1067 - x1068 + x1069
+    x1093 = 0.00028502849925 * x203
+    x1094 = 0.053028558 * x115
+    x1095 = 0.000206331435 * x43
+    x1096 = 8.763003e-05 * x43
+    x1097 = (
+        x1045 * x189
+        + x1045 * x770
+        + x1050 * x300
+        + x1052 * x297
+        + x1053 * x299
+        + x1094 * x406
+        - x1095 * x56
+        - x1095 * x90
+        - x1096 * x365
+        - x1096 * x505
+        - 2.512544616e-07 * x22
+        - 0.370536132 * x256
+        + 0.370536132 * x257
+        + x264 * x983
+        - 0.1846554453 * x267
+        + 0.1846554453 * x268
+        + x298 * x975
+        - 0.0040207725448136 * x35
+        - 0.104340058 * x407
+        + 0.104340058 * x408
+        + x426 * x984
+        + x428 * x985
+        + x448 * x983
+        - 0.141336383 * x483
+        + 0.141336383 * x484
+        - 0.104340058 * x517
+        + 0.0942803660835216 * x6
+    )
+    x1098 = 0.053028558 * x113
+    x1099 = x113 * x799
+    x1100 = x113 * x801
+    x1101 = -x1099 - x1100
+    x1102 = x113 * x318
+    x1103 = 0.029798 * x1102 + x981
+    x1104 = x113 * x316
+    x1105 = 0.029798 * x1104 - x979
+    x1106 = x1101 * x215 + x1103 * x324 + x1105 * x345
+    x1107 = 0.00017505 * x115
+    x1108 = x1023 * x215 - x1087 * x121 - x1107 * x118
+    x1109 = x113**2
+    x1110 = 0.00017505 * x1109
+    x1111 = -x998 - x1110
+    x1112 = x1101 * x210
+    x1113 = x1103 * x333
+    x1114 = x1105 * x352
+    x1115 = x1112 + x1113 + x1114
+    x1116 = x1023 * x210 - x1107 * x124 - x43 * x807
+    x1117 = x1103 * x316
+    x1118 = x1105 * x318
+    x1119 = x1117 - x1118
+    x1120 = x1103 * x318
+    x1121 = x1105 * x316
+    x1122 = x1120 + x1121
+    x1123 = -x1120 - x1121
+    x1124 = x1101 * x115
+    x1125 = x1117 * x113 - x1118 * x113 + x1124
+    x1126 = 0.5006 * x1125
+    x1127 = 0.10593 * x1104 + x1107 * x318
+    x1128 = 0.10593 * x1102 - x1107 * x316
+    x1129 = x1101 * x113
+    x1130 = x1129 * x43
+    x1131 = x1103 * x440 + x1105 * x435 + x1130
+    x1132 = x1110 * x43
+    x1133 = x999 + x1013 + x1132
+    x1134 = x1129 * x41
+    x1135 = x1103 * x322
+    x1136 = x1105 * x343
+    x1137 = -x1134 + x1135 + x1136
+    x1138 = x1117 * x115
+    x1139 = x1118 * x115
+    x1140 = -x1129 + x1138 - x1139
+    x1141 = -x998 * x41 - x1110 * x41 - 0.10593 * x261
+    x1142 = -x896 + x899
+    x1143 = 0.045483 * x113
+    x1144 = 1e-06 * x115
+    x1145 = -x1143 - x1144
+    x1146 = x1145 * x43
+    x1147 = 0.00965 * x115
+    x1148 = 0.00965 * x113
+    x1149 = x1146 * x21 - x1147 * x118 + x1148 * x215
+    x1150 = -x184 + x186
+    x1151 = x1143 + x1144
+    x1152 = -x1044 - x889
+    x1153 = 0.00965 * x1109
+    x1154 = 0.00965 * x997
+    x1155 = -x1153 - x1154
+    x1156 = -x131 * x43 + x41 * x694
+    x1157 = x1146 * x23
+    x1158 = -x1147 * x124 + x1148 * x210 + x1157
+    x1159 = x1153 * x43
+    x1160 = x1154 * x43
+    x1161 = x1145 * x41
+    x1162 = x1159 + x1160 + x1161
+    x1163 = x1146 - x1153 * x41 - x1154 * x41
+    x1164 = x1101 * x212
+    x1165 = x1103 * x335
+    x1166 = x1105 * x354
+    x1167 = 0.10593 * x113
+    x1168 = x1145 * x201
+    x1169 = x1103 * x329 + x1105 * x348 - x1130
+    x1170 = x1000 + x1012 - x1132
+    x1171 = -x1159 - x1160 - x1161
+    x1172 = x8 * x43
+    x1173 = x8 * x221
+    x1174 = (
+        0.00013072870670405 * x98
+        - 0.00013072870670405 * x103
+        - x1098 * x200
+        + x1101 * x264
+        + x1101 * x448
+        + x1103 * x426
+        + x1105 * x428
+        + x1145 * x300
+        + 0.000459361674330197 * x35
+        - 0.000459361674330197 * x36
+        + 0.00017526006 * x386
+        - 0.00017526006 * x387
+        + 0.006662366405 * x400
+        - 0.006662366405 * x401
+        + 4.33190623e-08 * x42
+        + 0.00017526006 * x508
+        + 8.763003e-05 * x512
+        - 8.763003e-05 * x513
+        + 4.33190623e-08 * x48
+    )
+    x1175 = 0.011402 * x318
+    x1176 = 0.000281 * x316
+    x1177 = x1175 - x1176
+    x1178 = 0.029798 * x316
+    x1179 = 0.029798 * x318
+    x1180 = x1177 * x215 + x1178 * x324 - x1179 * x345
+    x1181 = x318**2
+    x1182 = 0.029798 * x1181
+    x1183 = x316**2
+    x1184 = 0.029798 * x1183
+    x1185 = x1182 + x1184
+    x1186 = -0.10593 * x121 + x122 * x137
+    x1187 = x1177 * x210
+    x1188 = x1178 * x333 - x1179 * x352 + x1187
+    x1189 = x1177 * x115
+    x1190 = x113 * x1182 + x113 * x1184 + x1189
+    x1191 = 0.5006 * x1190
+    x1192 = x113 * x1177
+    x1193 = x1192 * x43
+    x1194 = x1178 * x440 - x1179 * x435 + x1193
+    x1195 = x1182 * x115 + x1184 * x115 - x1192
+    x1196 = x1192 * x41
+    x1197 = x1178 * x322 - x1179 * x343 - x1196
+    x1198 = -x679 + x681
+    x1199 = -x114 * x889 - 1e-06 * x116 - 0.045483 * x121 + x122 * x891
+    x1200 = -x113 * x889 + x115 * x891
+    x1201 = x1177 * x212
+    x1202 = x1178 * x329 - x1179 * x348 - x1193
+    x1203 = x8 * x338
+    x1204 = (
+        0.008661102849889 * x98
+        + x1177 * x264
+        + x1177 * x448
+        + 6.543665e-09 * x119
+        + 6.543665e-09 * x127
+        + 0.008661102849889 * x205
+        - 0.0005849081642729 * x213
+        - 0.0005849081642729 * x216
+        - 0.0679454368 * x502
+        + 0.0679454368 * x503
+    )
+    x1205 = x800 + x802 + x803 - x804
+    x1206 = -x1175 + x1176
+    x1207 = x799 + x801
+    x1208 = -x121 * x799 - x121 * x801 + 0.011402 * x332 - 0.000281 * x351
+    x1209 = x316 * x981 + x318 * x979
+    x1210 = x1099 + x1100
+    x1211 = 0.5006 * x1210
+    x1212 = -x977 + x978 - x980 - x982
+    x1213 = -0.011402 * x319 + x320 * x981 + x326 * x979 + 0.000281 * x327
+    x1214 = (
+        0.000674120333239 * x213
+        + 0.000674120333239 * x216
+        - 1.1916429428e-06 * x325
+        - 1.1916429428e-06 * x336
+        - 5.20822520776e-05 * x346
+        - 5.20822520776e-05 * x355
+    )
+    x1215 = -3e-06 * x470 - 3e-06 * x471
+    x1216 = (
+        x1215 + 0.000118 * x312 - 0.000118 * x313 - 0.000369 * x478 - 0.000369 * x479
+    )
+    x1217 = (
+        3e-06 * x312
+        - 3e-06 * x313
+        - 0.000587 * x470
+        - 0.000587 * x471
+        - 3e-06 * x478
+        - 3e-06 * x479
+    )
+    x1218 = 0.000278 * x194 + 0.00041 * x312 - 0.00041 * x313 - 0.000278 * x45
+    x1219 = (
+        x1215 + 0.000609 * x312 - 0.000609 * x313 - 0.000118 * x478 - 0.000118 * x479
+    )
+    x1220 = -0.001641 * x371 - 0.001641 * x372
+    x1221 = -0.001641 * x194 - 0.000278 * x312 + 0.000278 * x313 + 0.001641 * x45
+    x1222 = 0.001607 * x194 - 0.001607 * x45 + 0.000256 * x537
+    x1223 = -0.001596 * x100 - 0.001596 * x232
+    x1224 = 0.0005 * x3
+    x1225 = -x1224 + x131 * x5 + 0.000631 * x537
+    x1226 = 0.000256 * x23
+    x1227 = x1226 * x44 - 0.000256 * x45 + 0.000399 * x537
+    x1228 = -0.008147 * x555 - x690
+    x1229 = 1.1787 * x545
+    x1230 = 1.1787 * x539
+    x1231 = 1.1787 * x534
+    x1232 = 0.105316228 * x3
+    x1233 = 0.390633584 * x3
+    x1234 = 1.8568 * x545
+    x1235 = 0.5006 * x545
+    x1236 = 0.5006 * x580
+    x1237 = 0.5006 * x577
+    x1238 = 0.5006 * x539
+    x1239 = 0.5006 * x567
+    x1240 = 0.5006 * x534
+    x1241 = 0.5006 * x568
+    x1242 = 0.5006 * x579
+    x1243 = 0.5006 * x573
+    x1244 = 0.142658678 * x3
+    x1245 = 0.6781 * x545
+    x1246 = 0.6781 * x677
+    x1247 = 0.6781 * x678
+    x1248 = 0.6781 * x685
+    x1249 = 0.6781 * x688
+    x1250 = 0.6781 * x539
+    x1251 = 0.6781 * x696
+    x1252 = 0.6781 * x691
+    x1253 = 0.6781 * x534
+    x1254 = 0.195695476 * x3
+    x1255 = 0.9302 * x725
+    x1256 = 0.9302 * x727
+    x1257 = 0.9302 * x752
+    x1258 = 0.247974906 * x3
+    x1259 = 0.003191325 * x5
+    x1260 = 0.105316228 * x5
+    x1261 = 0.142658678 * x5
+    x1262 = 0.005930025 * x5
+    x1263 = 0.195695476 * x5
+    x1264 = 0.247974906 * x5
+    x1265 = 0.008316 * x3 - 0.0005 * x537
+    x1266 = 0.104340058 * x555
+    x1267 = 0.141336383 * x555
+    x1268 = 0.245676441 * x555
+    x1269 = 0.003191325 * x555
+    x1270 = 0.0118371 * x555
+    x1271 = 0.0043228875 * x555
+    x1272 = x371 + x372
+    x1273 = 0.6781 * x530
+    x1274 = 0.005426895410856 * x3
+    x1275 = (
+        x1230 * x782
+        + x1236 * x814
+        + x1237 * x809
+        + x1239 * x797
+        + x1241 * x798
+        + x1242 * x805
+        + x1242 * x812
+        + x1243 * x805
+        + x1243 * x812
+        + x1246 * x897
+        + x1247 * x895
+        + x1248 * x893
+        + x1249 * x902
+        + x1251 * x900
+        + x1252 * x904
+        + x1257 * x951
+        - x1274 * x582
+        - x1274 * x778
+        - 1.315362898125e-06 * x232 * x21
+        - 0.08081600593132 * x21 * x555
+        - 4.34080072953e-05 * x45 * x778
+        - 0.0055449842710128 * x3
+        + x531 * x966
+        + 0.015028425 * x531
+        + 0.0075142125 * x536
+        - 0.16283951582624 * x537
+        - 0.0075142125 * x541
+        + x552 * x967
+        - 0.0236742 * x586
+        - 0.003191325 * x593
+        + 2.38070011648e-05 * x5
+        - 0.0043228875 * x701
+        - 0.0043228875 * x703
+        + 0.0043228875 * x704
+        + 0.008645775 * x705
+        - 0.0198886062 * x729
+        + 0.0198886062 * x730
+        - x774 * x901
+        - 0.142658678 * x943
+    )
+    x1276 = 0.01115614803204 * x201
+    x1277 = (
+        4.34080072953e-05 * x100 * x21
+        + x1045 * x1251
+        - x1046 * x774
+        + x1050 * x1248
+        + x1052 * x1247
+        + x1053 * x1246
+        - 0.142658678 * x1084
+        + x1094 * x578
+        - x1095 * x530
+        - x1096 * x598
+        - x1096 * x633
+        + x1236 * x975
+        + x1239 * x984
+        + x1241 * x985
+        + x1242 * x983
+        + x1243 * x983
+        + 1.315362898125e-06 * x194
+        + 0.0942803660835216 * x3
+        - 0.370536132 * x535
+        + 0.370536132 * x540
+        - 0.104340058 * x653
+        - 0.104340058 * x655
+        + 0.104340058 * x656
+        + 0.1846554453 * x689
+        - 0.1846554453 * x692
+        - 0.141336383 * x721
+        + 0.141336383 * x722
+    )
+    x1278 = x99 * x21
+    x1279 = (
+        -4.33190623e-08 * x100
+        - x1098 * x577
+        + x1101 * x1242
+        + x1101 * x1243
+        + x1103 * x1239
+        + x1105 * x1241
+        + x1145 * x1248
+        + 0.00013072870670405 * x45
+        + 0.000459361674330197 * x537
+        + 0.00017526006 * x610
+        - 0.00017526006 * x611
+        + 0.00017526006 * x638
+        + 8.763003e-05 * x666
+        - 8.763003e-05 * x667
+        + 0.006662366405 * x710
+        - 0.006662366405 * x711
+    )
+    x1280 = 0.00033805705725 * x114
+    x1281 = x122 * x44
+    x1282 = (
+        x1177 * x1242
+        + x1177 * x1243
+        - 0.008661102849889 * x194
+        - 0.0005849081642729 * x312
+        + 0.0005849081642729 * x313
+        - 6.543665e-09 * x371
+        - 6.543665e-09 * x372
+        + 0.008661102849889 * x45
+        - 0.0679454368 * x616
+        + 0.0679454368 * x617
+    )
+    x1283 = (
+        0.000674120333239 * x312
+        - 0.000674120333239 * x313
+        + 1.1916429428e-06 * x470
+        + 1.1916429428e-06 * x471
+        + 5.20822520776e-05 * x478
+        + 5.20822520776e-05 * x479
+    )
+    x1284 = 0.000631 * x23 - x95
+    x1285 = -x131 + 0.008147 * x21
+    x1286 = x1226 - 0.001607 * x159
+    x1287 = -0.000256 * x159 + 0.000399 * x23
+    x1288 = 3e-06 * x316
+    x1289 = x114 * x1288 + 3e-06 * x323
+    x1290 = (
+        0.000118 * x122 + x1289 - 0.000118 * x214 - 0.000369 * x341 + 0.000369 * x344
+    )
+    x1291 = 3e-06 * x318
+    x1292 = (
+        -x114 * x1291
+        + 3e-06 * x122
+        - 3e-06 * x214
+        + 0.000587 * x317
+        + 0.000587 * x323
+        + 3e-06 * x344
+    )
+    x1293 = 0.00041 * x122 - 0.000278 * x159 - 0.00041 * x214
+    x1294 = (
+        0.000609 * x122 + x1289 - 0.000609 * x214 - 0.000118 * x341 + 0.000118 * x344
+    )
+    x1295 = 0.001641 * x41
+    x1296 = 0.001641 * x114 + x116 * x1295
+    x1297 = 0.000278 * x41
+    x1298 = x121 * x1297 - 0.000278 * x122 + 0.001641 * x159
+    x1299 = 0.0257956812 * x21
+    x1300 = 1.1787 * x782
+    x1301 = 0.003191325 * x21
+    x1302 = 0.5006 * x782
+    x1303 = 0.5006 * x814
+    x1304 = 0.5006 * x809
+    x1305 = 0.5006 * x797
+    x1306 = 0.5006 * x798
+    x1307 = 0.5006 * x812
+    x1308 = 0.5006 * x805
+    x1309 = 0.0043228875 * x21
+    x1310 = 0.6781 * x902
+    x1311 = 0.6781 * x904
+    x1312 = 0.6781 * x782
+    x1313 = 0.6781 * x897
+    x1314 = 0.6781 * x895
+    x1315 = 0.6781 * x893
+    x1316 = 0.6781 * x900
+    x1317 = 0.104340058 * x21
+    x1318 = 0.0257956812 * x23
+    x1319 = 0.003191325 * x23
+    x1320 = 0.141336383 * x21
+    x1321 = 0.245676441 * x21
+    x1322 = 0.0043228875 * x23
+    x1323 = 0.0075142125 * x23
+    x1324 = 0.053028558 * x221
+    x1325 = 0.000206331435 * x221
+    x1326 = 0.000118701405 * x221
+    x1327 = 0.071831133 * x221
+    x1328 = 8.763003e-05 * x221
+    x1329 = 0.001596 * x221
+    x1330 = 0.124859691 * x221
+    x1331 = x23 * x41
+    x1332 = -x114 - x117
+    x1333 = x159 * x41
+    x1334 = 0.0010721395522875 * x23
+    x1335 = (
+        x1045 * x1316
+        + x1050 * x1315
+        + x1052 * x1314
+        + x1053 * x1313
+        - 0.0043228875 * x1056
+        + 0.008645775 * x1060
+        + x1094 * x810
+        - x1096 * x828
+        - x1096 * x852
+        - 0.00561731514894 * x117 * x43
+        - 0.00033805705725 * x122 * x969
+        + x1303 * x975
+        + x1305 * x984
+        + x1306 * x985
+        + x1307 * x983
+        + x1308 * x983
+        - x1334 * x787
+        - x1334 * x969
+        - 2.63072579625e-06 * x159
+        - 3.579949116e-07 * x21
+        - 0.0069355657247636 * x23
+        + 0.370536132 * x783
+        - 0.104340058 * x869
+        - 0.104340058 * x871
+        + 0.104340058 * x872
+        + 0.1846554453 * x903
+        - 0.1846554453 * x905
+        + 0.141336383 * x929
+        - 0.141336383 * x930
+    )
+    x1336 = x23 * x43
+    x1337 = (
+        -x1098 * x809
+        + x1101 * x1307
+        + x1101 * x1308
+        + x1103 * x1305
+        + x1105 * x1306
+        + x1145 * x1315
+        - 0.0043228875 * x1157
+        + x1280 * x43
+        + 0.00561731514894 * x214
+        + 0.000459361674330197 * x23
+        + 0.00017526006 * x831
+        - 0.00017526006 * x832
+        + 0.00017526006 * x857
+        + 8.763003e-05 * x874
+        - 8.763003e-05 * x875
+        - 0.006662366405 * x918
+        + 0.006662366405 * x919
+    )
+    x1338 = x116 * x43
+    x1339 = (
+        x1177 * x1307
+        + x1177 * x1308
+        + 6.543665e-09 * x114
+        - 0.0005849081642729 * x122
+        + 0.008661102849889 * x159
+        - 0.0679454368 * x837
+        + 0.0679454368 * x838
+    )
+    x1340 = (
+        0.000674120333239 * x122
+        - 0.000674120333239 * x214
+        - 1.1916429428e-06 * x317
+        - 1.1916429428e-06 * x323
+        + 5.20822520776e-05 * x341
+        - 5.20822520776e-05 * x344
+    )
+    x1341 = x1295 - 0.000278 * x261
+    x1342 = -x1297 + 0.00041 * x261
+    x1343 = 3e-06 * x115
+    x1344 = -x1343 * x327 - 3e-06 * x326
+    x1345 = x1344 + 0.000118 * x261 - 0.000369 * x320 + 0.000369 * x347
+    x1346 = (
+        x1343 * x319 + 3e-06 * x261 - 3e-06 * x320 - 0.000587 * x326 - 0.000587 * x328
+    )
+    x1347 = 0.000118 * x115
+    x1348 = x1344 + x1347 * x319 + 0.000609 * x261 - 0.000118 * x320
+    x1349 = 0.053028558 * x41
+    x1350 = 0.5006 * x975
+    x1351 = 0.5006 * x984
+    x1352 = 0.5006 * x985
+    x1353 = 0.5006 * x983
+    x1354 = 0.071831133 * x41
+    x1355 = 0.1681787533 * x41
+    x1356 = 0.6781 * x1045
+    x1357 = 0.6781 * x1053
+    x1358 = 0.6781 * x1052
+    x1359 = 0.6781 * x1050
+    x1360 = 0.053028558 * x43
+    x1361 = 0.001607 * x41
+    x1362 = 0.000118701405 * x43
+    x1363 = 0.071831133 * x43
+    x1364 = 0.1681787533 * x43
+    x1365 = 0.001596 * x43
+    x1366 = 0.053028558 * x338
+    x1367 = 0.001641 * x338
+    x1368 = 8.763003e-05 * x338
+    x1369 = x113 * x338
+    x1370 = 0.0013821608231029 * x41
+    x1371 = (
+        -x997 * x1370
+        + 0.00017526006 * x1019
+        - 8.763003e-05 * x1034
+        + 8.763003e-05 * x1035
+        - 0.006662366405 * x1063
+        + 0.006662366405 * x1064
+        - x1096 * x1124
+        + x1101 * x1353
+        + x1103 * x1351
+        + x1105 * x1352
+        - x1109 * x1370
+        - 0.104340058 * x1134
+        + x1145 * x1359
+        - 0.01667005749288 * x261
+        + 0.001420807810163 * x41
+        - 1.846554453e-07 * x43
+        - 0.00017526006 * x993
+    )
+    x1372 = x115 * x41
+    x1373 = (
+        0.0679454368 * x1003
+        - 0.0679454368 * x1004
+        - x1096 * x1189
+        + x1177 * x1353
+        - 0.104340058 * x1196
+        + 0.008661102849889 * x41
+    )
+    x1374 = (
+        0.000674120333239 * x261 + 5.20822520776e-05 * x320 + 1.1916429428e-06 * x326
+    )
+    x1375 = 3e-06 * x1104
+    x1376 = -0.000369 * x1102 + x1347 + x1375
+    x1377 = -3e-06 * x1102 + 0.000587 * x1104 + x1343
+    x1378 = -0.000118 * x1102 + 0.000609 * x115 + x1375
+    x1379 = 0.001641 * x113
+    x1380 = 0.00041 * x115
+    x1381 = 0.5006 * x1103
+    x1382 = 0.5006 * x1105
+    x1383 = 0.5006 * x1101
+    x1384 = 0.6781 * x1145
+    x1385 = 0.00663129503 * x113
+    x1386 = 1.42658678e-07 * x0
+    x1387 = 0.000278 * x115
+    x1388 = 8.763003e-05 * x115
+    x1389 = 0.00663129503 * x115
+    x1390 = 1.42658678e-07 * x8
+    x1391 = 2.61119963394e-06 * x115
+    x1392 = (
+        0.0679454368 * x1117
+        - 0.0679454368 * x1118
+        + 6.662366405e-09 * x113
+        + x1177 * x1383
+        - x1181 * x1391
+        - x1183 * x1391
+        + 0.00017526006 * x1192
+        - 0.000599589709354415 * x115
+    )
+    x1393 = 0.000674120333239 * x115
+    x1394 = x115 * x318
+    x1395 = x115 * x316
+    x1396 = -x1288 - 0.000587 * x318
+    x1397 = -x1291
+    x1398 = x1397 - 0.000118 * x316
+    x1399 = x1397 - 0.000369 * x316
+    x1400 = 0.0149168788 * x316
+    x1401 = 0.5006 * x1177
+    x1402 = 0.0149168788 * x318
+    x1403 = 0.0005346749494125 * x118
+    x1404 = 4.3228875e-09 * x215
+    x1405 = 0.0006567138703936 * x316 + 1.60926677408e-05 * x318
+    x1406 = 3.638748765e-05 * x324
+    x1407 = 8.96762325e-07 * x345
+    x1408 = 0.001189685341316 * x440
+    x1409 = 2.9319556298e-05 * x435
+    u1 = qp[0]
+    u2 = qp[1]
+    u3 = qp[2]
+    u4 = qp[3]
+    u5 = qp[4]
+    u6 = qp[5]
+    u7 = qp[6]
+    x1410 = u1**2
+    x1411 = x0 * x1410
+    x1412 = 0.09958 * x0
+    x1413 = 4.4e-05 * x2
+    x1414 = -x1413
+    x1415 = 0.00625435 * x1410
+    x1416 = x0 * x38
+    x1417 = x5 * x17
+    x1418 = u1 * x2
+    x1419 = u2 * x1418
+    x1420 = x0**2 * x1410
+    x1421 = -0.006375 * x1418
+    x1422 = 0.21038 * u2 + x1421
+    x1423 = 0.5006 * u2
+    x1424 = 0.003191325 * x1419 + 0.105316228 * x1420 + x1422 * x1423
+    x1425 = 0.01175 * x0
+    x1426 = 0.6781 * u2
+    x1427 = 0.0043228875 * x1419 + 0.142658678 * x1420 + x1422 * x1426
+    x1428 = 0.0235 * x0
+    x1429 = u2 * x1422
+    x1430 = 0.005930025 * x1419 + 0.195695476 * x1420 + 0.9302 * x1429
+    x1431 = 0.00741795 * x1419 + 0.244798168 * x1420 + 1.1636 * x1429
+    x1432 = x1411 * x2
+    x1433 = 0.58632906 * x1432
+    x1434 = 0.006641 * x2
+    x1435 = 0.117892 * x0
+    x1436 = x5 * x1435 + x1434
+    x1437 = x5 * x1436
+    x1438 = x3 * x1435 + x1414
+    x1439 = x3 * x1438
+    x1440 = 1.1636 * x1418
+    x1441 = -0.244798168 * x1419 + 0.00741795 * x1420 - x1422 * x1440
+    x1442 = x1418 * x1422
+    x1443 = -0.195695476 * x1419 + 0.005930025 * x1420 - 0.9302 * x1442
+    x1444 = -0.142658678 * x1419 + 0.0043228875 * x1420 - 0.6781 * x1442
+    x1445 = -0.105316228 * x1419 + 0.003191325 * x1420 - 0.5006 * x1442
+    x1446 = 0.01275 * x8
+    x1447 = 0.244798168 * x1432
+    x1448 = 0.09958 * u2 - 0.013278 * x1418
+    x1449 = 1.1636 * u2
+    x1450 = u1 * x1413
+    x1451 = -u1 * x1412 + x1450
+    x1452 = x0 * u1
+    x1453 = 1.1636 * x1452
+    x1454 = u2 * x1452
+    x1455 = 4.4e-05 * u2
+    x1456 = 0.013278 * x1452 - x1455
+    x1457 = 4.4e-05 * x5
+    x1458 = 0.006641 * x3
+    x1459 = -x0 * x1457 - x0 * x1458
+    x1460 = 5e-06 * x1418
+    x1461 = 0.011088 * x1452 + x1460
+    x1462 = 0.011255 * u2 - 0.000691 * x1418
+    x1463 = 5e-06 * x1452
+    x1464 = -0.000691 * u2 + 0.001072 * x1418 + x1463
+    x1465 = 5.11984e-05 * u2
+    x1466 = x1452 * x1465
+    x1467 = 0.115871288 * u2
+    x1468 = -x1416 - x1417
+    x1469 = 2 * x1444
+    x1470 = x15 * x21
+    x1471 = x1470 + x55
+    x1472 = 0.20843 * x6
+    x1473 = x15 * x23
+    x1474 = x1472 - x1473 + x77
+    x1475 = x23 * x1471 + x21 * x1474
+    x1476 = x543 * x51
+    x1477 = -x30 - x1476
+    x1478 = x3 * x1477
+    x1479 = x21 * x1471
+    x1480 = x5 * x1479
+    x1481 = x23 * x1474
+    x1482 = x5 * x1481
+    x1483 = 0.0099803 * x1410
+    x1484 = 2 * x1475
+    x1485 = 0.390633584 * x1432
+    x1486 = 1.8e-05 * x6
+    x1487 = 0.015006 * x22
+    x1488 = 0.015006 * x24
+    x1489 = -x1486 + x1487 + x1488
+    x1490 = 0.075478 * x6
+    x1491 = 0.015006 * x35
+    x1492 = 0.015006 * x36
+    x1493 = x1490 - x1491 + x1492
+    x1494 = x1489 * x23 + x1493 * x21
+    x1495 = x5 * u2
+    x1496 = u3 * x1495
+    x1497 = x1495 * x1418
+    x1498 = x3 * x1452
+    x1499 = u3 * x1498
+    x1500 = u3 + x1418
+    x1501 = -0.21038 * x1495 + 0.21038 * x1498
+    x1502 = x1500 * x1501
+    x1503 = x3 * u2
+    x1504 = x5 * x1452
+    x1505 = -x1503 - x1504
+    x1506 = 0.006375 * x1495
+    x1507 = 0.006375 * x1498 - x1506
+    x1508 = x1505 * x1507
+    x1509 = (
+        -0.195695476 * x1496
+        + 0.195695476 * x1497
+        + 0.195695476 * x1499
+        - 0.9302 * x1502
+        + 0.9302 * x1508
+        + 0.005930025 * x1454
+    )
+    x1510 = 0.005375 * x2
+    x1511 = x3 * x1510
+    x1512 = (
+        -0.142658678 * x1496
+        + 0.142658678 * x1497
+        + 0.142658678 * x1499
+        - 0.6781 * x1502
+        + 0.6781 * x1508
+        + 0.0043228875 * x1454
+    )
+    x1513 = x3 * x1512
+    x1514 = 0.01075 * x2
+    x1515 = (
+        -0.105316228 * x1496
+        + 0.105316228 * x1497
+        + 0.105316228 * x1499
+        - 0.5006 * x1502
+        + 0.5006 * x1508
+        + 0.003191325 * x1454
+    )
+    x1516 = u3 * x1503
+    x1517 = x1503 * x1418
+    x1518 = u3 * x1504
+    x1519 = -x1495 + x1498
+    x1520 = x1507 * x1519
+    x1521 = -0.006375 * u3 + 0.21038 * x1503 + 0.21038 * x1504 + x1421
+    x1522 = x1500 * x1521
+    x1523 = (
+        -0.105316228 * x1516
+        + 0.105316228 * x1517
+        - 0.105316228 * x1518
+        - 0.5006 * x1520
+        + 0.5006 * x1522
+    )
+    x1524 = x1510 * x5
+    x1525 = (
+        -0.142658678 * x1516
+        + 0.142658678 * x1517
+        - 0.142658678 * x1518
+        - 0.6781 * x1520
+        + 0.6781 * x1522
+    )
+    x1526 = 0.42076 * x8
+    x1527 = x1514 * x5
+    x1528 = (
+        -0.195695476 * x1516
+        + 0.195695476 * x1517
+        - 0.195695476 * x1518
+        - 0.9302 * x1520
+        + 0.9302 * x1522
+    )
+    x1529 = x1493 * x23
+    x1530 = x5 * x1529
+    x1531 = x1489 * x21
+    x1532 = x5 * x1531
+    x1533 = x726 * x21
+    x1534 = x0 * x1533
+    x1535 = x724 * x23
+    x1536 = x0 * x1535
+    x1537 = -x61 + x62 - x1534 - x1536
+    x1538 = x3 * x1537
+    x1539 = 0.004999825 * x1410
+    x1540 = x1501 * x1519
+    x1541 = x1505 * x1521
+    x1542 = (
+        -0.005930025 * x1516
+        + 0.005930025 * x1517
+        - 0.005930025 * x1518
+        + 0.9302 * x1540
+        - 0.9302 * x1541
+    )
+    x1543 = (
+        -0.0043228875 * x1516
+        + 0.0043228875 * x1517
+        - 0.0043228875 * x1518
+        + 0.6781 * x1540
+        - 0.6781 * x1541
+    )
+    x1544 = 0.003191325 * x1503
+    x1545 = (
+        -0.003191325 * x1516
+        - 0.003191325 * x1518
+        + 0.5006 * x1540
+        - 0.5006 * x1541
+        + x1544 * x1418
+    )
+    x1546 = 2 * x1512
+    x1547 = 0.195695476 * x1432
+    x1548 = -x3 * x15 + x16
+    x1549 = -x1482 + x1478 + x1480
+    x1550 = 2 * x1525
+    x1551 = x30 + x1476
+    x1552 = 0.1371791312 * u3
+    x1553 = 0.1371791312 * x1418
+    x1554 = 0.006641 * u3 + 0.117892 * x1503 + 0.117892 * x1504 + u1 * x1434
+    x1555 = 1.1636 * x1500
+    x1556 = -x3 * x1455 + 0.006641 * x1495 - x1452 * x1457 - x1452 * x1458
+    x1557 = 1.1636 * x1556
+    x1558 = (
+        -x1503 * x1552
+        + x1503 * x1553
+        - x1504 * x1552
+        - x1519 * x1557
+        + x1554 * x1555
+        + x1466
+    )
+    x1559 = x5 * x1558
+    x1560 = -4.4e-05 * u3 - 0.117892 * x1495 + 0.117892 * x1498 - x1450
+    x1561 = (
+        -x1495 * x1552
+        + x1495 * x1553
+        + x1498 * x1552
+        + x1505 * x1557
+        - x1555 * x1560
+        - 0.0077274676 * x1454
+    )
+    x1562 = x3 * x1561
+    x1563 = u3 * x1519
+    x1564 = 7e-06 * u3
+    x1565 = 7e-06 * x1418
+    x1566 = -0.010932 * x1495 + 0.010932 * x1498 - x1564 - x1565
+    x1567 = (
+        0.001043 * u3
+        + 7e-06 * x1495
+        - 7e-06 * x1498
+        - 0.000606 * x1503
+        - 0.000606 * x1504
+        + 0.001043 * x1418
+    )
+    x1568 = (
+        -0.011127 * x1497
+        + x1500 * x1566
+        - x1519 * x1567
+        - 0.011127 * x1563
+        - 0.000606 * x1454
+    )
+    x1569 = u3 * x1505
+    x1570 = 0.000606 * u3
+    x1571 = 0.000606 * x1418
+    x1572 = -0.011127 * x1503 - 0.011127 * x1504 + x1570 + x1571
+    x1573 = (
+        -x1500 * x1572
+        + x1505 * x1567
+        + 0.010932 * x1517
+        + 0.010932 * x1569
+        + 7e-06 * x1454
+    )
+    x1574 = -x1479 + x1481
+    x1575 = (
+        5.11984e-05 * x1496
+        - 5.11984e-05 * x1497
+        - 5.11984e-05 * x1499
+        - 1.1636 * x1505 * x1554
+        + 0.0077274676 * x1516
+        - 0.0077274676 * x1517
+        + 0.0077274676 * x1518
+        + 1.1636 * x1519 * x1560
+    )
+    x1576 = -x1505 * x1564 - x1505 * x1566 - x1519 * x1570 + x1519 * x1572
+    x1577 = x5 * x301
+    x1578 = x45 - x194
+    x1579 = x100 + x232
+    x1580 = 0.00017505 * x35
+    x1581 = -x1580 + x166 - 0.10593 * x103 + 0.00017505 * x36
+    x1582 = 0.0063355125 * x1410
+    x1583 = x41 * x1581
+    x1584 = x90 * x23 - x256 * x21 + x1583 * x21
+    x1585 = 0.247974906 * x1432
+    x1586 = x43 * x1581
+    x1587 = x224 + x1586
+    x1588 = -x45 + x194
+    x1589 = x1577 + x140 * x1588 + x1581 * x233
+    x1590 = 0.063883 * x42
+    x1591 = 0.063883 * x48 + x94 + x1590 - 1e-06 * x36
+    x1592 = x41 * x1591
+    x1593 = 0.009432 * x35
+    x1594 = 0.063883 * x98
+    x1595 = -0.063883 * x103 + x1593 + x1594 - 0.009432 * x36
+    x1596 = x43 * x1595
+    x1597 = -0.009432 * x48 - 1e-06 * x103 + x185 - x186 * x22
+    x1598 = x1597 * x21
+    x1599 = x5 * x1598
+    x1600 = 0.0036447875 * x1410
+    x1601 = x43 * x1591
+    x1602 = x41 * x1595
+    x1603 = x1597 * x23 - x1601 * x21 + x1602 * x21
+    x1604 = 0.142658678 * x1432
+    x1605 = -x301 - x256 * x23 + x1583 * x23
+    x1606 = 0.005375 * x0
+    x1607 = 0.005375 * x3
+    x1608 = x1606 * x23 + x1607 * x22
+    x1609 = u3 * x23
+    x1610 = u4 * x1609
+    x1611 = x1495 * x21
+    x1612 = u4 * x1611
+    x1613 = 0.006375 * x0
+    x1614 = x1613 * x21
+    x1615 = 0.006375 * x1609
+    x1616 = x1503 * x1473 - x6 * x1615 - u2 * x1614 + u4 * x1473 - u4 * x77
+    x1617 = 0.5006 * u1
+    x1618 = u3 * x21
+    x1619 = x1495 * x23
+    x1620 = u1 * x25
+    x1621 = x1618 - x1619 + x1620
+    x1622 = -0.20843 * x1618 + 0.20843 * x1619 - 0.20843 * x1620
+    x1623 = 0.5006 * x1622
+    x1624 = 0.20843 * u4
+    x1625 = 0.20843 * x1503
+    x1626 = u1 * x129
+    x1627 = 0.20843 * x1504 - x1506 * x21 - x1615 + x1624 + x1625 - 0.006375 * x1626
+    x1628 = x1503 + x1504 + u4
+    x1629 = 0.5006 * x1628
+    x1630 = (
+        -x1544 * x1609
+        + 0.003191325 * x1610
+        + 0.003191325 * x1612
+        + x1616 * x1617
+        - x1621 * x1623
+        + x1627 * x1629
+    )
+    x1631 = x1503 * x1609
+    x1632 = 0.6781 * u1
+    x1633 = 0.6781 * x1622
+    x1634 = 0.6781 * x1628
+    x1635 = (
+        0.0043228875 * x1610
+        + 0.0043228875 * x1612
+        + x1616 * x1632
+        - x1621 * x1633
+        + x1627 * x1634
+        - 0.0043228875 * x1631
+    )
+    x1636 = 2 * x1635
+    x1637 = x0 * u2
+    x1638 = -x35 * x1624 - x35 * x1625 + x1609 * x1472 + x1624 * x36 + x878 * x1637
+    x1639 = 0.006375 * x1618
+    x1640 = -x1506 * x23 + 0.006375 * x1620 + x1639
+    x1641 = x1621 * x1640
+    x1642 = x1609 + x1611 + x1626
+    x1643 = x1627 * x1642
+    x1644 = (
+        -0.141336383 * x1610
+        - 0.141336383 * x1612
+        + 0.141336383 * x1631
+        + x1632 * x1638
+        + 0.6781 * x1641
+        - 0.6781 * x1643
+    )
+    x1645 = (
+        -0.104340058 * x1610
+        - 0.104340058 * x1612
+        + x1617 * x1638
+        + 0.104340058 * x1631
+        + 0.5006 * x1641
+        - 0.5006 * x1643
+    )
+    x1646 = -x17 * x21 + x55
+    x1647 = x1606 * x21
+    x1648 = -x35 * x1607 + x1647
+    x1649 = u4 * x1618
+    x1650 = x1503 * x1618
+    x1651 = u4 * x1619
+    x1652 = x1613 * x23
+    x1653 = x1503 * x1470 - x6 * x1639 + u2 * x1652 + u4 * x1470 + u4 * x55
+    x1654 = (
+        -0.104340058 * x1496
+        + 0.104340058 * x1497
+        + 0.104340058 * x1499
+        + x1617 * x1653
+        + x1623 * x1642
+        - x1629 * x1640
+        + 0.003191325 * x1649
+        - 0.003191325 * x1650
+        - 0.003191325 * x1651
+    )
+    x1655 = x3 * x1470 - x16 * x21 + x1652
+    x1656 = (
+        -0.141336383 * x1496
+        + 0.141336383 * x1497
+        + 0.141336383 * x1499
+        + x1632 * x1653
+        + x1633 * x1642
+        - x1634 * x1640
+        + 0.0043228875 * x1649
+        - 0.0043228875 * x1650
+        - 0.0043228875 * x1651
+    )
+    x1657 = 2 * x1656
+    x1658 = 2 * x1644
+    x1659 = -x3 * x1473 + x16 * x23 + x1614
+    x1660 = x166 + 0.10593 * x205 - 0.00017505 * x216 - 0.00017505 * x213
+    x1661 = x118 * x1660 + x406 * x21 + x215 * x249
+    x1662 = -x312 + x313
+    x1663 = 0.002690725 * x1410
+    x1664 = 0.105316228 * x1432
+    x1665 = 0.015006 * u2
+    x1666 = 0.015006 * x1618
+    x1667 = x1487 * x1503 + x1487 * u4 + x1488 * u4 - x6 * x1666 + x1665 * x51
+    x1668 = 0.9302 * u1
+    x1669 = 1.8e-05 * u4
+    x1670 = 1.8e-05 * x1503
+    x1671 = (
+        -1.8e-05 * x1504 - 0.015006 * x1619 + 0.015006 * x1620 + x1666 - x1669 - x1670
+    )
+    x1672 = 0.9302 * x1628
+    x1673 = (
+        x1495 * x63
+        + x1495 * x65
+        + 1.8e-05 * x1609
+        - 0.075478 * x1618
+        - 0.075478 * x1620
+        + 1.8e-05 * x1626
+    )
+    x1674 = 0.9302 * x1673
+    x1675 = (
+        -0.0702096356 * x1496
+        + 0.0702096356 * x1497
+        + 0.0702096356 * x1499
+        + x1642 * x1674
+        + 0.0139585812 * x1649
+        - 0.0139585812 * x1650
+        - 0.0139585812 * x1651
+        + x1667 * x1668
+        - x1671 * x1672
+    )
+    x1676 = 0.015006 * x1609
+    x1677 = -x0 * x1665 * x21 + x1491 * x1503 + x1491 * u4 - x1492 * u4 - x6 * x1676
+    x1678 = 0.075478 * u4
+    x1679 = 0.075478 * x1503
+    x1680 = (
+        0.075478 * x1504 - 0.015006 * x1611 - 0.015006 * x1626 - x1676 + x1678 + x1679
+    )
+    x1681 = (
+        1.67436e-05 * x1496
+        - 1.67436e-05 * x1497
+        - 1.67436e-05 * x1499
+        + 0.0139585812 * x1610
+        + 0.0139585812 * x1612
+        - x1621 * x1674
+        - 0.0139585812 * x1631
+        + x1668 * x1677
+        + x1672 * x1680
+    )
+    x1682 = x115 * x1660
+    x1683 = x43 * x1682
+    x1684 = -x256 + x1583
+    x1685 = -x224 - x1586
+    x1686 = 0.0005 * u4
+    x1687 = 0.0005 * x1503
+    x1688 = 1e-06 * x1618
+    x1689 = (
+        x1495 * x131
+        - 0.0005 * x1504
+        + 0.000631 * x1609
+        + 0.000631 * x1611
+        - 1e-06 * x1620
+        + 0.000631 * x1626
+        - x1686
+        - x1687
+        - x1688
+    )
+    x1690 = 1e-06 * x1609
+    x1691 = 1e-06 * x1611
+    x1692 = 1e-06 * x1626
+    x1693 = (
+        0.008147 * x1618 - 0.008147 * x1619 + 0.008147 * x1620 - x1690 - x1691 - x1692
+    )
+    x1694 = x1505 * x1618
+    x1695 = x1454 * x23
+    x1696 = (
+        0.008316 * x1563
+        + x1418 * x1687 * x21
+        + x1621 * x1686
+        + x1621 * x1689
+        - x1642 * x1693
+        + 0.0005 * x1694
+        + 0.0005 * x1695
+    )
+    x1697 = 0.008316 * x1497 + x1696
+    x1698 = (
+        -0.0702096356 * x1610
+        - 0.0702096356 * x1612
+        + 0.9302 * x1621 * x1671
+        + 0.0702096356 * x1631
+        - 0.9302 * x1642 * x1680
+        - 1.67436e-05 * x1649
+        + 1.67436e-05 * x1650
+        + 1.67436e-05 * x1651
+        + x1668
+        * (x1486 * x1618 - x1637 * x950 - x1669 * x24 - x1669 * x22 - x1670 * x22)
+        + x1668
+        * (x1490 * x1609 - x35 * x1678 - x35 * x1679 + x1637 * x949 + x1678 * x36)
+    )
+    x1699 = x185 + 0.00965 * x119 + 0.00965 * x127 + 1e-06 * x205
+    x1700 = 0.045483 * x98 + 0.045483 * x205 - 0.00965 * x216 - 0.00965 * x213
+    x1701 = x118 * x1700 + x215 * x1699 + x485 * x21
+    x1702 = x1454 * x21
+    x1703 = x1517 * x21
+    x1704 = x1505 * x1609
+    x1705 = u4 * x1642
+    x1706 = u4 * x1621
+    x1707 = (
+        0.008316 * x1503
+        + 0.008316 * x1504
+        + 0.008316 * u4
+        - 0.0005 * x1609
+        - 0.0005 * x1611
+        - 0.0005 * x1626
+    )
+    x1708 = (
+        x1505 * x1688
+        + 0.008147 * x1517 * x23
+        - x1628 * x1689
+        + x1642 * x1707
+        + x131 * x1454
+        - 0.008147 * x1702
+        + 1e-06 * x1703
+        + 0.008147 * x1704
+        + 0.008147 * x1705
+        + 1e-06 * x1706
+    )
+    x1709 = x113 * x1660 + x115 * x249
+    x1710 = (
+        -0.0005 * x1497
+        - x1505 * x1690
+        - x1517 * x131
+        - 0.0005 * x1563
+        - x1621 * x1707
+        + x1628 * x1693
+        - 0.000631 * x1694
+        - 0.000631 * x1695
+        + 1e-06 * x1702
+        - 0.000631 * x1703
+        - 1e-06 * x1705
+        - 0.000631 * x1706
+    )
+    x1711 = x113 * x1699
+    x1712 = x43 * x1711
+    x1713 = x115 * x1700
+    x1714 = x43 * x1713
+    x1715 = x113 * x1700 + x115 * x1699
+    x1716 = x41 * u4
+    x1717 = u5 * x1716
+    x1718 = x1609 * x1716
+    x1719 = x43 * x1618
+    x1720 = u5 * x1719
+    x1721 = u3 * x44
+    x1722 = 0.10593 * x45
+    x1723 = u4 * x21
+    x1724 = x99 * x1723
+    x1725 = 0.10593 * x194
+    x1726 = -x1609 * x1722 - u5 * x1722 + u5 * x1725 + 0.10593 * x1721 + 0.10593 * x1724
+    x1727 = 0.10593 * x1716
+    x1728 = u2 * x2
+    x1729 = x47 * x1728
+    x1730 = -u3 * x100 - x45 * x1723 - x99 * x1609 - x99 * u5 - x101 * u5
+    x1731 = x0 * x1730
+    x1732 = x35 * x1727 - x166 * u5 - x1637 * x954 + 0.10593 * x1729 + 0.10593 * x1731
+    x1733 = x43 * u4
+    x1734 = x41 * x1618
+    x1735 = u2 * x233
+    x1736 = u1 * x49
+    x1737 = (
+        -0.00017505 * x1733
+        + 0.00017505 * x1734
+        + 0.00017505 * x1735
+        + 0.00017505 * x1736
+    )
+    x1738 = -x1733 + x1734 + x1735 + x1736
+    x1739 = 0.6781 * x1738
+    x1740 = 0.00017505 * u5
+    x1741 = 0.00017505 * x1609
+    x1742 = u1 * x174
+    x1743 = u2 * x1588
+    x1744 = 0.10593 * x1719 + x1727
+    x1745 = (
+        -0.00017505 * x1611
+        - 0.00017505 * x1626
+        - x1740
+        - x1741
+        - 0.10593 * x1742
+        - 0.10593 * x1743
+        + x1744
+    )
+    x1746 = x1642 + u5
+    x1747 = 0.6781 * x1746
+    x1748 = (
+        x1632 * x1732
+        + x1426 * x1726
+        - 0.071831133 * x1717
+        + 0.071831133 * x1718
+        - 0.071831133 * x1720
+        - x1737 * x1739
+        + x1745 * x1747
+    )
+    x1749 = (
+        x1423 * x1726
+        + x1617 * x1732
+        - 0.053028558 * x1717
+        + 0.053028558 * x1718
+        - 0.053028558 * x1720
+        - 0.5006 * x1737 * x1738
+        + 0.5006 * x1745 * x1746
+    )
+    x1750 = x43 * x1647
+    x1751 = -x1510 * x102 - x1750
+    x1752 = x45 * x196
+    x1753 = x100 * x1614
+    x1754 = x1752 - x1753 - x162
+    x1755 = x41 * x1477
+    x1756 = x43 * x1474
+    x1757 = -x1755 - x1756
+    x1758 = 8.763003e-05 * x1716
+    x1759 = u3 * x1088 - x45 * x1740 - x45 * x1741 + x194 * x1740 + 0.00017505 * x1724
+    x1760 = 0.00017505 * x0
+    x1761 = 0.00017505 * x1728
+    x1762 = (
+        -u2 * x1760 * x221 + x47 * x1761 + x1580 * x1716 - x98 * x1740 + x1730 * x1760
+    )
+    x1763 = 0.10593 * x1733
+    x1764 = x137 * x1618 + 0.10593 * x1735 + 0.10593 * x1736 - x1763
+    x1765 = 0.5006 * x1764
+    x1766 = -x1716 - x1719 + x1742 + x1743
+    x1767 = 0.5006 * x1766
+    x1768 = (
+        x1609 * x1758
+        + x1423 * x1759
+        + x1617 * x1762
+        - 8.763003e-05 * x1717
+        - 8.763003e-05 * x1720
+        + x1738 * x1765
+        - x1745 * x1767
+    )
+    x1769 = 0.6781 * x1766
+    x1770 = (
+        x1632 * x1762
+        + x1426 * x1759
+        - 0.000118701405 * x1717
+        + 0.000118701405 * x1718
+        - 0.000118701405 * x1720
+        + x1739 * x1764
+        - x1745 * x1769
+    )
+    x1771 = x43 * x1614
+    x1772 = -x15 * x102 - x1588 * x196 - x1771
+    x1773 = x1642 * x1716
+    x1774 = 0.000256 * u5
+    x1775 = 0.000256 * x1609
+    x1776 = (
+        0.000256 * x1611
+        + 0.000256 * x1626
+        - 0.001607 * x1716
+        - 0.001607 * x1719
+        + 0.001607 * x1742
+        + 0.001607 * x1743
+        + x1774
+        + x1775
+    )
+    x1777 = (
+        0.000399 * x1609
+        + 0.000399 * x1611
+        + 0.000399 * x1626
+        + 0.000399 * u5
+        - 0.000256 * x1716
+        - 0.000256 * x1719
+        + 0.000256 * x1742
+        + 0.000256 * x1743
+    )
+    x1778 = (
+        -0.001596 * x1563 * x43
+        + 0.001596 * x41 * x1704
+        + 0.001596 * x47 * x1419
+        + 0.001596 * u5 * x1766
+        - x1746 * x1776
+        - 0.001596 * x221 * x1454
+        + x1766 * x1777
+        + 0.001596 * x1773
+    )
+    x1779 = -x1510 * x47 + x41 * x1647
+    x1780 = x44 * u5
+    x1781 = u3 * x45
+    x1782 = x44 * x1609
+    x1783 = x100 * x1723
+    x1784 = x46 * u5
+    x1785 = x1780 - x1781 + x1782 + x1783 - x1784
+    x1786 = x0 * x1785
+    x1787 = x102 * x1728
+    x1788 = x35 * x1763 + x138 * u5 - x1637 * x781
+    x1789 = -0.10593 * x1786 - 0.10593 * x1787 + x1788
+    x1790 = u4 * x22
+    x1791 = x1503 * x22
+    x1792 = x6 * x1618
+    x1793 = u4 * x8
+    x1794 = (
+        x1637 * x528
+        + x528 * x1793
+        + 0.00017505 * x1790
+        + 0.00017505 * x1791
+        - 0.00017505 * x1792
+    )
+    x1795 = u3 * x99
+    x1796 = x44 * x1723
+    x1797 = -x1609 * x532 - u5 * x532 - u5 * x533 - 0.10593 * x1795 + 0.10593 * x1796
+    x1798 = u5 * x1733
+    x1799 = x1609 * x1733
+    x1800 = u5 * x1734
+    x1801 = (
+        x1423 * x1797 - 0.053028558 * x1798 + 0.053028558 * x1799 + 0.053028558 * x1800
+    )
+    x1802 = (
+        x1617 * x1789
+        + x1617 * x1794
+        + 8.763003e-05 * x1649
+        - 8.763003e-05 * x1650
+        - 8.763003e-05 * x1651
+        + x1737 * x1767
+        - x1746 * x1765
+        + x1801
+    )
+    x1803 = (
+        x1632 * x1789
+        + x1632 * x1794
+        + x1426 * x1797
+        + 0.000118701405 * x1649
+        - 0.000118701405 * x1650
+        - 0.000118701405 * x1651
+        + x1737 * x1769
+        - x1747 * x1764
+        - 0.071831133 * x1798
+        + 0.071831133 * x1799
+        + 0.071831133 * x1800
+    )
+    x1804 = x41 * x105 + x45 * x1614 + x100 * x196
+    x1805 = x43 * x1477
+    x1806 = x41 * x1474
+    x1807 = -x1805 + x1806
+    x1808 = -x15 * x47 + x41 * x1614 - x233 * x196
+    x1809 = x159 * x1454
+    x1810 = x1563 * x41
+    x1811 = x43 * x1704
+    x1812 = x1419 * x102
+    x1813 = x1642 * x1733
+    x1814 = u5 * x1738
+    x1815 = -0.001596 * x1733 + 0.001596 * x1734 + 0.001596 * x1735 + 0.001596 * x1736
+    x1816 = (
+        -0.000256 * x1694
+        - 0.000256 * x1695
+        - 0.000256 * x1703
+        - 0.000256 * x1706
+        - x1738 * x1777
+        + x1746 * x1815
+        + 0.001607 * x1809
+        - 0.001607 * x1810
+        - 0.001607 * x1811
+        + 0.001607 * x1812
+        - 0.001607 * x1813
+        - 0.001607 * x1814
+    )
+    x1817 = -0.000281 * x216 - 0.000281 * x213 + 0.029798 * x325 + 0.029798 * x336
+    x1818 = x215 * x424 + x345 * x1817 + x324 * x414
+    x1819 = (
+        -x1505 * x43 * x1775
+        - 0.000399 * x1694
+        - 0.000399 * x1695
+        - 0.000399 * x1703
+        - 0.000399 * x1706
+        - x1738 * x1774
+        + x1738 * x1776
+        - x1766 * x1815
+        + 0.000256 * x1809
+        - 0.000256 * x1810
+        + 0.000256 * x1812
+        - 0.000256 * x1813
+    )
+    x1820 = x478 + x479
+    x1821 = x470 + x471
+    x1822 = (
+        -x1637 * x694
+        - 0.009432 * x1790
+        - 0.009432 * x1791
+        + 0.009432 * x1792
+        - x1793 * x694
+    )
+    x1823 = 0.063883 * x100
+    x1824 = 0.063883 * x21
+    x1825 = u4 * x1824
+    x1826 = 0.063883 * x232
+    x1827 = x44 * x1825 - x1609 * x1823 - u5 * x1823 - u5 * x1826 - 0.063883 * x1795
+    x1828 = x43 * x1824
+    x1829 = 0.063883 * x1733
+    x1830 = (
+        x35 * x1829 + x1590 * u5 - x1637 * x1828 - 0.063883 * x1786 - 0.063883 * x1787
+    )
+    x1831 = 1e-06 * u5
+    x1832 = (
+        x1690
+        + x1691
+        + x1692
+        + 0.063883 * x1734
+        + 0.063883 * x1735
+        + 0.063883 * x1736
+        - x1829
+        + x1831
+    )
+    x1833 = 1e-06 * x1716
+    x1834 = x184 * x1618 + x1833
+    x1835 = (
+        -x186 * x1618
+        + 0.009432 * x1733
+        - 0.009432 * x1735
+        - 0.009432 * x1736
+        - 1e-06 * x1742
+        - 1e-06 * x1743
+        + x1834
+    )
+    x1836 = (
+        x1632 * x1822
+        + x1632 * x1830
+        + x1426 * x1827
+        - 0.0063958392 * x1649
+        + 0.0063958392 * x1650
+        + 0.0063958392 * x1651
+        - x1747 * x1832
+        + x1769 * x1835
+        - 0.0433190623 * x1798
+        + 0.0433190623 * x1799
+        + 0.0433190623 * x1800
+    )
+    x1837 = x6 * x1688 - x1637 * x131 - x131 * x1793 - 1e-06 * x1790 - 1e-06 * x1791
+    x1838 = 0.063883 * x45
+    x1839 = 0.063883 * x194
+    x1840 = x99 * x1825 - x1609 * x1838 - u5 * x1838 + u5 * x1839 + 0.063883 * x1721
+    x1841 = x41 * x1824
+    x1842 = 0.063883 * x1716
+    x1843 = (
+        x35 * x1842 - x1594 * u5 - x1637 * x1841 + 0.063883 * x1729 + 0.063883 * x1731
+    )
+    x1844 = 0.009432 * u5
+    x1845 = 0.009432 * x1609
+    x1846 = (
+        0.009432 * x1611
+        + 0.009432 * x1626
+        + 0.063883 * x1719
+        - 0.063883 * x1742
+        - 0.063883 * x1743
+        + x1842
+        + x1844
+        + x1845
+    )
+    x1847 = (
+        x1632 * x1837
+        + x1632 * x1843
+        + x1426 * x1840
+        - 6.781e-07 * x1649
+        + 6.781e-07 * x1650
+        + 6.781e-07 * x1651
+        - 0.0433190623 * x1717
+        + 0.0433190623 * x1718
+        - 0.0433190623 * x1720
+        - x1739 * x1835
+        + x1747 * x1846
+    )
+    x1848 = x318 * x1817
+    x1849 = -x113 * x1848 + x113 * x503 + x115 * x424
+    x1850 = 1e-06 * x0
+    x1851 = 1e-06 * x1728
+    x1852 = x42 * x1831 + x94 * x1733 - x1637 * x896
+    x1853 = 0.009432 * x44
+    x1854 = 1e-06 * x99
+    x1855 = -u3 * x1854 - x100 * x1690 - x100 * x1831 - x232 * x1831 + 1e-06 * x1796
+    x1856 = x1426 * x1855 - 6.781e-07 * x1798 + 6.781e-07 * x1799 + 6.781e-07 * x1800
+    x1857 = (
+        x1632 * (-x102 * x1851 - x1785 * x1850 + x1852)
+        + x1632
+        * (
+            x98 * x1844
+            - x1593 * x1716
+            + x1637 * x899
+            - 0.009432 * x1729
+            - 0.009432 * x1731
+        )
+        + x1426
+        * (-u3 * x1853 + x45 * x1844 + x45 * x1845 - x194 * x1844 - 0.009432 * x1724)
+        + 0.0063958392 * x1717
+        - 0.0063958392 * x1718
+        + 0.0063958392 * x1720
+        + x1739 * x1832
+        - x1769 * x1846
+        + x1856
+    )
+    x1858 = x316 * x1817
+    x1859 = x115 * u5
+    x1860 = u6 * x1859
+    x1861 = x113 * x1733
+    x1862 = u6 * x1861
+    x1863 = u4 * x121
+    x1864 = x122 * u6
+    x1865 = 0.00017505 * x122
+    x1866 = x43 * x1740
+    x1867 = x214 * u6
+    x1868 = 0.5006 * u3
+    x1869 = u3 * x120
+    x1870 = 0.00017505 * x1859
+    x1871 = 0.00017505 * x312
+    x1872 = x3 * u3
+    x1873 = x1872 * (x121 - x123)
+    x1874 = u4 * x114
+    x1875 = x116 * u6
+    x1876 = x116 * x1716
+    x1877 = x43 * u5
+    x1878 = x122 * x1877
+    x1879 = x209 * u6
+    x1880 = x5 * (x1874 + x1875 + x1876 + x1878 + x1879)
+    x1881 = u2 * x118
+    x1882 = x116 * x1877
+    x1883 = x2 * (x122 * x1716 - x1863 + x1864 - x1867 - x1882)
+    x1884 = (
+        x3 * (-x1874 - x1875 - x1876 - x1878 - x1879)
+        - u3 * x371
+        - u3 * x372
+        - x99 * x1859
+        + x208 * u6
+    )
+    x1885 = x113 * u5
+    x1886 = x115 * x1733
+    x1887 = u3 * x118
+    x1888 = u2 * x373
+    x1889 = u1 * x128
+    x1890 = x1885 - x1886 + x1887 + x1888 + x1889
+    x1891 = (
+        -0.10593 * x1885
+        + 0.10593 * x1886
+        - 0.10593 * x1887
+        - 0.10593 * x1888
+        - 0.10593 * x1889
+    )
+    x1892 = 0.5006 * x1891
+    x1893 = 0.10593 * u6
+    x1894 = u1 * x217
+    x1895 = u2 * x1578
+    x1896 = u1 * x279
+    x1897 = u3 * x215
+    x1898 = u2 * x314
+    x1899 = (
+        x1744
+        - 0.00017505 * x1861
+        - x1870
+        + x1893
+        + 0.10593 * x1894
+        + 0.10593 * x1895
+        - 0.00017505 * x1896
+        - 0.00017505 * x1897
+        - 0.00017505 * x1898
+    )
+    x1900 = x1716 + x1719 + u6 + x1894 + x1895
+    x1901 = 0.5006 * x1900
+    x1902 = (
+        x1423
+        * (
+            -x45 * x1870
+            + u6 * x1871
+            + 0.00017505 * x1869
+            + 0.00017505 * x1873
+            + 0.00017505 * x1880
+        )
+        + x1617 * (x126 * x1761 - x1760 * x1881 + x1760 * x1884 + 0.00017505 * x1883)
+        - x1758 * x1859
+        + 8.763003e-05 * x1860
+        + 8.763003e-05 * x1862
+        + x1868
+        * (
+            -x116 * x1866
+            + x1716 * x1865
+            - 0.00017505 * x1863
+            + 0.00017505 * x1864
+            - 0.00017505 * x1867
+        )
+        - x1890 * x1892
+        + x1899 * x1901
+    )
+    x1903 = -x1510 * x212 + x1606 * x215
+    x1904 = x17 * x210 + x215 * x160 - x312 * x196
+    x1905 = x113 * x1805 - x113 * x1806 + x115 * x1471
+    x1906 = x90 * x115 - x1581 * x113
+    x1907 = -x1510 * x201 + x1750
+    x1908 = x1716 * x1859
+    x1909 = 0.10593 * x120
+    x1910 = x0 * x1881
+    x1911 = x126 * x1728
+    x1912 = x0 * x1884
+    x1913 = 0.00017505 * x1885
+    x1914 = (
+        -0.00017505 * x1886
+        + 0.00017505 * x1887
+        + 0.00017505 * x1888
+        + 0.00017505 * x1889
+        + x1913
+    )
+    x1915 = x1859 + x1861 + x1896 + x1897 + x1898
+    x1916 = (
+        x1423
+        * (
+            -u3 * x1909
+            - x312 * x1893
+            + x1722 * x1859
+            - 0.10593 * x1873
+            - 0.10593 * x1880
+        )
+        + x1617
+        * (-0.10593 * x1883 + 0.10593 * x1910 - 0.10593 * x1911 - 0.10593 * x1912)
+        - 0.053028558 * x1860
+        - 0.053028558 * x1862
+        + x1868
+        * (
+            -x122 * x1727
+            - x122 * x1893
+            + x214 * x1893
+            + 0.10593 * x1863
+            + 0.10593 * x1882
+        )
+        + 0.5006 * x1890 * x1914
+        - 0.5006 * x1899 * x1915
+        + 0.053028558 * x1908
+    )
+    x1917 = -x15 * x212 + x1613 * x215 - x314 * x196
+    x1918 = 0.001641 * x1454
+    x1919 = 0.001641 * x1716
+    x1920 = x1766 * x1859
+    x1921 = 0.001641 * u6
+    x1922 = 0.000278 * u6
+    x1923 = 0.000278 * x1716
+    x1924 = (
+        -0.000278 * x1719
+        + 0.00041 * x1859
+        + 0.00041 * x1861
+        - 0.000278 * x1894
+        - 0.000278 * x1895
+        + 0.00041 * x1896
+        + 0.00041 * x1897
+        + 0.00041 * x1898
+        - x1922
+        - x1923
+    )
+    x1925 = (
+        0.001641 * x1719
+        - 0.000278 * x1859
+        - 0.000278 * x1861
+        + 0.001641 * x1894
+        + 0.001641 * x1895
+        - 0.000278 * x1896
+        - 0.000278 * x1897
+        - 0.000278 * x1898
+        + x1919
+        + x1921
+    )
+    x1926 = (
+        -0.001641 * x1563 * x338
+        + 0.001641 * x1569 * x124
+        + 0.001641 * x1419 * x126
+        + x1642 * x115 * x1919
+        - 0.001641 * x113 * x1706
+        - x118 * x1918
+        - x1900 * x1924
+        + x1915 * x1921
+        + x1915 * x1925
+        + 0.001641 * x1920
+    )
+    x1927 = -x1752 + x1753 + x162
+    x1928 = x1755 + x1756
+    x1929 = -x15 * x201 - x1578 * x196 + x1771
+    x1930 = -x1510 * x126 + x1606 * x118
+    x1931 = u2 * x215
+    x1932 = u4 * x116
+    x1933 = x114 * u6
+    x1934 = x121 * x1877
+    x1935 = x114 * x1716
+    x1936 = x117 * u6
+    x1937 = -x1932 - x1933 + x1934 - x1935 - x1936
+    x1938 = x2 * x1937
+    x1939 = x121 * u6
+    x1940 = u4 * x122
+    x1941 = x121 * x1716
+    x1942 = x114 * x1877
+    x1943 = x123 * u6
+    x1944 = (
+        x3 * (x1939 - x1940 + x1941 + x1942 - x1943)
+        + u3 * x312
+        - u3 * x313
+        + x99 * x1885
+        + x120 * u6
+    )
+    x1945 = -x212 * x1761 + x1760 * x1931 - x1760 * x1944 - 0.00017505 * x1938
+    x1946 = x0 * (-x1780 + x1781 - x1782 - x1783 + x1784)
+    x1947 = x201 * x1728
+    x1948 = x1788 + 0.10593 * x1946 + 0.10593 * x1947
+    x1949 = u3 * x208
+    x1950 = 0.00017505 * x371
+    x1951 = x116 + x209
+    x1952 = x1872 * x1951
+    x1953 = -x1939 + x1940 - x1941 - x1942 + x1943
+    x1954 = x5 * x1953
+    x1955 = (
+        -x45 * x1913
+        - u6 * x1950
+        + 0.00017505 * x1949
+        - 0.00017505 * x1952
+        - 0.00017505 * x1954
+    )
+    x1956 = 0.00017505 * x114
+    x1957 = (
+        -x121 * x1866
+        + x1716 * x1956
+        + 0.00017505 * x1932
+        + 0.00017505 * x1933
+        + 0.00017505 * x1936
+    )
+    x1958 = u6 * x1885
+    x1959 = u6 * x1886
+    x1960 = (
+        x1423 * x1955
+        + x1617 * x1945
+        + x1617 * x1948
+        - x1758 * x1885
+        + x1801
+        + x1868 * x1957
+        + x1892 * x1915
+        - x1901 * x1914
+        + 8.763003e-05 * x1958
+        - 8.763003e-05 * x1959
+    )
+    x1961 = x17 * x124 + x118 * x160 + x371 * x196
+    x1962 = x113 * x1471
+    x1963 = -x115 * x1805 + x115 * x1806 + x1962
+    x1964 = x1581 * x115
+    x1965 = x368 + x1964
+    x1966 = x1419 * x201
+    x1967 = x1563 * x261
+    x1968 = x215 * x1454
+    x1969 = x1569 * x210
+    x1970 = x1419 * x212
+    x1971 = x115 * x1706
+    x1972 = x113 * x1773
+    x1973 = x1766 * x1885
+    x1974 = u6 * x1890
+    x1975 = (
+        0.001641 * x1885
+        - 0.001641 * x1886
+        + 0.001641 * x1887
+        + 0.001641 * x1888
+        + 0.001641 * x1889
+    )
+    x1976 = (
+        0.000278 * x1809
+        - 0.000278 * x1810
+        - 0.000278 * x1811
+        - 0.000278 * x1813
+        - 0.000278 * x1814
+        - x1890 * x1925
+        + x1900 * x1975
+        - 0.000278 * x1966
+        + 0.00041 * x1967
+        - 0.00041 * x1968
+        + 0.00041 * x1969
+        + 0.00041 * x1970
+        - 0.00041 * x1971
+        - 0.00041 * x1972
+        - 0.00041 * x1973
+        - 0.00041 * x1974
+    )
+    x1977 = -x15 * x126 + x1613 * x118 - x373 * x196
+    x1978 = (
+        x1642 * x113 * x1923
+        - x159 * x1918
+        + 0.001641 * x1810
+        + 0.001641 * x1811
+        + 0.001641 * x1813
+        + 0.001641 * x1814
+        + x1890 * x1922
+        + x1890 * x1924
+        - x1915 * x1975
+        + 0.001641 * x1966
+        - 0.000278 * x1967
+        + 0.000278 * x1968
+        - 0.000278 * x1969
+        - 0.000278 * x1970
+        + 0.000278 * x1971
+        + 0.000278 * x1973
+    )
+    x1979 = 0.006543665 * x1716
+    x1980 = 0.045483 * x100
+    x1981 = (
+        -0.045483 * x232 * u5
+        - x1609 * x1980
+        - u5 * x1980
+        - 0.045483 * x1795
+        + 0.045483 * x1796
+    )
+    x1982 = 0.00965 * x114
+    x1983 = (
+        x1716 * x1982
+        + 0.00965 * x1932
+        + 0.00965 * x1933
+        - 0.00965 * x1934
+        + 0.00965 * x1936
+    )
+    x1984 = 0.6781 * u3
+    x1985 = 0.045483 * x159
+    x1986 = (
+        0.045483 * x35 * x1733
+        - x1637 * x1985
+        + u5 * x891 * x22
+        + 0.045483 * x1946
+        + 0.045483 * x1947
+    )
+    x1987 = 0.00965 * x1885
+    x1988 = 0.00965 * x371
+    x1989 = (
+        -x45 * x1987 - u6 * x1988 + 0.00965 * x1949 - 0.00965 * x1952 - 0.00965 * x1954
+    )
+    x1990 = 0.00965 * x0
+    x1991 = 0.00965 * x1728
+    x1992 = -x212 * x1991 + x1931 * x1990 - 0.00965 * x1938 - x1944 * x1990
+    x1993 = 1e-06 * u6
+    x1994 = (
+        x1834
+        - 0.00965 * x1886
+        + 0.00965 * x1887
+        + 0.00965 * x1888
+        + 0.00965 * x1889
+        + 1e-06 * x1894
+        + 1e-06 * x1895
+        + x1987
+        + x1993
+    )
+    x1995 = 0.6781 * x1900
+    x1996 = (
+        -x1733 * x679
+        + x1733 * x681
+        - 1e-06 * x1859
+        - 0.045483 * x1885
+        - 0.045483 * x1887
+        - 0.045483 * x1888
+        - 0.045483 * x1889
+        - 1e-06 * x1896
+        - 1e-06 * x1897
+        - 1e-06 * x1898
+    )
+    x1997 = 0.6781 * x1996
+    x1998 = (
+        x1632 * x1986
+        + x1632 * x1992
+        + x1426 * x1981
+        + x1426 * x1989
+        - 0.0308420223 * x1798
+        + 0.0308420223 * x1799
+        + 0.0308420223 * x1800
+        - x1885 * x1979
+        + x1915 * x1997
+        + 0.006543665 * x1958
+        - 0.006543665 * x1959
+        + x1983 * x1984
+        - x1994 * x1995
+    )
+    x1999 = x126 * x1991 - x1881 * x1990 + 0.00965 * x1883 + x1884 * x1990
+    x2000 = 0.045483 * u6
+    x2001 = 0.045483 * x1716
+    x2002 = 0.00965 * x1859
+    x2003 = (
+        0.045483 * x1719
+        - 0.00965 * x1861
+        + 0.045483 * x1894
+        + 0.045483 * x1895
+        - 0.00965 * x1896
+        - 0.00965 * x1897
+        - 0.00965 * x1898
+        + x2000
+        + x2001
+        - x2002
+    )
+    x2004 = x1852 + 1e-06 * x1946 + 1e-06 * x1947
+    x2005 = 0.00965 * x312
+    x2006 = (
+        -x45 * x2002 + u6 * x2005 + 0.00965 * x1869 + 0.00965 * x1873 + 0.00965 * x1880
+    )
+    x2007 = 0.00965 * x122
+    x2008 = (
+        x1716 * x2007
+        - 0.00965 * x1863
+        + 0.00965 * x1864
+        - 0.00965 * x1867
+        - 0.00965 * x1882
+    )
+    x2009 = (
+        x1632 * x1999
+        + x1632 * x2004
+        + x1426 * x2006
+        + x1856
+        - x1859 * x1979
+        + 0.006543665 * x1860
+        + 0.006543665 * x1862
+        - x1890 * x1997
+        + x1984 * x2008
+        + x1995 * x2003
+    )
+    x2010 = x1716 * x1885
+    x2011 = 0.045483 * x45
+    x2012 = (
+        x1632
+        * (-0.045483 * x1883 + 0.045483 * x1910 - 0.045483 * x1911 - 0.045483 * x1912)
+        + x1632 * (-x212 * x1851 + x1850 * x1931 - x1850 * x1944 - 1e-06 * x1938)
+        + x1426
+        * (
+            -x312 * x2000
+            - x1721 * x681
+            + x1859 * x2011
+            - 0.045483 * x1873
+            - 0.045483 * x1880
+        )
+        + x1426
+        * (-x371 * x1993 + x1721 * x679 - x1885 * x674 - 1e-06 * x1952 - 1e-06 * x1954)
+        - 0.0308420223 * x1860
+        - 0.0308420223 * x1862
+        + 0.6781 * x1890 * x1994
+        + 0.0308420223 * x1908
+        - 0.6781 * x1915 * x2003
+        + 6.781e-07 * x1958
+        - 6.781e-07 * x1959
+        + x1984
+        * (
+            -x122 * x2000
+            - x122 * x2001
+            + x214 * x2000
+            + 0.045483 * x1863
+            + 0.045483 * x1882
+        )
+        + x1984
+        * (
+            -x43 * x121 * x1831
+            + x114 * x1833
+            + x114 * x1993
+            + x117 * x1993
+            + 1e-06 * x1932
+        )
+        - 6.781e-07 * x2010
+    )
+    x2013 = x318 * u6
+    x2014 = u7 * x2013
+    x2015 = x1859 * x2013
+    x2016 = x316 * x1885
+    x2017 = u7 * x2016
+    x2018 = (
+        -0.011402 * x1932
+        - 0.011402 * x1933
+        + 0.011402 * x1934
+        - 0.011402 * x1935
+        - 0.011402 * x1936
+    )
+    x2019 = u5 * x327
+    x2020 = x326 * u7
+    x2021 = 0.029798 * x326
+    x2022 = 0.029798 * x113
+    x2023 = u6 * x2022
+    x2024 = x328 * u7
+    x2025 = (
+        x319 * x2023
+        - x1859 * x2021
+        - 0.029798 * x2019
+        - 0.029798 * x2020
+        - 0.029798 * x2024
+    )
+    x2026 = 0.5006 * u4
+    x2027 = x45 * x1885
+    x2028 = x100 * u6
+    x2029 = 0.011402 * x1872
+    x2030 = 0.011402 * x5
+    x2031 = (
+        -0.011402 * x1949
+        + x1951 * x2029
+        + x1953 * x2030
+        + 0.011402 * x2027
+        + x981 * x2028
+    )
+    x2032 = u4 * x350
+    x2033 = 0.029798 * x2013
+    x2034 = x317 * u7
+    x2035 = u4 * x351
+    x2036 = x113 * u6
+    x2037 = -u5 * x320 + x326 * x2036 + x319 * x1859 + x319 * u7 - x321 * u7
+    x2038 = x21 * x2037
+    x2039 = (
+        x122 * x2033
+        - 0.029798 * x2032
+        + 0.029798 * x2034
+        - 0.029798 * x2035
+        - 0.029798 * x2038
+    )
+    x2040 = 0.011402 * x0
+    x2041 = u2 * x2040
+    x2042 = 0.011402 * x2
+    x2043 = u2 * x2042
+    x2044 = -x215 * x2041 + x212 * x2043 + x1937 * x2042 + x1944 * x2040
+    x2045 = 0.029798 * x5
+    x2046 = u3 * x435
+    x2047 = x1872 * (-x350 - x351)
+    x2048 = x319 * x2036
+    x2049 = x326 * x1859 + x2019 + x2020 + x2024 - x2048
+    x2050 = x3 * x2049
+    x2051 = u4 * x341
+    x2052 = x116 * x2013
+    x2053 = x331 * u7
+    x2054 = u4 * x344
+    x2055 = x23 * x2037
+    x2056 = x5 * (-x2051 - x2052 - x2053 + x2054 - x2055)
+    x2057 = x2045 * x2046 - 0.029798 * x2047 - 0.029798 * x2050 - 0.029798 * x2056
+    x2058 = 0.029798 * x0
+    x2059 = u2 * x345
+    x2060 = 0.029798 * x2
+    x2061 = u2 * x2060
+    x2062 = x2 * (-x122 * x2013 + x2032 - x2034 + x2035 + x2038)
+    x2063 = x0 * (
+        x3 * (x2051 + x2052 + x2053 - x2054 + x2055)
+        - u3 * x479
+        + x5 * x2049
+        + x435 * x1872
+    )
+    x2064 = -x354 * x2061 + x2058 * x2059 - 0.029798 * x2062 - 0.029798 * x2063
+    x2065 = x1915 + u7
+    x2066 = 0.000281 * u7
+    x2067 = 0.000281 * x1859
+    x2068 = u4 * x440
+    x2069 = u3 * x324
+    x2070 = u2 * x472
+    x2071 = u1 * x337
+    x2072 = (
+        -0.000281 * x1861
+        - 0.000281 * x1896
+        - 0.000281 * x1897
+        - 0.000281 * x1898
+        + 0.029798 * x2016
+        - x2033
+        - x2066
+        - x2067
+        + 0.029798 * x2068
+        + 0.029798 * x2069
+        + 0.029798 * x2070
+        + 0.029798 * x2071
+    )
+    x2073 = 0.5006 * x2072
+    x2074 = x316 * u6
+    x2075 = u4 * x435
+    x2076 = u3 * x345
+    x2077 = u2 * x480
+    x2078 = u1 * x493
+    x2079 = (
+        -x1885 * x799
+        - x1885 * x801
+        + 0.011402 * x2013
+        - 0.011402 * x2068
+        - 0.011402 * x2069
+        - 0.011402 * x2070
+        - 0.011402 * x2071
+        - 0.000281 * x2074
+        + 0.000281 * x2075
+        + 0.000281 * x2076
+        + 0.000281 * x2077
+        + 0.000281 * x2078
+    )
+    x2080 = x318 * x1885
+    x2081 = -x2074 + x2075 + x2076 + x2077 + x2078 - x2080
+    x2082 = 0.5006 * x2081
+    x2083 = (
+        x1423 * x2031
+        + x1423 * x2057
+        + x1617 * x2044
+        + x1617 * x2064
+        + x1868 * x2018
+        + x1868 * x2039
+        - 0.0057078412 * x1958
+        + 0.0057078412 * x1959
+        + 0.0057078412 * x2010
+        - 0.0149168788 * x2014
+        + 0.0149168788 * x2015
+        + 0.0149168788 * x2017
+        + x2025 * x2026
+        - x2065 * x2073
+        + x2079 * x2082
+    )
+    x2084 = u7 * x2074
+    x2085 = x1859 * x2074
+    x2086 = u7 * x2080
+    x2087 = (
+        0.000281 * x1932
+        + 0.000281 * x1933
+        - 0.000281 * x1934
+        + 0.000281 * x1935
+        + 0.000281 * x1936
+    )
+    x2088 = u5 * x319
+    x2089 = x320 * u7
+    x2090 = 0.029798 * x320
+    x2091 = x347 * u7
+    x2092 = (
+        x327 * x2023
+        - x1859 * x2090
+        + 0.029798 * x2088
+        - 0.029798 * x2089
+        + 0.029798 * x2091
+    )
+    x2093 = (
+        0.000281 * x1949
+        - 0.000281 * x1952
+        - 0.000281 * x1954
+        - 0.000281 * x2027
+        - x2028 * x979
+    )
+    x2094 = u4 * x331
+    x2095 = 0.029798 * x2074
+    x2096 = x341 * u7
+    x2097 = u4 * x332
+    x2098 = -u5 * x326 - x327 * x1859 - x327 * u7 - x342 * u7 - x320 * x2036
+    x2099 = x21 * x2098
+    x2100 = (
+        x122 * x2095
+        - 0.029798 * x2094
+        - 0.029798 * x2096
+        + 0.029798 * x2097
+        + 0.029798 * x2099
+    )
+    x2101 = 0.000281 * x0
+    x2102 = 0.000281 * x1728
+    x2103 = -x212 * x2102 + x1931 * x2101 - 0.000281 * x1938 - x1944 * x2101
+    x2104 = u3 * x440
+    x2105 = x331 - x332
+    x2106 = x327 * x2036
+    x2107 = -x320 * x1859 + x2088 - x2089 + x2091 + x2106
+    x2108 = x3 * x2107
+    x2109 = u4 * x317
+    x2110 = x116 * x2074
+    x2111 = x350 * u7
+    x2112 = u4 * x323
+    x2113 = x23 * x2098
+    x2114 = x2109 + x2110 - x2111 + x2112 - x2113
+    x2115 = 0.029798 * x1872 * x2105 - x2045 * x2104 + x2045 * x2114 + 0.029798 * x2108
+    x2116 = x122 * x2074 - x2094 - x2096 + x2097 + x2099
+    x2117 = (
+        x3 * (-x2109 - x2110 + x2111 - x2112 + x2113)
+        - u3 * x471
+        + x5 * x2107
+        + x440 * x1872
+    )
+    x2118 = -u2 * x324 * x2058 + x335 * x2061 + x2058 * x2117 + x2060 * x2116
+    x2119 = 0.011402 * u7
+    x2120 = 0.011402 * x1859
+    x2121 = (
+        0.011402 * x1861
+        + 0.011402 * x1896
+        + 0.011402 * x1897
+        + 0.011402 * x1898
+        - 0.029798 * x2075
+        - 0.029798 * x2076
+        - 0.029798 * x2077
+        - 0.029798 * x2078
+        + 0.029798 * x2080
+        + x2095
+        + x2119
+        + x2120
+    )
+    x2122 = x2065 * x2121
+    x2123 = -x2013 + x2016 + x2068 + x2069 + x2070 + x2071
+    x2124 = x2079 * x2123
+    x2125 = (
+        x1423 * x2093
+        + x1423 * x2115
+        + x1617 * x2103
+        + x1617 * x2118
+        + x1868 * x2087
+        + x1868 * x2100
+        + 0.0001406686 * x1958
+        - 0.0001406686 * x1959
+        - 0.0001406686 * x2010
+        + x2026 * x2092
+        - 0.0149168788 * x2084
+        + 0.0149168788 * x2085
+        - 0.0149168788 * x2086
+        + 0.5006 * x2122
+        - 0.5006 * x2124
+    )
+    x2126 = 0.000281 * x122
+    x2127 = 0.011402 * x122
+    x2128 = (
+        x1423
+        * (
+            -0.000281 * x5 * x2046
+            + 0.000281 * x2047
+            + 0.000281 * x2050
+            + 0.000281 * x2056
+        )
+        + x1423 * (-x2029 * x2105 + x2030 * x2104 - x2030 * x2114 - 0.011402 * x2108)
+        + x1617 * (x324 * x2041 - x335 * x2043 - x2040 * x2117 - x2042 * x2116)
+        + x1617 * (x354 * x2102 - x2059 * x2101 + 0.000281 * x2062 + 0.000281 * x2063)
+        + x1868
+        * (
+            x341 * x2119
+            + x1863 * x801
+            - x2074 * x2127
+            - 0.011402 * x2097
+            - 0.011402 * x2099
+        )
+        + x1868
+        * (
+            -x317 * x2066
+            + x1863 * x799
+            - x2013 * x2126
+            + 0.000281 * x2035
+            + 0.000281 * x2038
+        )
+        + 0.0001406686 * x2014
+        - 0.0001406686 * x2015
+        - 0.0001406686 * x2017
+        + x2026
+        * (
+            x326 * x2066
+            + x326 * x2067
+            + x328 * x2066
+            + 0.000281 * x2019
+            - 0.000281 * x2048
+        )
+        + x2026
+        * (
+            x320 * x2119
+            + x320 * x2120
+            - x347 * x2119
+            - 0.011402 * x2088
+            - 0.011402 * x2106
+        )
+        + x2073 * x2123
+        - x2082 * x2121
+        + 0.0057078412 * x2084
+        - 0.0057078412 * x2085
+        + 0.0057078412 * x2086
+    )
+    x2129 = 3e-06 * u7
+    x2130 = 3e-06 * x1859
+    x2131 = 3e-06 * x2074
+    x2132 = (
+        3e-06 * x1861
+        + 3e-06 * x1896
+        + 3e-06 * x1897
+        + 3e-06 * x1898
+        - 0.000587 * x2013
+        + 0.000587 * x2016
+        + 0.000587 * x2068
+        + 0.000587 * x2069
+        + 0.000587 * x2070
+        + 0.000587 * x2071
+        + 3e-06 * x2075
+        + 3e-06 * x2076
+        + 3e-06 * x2077
+        + 3e-06 * x2078
+        - 3e-06 * x2080
+        + x2129
+        + x2130
+        - x2131
+    )
+    x2133 = 3e-06 * x2013
+    x2134 = (
+        3e-06 * x2016
+        + 3e-06 * x2068
+        + 3e-06 * x2069
+        + 3e-06 * x2070
+        + 3e-06 * x2071
+        - x2133
+    )
+    x2135 = (
+        0.000609 * x1859
+        + 0.000609 * x1861
+        + 0.000609 * x1896
+        + 0.000609 * x1897
+        + 0.000609 * x1898
+        + 0.000609 * u7
+        - 0.000118 * x2074
+        + 0.000118 * x2075
+        + 0.000118 * x2076
+        + 0.000118 * x2077
+        + 0.000118 * x2078
+        - 0.000118 * x2080
+        + x2134
+    )
+    x2136 = x1569 * x352
+    x2137 = x1705 * x343
+    x2138 = x1563 * x348
+    x2139 = x1814 * x316
+    x2140 = x1915 * x2013
+    x2141 = x1419 * x354
+    x2142 = x1706 * x1102
+    x2143 = x345 * x1454
+    x2144 = 3e-06 * x1569
+    x2145 = 3e-06 * x1705
+    x2146 = 3e-06 * x1563
+    x2147 = 3e-06 * x1814
+    x2148 = 3e-06 * x1419
+    x2149 = x1766 * x2130
+    x2150 = 3e-06 * x1454
+    x2151 = x1706 * x1104
+    x2152 = (
+        -x318 * x2147
+        + x316 * x2149
+        + x322 * x2145
+        - x324 * x2150
+        - x329 * x2146
+        + x333 * x2144
+        + x335 * x2148
+        + x1915 * x2131
+        + x2081 * x2129
+        - 3e-06 * x2151
+    )
+    x2153 = (
+        -0.000369 * x318 * x1920
+        + 0.000118 * x1967
+        - 0.000118 * x1968
+        + 0.000118 * x1969
+        + 0.000118 * x1970
+        - 0.000118 * x1971
+        - 0.000118 * x1972
+        - 0.000118 * x1973
+        - 0.000118 * x1974
+        - 0.000369 * u7 * x2123
+        + x2065 * x2132
+        - x2123 * x2135
+        + 0.000369 * x2136
+        + 0.000369 * x2137
+        - 0.000369 * x2138
+        - 0.000369 * x2139
+        - 0.000369 * x2140
+        + 0.000369 * x2141
+        + 0.000369 * x2142
+        - 0.000369 * x2143
+        + x2152
+    )
+    x2154 = 0.000118 * u7
+    x2155 = 0.000118 * x1859
+    x2156 = (
+        0.000118 * x1861
+        + 0.000118 * x1896
+        + 0.000118 * x1897
+        + 0.000118 * x1898
+        - 0.000369 * x2074
+        + 0.000369 * x2075
+        + 0.000369 * x2076
+        + 0.000369 * x2077
+        + 0.000369 * x2078
+        - 0.000369 * x2080
+        + x2134
+        + x2154
+        + x2155
+    )
+    x2157 = (
+        -0.000587 * x1563 * x329
+        + 0.000587 * x1569 * x333
+        + 0.000587 * x1419 * x335
+        - x215 * x2150
+        + x210 * x2144
+        + x212 * x2148
+        + 0.000587 * x1705 * x322
+        - 0.000587 * x1814 * x318
+        - x318 * x2149
+        + 0.000587 * x316 * x1920
+        - x316 * x2147
+        + x343 * x2145
+        - x345 * x2150
+        - 0.000587 * x324 * x1454
+        - x348 * x2146
+        + x352 * x2144
+        + x354 * x2148
+        + 0.000587 * x1915 * x2074
+        - x1915 * x2133
+        + x261 * x2146
+        - 3e-06 * x1971
+        - 3e-06 * x1972
+        - 3e-06 * x1973
+        - 3e-06 * x1974
+        + 0.000587 * u7 * x2081
+        - x2065 * x2156
+        + x2081 * x2135
+        - x2123 * x2129
+        + 3e-06 * x2142
+        - 0.000587 * x2151
+    )
+    x2158 = (
+        -x1766 * x318 * x2155
+        + 0.000609 * x1967
+        - 0.000609 * x1968
+        + 0.000609 * x1969
+        + 0.000609 * x1970
+        - 0.000609 * x1971
+        - 0.000609 * x1972
+        - 0.000609 * x1973
+        - 0.000609 * x1974
+        - x2081 * x2132
+        - x2123 * x2154
+        + x2123 * x2156
+        + 0.000118 * x2136
+        + 0.000118 * x2137
+        - 0.000118 * x2138
+        - 0.000118 * x2139
+        - 0.000118 * x2140
+        + 0.000118 * x2141
+        + 0.000118 * x2142
+        - 0.000118 * x2143
+        + x2152
+    )
+    x2159 = 0.01275 * x5
+    x2160 = x543 * x555
+    x2161 = x21 * x734 * x793
+    x2162 = 0.006375 * x537
+    x2163 = -x2162
+    x2164 = x543 + x2163
+    x2165 = x23 * x2164
+    x2166 = x5 * x2165
+    x2167 = 0.20843 * x23
+    x2168 = x23 * x2162
+    x2169 = -x584
+    x2170 = x21 * x2164 + x2169
+    x2171 = 2 * x2170
+    x2172 = x724 - 0.015006 * x537
+    x2173 = x23 * x2172
+    x2174 = x5 * x2173
+    x2175 = x3 * x752
+    x2176 = -x726 - 0.015006 * x555
+    x2177 = x21 * x2176
+    x2178 = x5 * x2177
+    x2179 = x23 * x2176 + x21 * x2172
+    x2180 = x2160 - x2161 - x2166
+    x2181 = 0.42076 * x3
+    x2182 = 0.42076 * x5
+    x2183 = 0.84152 * x5
+    x2184 = 0.41686 * x555
+    x2185 = x531 * x5
+    x2186 = x1722 - x1725
+    x2187 = x2186 - 0.00017505 * x537
+    x2188 = x2187 * x41
+    x2189 = x530 * x23 - x535 * x21 + x2188 * x21
+    x2190 = x2165 + x2168
+    x2191 = x1838 - x1839 + 0.009432 * x537
+    x2192 = -x675 + x674
+    x2193 = x693 + x695 + x2192
+    x2194 = x2193 * x21
+    x2195 = x2194 * x5
+    x2196 = -x1823 - x1826 + 1e-06 * x537
+    x2197 = x2191 * x41
+    x2198 = x2196 * x43
+    x2199 = x2193 * x23 + x2197 * x21 - x2198 * x21
+    x2200 = x2185 + x534 * x1588 + x2187 * x233
+    x2201 = x2187 * x43
+    x2202 = x552 + x2201
+    x2203 = x2196 * x41
+    x2204 = x2191 * x43
+    x2205 = -x531 - x535 * x23 + x2188 * x23
+    x2206 = -0.00017505 * x372 - x1950
+    x2207 = x2186 + 0.00017505 * x313 - x1871
+    x2208 = x578 * x21 + x2206 * x215 + x2207 * x118
+    x2209 = x2206 * x113
+    x2210 = x2209 * x43
+    x2211 = x2207 * x115
+    x2212 = x2211 * x43
+    x2213 = x2192 - 0.00965 * x372 - x1988
+    x2214 = -0.045483 * x194 + 0.00965 * x313 - x2005 + x2011
+    x2215 = x2213 * x215 + x2214 * x118 + x686 * x21
+    x2216 = x1635 * x21
+    x2217 = x557 * x21
+    x2218 = -x556 - x2217
+    x2219 = x557 * x23
+    x2220 = x1656 * x23
+    x2221 = x2219 + x2163
+    x2222 = x2213 * x113
+    x2223 = x2222 * x43
+    x2224 = x2214 * x115
+    x2225 = x2224 * x43
+    x2226 = -x535 + x2188
+    x2227 = -x552 - x2201
+    x2228 = x2206 * x115 + x2207 * x113
+    x2229 = x2213 * x115 + x2214 * x113
+    x2230 = x567 * x324 + x568 * x345 + x573 * x215
+    x2231 = x43 * x2164
+    x2232 = -x549 - x2231
+    x2233 = x573 * x115 - x616 * x113 + x617 * x113
+    x2234 = x41 * x2164
+    x2235 = x2234 - 0.20843 * x194
+    x2236 = -x562 * x99 + x565
+    x2237 = -x2234 * x113 + x630 * x114 - x122 * x628
+    x2238 = x530 * x115 - x2187 * x113
+    x2239 = x625 - x215 * x628
+    x2240 = x549 + x2231
+    x2241 = x2234 * x115 - x630 * x122 - x114 * x628
+    x2242 = x2187 * x115
+    x2243 = x604 + x2242
+    x2244 = x626 - x118 * x628
+    x2245 = x694 + x1828
+    x2246 = x131 + x1841
+    x2247 = x781 - x528
+    x2248 = -x816 - x583
+    x2249 = x2245 * x41
+    x2250 = x2246 * x43
+    x2251 = x2245 * x43
+    x2252 = x2246 * x41
+    x2253 = x2247 * x41
+    x2254 = -x780 + x2253
+    x2255 = x2247 * x115
+    x2256 = x813 + x2255
+    x2257 = x2247 * x43
+    x2258 = x789 + x2257
+    x2259 = x811 + x1956
+    x2260 = x813 + x781 - x1865
+    x2261 = x2259 * x115 + x2260 * x113
+    x2262 = x2259 * x113
+    x2263 = x2260 * x115
+    x2264 = 0.00965 * x117 + x896 + x1982
+    x2265 = 0.00965 * x214 + x1985 - x2007
+    x2266 = x2264 * x115 + x2265 * x113
+    x2267 = x2265 * x115
+    x2268 = x2264 * x113
+    x2269 = 0.000281 * x214 + 0.029798 * x317 + 0.029798 * x323 - x2126
+    x2270 = x2269 * x318
+    x2271 = -0.011402 * x214 + 0.029798 * x341 - 0.029798 * x344 + x2127
+    x2272 = x2271 * x316
+    x2273 = x2269 * x316
+    x2274 = x2271 * x318
+    x2275 = -x789 - x2257
+    x2276 = -x2247 * x113 + x811
+    x2277 = x41 * x878
+    x2278 = x2277 + x794
+    x2279 = x41 * x793
+    x2280 = -x2279 + 0.20843 * x159
+    x2281 = -x899 + x896
+    x2282 = -x2277 - x794
+    x2283 = x2281 * x21
+    x2284 = x2283 * x5
+    x2285 = x932 * x5
+    x2286 = x933 * x5
+    x2287 = x3 * x951
+    x2288 = x953 * x99
+    x2289 = x2247 * x233 + x2288 + x1588 * x954
+    x2290 = x2269 * x345 + x2271 * x324 + x805 * x215
+    x2291 = x2259 * x215 + x2260 * x118 + x810 * x21
+    x2292 = x2264 * x215 + x2265 * x118 + x894 * x21
+    x2293 = x2249 * x21 - x2250 * x21 + x2281 * x23
+    x2294 = x2262 * x43
+    x2295 = x2263 * x43
+    x2296 = -x2270 * x113 + x2272 * x113 + x805 * x115
+    x2297 = x2268 * x43
+    x2298 = x2267 * x43
+    x2299 = x21 * x543
+    x2300 = x816 * x5
+    x2301 = -x2299 + x2300 + x584
+    x2302 = -x778 * x43 * x137 + x2253 * x21 + x221 * x528
+    x2303 = x849 - x850 * x121
+    x2304 = 0.00017505 * x41
+    x2305 = -x778 * x2304 - x780 * x23 + x2253 * x23
+    x2306 = 0.41686 * x21
+    x2307 = 0.01275 * x21
+    x2308 = x2304 * x21
+    x2309 = x1410 * x8
+    x2310 = 0.00017505 * x261
+    x2311 = -x2310
+    x2312 = x2311 + x137
+    x2313 = x889 - 0.00965 * x338
+    x2314 = x2312 * x115
+    x2315 = x2312 * x113 + x1000
+    x2316 = x2313 * x115 + x1052 * x113
+    x2317 = x2313 * x113
+    x2318 = -0.029798 * x347 + 0.011402 * x261 + x2090
+    x2319 = x2318 * x316
+    x2320 = -0.029798 * x328 - 0.000281 * x261 - x2021
+    x2321 = x2320 * x318
+    x2322 = x2320 * x316
+    x2323 = x2318 * x318
+    x2324 = x137 * x115
+    x2325 = x2311 + x2324
+    x2326 = -x973 + x1013
+    x2327 = x1042 * x21 + x1043 * x21 + x1045 * x23
+    x2328 = x970 * x116 + x2312 * x118 - x973 * x215
+    x2329 = x2313 * x215 + x1052 * x118 + x1051 * x21
+    x2330 = x2318 * x324 + x2320 * x345 + x983 * x215
+    x2331 = x2317 * x43
+    x2332 = x2319 * x113 - x2321 * x113 + x983 * x115
+    x2333 = x1088 * x21
+    x2334 = x43 * x1588
+    x2335 = -x2333 - 0.10593 * x2334 + x137 * x233
+    x2336 = x789 + x970 * x21 - x43 * x528
+    x2337 = x1060 * x5
+    x2338 = x788 * x23 + x970 * x23 + 0.00017505 * x159
+    x2339 = x969 * x1107 * x113
+    x2340 = x2314 * x43
+    x2341 = 0.31436 * x43
+    x2342 = 0.31436 * x41
+    x2343 = x43 * x1578
+    x2344 = 0.00017505 * x43
+    x2345 = x115 * x1960
+    x2346 = 0.20843 * x41
+    x2347 = x115 * x1998
+    x2348 = x2346 * x113
+    x2349 = x113 * x2009
+    x2350 = x43 * x102
+    x2351 = x318 * x2022 + x981
+    x2352 = x316 * x2022 - x979
+    x2353 = x2351 * x316
+    x2354 = x2352 * x318
+    x2355 = x2351 * x318
+    x2356 = x2352 * x316
+    x2357 = x899 - x896
+    x2358 = x527 + x529
+    x2359 = x1107 * x318
+    x2360 = x1107 * x316
+    x2361 = x2351 * x324 + x2352 * x345 + x1101 * x215
+    x2362 = x113 * x314
+    x2363 = x2353 * x113 - x2354 * x113 + x1101 * x115
+    x2364 = 0.10593 * x121
+    x2365 = x1023 * x215 - x1107 * x118 - x2364 * x43
+    x2366 = -x1147 * x118 + x1146 * x21 + x1148 * x215
+    x2367 = 0.0063958392 * u1
+    x2368 = 0.0003501 * x113
+    x2369 = 6.781e-07 * u1
+    x2370 = 6.781e-07 * u2
+    x2371 = 0.000206331435 * u1
+    x2372 = u2 * x1797
+    x2373 = x41 * x528
+    x2374 = 0.029798 * x318**2
+    x2375 = 0.029798 * x316**2
+    x2376 = x1177 * x115 + x2374 * x113 + x2375 * x113
+    x2377 = 0.053028558 * u1
+    x2378 = 0.0308420223 * u1
+    x2379 = 0.0308420223 * u2
+    x2380 = 0.0057078412 * u1
+    x2381 = 0.0057078412 * u2
+    x2382 = 0.0057078412 * u3
+    x2383 = 0.0001406686 * u1
+    x2384 = 0.0001406686 * u2
+    x2385 = 0.0001406686 * u3
+    gravity_acceleration = 9.80665
+    x2386 = 1.1636 * x2
+    x2387 = -x35 + x36
+    x2388 = x776 * x0
+    x2389 = 0.9302 * x6
+    x2390 = 0.9302 * x2387
+    x2391 = -x22 - x2388
+    x2392 = 0.9302 * x2391
+    x2393 = 1.8568 * x2391
+    x2394 = x776 * x41 - x44
+    x2395 = 1.1787 * x2387
+    x2396 = 0.10593 * x0
+    x2397 = x0 * x99
+    x2398 = x2391 * x43
+    x2399 = x2397 - x2398
+    x2400 = 1.1787 * x2399
+    x2401 = 0.063883 * x0
+    x2402 = 0.6781 * x2399
+    x2403 = x776 * x43
+    x2404 = -x99 - x2403
+    x2405 = x0 * x44
+    x2406 = x2391 * x41
+    x2407 = x2405 + x2406
+    x2408 = 1.1787 * x2407
+    x2409 = 0.6781 * x2407
+    x2410 = 1e-06 * x98
+    x2411 = 0.6781 * x2387
+    x2412 = x2 * (x114 + x117)
+    x2413 = x41 * x122 - x121
+    x2414 = x3 * x2413 - x44 * x115
+    x2415 = -x2397 + x2398
+    x2416 = 0.5006 * x2415
+    x2417 = x2387 * x115
+    x2418 = x2407 * x113
+    x2419 = x2417 - x2418
+    x2420 = 0.5006 * x2419
+    x2421 = x99 + x2403
+    x2422 = x0 * x2421
+    x2423 = x0 * x2414
+    x2424 = 0.6781 * x2419
+    x2425 = x2 * (x122 - x214)
+    x2426 = -x41 * x114 - x116
+    x2427 = x3 * x2426 + x44 * x113
+    x2428 = x0 * x2427
+    x2429 = x2387 * x113
+    x2430 = x2407 * x115
+    x2431 = x2429 + x2430
+    x2432 = 0.6781 * x2431
+    x2433 = 0.5006 * x2431
+    x2434 = 0.6781 * x2415
+    x2435 = x115 * x320 - x319
+    x2436 = x21 * x2435
+    x2437 = x2 * (x317 + x2436)
+    x2438 = x23 * x2435 - x121 * x316
+    x2439 = x3 * x2438 - x329 * x5
+    x2440 = x2415 * x316
+    x2441 = x2431 * x318
+    x2442 = -x2440 - x2441
+    x2443 = 0.5006 * x2442
+    x2444 = -x115 * x326 - x327
+    x2445 = x2444 * x21
+    x2446 = x2 * (-x341 + x2445)
+    x2447 = -x347 + x320
+    x2448 = x2444 * x23 + x121 * x318
+    x2449 = x0 * (x3 * x2448 - x2447 * x5)
+    x2450 = x2415 * x318
+    x2451 = x2431 * x316
+    x2452 = -x2450 + x2451
+    x2453 = 0.5006 * x2452
+    x2454 = 0.7235081912 * x0
+    x2455 = 0.10593 * x23
+    x2456 = x3 * x889 - x131 * x44
+    x2457 = x3 * x137 - x2455 * x44
+    x2458 = x2413 * x5
+    x2459 = x5 * x2426
+    x2460 = 0.00965 * x100
+    x2461 = x3 * x2447
+    x2462 = x2438 * x5
+    x2463 = x2448 * x5
+    x2464 = 0.000281 * x113
+    x2465 = 0.011402 * x113
+    x2466 = x21 * x2387
+    x2467 = 1e-06 * x159
+    x2468 = 0.053028558 * x2415
+    mass[..., 0, 0] = (
+        0.0273446 * x0 * x10
+        + x0 * (0.011088 * x0 + 5e-06 * x2)
+        - 0.58632906 * x0 * (-x0 * x38 - x17 * x5)
+        + x8 * x9
+        + 0.58632906 * x8 * x29
+        - 0.390633584 * x8 * x32
+        + x8 * x34
+        + x97 * x25
+        + x106 * x82
+        + x106 * x83
+        + x108 * x82
+        + x108 * x83
+        + x110 * x111
+        + x110 * x112
+        - x11 * x6
+        + 1.53396367515e-08 * x128**2
+        + x128 * x244
+        + x129 * x132
+        + x129 * x153
+        + 0.00561731514894 * x133**2
+        + x134 * x135
+        + x134 * x145
+        + 1.1636 * x12 * x37
+        + x136 * x49
+        - x140 * x144
+        - x13 * x14
+        + x148 * x149
+        + x151 * x152
+        + x151 * x183
+        + x152 * x163
+        + x152 * x192
+        + x152 * x197
+        + x14 * x20
+        + x156 * x157
+        + x163 * x183
+        - x164 * x165
+        - x167 * x171
+        - x172 * x173
+        + x174 * x175
+        - x178 * (-x176 + x177 + x33)
+        - x179 * (x146 * x5 - x147 * x5 + x32 * x3)
+        + x180 * x181
+        + x180 * x182
+        + x181 * x223
+        + x181 * x231
+        + x181 * x234
+        + x182 * x223
+        + x182 * x231
+        + x182 * x234
+        + x183 * x192
+        + x183 * x197
+        + 2.787 * x17 * x37
+        - x187 * x188
+        + 1.3562 * x187 * x56
+        + x189 * x57
+        + x189 * x88
+        + x189 * x89
+        + 0.0004175274375 * x1 * x3
+        + 0.123465173064675 * x1 * x4
+        + 0.175655079983077 * x1
+        - 0.02996025 * x18 * x2
+        - x200 * x204
+        + 1.1636 * x19 * x29
+        + x206 * x207
+        + x206 * x300
+        + x207 * x218
+        + x207 * x228
+        + x207 * x239
+        + x207 * x243
+        + x207 * x501
+        + x217 * x260
+        + x218 * x300
+        + x219 * x220
+        + x220 * x497
+        + x226 * x227
+        + x228 * x300
+        - x235 * (-x154 * x5 + x155 * x5 + x3 * x67)
+        - x238 * (x236 - x237 + x69)
+        + x239 * x300
+        + x240 * x241
+        + x243 * x300
+        + x247 * x248
+        + x248 * x477
+        - x249 * x253
+        + x249 * x255
+        + x249 * x311
+        + 1.0012 * x249 * x424
+        - x253 * x424
+        + x254 * x299
+        + x255 * x424
+        + x258 * x259
+        + x263 * x264
+        + x263 * x299
+        + x263 * x448
+        + x264 * x277
+        + x264 * x315
+        + x265 * x266
+        + x266 * x482
+        + x269 * x270
+        + x270 * x486
+        + x272 * x273
+        + x272 * x278
+        + 7.54615125e-05 * x25**2
+        + x277 * x299
+        + x277 * x448
+        + x279 * x280
+        + x279 * x463
+        - x281 * x285
+        + 0.08066508290632 * x26**2
+        - x286 * x287
+        - x288 * x289
+        - x294 * x295
+        + 0.0008025337564374 * x2**2
+        - 0.0199606 * x2 * x33
+        - 0.00999965 * x2 * x69
+        + x2 * (5e-06 * x0 + 0.001072 * x2)
+        + x2 * (-7e-06 * x8 + 0.001043 * x2 - 0.000606 * x6)
+        + x296 * x297
+        + x296 * x298
+        + x297 * x340
+        + x297 * x364
+        + x297 * x370
+        + x297 * x374
+        + x298 * x340
+        + x298 * x364
+        + x298 * x370
+        + x298 * x374
+        + x298 * x504
+        + x299 * x310
+        + x299 * x315
+        + x304 * x305
+        + x306 * x307
+        + x311 * x424
+        + x315 * x448
+        + x337 * x488
+        + 1.8568 * x32 * x50
+        - x356 * (x140 * x195 + x167 * x233 + x301 * x5)
+        - x360 * (-x357 + x358 + x359)
+        + x367 * x56
+        + x367 * x90
+        + x376 * x377
+        + x376 * x378
+        + x377 * x487
+        + x378 * x487
+        + x382 * x383
+        + x383 * x492
+        + x385 * x56
+        + x385 * x90
+        + x388 * x389
+        + x389 * x514
+        - x390 * (x164 * x195 + x172 * x233 + x381 * x5)
+        - x390 * (x242 * x294 + x281 * x373 + x288 * x314)
+        - x394 * (x391 + x392 - x393)
+        - x394 * (x498 + x499 + x500)
+        + x398 * x399
+        + x399 * x510
+        + x402 * x403
+        + x404 * x405
+        + x405 * x511
+        + x409 * x410
+        + x410 * x518
+        + x411 * x412
+        + x411 * x413
+        + x412 * x519
+        + x413 * x519
+        - x39 * (-x16 * x3 + x18)
+        - x414 * x418
+        - x419 * x423
+        + x40 * x6
+        + x425 * x426
+        + x426 * x443
+        + x426 * x445
+        + x426 * x460
+        + x426 * x469
+        + x426 * x473
+        + x427 * x428
+        + x428 * x438
+        + x428 * x447
+        + x428 * x452
+        + x428 * x466
+        + x428 * x481
+        + x432 * x433
+        + x433 * x523
+        - x456 * (x453 + x454 + x455)
+        - x456 * (x524 + x525 + x526)
+        - x461 * (x200 * x242 + x249 * x314 + x286 * x373)
+        - x461 * (x314 * x424 + x414 * x472 + x419 * x480)
+        + x493 * x494
+        + x507 * x56
+        + x507 * x90
+        + 0.0132264231859477 * x49**2
+        + x50 * x93
+        - 0.0099803 * x53 * x56
+        + 2.3574 * x56 * x90
+        + x57 * x58
+        + x57 * x86
+        + x57 * x92
+        + x58 * x88
+        + x58 * x89
+        - x59 * (x13 - x20)
+        - x60 * (-x12 * x5 - x19 * x3)
+        - x67 * x68
+        + x68 * x70
+        - x71 * x75
+        + 0.006303037395 * x6 * x7
+        - x78 * x79
+        + x81 * x82
+        + x81 * x83
+        - x84 * x85
+        + x86 * x88
+        + x86 * x89
+        + x88 * x92
+        + x89 * x92
+        - x90 * x91
+        + 0.01153846285904 * (-x0 + 0.000441855794336212 * x2) ** 2
+        + 5.13181123316e-05 * (-x8 - 0.00662550820659539 * x6) ** 2
+        + 0.0161723221354304 * (x8 - 0.000373222949818478 * x2) ** 2
+        + 0.0002094624694872 * (x25 - 0.00119952019192323 * x6) ** 2
+        + 0.1233519076428 * (-0.0303023101055233 * x2 + x6) ** 2
+        + 0.0161723221354304 * (0.0563312184032844 * x2 + x6) ** 2
+        + 6.314636725e-05
+        * (0.000103626943005181 * x98 + x128 + 0.000103626943005181 * x205) ** 2
+        + 0.01322638706763
+        * (x104 - 0.00165250637213254 * x35 + 0.00165250637213254 * x36) ** 2
+        + 0.0027673516569109
+        * (x104 + 0.147644913357231 * x35 - 0.147644913357231 * x36) ** 2
+        + 0.0014027877002709
+        * (x133 - 2.19862366158785e-05 * x213 - 2.19862366158785e-05 * x216) ** 2
+        + 0.0014027877002709
+        * (-0.212167183343227 * x213 - 0.212167183343227 * x216 + x217) ** 2
+        + 0.0004444931544824
+        * (-0.00943016309819451 * x213 - 0.00943016309819451 * x216 + x337) ** 2
+        + 0.00561731514894
+        * (-0.00165250637213254 * x213 - 0.00165250637213254 * x216 + x217) ** 2
+        + 0.0052992828758168
+        * (x26 + 0.000238480086912743 * x35 - 0.000238480086912743 * x36) ** 2
+        + 0.0052992828758168
+        * (-0.198812899122923 * x35 + 0.198812899122923 * x36 + x6) ** 2
+        + 0.08066508290632
+        * (-0.0305858081850022 * x35 + 0.0305858081850022 * x36 + x6) ** 2
+        + 0.0027673516569109
+        * (1.56536167681543e-05 * x35 - 1.56536167681543e-05 * x36 + x49) ** 2
+        + 6.03255553344e-05
+        * (0.000106022052586938 * x98 - 0.000106022052586938 * x103 - x42 - x48) ** 2
+        + 0.0004444931544824
+        * (0.382643130411437 * x213 + 0.382643130411437 * x216 - x346 - x355) ** 2
+        + 6.50808053624e-05
+        * (-x325 - x336 + 0.0246447991580424 * x346 + 0.0246447991580424 * x355) ** 2
+        + 0.0017046923937075
+    )
+    mass[..., 0, 1] = (
+        -x97 * x555
+        - x9 * x5
+        + x111 * x585
+        + x112 * x585
+        - x11 * x3
+        + x132 * x537
+        + x135 * x728
+        + x136 * x233
+        - x144 * x534
+        + x145 * x728
+        + x149 * x587
+        + x152 * x551
+        + x152 * x561
+        + x152 * x564
+        + x153 * x537
+        + x157 * x731
+        - x165 * x691
+        - x171 * x539
+        - x173 * x688
+        + x175 * x195
+        - x178 * (x556 * x742 + 0.20843 * x741 + x743)
+        - x179 * (x543 * x555 - x562 * x741 - x586 * x5)
+        + x181 * x547
+        + x181 * x565
+        + x181 * x566
+        + x182 * x547
+        + x182 * x565
+        + x182 * x566
+        + x183 * x551
+        + x183 * x561
+        + x183 * x564
+        - x188 * x696
+        + x189 * x558
+        - x204 * x577
+        + x207 * x597
+        + x207 * x622
+        + x207 * x627
+        + x207 * x637
+        + x207 * x645
+        + x220 * x609
+        + x220 * x636
+        + x227 * x764
+        - x235 * (x3 * x752 - x5 * x729 + x5 * x730)
+        - x238 * (x753 + x754 - x755)
+        + x241 * x554
+        + x242 * x260
+        + x244 * x373
+        + x248 * x761
+        + x248 * x762
+        - x253 * x573
+        - x253 * x579
+        + x259 * x548
+        + x264 * x603
+        + x264 * x625
+        + x264 * x629
+        + x264 * x632
+        + x266 * x715
+        + x266 * x720
+        + x270 * x707
+        + x270 * x723
+        + x273 * x733
+        + x278 * x733
+        + x280 * x314
+        - x285 * x678
+        - x287 * x580
+        - x289 * x677
+        - x295 * x685
+        + x297 * x606
+        + x297 * x626
+        + x297 * x671
+        + x297 * x673
+        + x298 * x606
+        + x298 * x618
+        + x298 * x626
+        + x298 * x671
+        + x298 * x673
+        + x299 * x603
+        + x299 * x625
+        + x299 * x629
+        + x299 * x632
+        + x300 * x597
+        + x300 * x627
+        + x300 * x637
+        + x300 * x645
+        + x305 * x542
+        + x307 * x716
+        + x314 * x463
+        + 0.781267168 * x33
+        - x356 * (x195 * x534 + x233 * x539 + x531 * x5)
+        - x360 * (-x756 + x757 + x758)
+        + x377 * x687
+        + x377 * x698
+        + x378 * x687
+        + x378 * x698
+        + x383 * x702
+        + x383 * x706
+        + x389 * x612
+        + x389 * x668
+        - x390 * (x195 * x691 + x233 * x688 + x5 * x705)
+        - x390 * (x242 * x685 + x314 * x677 + x373 * x678)
+        - x394 * (x744 + x745 + x746)
+        - x394 * (-x747 + x748 + x749)
+        + x399 * x759
+        + x399 * x760
+        + x403 * x712
+        + x405 * x640
+        + x405 * x644
+        + x410 * x654
+        + x410 * x657
+        + x412 * x574
+        + x412 * x581
+        + x413 * x574
+        + x413 * x581
+        - x39 * (x38 + 0.21038 * x734)
+        - x418 * x567
+        - x423 * x568
+        + x40 * x3
+        + x426 * x615
+        + x426 * x624
+        + x426 * x650
+        + x426 * x665
+        + x426 * x670
+        + x428 * x621
+        + x428 * x623
+        + x428 * x648
+        + x428 * x661
+        + x428 * x669
+        + x433 * x592
+        + x433 * x596
+        + x448 * x603
+        + x448 * x625
+        + x448 * x629
+        + x448 * x632
+        - x456 * (x735 + x736 + x737)
+        - x456 * (x738 + x739 + x740)
+        - x461 * (x242 * x577 + x314 * x579 + x373 * x580)
+        - x461 * (x314 * x573 + x472 * x567 + x480 * x568)
+        + x472 * x488
+        + x480 * x494
+        - x530 * x91
+        - x545 * x79
+        + 6.36244125e-05 * x555 * x53
+        + x558 * x58
+        + x558 * x86
+        + x558 * x92
+        + x588 * x82
+        + x588 * x83
+        + x56 * x600
+        + x56 * x635
+        + x56 * x709
+        + x600 * x90
+        - x59 * (0.117892 * x4 + 0.117892 * x734)
+        + x635 * x90
+        + x709 * x90
+        + x68 * x763
+        + 0.391390952 * x69
+        - x725 * x75
+        - x727 * x85
+        - 0.246817080707475 * x765
+        + x777
+    )
+    mass[..., 0, 2] = (
+        -1.30358817728e-05 * x8
+        + x97 * x21
+        + x118 * x244
+        + x132 * x23
+        + x136 * x221
+        - 0.000671120839125 * x143 * x221
+        + x149 * x817
+        + x152 * x795
+        + x153 * x23
+        + x157 * x934
+        - x159 * x175
+        + x159 * x260
+        - x165 * x904
+        - x171 * x782
+        - x173 * x902
+        - x178 * (-x3 * x583 - x3 * x816 - 0.20843 * x537)
+        - x179 * (-x21 * x543 + x584 + x5 * x816)
+        + x181 * x796
+        + x182 * x796
+        + x183 * x795
+        - x188 * x900
+        - x204 * x809
+        + x207 * x848
+        + x207 * x864
+        + x215 * x280
+        + x215 * x463
+        + x220 * x842
+        + x220 * x855
+        - x221 * x964
+        + x227 * x961
+        - 0.00013865178645 * x21 * x53
+        - x235 * (x3 * x951 + x5 * x932 + x5 * x933)
+        - x238 * (-x3 * x932 - x3 * x933 + x952)
+        + x241 * x791
+        + x248 * x958
+        + x248 * x959
+        - x253 * x805
+        - x253 * x812
+        + 0.00013865178645 * x23 * x74
+        + x259 * x786
+        + x264 * x844
+        + x264 * x849
+        + x264 * x851
+        + x266 * x923
+        + x266 * x928
+        + x270 * x915
+        + x270 * x931
+        + x273 * x935
+        + x278 * x935
+        - x285 * x895
+        - x287 * x814
+        - x289 * x897
+        - x295 * x893
+        + x297 * x827
+        + x297 * x856
+        + x297 * x877
+        + x298 * x827
+        + x298 * x839
+        + x298 * x856
+        + x298 * x877
+        + x299 * x844
+        + x299 * x849
+        + x299 * x851
+        + x300 * x864
+        + x305 * x785
+        + x307 * x924
+        + x324 * x488
+        + x345 * x494
+        - x356 * (x99 * x953 + x195 * x954 + x233 * x782)
+        - x360 * (x102 * x954 - x45 * x953 + x955)
+        + x377 * x898
+        + x377 * x906
+        + x378 * x898
+        + x378 * x906
+        + x383 * x910
+        + x383 * x914
+        + x389 * x833
+        + x389 * x876
+        - x390 * (x195 * x904 + x233 * x902 + x5 * x912)
+        - x390 * (x242 * x893 + x314 * x897 + x373 * x895)
+        - x394 * (-x943 + x944 + x945)
+        - x394 * (x946 + x947 + x948)
+        - x395 * x962
+        + x399 * x956
+        + x399 * x957
+        + x403 * x920
+        + x405 * x859
+        + x405 * x863
+        + x410 * x870
+        + x410 * x873
+        + x412 * x806
+        + x412 * x815
+        + x413 * x806
+        + x413 * x815
+        - x418 * x797
+        - x423 * x798
+        + x426 * x836
+        + x426 * x866
+        + x426 * x880
+        + x426 * x884
+        + x428 * x847
+        + x428 * x865
+        + x428 * x879
+        + x428 * x886
+        + x433 * x821
+        + x433 * x825
+        + x448 * x844
+        + x448 * x849
+        + x448 * x851
+        - x456 * (x936 + x937 + x938)
+        - x456 * (x939 + x940 + x941)
+        - x461 * (x242 * x809 + x314 * x812 + x373 * x814)
+        - x461 * (x314 * x805 + x472 * x797 + x480 * x798)
+        - x476 * x963
+        + x56 * x830
+        + x56 * x854
+        - x59 * (0.006641 * x3 + 4.4e-05 * x5)
+        - x60 * (-x767 + x768)
+        + x68 * x960
+        + x770 * x916
+        - 0.0071706889047008 * x6
+        + x830 * x90
+        + x854 * x90
+        + 0.0001672285804 * x7
+        + x916 * x917
+        - 2.751914e-07 * x942
+        + x968
+    )
+    mass[..., 0, 3] = (
+        x994 * x389
+        + x996 * x426
+        + x1002 * x56
+        + x1002 * x90
+        + x1005 * x298
+        + x1008 * x220
+        + x1010 * x428
+        + x1011 * x207
+        + x1014 * x264
+        + x1014 * x299
+        + x1014 * x448
+        + x1017 * x56
+        + x1017 * x90
+        + x1018 * x297
+        + x1018 * x298
+        + x1021 * x405
+        + x1027 * x405
+        + x1028 * x428
+        + x1029 * x426
+        + x1033 * x410
+        + x1036 * x389
+        + x1039 * x410
+        + x1040 * x428
+        + x1041 * x426
+        - x1045 * x188
+        + x1047 * x377
+        + x1047 * x378
+        - x1050 * x295
+        - x1052 * x285
+        - x1053 * x289
+        + x1054 * x377
+        + x1054 * x378
+        + x1055 * x270
+        + x1059 * x383
+        + x1061 * x383
+        + x1062 * x770
+        + x1062 * x917
+        + x1065 * x403
+        + x1066 * x307
+        + x1070 * x266
+        + x1073 * x270
+        + x1074 * x157
+        + x1075 * x273
+        + x1075 * x278
+        + 0.387012824 * x105
+        + 0.08141975791312 * x1089
+        + x1090 * x399
+        + x1091 * x399
+        + x1092 * x248
+        - x1093 * x338
+        - x1094 * x256
+        + x1097
+        + x135 * x960
+        - x136 * x43
+        + 0.0009039607989875 * x143 * x43
+        + x145 * x960
+        - 0.0009039607989875 * x170 * x41
+        - x175 * x41
+        - x235 * x763
+        - x238 * (x21 * x726 + x23 * x724)
+        - x244 * x338
+        + 4.7101141125e-07 * x252 * x338
+        - x253 * x983
+        + x259 * x971
+        + x260 * x41
+        + x261 * x280
+        + x261 * x463
+        - 2.512544616e-07 * x24
+        - x287 * x975
+        + x305 * x972
+        - x356 * (-x1087 * x195 - x1088 * x21 + x137 * x233)
+        - x360 * (-x102 * x1087 + x137 * x47 + x21 * x527)
+        + 0.0064879792978136 * x36
+        - x390 * (x1050 * x242 + x1052 * x373 + x1053 * x314)
+        - x390 * (x1060 * x5 + x1085 * x233 - x1086 * x195)
+        - x394 * (x1081 + x1082 + x1083)
+        - x394 * (-x102 * x1086 - x1084 + x1085 * x47)
+        + 0.157368616 * x406
+        + x412 * x976
+        + x412 * x986
+        + x413 * x976
+        + x413 * x986
+        - x418 * x984
+        - x423 * x985
+        + x433 * x988
+        + x433 * x992
+        + x435 * x494
+        + x440 * x488
+        - x456 * (x1078 + x1079 + x1080)
+        - x456 * (x1076 * x201 + x1077 - x212 * x973)
+        - x461 * (x1076 * x242 - x314 * x973 + x373 * x975)
+        - x461 * (x314 * x983 + x472 * x984 + x480 * x985)
+        + x43 * x964
+        + 0.213167516 * x485
+        - 8.999685e-08 * x51
+        - 8.999685e-08 * x52
+        + 0.00492477747335 * x72
+        - 0.00492477747335 * x73
+    )
+    mass[..., 0, 4] = (
+        x1045 * x248
+        + x1093 * x113
+        + x1098 * x140
+        - x1101 * x253
+        - x1102 * x494
+        - x1103 * x418
+        + x1104 * x488
+        - x1105 * x423
+        + x1106 * x412
+        + x1106 * x413
+        + x1108 * x412
+        + x1108 * x413
+        + x1111 * x389
+        + x1115 * x433
+        + x1116 * x433
+        + x1119 * x298
+        + x1122 * x220
+        + x1123 * x207
+        + x1126 * x56
+        + x1126 * x90
+        + x1127 * x428
+        + x1128 * x426
+        + x1131 * x405
+        + x1133 * x405
+        + x1137 * x410
+        + x1140 * x389
+        + x1141 * x410
+        + x1142 * x377
+        + x1142 * x378
+        - x1145 * x295
+        + x1149 * x377
+        + x1149 * x378
+        + x1150 * x270
+        + x1151 * x307
+        + x1152 * x266
+        + x1155 * x403
+        + x1156 * x383
+        + x1158 * x383
+        + x1162 * x266
+        + x1163 * x270
+        + x1169 * x399
+        + x1170 * x399
+        + x1171 * x248
+        - 4.34080072953e-05 * x1172
+        - 1.315362898125e-06 * x1173
+        + x113 * x244
+        - 3.564321078625e-05 * x113 * x252
+        + x1174
+        + x115 * x280
+        + 3.564321078625e-05 * x115 * x284
+        + x115 * x463
+        - 3.6447875e-09 * x141
+        - 3.6447875e-09 * x142
+        + 3.195324133875e-05 * x168
+        - 3.3268604236875e-05 * x169
+        - 0.000206331435 * x222
+        + 0.000206331435 * x229
+        - 0.000206331435 * x230
+        - x356 * (x527 + x529)
+        - x360 * (x1088 - x45 * x528)
+        - x390 * (x1145 * x242 - x1147 * x373 + x1148 * x314)
+        - x390 * (-x674 + x675 - x693 - x695)
+        - x394 * (-x1147 * x126 + x1148 * x212 + x1168)
+        - x394 * (-1e-06 * x99 - x100 * x131 - 0.009432 * x44 + x45 * x694)
+        - x456 * (x1164 + x1165 + x1166)
+        - x456 * (x1023 * x212 - x1107 * x126 - x1167 * x201)
+        - x461 * (x1023 * x314 - x1107 * x373 - x1167 * x242)
+        - x461 * (x1101 * x314 + x1103 * x472 + x1105 * x480)
+    )
+    mass[..., 0, 5] = (
+        x1050 * x248
+        + x1066 * x266
+        + x1151 * x770
+        + x1151 * x917
+        - x1177 * x253
+        + x1180 * x412
+        + x1180 * x413
+        + x1185 * x298
+        + x1186 * x433
+        + x1188 * x433
+        + x1191 * x56
+        + x1191 * x90
+        + x1194 * x405
+        + x1195 * x389
+        + x1197 * x410
+        + x1198 * x403
+        + x1199 * x383
+        + x1200 * x270
+        + x1202 * x399
+        + 0.01115614803204 * x1203
+        + x1204
+        + 3.6447875e-09 * x250
+        - 3.6447875e-09 * x251
+        + 0.0004508043691125 * x282
+        - 0.0004508043691125 * x283
+        - 8.017822355e-05 * x316 * x417
+        - x316 * x494
+        + 8.017822355e-05 * x318 * x422
+        - x318 * x488
+        + 0.053028558 * x361
+        - 0.053028558 * x362
+        + 0.053028558 * x363
+        + 0.053028558 * x368
+        + 0.053028558 * x369
+        + x377 * x924
+        + x378 * x924
+        - x390 * x716
+        - x394 * (0.045483 * x125 + 1e-06 * x211 + x44 * x679 - x44 * x681)
+        + x412 * x855
+        + x413 * x855
+        - x456 * (-0.10593 * x120 + 0.10593 * x125)
+        - x456 * (x1178 * x335 - x1179 * x354 + x1201)
+        - x461 * x636
+        - x461 * (x1177 * x314 + x1178 * x472 - x1179 * x480)
+    )
+    mass[..., 0, 6] = (
+        x1177 * x220
+        + x1205 * x412
+        + x1205 * x413
+        + x1206 * x207
+        + x1207 * x298
+        + x1208 * x433
+        + x1209 * x389
+        + x1211 * x56
+        + x1211 * x90
+        + x1212 * x405
+        + x1213 * x410
+        + x1214
+        + x399 * x983
+        + 3.067964645e-05 * x415
+        - 3.067964645e-05 * x416
+        - 7.56093725e-07 * x420
+        + 7.56093725e-07 * x421
+        - x456
+        * (-0.011402 * x330 + 0.011402 * x334 + 0.000281 * x349 - 0.000281 * x353)
+        - x461 * (-x569 + x570 - x571 + x572)
+    )
+    mass[..., 1, 0] = (
+        x106 * x1234
+        + x106 * x1255
+        + x108 * x1234
+        + x108 * x1255
+        - x110 * x773
+        + x1216 * x493
+        + x1217 * x337
+        + x1218 * x279
+        + x1219 * x279
+        + x1220 * x128
+        + x1221 * x217
+        + x1222 * x174
+        + x1223 * x49
+        + x1225 * x129
+        + x1227 * x129
+        + x1228 * x25
+        + x1229 * x258
+        + x1230 * x180
+        + x1230 * x223
+        + x1230 * x231
+        + x1230 * x234
+        + x1231 * x151
+        + x1231 * x163
+        + x1231 * x192
+        + x1231 * x197
+        + x1232 * x432
+        + x1232 * x523
+        + x1233 * x148
+        + x1234 * x81
+        + x1235 * x409
+        + x1235 * x518
+        + x1236 * x296
+        + x1236 * x340
+        + x1236 * x364
+        + x1236 * x370
+        + x1236 * x374
+        + x1236 * x504
+        + x1237 * x206
+        + x1237 * x218
+        + x1237 * x228
+        + x1237 * x239
+        + x1237 * x243
+        + x1237 * x501
+        + x1238 * x388
+        + x1238 * x514
+        + x1239 * x425
+        + x1239 * x443
+        + x1239 * x445
+        + x1239 * x460
+        + x1239 * x469
+        + x1239 * x473
+        + x1240 * x219
+        + x1240 * x497
+        + x1241 * x427
+        + x1241 * x438
+        + x1241 * x447
+        + x1241 * x452
+        + x1241 * x466
+        + x1241 * x481
+        + x1242 * x263
+        + x1242 * x277
+        + x1242 * x315
+        + x1243 * x263
+        + x1243 * x277
+        + x1243 * x315
+        + x1244 * x382
+        + x1244 * x492
+        + x1245 * x269
+        + x1245 * x486
+        + x1246 * x254
+        + x1246 * x263
+        + x1246 * x277
+        + x1246 * x310
+        + x1246 * x315
+        + x1247 * x296
+        + x1247 * x340
+        + x1247 * x364
+        + x1247 * x370
+        + x1247 * x374
+        + x1248 * x206
+        + x1248 * x218
+        + x1248 * x228
+        + x1248 * x239
+        + x1248 * x243
+        + x1249 * x180
+        + x1249 * x223
+        + x1249 * x231
+        + x1249 * x234
+        + x1250 * x402
+        + x1251 * x57
+        + x1251 * x88
+        + x1251 * x89
+        + x1252 * x151
+        + x1252 * x163
+        + x1252 * x192
+        + x1252 * x197
+        + x1253 * x306
+        + x1254 * x156
+        + x1255 * x81
+        + x1256 * x57
+        + x1256 * x88
+        + x1256 * x89
+        + x1257 * x50
+        + x1258 * x304
+        - x1259 * x411
+        - x1259 * x519
+        - x1260 * x398
+        - x1260 * x510
+        - x1261 * x247
+        - x1261 * x477
+        - x1262 * x134
+        - x1263 * x70
+        - x1264 * x226
+        + x1265 * x6
+        + x1266 * x404
+        + x1266 * x511
+        + x1267 * x265
+        + x1267 * x482
+        + x1268 * x240
+        - x1269 * x366
+        - x1269 * x506
+        - x1270 * x57
+        - x1270 * x88
+        - x1270 * x89
+        - x1271 * x384
+        + x255 * x573
+        + x255 * x579
+        - x272 * x775
+        + x2 * (-0.000606 * x3 + 7e-06 * x5)
+        + x311 * x573
+        + x311 * x579
+        - 0.7235081912 * x29 * x5
+        + 0.390633584 * x33
+        + 0.247974906 * x358
+        + 0.247974906 * x359
+        - x34 * x5
+        + x367 * x530
+        - x376 * x774
+        + x385 * x530
+        + 0.142658678 * x391
+        + 0.142658678 * x392
+        + 0.7235081912 * x37 * x3
+        + 0.105316228 * x453
+        + 0.105316228 * x454
+        + 0.105316228 * x455
+        - x487 * x774
+        + 0.142658678 * x498
+        + 0.142658678 * x499
+        + 0.142658678 * x500
+        + x507 * x530
+        + 0.105316228 * x524
+        + 0.105316228 * x525
+        + 0.105316228 * x526
+        + 0.387012824 * x50 * x555
+        + x57 * x766
+        - x68 * x752
+        + 0.195695476 * x69
+        - 0.246622080707475 * x765
+        + x766 * x88
+        + x766 * x89
+        + x777
+    )
+    mass[..., 1, 1] = (
+        x1216 * x480
+        + x1217 * x472
+        + x1218 * x314
+        + x1219 * x314
+        + x1220 * x373
+        + x1221 * x242
+        + x1222 * x195
+        + x1223 * x233
+        + x1225 * x537
+        + x1227 * x537
+        - x1228 * x555
+        + x1229 * x548
+        + x1230 * x547
+        + x1230 * x565
+        + x1230 * x566
+        + x1231 * x551
+        + x1231 * x561
+        + x1231 * x564
+        + x1232 * x592
+        + x1232 * x596
+        + x1233 * x587
+        + x1234 * x588
+        + x1235 * x654
+        + x1235 * x657
+        + x1236 * x606
+        + x1236 * x618
+        + x1236 * x626
+        + x1236 * x671
+        + x1236 * x673
+        + x1237 * x597
+        + x1237 * x622
+        + x1237 * x627
+        + x1237 * x637
+        + x1237 * x645
+        + x1238 * x612
+        + x1238 * x668
+        + x1239 * x615
+        + x1239 * x624
+        + x1239 * x650
+        + x1239 * x665
+        + x1239 * x670
+        + x1240 * x609
+        + x1240 * x636
+        + x1241 * x621
+        + x1241 * x623
+        + x1241 * x648
+        + x1241 * x661
+        + x1241 * x669
+        + x1242 * x603
+        + x1242 * x625
+        + x1242 * x629
+        + x1242 * x632
+        + x1243 * x603
+        + x1243 * x625
+        + x1243 * x629
+        + x1243 * x632
+        + x1244 * x702
+        + x1244 * x706
+        + x1245 * x707
+        + x1245 * x723
+        + x1246 * x603
+        + x1246 * x625
+        + x1246 * x629
+        + x1246 * x632
+        + x1247 * x606
+        + x1247 * x626
+        + x1247 * x671
+        + x1247 * x673
+        + x1248 * x597
+        + x1248 * x627
+        + x1248 * x637
+        + x1248 * x645
+        + x1249 * x547
+        + x1249 * x565
+        + x1249 * x566
+        + x1250 * x712
+        + x1251 * x558
+        + x1252 * x551
+        + x1252 * x561
+        + x1252 * x564
+        + x1253 * x716
+        + x1254 * x731
+        + x1255 * x588
+        + x1256 * x558
+        + x1258 * x542
+        - x1259 * x574
+        - x1259 * x581
+        - x1260 * x759
+        - x1260 * x760
+        - x1261 * x761
+        - x1261 * x762
+        - x1262 * x728
+        - x1263 * x763
+        - x1264 * x764
+        + x1265 * x3
+        + x1266 * x640
+        + x1266 * x644
+        + x1267 * x715
+        + x1267 * x720
+        + x1268 * x554
+        - x1269 * x599
+        - x1269 * x634
+        - x1270 * x558
+        - x1271 * x708
+        + 0.00561731514894 * x1272**2
+        + 0.0132264231859477 * x233**2
+        + 1.53396367515e-08 * x373**2
+        + x530 * x600
+        + x530 * x635
+        + x530 * x709
+        + 0.004980578196 * x555 * x742
+        + x558 * x766
+        + 1.0012 * x573 * x579
+        + 0.08074054441882 * x582 * x734
+        - x585 * x773
+        + 0.455074536307542 * x4
+        - x687 * x774
+        - 0.008645775 * x5 * x697
+        - 0.015028425 * x5 * x732
+        - x698 * x774
+        - x733 * x775
+        + 0.454992801729417 * x734
+        + 0.105316228 * x735
+        + 0.105316228 * x736
+        + 0.105316228 * x737
+        + 0.105316228 * x738
+        + 0.105316228 * x739
+        + 0.105316228 * x740
+        + 0.32567903165248 * x741
+        + 0.781267168 * x743
+        + 0.142658678 * x744
+        + 0.142658678 * x745
+        + 0.142658678 * x746
+        - 0.285317356 * x747
+        + 0.142658678 * x748
+        + 0.142658678 * x749
+        + 0.587086428 * x753
+        + 0.391390952 * x754
+        - 0.391390952 * x755
+        - 0.495949812 * x756
+        + 0.247974906 * x757
+        + 0.247974906 * x758
+        + 0.0027673516569109 * (x233 + 1.56536167681543e-05 * x537) ** 2
+        + 0.01322638706763 * (x242 - 0.00165250637213254 * x537) ** 2
+        + 0.0027673516569109 * (x242 + 0.147644913357231 * x537) ** 2
+        + 5.13181123316e-05 * (-0.00662550820659539 * x3 + x5) ** 2
+        + 0.0002094624694872 * (-0.00119952019192323 * x3 - x555) ** 2
+        + 0.0052992828758168 * (x3 - 0.198812899122923 * x537) ** 2
+        + 0.08066508290632 * (x3 - 0.0305858081850022 * x537) ** 2
+        + 0.0052992828758168 * (0.000238480086912743 * x537 + x555) ** 2
+        + 0.0014027877002709
+        * (x1272 - 2.19862366158785e-05 * x312 + 2.19862366158785e-05 * x313) ** 2
+        + 6.314636725e-05
+        * (-0.000103626943005181 * x194 + x373 + 0.000103626943005181 * x45) ** 2
+        + 0.0014027877002709
+        * (x242 - 0.212167183343227 * x312 + 0.212167183343227 * x313) ** 2
+        + 0.00561731514894
+        * (x242 - 0.00165250637213254 * x312 + 0.00165250637213254 * x313) ** 2
+        + 0.0004444931544824
+        * (-0.00943016309819451 * x312 + 0.00943016309819451 * x313 + x472) ** 2
+        + 6.03255553344e-05
+        * (x100 - 0.000106022052586938 * x194 + x232 + 0.000106022052586938 * x45) ** 2
+        + 0.0004444931544824
+        * (0.382643130411437 * x312 - 0.382643130411437 * x313 + x478 + x479) ** 2
+        + 6.50808053624e-05
+        * (x470 + x471 - 0.0246447991580424 * x478 - 0.0246447991580424 * x479) ** 2
+        + 0.19764601133841
+    )
+    mass[..., 1, 2] = (
+        0.02626798179258 * x102 * x221
+        + x1216 * x345
+        + x1217 * x324
+        + x1218 * x215
+        + x1219 * x215
+        + x1220 * x118
+        + x1221 * x159
+        - x1222 * x159
+        + x1223 * x221
+        + x1225 * x23
+        + x1227 * x23
+        + x1228 * x21
+        + x1229 * x786
+        + x1230 * x796
+        + x1231 * x795
+        + x1232 * x821
+        + x1232 * x825
+        + x1233 * x817
+        + x1235 * x870
+        + x1235 * x873
+        + x1236 * x827
+        + x1236 * x839
+        + x1236 * x856
+        + x1236 * x877
+        + x1237 * x848
+        + x1237 * x864
+        + x1238 * x833
+        + x1238 * x876
+        + x1239 * x836
+        + x1239 * x866
+        + x1239 * x880
+        + x1239 * x884
+        + x1240 * x842
+        + x1240 * x855
+        + x1241 * x847
+        + x1241 * x865
+        + x1241 * x879
+        + x1241 * x886
+        + x1242 * x844
+        + x1242 * x849
+        + x1242 * x851
+        + x1243 * x844
+        + x1243 * x849
+        + x1243 * x851
+        + x1244 * x910
+        + x1244 * x914
+        + x1245 * x915
+        + x1245 * x931
+        + x1246 * x844
+        + x1246 * x849
+        + x1246 * x851
+        + x1247 * x827
+        + x1247 * x856
+        + x1247 * x877
+        + x1248 * x864
+        + x1249 * x796
+        + x1250 * x920
+        + x1252 * x795
+        + x1253 * x924
+        + x1254 * x934
+        + x1258 * x785
+        - x1259 * x806
+        - x1259 * x815
+        - x1260 * x956
+        - x1260 * x957
+        - x1261 * x958
+        - x1261 * x959
+        - x1263 * x960
+        - x1264 * x961
+        + x1266 * x859
+        + x1266 * x863
+        + x1267 * x923
+        + x1267 * x928
+        + x1268 * x791
+        - x1269 * x829
+        - x1269 * x853
+        - x1271 * x916
+        + x1273 * x916
+        + x1275
+        + x530 * x830
+        + x530 * x854
+        - x641 * x962
+        - x719 * x963
+        - x774 * x898
+        - x774 * x906
+        - x775 * x935
+        + 0.105316228 * x936
+        + 0.105316228 * x937
+        + 0.105316228 * x938
+        + 0.105316228 * x939
+        + 0.105316228 * x940
+        + 0.105316228 * x941
+        + 0.142658678 * x944
+        + 0.142658678 * x945
+        + 0.142658678 * x946
+        + 0.142658678 * x947
+        + 0.142658678 * x948
+        + 0.195695476 * x952
+        + 0.247974906 * x955
+    )
+    mass[..., 1, 3] = (
+        x994 * x1238
+        + x996 * x1239
+        - x1001 * x1269
+        + x1002 * x530
+        + x1005 * x1236
+        + x1008 * x1240
+        + x1010 * x1241
+        + x1011 * x1237
+        + x1014 * x1242
+        + x1014 * x1243
+        + x1014 * x1246
+        - x1016 * x1269
+        + x1017 * x530
+        + x1018 * x1236
+        + x1018 * x1247
+        + x1021 * x1266
+        + x1027 * x1266
+        + x1028 * x1241
+        + x1029 * x1239
+        + x1033 * x1235
+        + x1036 * x1238
+        + x1039 * x1235
+        + x1040 * x1241
+        + x1041 * x1239
+        - x1047 * x774
+        - 0.035381446119254 * x102 * x43
+        - x1054 * x774
+        + x1055 * x1245
+        + x1059 * x1244
+        + x1061 * x1244
+        - x1062 * x1271
+        + x1062 * x1273
+        + x1065 * x1250
+        + x1066 * x1253
+        + x1070 * x1267
+        + x1073 * x1245
+        + x1074 * x1254
+        - x1075 * x775
+        + 0.105316228 * x1077
+        + 0.105316228 * x1078
+        + 0.105316228 * x1079
+        + 0.105316228 * x1080
+        + 0.142658678 * x1081
+        + 0.142658678 * x1082
+        + 0.142658678 * x1083
+        - x1090 * x1260
+        - x1091 * x1260
+        - x1092 * x1261
+        - x1094 * x535
+        + x1216 * x435
+        + x1217 * x440
+        + x1218 * x261
+        + x1219 * x261
+        - x1220 * x338
+        + x1221 * x41
+        - x1222 * x41
+        - x1223 * x43
+        + x1229 * x971
+        + x1232 * x988
+        + x1232 * x992
+        + x1258 * x972
+        - x1259 * x976
+        - x1259 * x986
+        - x1262 * x960
+        + x1276 * x338
+        + x1277
+        - 1.84356057114e-05 * x212 * x338
+        + 0.035381446119254 * x41 * x47
+        - 0.0064879792978136 * x537
+        + 2.512544616e-07 * x555
+        + 0.157368616 * x578
+        + 0.213167516 * x686
+        + 3.522518568e-06 * x742
+        + 0.177610218963768 * x776
+    )
+    mass[..., 1, 4] = (
+        -1.42658678e-07 * x99
+        - 1.42658678e-07 * x101
+        - x1045 * x1261
+        + x1098 * x534
+        - x1102 * x1216
+        + x1104 * x1217
+        - x1106 * x1259
+        - x1108 * x1259
+        + x1111 * x1238
+        + x1115 * x1232
+        + x1116 * x1232
+        + x1119 * x1236
+        + x1122 * x1240
+        + x1123 * x1237
+        - x1125 * x1269
+        + x1126 * x530
+        + x1127 * x1241
+        + x1128 * x1239
+        + x1131 * x1266
+        + x1133 * x1266
+        + x1137 * x1235
+        + x1140 * x1238
+        + x1141 * x1235
+        - x1142 * x774
+        - x1149 * x774
+        + x1150 * x1245
+        + x1151 * x1253
+        + x1152 * x1267
+        + x1155 * x1250
+        + x1156 * x1244
+        + x1158 * x1244
+        + x1162 * x1267
+        + x1163 * x1245
+        + 0.105316228 * x1164
+        + 0.105316228 * x1165
+        + 0.105316228 * x1166
+        + 0.142658678 * x1168
+        - x1169 * x1260
+        - x1170 * x1260
+        - x1171 * x1261
+        + x113 * x1220
+        - x113 * x1276
+        + 0.0013950918484114 * x113 * x212
+        + x115 * x1218
+        + x115 * x1219
+        - 0.0013950918484114 * x115 * x126
+        + 1.315362898125e-06 * x1278
+        + x1279
+        - 8.7723045707e-05 * x194
+        - 4.33190623e-08 * x232
+        - 0.0012587406363054 * x44
+        + 0.0012587406363054 * x46
+        - 0.000206331435 * x546
+    )
+    mass[..., 1, 5] = (
+        -x1050 * x1261
+        + x1066 * x1267
+        - x1151 * x1271
+        + x1151 * x1273
+        - x1180 * x1259
+        + x1185 * x1236
+        + x1186 * x1232
+        + x1188 * x1232
+        - x1190 * x1269
+        + x1191 * x530
+        + x1194 * x1266
+        + x1195 * x1238
+        + x1197 * x1235
+        + x1198 * x1250
+        + x1199 * x1244
+        + x1200 * x1245
+        + 0.105316228 * x1201
+        - x1202 * x1260
+        - x1216 * x316
+        - x1217 * x318
+        - 0.028800840715554 * x120
+        - x1259 * x855
+        - x1280 * x5
+        - 0.01105274234394 * x1281
+        + x1282
+        + 0.017644692683514 * x125
+        + 1.42658678e-07 * x208
+        + 1.42658678e-07 * x211
+        + 0.003138212961944 * x316 * x335
+        - 0.003138212961944 * x318 * x354
+        + 0.053028558 * x604
+        + 0.053028558 * x605
+        + 0.053028558 * x672
+        - x774 * x924
+    )
+    mass[..., 1, 6] = (
+        x1177 * x1240
+        - x1205 * x1259
+        + x1206 * x1237
+        + x1207 * x1236
+        + x1208 * x1232
+        + x1209 * x1238
+        - x1210 * x1269
+        + x1211 * x530
+        + x1212 * x1266
+        + x1213 * x1235
+        - x1260 * x983
+        + x1283
+        - 0.001200815631656 * x330
+        + 0.001200815631656 * x334
+        + 2.9593860068e-05 * x349
+        - 2.9593860068e-05 * x353
+    )
+    mass[..., 2, 0] = (
+        -2.38070011648e-05 * x8
+        - x106 * x1318
+        - x108 * x1318
+        + x1284 * x129
+        + x1285 * x25
+        + x1286 * x174
+        + x1287 * x129
+        + x1290 * x493
+        + x1292 * x337
+        + x1293 * x279
+        + x1294 * x279
+        + x1296 * x128
+        + x1298 * x217
+        + x1299 * x57
+        + x1299 * x88
+        + x1299 * x89
+        + x1300 * x180
+        + x1300 * x223
+        + x1300 * x231
+        + x1300 * x234
+        + x1301 * x366
+        + x1301 * x506
+        + x1302 * x388
+        + x1302 * x514
+        + x1303 * x296
+        + x1303 * x340
+        + x1303 * x364
+        + x1303 * x370
+        + x1303 * x374
+        + x1303 * x504
+        + x1304 * x206
+        + x1304 * x218
+        + x1304 * x228
+        + x1304 * x239
+        + x1304 * x243
+        + x1304 * x501
+        + x1305 * x425
+        + x1305 * x443
+        + x1305 * x445
+        + x1305 * x460
+        + x1305 * x469
+        + x1305 * x473
+        + x1306 * x427
+        + x1306 * x438
+        + x1306 * x447
+        + x1306 * x452
+        + x1306 * x466
+        + x1306 * x481
+        + x1307 * x263
+        + x1307 * x277
+        + x1307 * x315
+        + x1308 * x263
+        + x1308 * x277
+        + x1308 * x315
+        + x1309 * x384
+        + x1310 * x180
+        + x1310 * x223
+        + x1310 * x231
+        + x1310 * x234
+        + x1311 * x151
+        + x1311 * x163
+        + x1311 * x192
+        + x1311 * x197
+        + x1312 * x402
+        + x1313 * x254
+        + x1313 * x263
+        + x1313 * x277
+        + x1313 * x310
+        + x1313 * x315
+        + x1314 * x296
+        + x1314 * x340
+        + x1314 * x364
+        + x1314 * x370
+        + x1314 * x374
+        + x1315 * x206
+        + x1315 * x218
+        + x1315 * x228
+        + x1315 * x239
+        + x1315 * x243
+        + x1316 * x57
+        + x1316 * x88
+        + x1316 * x89
+        - x1317 * x404
+        - x1317 * x511
+        - x1318 * x81
+        - x1319 * x409
+        - x1319 * x518
+        - x1320 * x265
+        - x1320 * x482
+        - x1321 * x240
+        - x1322 * x269
+        - x1322 * x486
+        - x1323 * x258
+        + x1324 * x219
+        + x1324 * x497
+        + x1325 * x57
+        + x1325 * x88
+        + x1325 * x89
+        + x1326 * x384
+        + x1327 * x306
+        + x1328 * x366
+        + x1328 * x506
+        + x1329 * x49
+        + x1330 * x151
+        + x1330 * x163
+        + x1330 * x192
+        + x1330 * x197
+        - x130 * x23
+        + x255 * x805
+        + x255 * x812
+        + x311 * x805
+        + x311 * x812
+        - 0.003191325 * x430
+        - 0.003191325 * x431
+        - 0.0043228875 * x489
+        - 0.0043228875 * x490
+        - 0.003191325 * x520
+        - 0.003191325 * x521
+        - 0.003191325 * x522
+        + 0.9302 * x50 * x951
+        - x50 * x965
+        - x68 * x951
+        - 0.0055449842710128 * x6
+        + 0.00011796597445 * x7
+        - 6.015812e-07 * x942
+        + x968
+    )
+    mass[..., 2, 1] = (
+        -x1224 * x23
+        + x1275
+        + x1284 * x537
+        - x1285 * x555
+        + x1286 * x195
+        + x1287 * x537
+        + x1290 * x480
+        + x1292 * x472
+        + x1293 * x314
+        + x1294 * x314
+        + x1296 * x373
+        + x1298 * x242
+        + x1299 * x558
+        + x1300 * x547
+        + x1300 * x565
+        + x1300 * x566
+        + x1301 * x599
+        + x1301 * x634
+        + x1302 * x612
+        + x1302 * x668
+        + x1303 * x606
+        + x1303 * x618
+        + x1303 * x626
+        + x1303 * x671
+        + x1303 * x673
+        + x1304 * x597
+        + x1304 * x622
+        + x1304 * x627
+        + x1304 * x637
+        + x1304 * x645
+        + x1305 * x615
+        + x1305 * x624
+        + x1305 * x650
+        + x1305 * x665
+        + x1305 * x670
+        + x1306 * x621
+        + x1306 * x623
+        + x1306 * x648
+        + x1306 * x661
+        + x1306 * x669
+        + x1307 * x603
+        + x1307 * x625
+        + x1307 * x629
+        + x1307 * x632
+        + x1308 * x603
+        + x1308 * x625
+        + x1308 * x629
+        + x1308 * x632
+        + x1309 * x708
+        + x1310 * x547
+        + x1310 * x565
+        + x1310 * x566
+        + x1311 * x551
+        + x1311 * x561
+        + x1311 * x564
+        + x1312 * x712
+        + x1313 * x603
+        + x1313 * x625
+        + x1313 * x629
+        + x1313 * x632
+        + x1314 * x606
+        + x1314 * x626
+        + x1314 * x671
+        + x1314 * x673
+        + x1315 * x597
+        + x1315 * x627
+        + x1315 * x637
+        + x1315 * x645
+        + x1316 * x558
+        - x1317 * x640
+        - x1317 * x644
+        - x1318 * x588
+        - x1319 * x654
+        - x1319 * x657
+        - x1320 * x715
+        - x1320 * x720
+        - x1321 * x554
+        - x1322 * x707
+        - x1322 * x723
+        - x1323 * x548
+        + x1324 * x609
+        + x1324 * x636
+        + x1325 * x558
+        + x1326 * x708
+        + x1327 * x716
+        + x1328 * x599
+        + x1328 * x634
+        + x1329 * x233
+        + x1330 * x551
+        + x1330 * x561
+        + x1330 * x564
+        - 0.003191325 * x589
+        - 0.003191325 * x590
+        - 0.003191325 * x591
+        - 0.003191325 * x594
+        - 0.003191325 * x595
+        - 0.0043228875 * x699
+        - 0.0043228875 * x700
+        + 0.391390952 * x952
+    )
+    mass[..., 2, 2] = (
+        1.53396367515e-08 * x118**2
+        + x118 * x1296
+        + x1284 * x23
+        + x1285 * x21
+        - x1286 * x159
+        + x1287 * x23
+        + x1290 * x345
+        + x1292 * x324
+        + x1293 * x215
+        + x1294 * x215
+        + x1298 * x159
+        + x1300 * x796
+        + x1301 * x829
+        + x1301 * x853
+        + x1302 * x833
+        + x1302 * x876
+        + x1303 * x827
+        + x1303 * x839
+        + x1303 * x856
+        + x1303 * x877
+        + x1304 * x848
+        + x1304 * x864
+        + x1305 * x836
+        + x1305 * x866
+        + x1305 * x880
+        + x1305 * x884
+        + x1306 * x847
+        + x1306 * x865
+        + x1306 * x879
+        + x1306 * x886
+        + x1307 * x844
+        + x1307 * x849
+        + x1307 * x851
+        + x1308 * x844
+        + x1308 * x849
+        + x1308 * x851
+        + x1309 * x916
+        + x1310 * x796
+        + x1311 * x795
+        + x1312 * x920
+        + x1313 * x844
+        + x1313 * x849
+        + x1313 * x851
+        + x1314 * x827
+        + x1314 * x856
+        + x1314 * x877
+        + x1315 * x864
+        - x1317 * x859
+        - x1317 * x863
+        - x1319 * x870
+        - x1319 * x873
+        - x1320 * x923
+        - x1320 * x928
+        - x1321 * x791
+        - x1322 * x915
+        - x1322 * x931
+        - x1323 * x786
+        + x1324 * x842
+        + x1324 * x855
+        + x1326 * x916
+        + x1327 * x924
+        + x1328 * x829
+        + x1328 * x853
+        + x1330 * x795
+        + 0.00159196106025 * x1331 * x159
+        + 0.00561731514894 * x1332**2
+        + 0.0006138189172872 * x582
+        + 0.0148224231859477 * x778 * x787
+        + 0.0812789018236072 * x778
+        + 5.2614515925e-06 * x779
+        - 0.015028425 * x784
+        + 1.0012 * x805 * x812
+        - 0.003191325 * x818
+        - 0.003191325 * x819
+        - 0.003191325 * x820
+        - 0.00638265 * x822
+        - 0.003191325 * x823
+        - 0.003191325 * x824
+        - x860 * x962
+        - 0.008645775 * x907
+        - 0.0043228875 * x908
+        - 0.0043228875 * x909
+        - 0.008645775 * x911
+        + 0.01729155 * x912
+        + 0.008645775 * x913
+        - x927 * x963
+        + 6.314636725e-05 * (x118 + 0.000103626943005181 * x159) ** 2
+        + 6.03255553344e-05 * (0.000106022052586938 * x159 - x221) ** 2
+        + 0.01322638706763 * (x159 - 0.00165250637213254 * x23) ** 2
+        + 0.0027673516569109 * (x159 + 0.147644913357231 * x23) ** 2
+        + 0.0027673516569109 * (x221 + 1.56536167681543e-05 * x23) ** 2
+        + 0.0052992828758168 * (-x21 + 0.000238480086912743 * x23) ** 2
+        + 0.0014027877002709
+        * (-0.212167183343227 * x122 + x159 + 0.212167183343227 * x214) ** 2
+        + 0.0004444931544824
+        * (-0.00943016309819451 * x122 + 0.00943016309819451 * x214 + x324) ** 2
+        + 0.00561731514894
+        * (-0.00165250637213254 * x122 + x159 + 0.00165250637213254 * x214) ** 2
+        + 0.0014027877002709
+        * (-2.19862366158785e-05 * x122 + x1332 + 2.19862366158785e-05 * x214) ** 2
+        + 0.0004444931544824
+        * (0.382643130411437 * x122 - 0.382643130411437 * x214 + x341 - x344) ** 2
+        + 6.50808053624e-05
+        * (-x317 - x323 - 0.0246447991580424 * x341 + 0.0246447991580424 * x344) ** 2
+        + 0.0012075857869362
+    )
+    mass[..., 2, 3] = (
+        x994 * x1302
+        + x996 * x1305
+        + x1001 * x1301
+        + x1001 * x1328
+        + x1005 * x1303
+        + x1008 * x1324
+        + x1010 * x1306
+        + x1011 * x1304
+        + x1014 * x1307
+        + x1014 * x1308
+        + x1014 * x1313
+        + x1016 * x1301
+        + x1016 * x1328
+        + x1018 * x1303
+        + x1018 * x1314
+        - x1021 * x1317
+        - x1027 * x1317
+        + x1028 * x1306
+        + x1029 * x1305
+        - x1033 * x1319
+        + x1036 * x1302
+        - x1039 * x1319
+        + x1040 * x1306
+        + x1041 * x1305
+        - x1055 * x1322
+        - 0.0043228875 * x1057
+        - 0.0043228875 * x1058
+        + x1062 * x1309
+        + x1062 * x1326
+        + x1065 * x1312
+        + x1066 * x1327
+        - x1070 * x1320
+        - x1073 * x1322
+        - x1286 * x41
+        + x1290 * x435
+        + x1292 * x440
+        + x1293 * x261
+        + x1294 * x261
+        - x1296 * x338
+        + x1298 * x41
+        - x1323 * x971
+        - 0.0408469285810777 * x1333
+        + x1335
+        + 5.5864144125e-07 * x210 * x338
+        + 0.157368616 * x810
+        + 0.213167516 * x894
+        - 0.003191325 * x987
+        - 0.003191325 * x989
+        - 0.003191325 * x990
+        - 0.003191325 * x991
+    )
+    mass[..., 2, 4] = (
+        -x1102 * x1290
+        + x1104 * x1292
+        + x1111 * x1302
+        - 0.003191325 * x1112
+        - 0.003191325 * x1113
+        - 0.003191325 * x1114
+        + x1119 * x1303
+        + x1122 * x1324
+        + x1123 * x1304
+        + x1125 * x1301
+        + x1125 * x1328
+        + x1127 * x1306
+        + x1128 * x1305
+        - x1131 * x1317
+        - x1133 * x1317
+        - x1137 * x1319
+        + x1140 * x1302
+        - x1141 * x1319
+        - x1150 * x1322
+        + x1151 * x1327
+        - x1152 * x1320
+        + x1155 * x1312
+        - x1162 * x1320
+        - x1163 * x1322
+        + x113 * x1296
+        - 4.227450581625e-05 * x113 * x210
+        + 4.227450581625e-05 * x115 * x124
+        + x115 * x1293
+        + x115 * x1294
+        - 3.814274910375e-05 * x1331
+        + 4.3228875e-09 * x1336
+        + x1337
+        + 8.7723045707e-05 * x159
+        + 4.33190623e-08 * x221
+    )
+    mass[..., 2, 5] = (
+        -x1066 * x1320
+        + x1151 * x1309
+        + x1151 * x1326
+        + x1185 * x1303
+        - 0.003191325 * x1187
+        + x1190 * x1301
+        + x1190 * x1328
+        - x1194 * x1317
+        + x1195 * x1302
+        - x1197 * x1319
+        + x1198 * x1312
+        - x1200 * x1322
+        + 4.3228875e-09 * x116
+        + 6.543665e-09 * x117
+        + 0.0008727320066625 * x121
+        - 0.0008727320066625 * x123
+        - x1290 * x316
+        - x1292 * x318
+        + 0.01105274234394 * x1338
+        + x1339
+        + 4.3228875e-09 * x209
+        + 0.0005941908133508 * x214
+        - 9.509510235e-05 * x316 * x333
+        + 9.509510235e-05 * x318 * x352
+        + 0.053028558 * x826
+    )
+    mass[..., 2, 6] = (
+        x1177 * x1324
+        + x1206 * x1304
+        + x1207 * x1303
+        + x1209 * x1302
+        + x1210 * x1301
+        + x1210 * x1328
+        - x1212 * x1317
+        - x1213 * x1319
+        + x1340
+        + 3.638748765e-05 * x331
+        - 3.638748765e-05 * x332
+        + 8.96762325e-07 * x350
+        + 8.96762325e-07 * x351
+    )
+    mass[..., 3, 0] = (
+        0.4572224596 * x105
+        + 0.096190461050648 * x1089
+        - x1095 * x57
+        - x1095 * x88
+        - x1095 * x89
+        - x1096 * x366
+        - x1096 * x506
+        + x1097
+        - x128 * x1367
+        - 0.000256 * x129 * x41
+        + x1341 * x217
+        + x1342 * x279
+        + x1345 * x493
+        + x1346 * x337
+        + x1348 * x279
+        + x1349 * x388
+        + x1349 * x514
+        + x1350 * x296
+        + x1350 * x340
+        + x1350 * x364
+        + x1350 * x370
+        + x1350 * x374
+        + x1350 * x504
+        + x1351 * x425
+        + x1351 * x443
+        + x1351 * x445
+        + x1351 * x460
+        + x1351 * x469
+        + x1351 * x473
+        + x1352 * x427
+        + x1352 * x438
+        + x1352 * x447
+        + x1352 * x452
+        + x1352 * x466
+        + x1352 * x481
+        + x1353 * x263
+        + x1353 * x277
+        + x1353 * x315
+        + x1354 * x402
+        + x1355 * x180
+        + x1355 * x223
+        + x1355 * x231
+        + x1355 * x234
+        + x1356 * x57
+        + x1356 * x88
+        + x1356 * x89
+        + x1357 * x254
+        + x1357 * x263
+        + x1357 * x277
+        + x1357 * x310
+        + x1357 * x315
+        + x1358 * x296
+        + x1358 * x340
+        + x1358 * x364
+        + x1358 * x370
+        + x1358 * x374
+        + x1359 * x206
+        + x1359 * x218
+        + x1359 * x228
+        + x1359 * x239
+        + x1359 * x243
+        - x1360 * x219
+        - x1360 * x497
+        - x1361 * x174
+        - x1362 * x384
+        - x1363 * x306
+        - x1364 * x151
+        - x1364 * x163
+        - x1364 * x192
+        - x1364 * x197
+        - x1365 * x49
+        + x1366 * x206
+        + x1366 * x218
+        + x1366 * x228
+        + x1366 * x239
+        + x1366 * x243
+        + x1366 * x501
+        - x1368 * x254
+        - x1368 * x263
+        - x1368 * x277
+        - x1368 * x310
+        - x1368 * x315
+        + 3.522518568e-06 * x21 * x6
+        + x255 * x983
+        - 3.579949116e-07 * x24
+        + x311 * x983
+        + 0.0069355657247636 * x36
+        + 0.104340058 * x406
+        + 0.141336383 * x485
+        + 0.104340058 * x515
+        + 0.104340058 * x516
+        - 1.967373e-07 * x51
+        - 1.967373e-07 * x52
+        + 0.0053723639003 * x72
+        - 0.0053723639003 * x73
+        + 1.67436e-05 * x87
+    )
+    mass[..., 3, 1] = (
+        -x1095 * x558
+        - x1096 * x599
+        - x1096 * x634
+        + x1277
+        - 0.000256 * x1278
+        + x1341 * x242
+        + x1342 * x314
+        + x1345 * x480
+        + x1346 * x472
+        + x1348 * x314
+        + x1349 * x612
+        + x1349 * x668
+        + x1350 * x606
+        + x1350 * x618
+        + x1350 * x626
+        + x1350 * x671
+        + x1350 * x673
+        + x1351 * x615
+        + x1351 * x624
+        + x1351 * x650
+        + x1351 * x665
+        + x1351 * x670
+        + x1352 * x621
+        + x1352 * x623
+        + x1352 * x648
+        + x1352 * x661
+        + x1352 * x669
+        + x1353 * x603
+        + x1353 * x625
+        + x1353 * x629
+        + x1353 * x632
+        + x1354 * x712
+        + x1355 * x547
+        + x1355 * x565
+        + x1355 * x566
+        + x1356 * x558
+        + x1357 * x603
+        + x1357 * x625
+        + x1357 * x629
+        + x1357 * x632
+        + x1358 * x606
+        + x1358 * x626
+        + x1358 * x671
+        + x1358 * x673
+        + x1359 * x597
+        + x1359 * x627
+        + x1359 * x637
+        + x1359 * x645
+        - x1360 * x609
+        - x1360 * x636
+        - x1361 * x195
+        - x1362 * x708
+        - x1363 * x716
+        - x1364 * x551
+        - x1364 * x561
+        - x1364 * x564
+        - x1365 * x233
+        + x1366 * x597
+        + x1366 * x622
+        + x1366 * x627
+        + x1366 * x637
+        + x1366 * x645
+        - x1367 * x373
+        - x1368 * x603
+        - x1368 * x625
+        - x1368 * x629
+        - x1368 * x632
+        - 0.0069355657247636 * x537
+        + 3.579949116e-07 * x555
+        + 0.104340058 * x578
+        + 0.104340058 * x651
+        + 0.104340058 * x652
+        + 0.141336383 * x686
+        + 7.045037136e-06 * x742
+        + 0.192380922101296 * x776
+    )
+    mass[..., 3, 2] = (
+        -x1067 * x963
+        - x1096 * x829
+        - x1096 * x853
+        - x118 * x1367
+        - x1226 * x41
+        - 0.0392399285810777 * x1333
+        + x1335
+        + x1341 * x159
+        + x1342 * x215
+        + x1345 * x345
+        + x1346 * x324
+        + x1348 * x215
+        + x1349 * x833
+        + x1349 * x876
+        + x1350 * x827
+        + x1350 * x839
+        + x1350 * x856
+        + x1350 * x877
+        + x1351 * x836
+        + x1351 * x866
+        + x1351 * x880
+        + x1351 * x884
+        + x1352 * x847
+        + x1352 * x865
+        + x1352 * x879
+        + x1352 * x886
+        + x1353 * x844
+        + x1353 * x849
+        + x1353 * x851
+        + x1354 * x920
+        + x1355 * x796
+        + x1357 * x844
+        + x1357 * x849
+        + x1357 * x851
+        + x1358 * x827
+        + x1358 * x856
+        + x1358 * x877
+        + x1359 * x864
+        - x1360 * x842
+        - x1360 * x855
+        - x1362 * x916
+        - x1363 * x924
+        - x1364 * x795
+        + x1366 * x848
+        + x1366 * x864
+        - x1368 * x844
+        - x1368 * x849
+        - x1368 * x851
+        + 0.104340058 * x810
+        + 0.104340058 * x867
+        + 0.104340058 * x868
+        + 0.141336383 * x894
+    )
+    mass[..., 3, 3] = (
+        x994 * x1349
+        + x996 * x1351
+        + 0.00725833048857675 * x997 * x969
+        - x1001 * x1096
+        + x1005 * x1350
+        - x1008 * x1360
+        + x1010 * x1352
+        + x1011 * x1366
+        + x1014 * x1353
+        + x1014 * x1357
+        - x1014 * x1368
+        - 0.00017526006 * x1015 * x43
+        - x1016 * x1096
+        + x1018 * x1350
+        + x1018 * x1358
+        + 0.03334011498576 * x1024
+        + x1028 * x1352
+        + x1029 * x1351
+        - 0.208680116 * x1030
+        + 0.104340058 * x1031
+        + 0.104340058 * x1032
+        + x1036 * x1349
+        + 3.65294543058e-05 * x1037 * x338
+        + 0.208680116 * x1038
+        + x1040 * x1352
+        + x1041 * x1351
+        + 0.354503899 * x1051
+        - x1062 * x1362
+        + x1065 * x1354
+        - x1066 * x1363
+        + 0.282672766 * x1071
+        - 0.282672766 * x1072
+        + x1341 * x41
+        + x1342 * x261
+        + x1345 * x435
+        + x1346 * x440
+        + x1348 * x261
+        + 0.0877077338251789 * x787
+        + 0.0876967699434966 * x969
+        + 0.0014027877002709 * (-0.212167183343227 * x261 + x41) ** 2
+        + 0.0004444931544824 * (-0.00943016309819451 * x261 + x440) ** 2
+        + 0.00561731514894 * (-0.00165250637213254 * x261 + x41) ** 2
+        + 0.0014027877002709 * (-2.19862366158785e-05 * x261 + x338) ** 2
+        + 0.0004444931544824 * (0.382643130411437 * x261 + x348) ** 2
+        + 6.314636725e-05 * (-x338 + 0.000103626943005181 * x41) ** 2
+        + 6.03255553344e-05 * (0.000106022052586938 * x41 + x43) ** 2
+        + 6.50808053624e-05
+        * (-0.0246447991580424 * x320 + x329 + 0.0246447991580424 * x347) ** 2
+        + 0.0942803660835216
+    )
+    mass[..., 3, 4] = (
+        -x1096 * x1125
+        - x1102 * x1345
+        + x1104 * x1346
+        + x1111 * x1349
+        + x1119 * x1350
+        - x1122 * x1360
+        + x1123 * x1366
+        + x1127 * x1352
+        + x1128 * x1351
+        + 0.104340058 * x1135
+        + 0.104340058 * x1136
+        + x1140 * x1349
+        + 0.141336383 * x1146
+        - x1151 * x1363
+        + x1155 * x1354
+        + x115 * x1342
+        + x115 * x1348
+        - 0.0072583458282135 * x1369
+        + x1371
+    )
+    mass[..., 3, 5] = (
+        -1.41336383e-07 * x1037
+        - x1096 * x1190
+        - x1151 * x1362
+        + x1185 * x1350
+        + x1195 * x1349
+        + x1198 * x1354
+        - x1345 * x316
+        - x1346 * x318
+        + 0.023098460200869 * x1372
+        + x1373
+        - 0.0005941908133508 * x261
+        + 0.003109125048284 * x316 * x322
+        - 0.003109125048284 * x318 * x343
+        - 6.543665e-09 * x338
+    )
+    mass[..., 3, 6] = (
+        -x1096 * x1210
+        - x1177 * x1360
+        + x1206 * x1366
+        + x1207 * x1350
+        + x1209 * x1349
+        + x1374
+        - 0.001189685341316 * x319
+        + 0.001189685341316 * x321
+        + 2.9319556298e-05 * x327
+        + 1.1916429428e-06 * x328
+        + 2.9319556298e-05 * x342
+        - 5.20822520776e-05 * x347
+    )
+    mass[..., 4, 0] = (
+        -0.0013021486436007 * x0 * x233
+        - 4.3228875e-09 * x8 * x159
+        - x1098 * x206
+        - x1098 * x218
+        - x1098 * x228
+        - x1098 * x239
+        - x1098 * x243
+        - x1098 * x501
+        + x1101 * x255
+        + x1101 * x311
+        + 0.0013021486436007 * x1172
+        + 3.9458112001875e-05 * x1173
+        + x1174
+        + x128 * x1379
+        + x1376 * x493
+        + x1377 * x337
+        + x1378 * x279
+        + x1380 * x279
+        + x1381 * x425
+        + x1381 * x443
+        + x1381 * x445
+        + x1381 * x460
+        + x1381 * x469
+        + x1381 * x473
+        + x1382 * x427
+        + x1382 * x438
+        + x1382 * x447
+        + x1382 * x452
+        + x1382 * x466
+        + x1382 * x481
+        + x1383 * x263
+        + x1383 * x277
+        + x1383 * x315
+        + x1384 * x206
+        + x1384 * x218
+        + x1384 * x228
+        + x1384 * x239
+        + x1384 * x243
+        + x1385 * x254
+        + x1385 * x263
+        + x1385 * x277
+        + x1385 * x310
+        + x1385 * x315
+        - x1386 * x195
+        - x1387 * x217
+        - x1388 * x504
+        - x1389 * x296
+        - x1389 * x340
+        - x1389 * x364
+        - x1389 * x370
+        - x1389 * x374
+        + x1390 * x41
+        - 7.967675e-09 * x141
+        - 7.967675e-09 * x142
+        - 6.781e-07 * x162
+        + 7.272671623875e-05 * x168
+        - 7.272671623875e-05 * x169
+        - 6.781e-07 * x190
+        - 6.781e-07 * x191
+        + 0.006189507765 * x222
+        - 0.006189507765 * x229
+        + 0.006189507765 * x230
+    )
+    mass[..., 4, 1] = (
+        -2.85317356e-07 * x99
+        - 2.85317356e-07 * x101
+        - x1098 * x597
+        - x1098 * x622
+        - x1098 * x627
+        - x1098 * x637
+        - x1098 * x645
+        - 3.9458112001875e-05 * x1278
+        + x1279
+        + x1376 * x480
+        + x1377 * x472
+        + x1378 * x314
+        + x1379 * x373
+        + x1380 * x314
+        + x1381 * x615
+        + x1381 * x624
+        + x1381 * x650
+        + x1381 * x665
+        + x1381 * x670
+        + x1382 * x621
+        + x1382 * x623
+        + x1382 * x648
+        + x1382 * x661
+        + x1382 * x669
+        + x1383 * x603
+        + x1383 * x625
+        + x1383 * x629
+        + x1383 * x632
+        + x1384 * x597
+        + x1384 * x627
+        + x1384 * x637
+        + x1384 * x645
+        + x1385 * x603
+        + x1385 * x625
+        + x1385 * x629
+        + x1385 * x632
+        - x1387 * x242
+        - x1388 * x618
+        - x1389 * x606
+        - x1389 * x626
+        - x1389 * x671
+        - x1389 * x673
+        - 0.001420807810163 * x194
+        - 1.846554453e-07 * x232
+        + 4.3228875e-09 * x21 * x44
+        - 0.0026042972872014 * x44
+        + 0.0026042972872014 * x46
+        + 0.006189507765 * x546
+        - 6.781e-07 * x550
+    )
+    mass[..., 4, 2] = (
+        -x1098 * x848
+        - x1098 * x864
+        - x1161 * x963
+        + x118 * x1379
+        - 7.891622400375e-05 * x1331
+        + 8.645775e-09 * x1336
+        + x1337
+        - 0.000278 * x1338
+        + x1376 * x345
+        + x1377 * x324
+        + x1378 * x215
+        + x1380 * x215
+        + x1381 * x836
+        + x1381 * x866
+        + x1381 * x880
+        + x1381 * x884
+        + x1382 * x847
+        + x1382 * x865
+        + x1382 * x879
+        + x1382 * x886
+        + x1383 * x844
+        + x1383 * x849
+        + x1383 * x851
+        + x1384 * x864
+        + x1385 * x844
+        + x1385 * x849
+        + x1385 * x851
+        - x1388 * x839
+        - x1389 * x827
+        - x1389 * x856
+        - x1389 * x877
+        + 0.001420807810163 * x159
+        + 1.846554453e-07 * x221
+    )
+    mass[..., 4, 3] = (
+        x996 * x1381
+        - x1005 * x1388
+        + x1010 * x1382
+        - x1011 * x1098
+        + x1014 * x1383
+        + x1014 * x1385
+        - x1018 * x1389
+        + x1028 * x1382
+        + x1029 * x1381
+        + x1040 * x1382
+        + x1041 * x1381
+        + 0.213167516 * x1146
+        - x115 * x1297
+        - 0.0068483458282135 * x1369
+        + x1371
+        + x1376 * x435
+        + x1377 * x440
+        + x1378 * x261
+    )
+    mass[..., 4, 4] = (
+        0.000475483323276755 * x997
+        - x1098 * x1123
+        - x1102 * x1376
+        + x1104 * x1377
+        + 0.00732379847221675 * x1109
+        - x1119 * x1388
+        + x1127 * x1382
+        + x1128 * x1381
+        + 0.00035052012 * x1129
+        - 0.00017526006 * x1138
+        + 0.00017526006 * x1139
+        + x115 * x1378
+        + 6.50808053624e-05 * (-0.0246447991580424 * x1102 - x1104) ** 2
+        + 0.0004444931544824 * (x1102 + 0.382643130411437 * x115) ** 2
+        + 0.0004444931544824 * (x1104 - 0.00943016309819451 * x115) ** 2
+        + 0.0014027877002709 * (-x113 - 2.19862366158785e-05 * x115) ** 2
+        + 0.000459361674330197
+    )
+    mass[..., 4, 5] = -x1185 * x1388 - x1376 * x316 - x1377 * x318 + x1392
+    mass[..., 4, 6] = (
+        -x1098 * x1206
+        + 5.20822520776e-05 * x1102
+        - 1.1916429428e-06 * x1104
+        - x1207 * x1388
+        + x1393
+        - 2.462403843e-08 * x1394
+        - 9.9915760206e-07 * x1395
+    )
+    mass[..., 5, 0] = (
+        -0.017644692683514 * x0 * x373
+        + x8 * x1403
+        + x8 * x1404
+        + x1177 * x255
+        + x1177 * x311
+        + 0.017644692683514 * x1203
+        + x1204
+        - x1386 * x314
+        - x1390 * x261
+        + x1396 * x337
+        + x1398 * x279
+        + x1399 * x493
+        + x1400 * x425
+        + x1400 * x443
+        + x1400 * x445
+        + x1400 * x460
+        + x1400 * x469
+        + x1400 * x473
+        + x1401 * x263
+        + x1401 * x277
+        + x1401 * x315
+        - x1402 * x427
+        - x1402 * x438
+        - x1402 * x447
+        - x1402 * x452
+        - x1402 * x466
+        - x1402 * x481
+        + 7.967675e-09 * x250
+        - 7.967675e-09 * x251
+        + 6.781e-07 * x262
+        + 6.781e-07 * x274
+        + 6.781e-07 * x275
+        - 6.781e-07 * x276
+        + 0.000985479318525 * x282
+        - 0.000985479318525 * x283
+        + 6.781e-07 * x308
+        - 6.781e-07 * x309
+        + 0.0838705803 * x339
+        + 0.0838705803 * x361
+        - 0.0838705803 * x362
+        + 0.0838705803 * x363
+        + 0.0838705803 * x368
+        + 0.0838705803 * x369
+    )
+    mass[..., 5, 1] = (
+        1.41336383e-07 * x114 * x44
+        - 0.0005346749494125 * x114 * x5
+        - 0.035289385367028 * x120
+        - 4.3228875e-09 * x122 * x5
+        - 0.017481145051929 * x1281
+        + x1282
+        + 0.035289385367028 * x125
+        + x1396 * x472
+        + x1398 * x314
+        + x1399 * x480
+        + x1400 * x615
+        + x1400 * x624
+        + x1400 * x650
+        + x1400 * x665
+        + x1400 * x670
+        + x1401 * x603
+        + x1401 * x625
+        + x1401 * x629
+        + x1401 * x632
+        - x1402 * x621
+        - x1402 * x623
+        - x1402 * x648
+        - x1402 * x661
+        - x1402 * x669
+        - x1403 * x5
+        - x1404 * x5
+        + 2.85317356e-07 * x208
+        + 2.85317356e-07 * x211
+        + 6.781e-07 * x601
+        - 6.781e-07 * x602
+        + 0.0838705803 * x604
+        + 0.0838705803 * x605
+        - 6.781e-07 * x631
+        + 0.0838705803 * x672
+    )
+    mass[..., 5, 2] = (
+        8.645775e-09 * x116
+        + 6.662366405e-09 * x117
+        - 1.41336383e-07 * x121 * x43
+        + 0.001069349898825 * x121
+        - 0.001069349898825 * x123
+        + 0.017481145051929 * x1338
+        + x1339
+        + x1396 * x324
+        + x1398 * x215
+        + x1399 * x345
+        + x1400 * x836
+        + x1400 * x866
+        + x1400 * x880
+        + x1400 * x884
+        + x1401 * x844
+        + x1401 * x849
+        + x1401 * x851
+        - x1402 * x847
+        - x1402 * x865
+        - x1402 * x879
+        - x1402 * x886
+        + 8.645775e-09 * x209
+        + 0.000599589709354415 * x214
+        + 0.0838705803 * x826
+        - 6.781e-07 * x843
+    )
+    mass[..., 5, 3] = (
+        x996 * x1400
+        - x1010 * x1402
+        + x1014 * x1401
+        - x1028 * x1402
+        + x1029 * x1400
+        - 2.13167516e-07 * x1037
+        - x1040 * x1402
+        + x1041 * x1400
+        + 0.026365555623108 * x1372
+        + x1373
+        + x1396 * x440
+        + x1398 * x261
+        + x1399 * x435
+        - 0.000599589709354415 * x261
+        - 6.662366405e-09 * x338
+    )
+    mass[..., 5, 4] = (
+        -x1102 * x1399
+        + x1104 * x1396
+        - x1127 * x1402
+        + x1128 * x1400
+        + x115 * x1398
+        + x1392
+    )
+    mass[..., 5, 5] = (
+        0.0036047830970504 * x1181
+        + 0.0036047830970504 * x1183
+        - x1396 * x318
+        - x1399 * x316
+        + 6.50808053624e-05 * (-0.0246447991580424 * x316 + x318) ** 2
+        + 0.008661102849889
+    )
+    mass[..., 5, 6] = x1405
+    mass[..., 6, 0] = (
+        -0.001200815631656 * x0 * x472
+        + 2.9593860068e-05 * x0 * x480
+        + x8 * x1406
+        - x8 * x1407
+        + 0.001200815631656 * x8 * x329
+        - 2.9593860068e-05 * x8 * x348
+        + x1214
+        + 6.70671341e-05 * x415
+        - 6.70671341e-05 * x416
+        - 1.65285605e-06 * x420
+        + 1.65285605e-06 * x421
+        + 0.0001406686 * x434
+        - 0.0001406686 * x436
+        - 0.0001406686 * x437
+        + 0.0057078412 * x439
+        + 0.0057078412 * x441
+        + 0.0057078412 * x442
+        + 0.0057078412 * x444
+        - 0.0001406686 * x446
+        - 0.0001406686 * x449
+        + 0.0001406686 * x450
+        + 0.0001406686 * x451
+        + 0.0057078412 * x457
+        + 0.0057078412 * x458
+        + 0.0057078412 * x459
+        + 0.0001406686 * x464
+        + 0.0001406686 * x465
+        - 0.0057078412 * x467
+        + 0.0057078412 * x468
+    )
+    mass[..., 6, 1] = (
+        x1283
+        - x1406 * x5
+        + x1407 * x5
+        + x1408 * x555
+        - x1409 * x555
+        - 3.638748765e-05 * x317 * x5
+        - 0.002401631263312 * x330
+        + 0.002401631263312 * x334
+        - 8.96762325e-07 * x341 * x5
+        + 5.9187720136e-05 * x349
+        - 5.9187720136e-05 * x353
+        - 0.0057078412 * x613
+        + 0.0057078412 * x614
+        + 0.0001406686 * x619
+        + 0.0001406686 * x620
+        - 0.0001406686 * x647
+        + 0.0057078412 * x649
+        - 0.0001406686 * x658
+        + 0.0001406686 * x659
+        + 0.0001406686 * x660
+        + 0.0057078412 * x662
+        + 0.0057078412 * x663
+        + 0.0057078412 * x664
+    )
+    mass[..., 6, 2] = (
+        9.9915760206e-07 * x121 * x320
+        + 2.462403843e-08 * x121 * x326
+        + x1340
+        - x1408 * x21
+        + x1409 * x21
+        - 1.4901024798e-05 * x21 * x320
+        + 0.000604631618316 * x21 * x326
+        + 7.27749753e-05 * x331
+        - 7.27749753e-05 * x332
+        + 1.79352465e-06 * x350
+        + 1.79352465e-06 * x351
+        - 0.0057078412 * x834
+        + 0.0057078412 * x835
+        + 0.0001406686 * x845
+        + 0.0001406686 * x846
+        + 0.0057078412 * x883
+        + 0.0001406686 * x885
+    )
+    mass[..., 6, 3] = (
+        0.0057078412 * x995
+        + 0.0001406686 * x1009
+        - 2.462403843e-08 * x113 * x319
+        - 9.9915760206e-07 * x113 * x327
+        + x1374
+        - 0.001794316959632 * x319
+        + 0.001794316959632 * x321
+        + 4.4220581096e-05 * x327
+        + 1.60926677408e-05 * x328
+        + 4.4220581096e-05 * x342
+        - 0.0006567138703936 * x347
+    )
+    mass[..., 6, 4] = (
+        0.0006567138703936 * x1102
+        - 1.60926677408e-05 * x1104
+        + x1393
+        - 4.924807686e-08 * x1394
+        - 1.99831520412e-06 * x1395
+    )
+    mass[..., 6, 5] = x1405
+    mass[..., 6, 6] = 0.000674120333239
+    coriolis_term[..., 0] = (
+        -0.42076 * x0 * x1444
+        + 0.018653 * x0 * (0.0154502808 * x1419 + x1448 * x1449 - x1451 * x1453)
+        + x0 * (-u2 * x1463 - u2 * x1464 + x1418 * x1462 + 0.011088 * x1419)
+        - x1483 * (x1482 - x1478 - x1480)
+        + x1484 * x1543
+        + x1484 * x1427
+        - x1485 * (-x3 * x1479 + x3 * x1481 + x5 * x1477)
+        + x1489 * x1681
+        + x1493 * x1675
+        + x1494 * x1542
+        + x1494 * x1430
+        - x1509 * x1511
+        + x1509 * x1548
+        + x1509 * x17
+        + x1509 * (x1529 - x1531)
+        + x1510 * x1559
+        - x1510 * x1562
+        - x1511 * x1515
+        + x1512 * x1605
+        + x1512 * (-x1598 - x1601 * x23 + x1602 * x23)
+        + x1512 * (x124 * x1700 + x210 * x1699 + x485 * x23)
+        - x1513 * x1514
+        + x1515 * x1548
+        + x1515 * x17
+        + x1515 * x1574
+        + x1515 * x1605
+        + x1515 * (x124 * x1660 + x406 * x23 + x249 * x210)
+        + x1515 * (x210 * x424 + x333 * x414 + x1817 * x352)
+        + x1523 * x27
+        + x1523 * x1524
+        + x1523 * x29
+        + x1523 * x1551
+        + x1523 * x1587
+        + x1523 * (-x395 - x396 + x1683)
+        + x1523 * (x329 * x414 + x1817 * x348 - x509)
+        + x27 * x1528
+        - x27 * x1645
+        - x27 * x1698
+        + x1524 * x1528
+        - x1524 * x1645
+        - x1524 * x1698
+        + x1525 * x1526
+        + x1525 * x1527
+        + x1525 * x1587
+        + x1525 * (x1592 + x1596)
+        + x1525 * (-x1712 + x1714 - x476)
+        - x1526 * x1644
+        - x1527 * x1644
+        + x1528 * x29
+        + x1528 * (x61 - x62 + x1534 + x1536)
+        + x1537 * x1698
+        - x1539 * (x1530 - x1532 - x1538)
+        + x1542 * x1425
+        + x1542 * x160
+        + x1543 * x1584
+        + x1543 * x1603
+        + x1543 * x1428
+        + x1543 * x1701
+        + x1543 * x1446
+        - x6 * x1568
+        + x6 * x1697
+        + x1545 * x1584
+        + x1545 * x1425
+        + x1545 * x1661
+        + x1545 * x160
+        + x1545 * x1818
+        + x1545 * x1475
+        + x1546 * x1548
+        + x1546 * x17
+        + x1546 * x1574
+        - x1547 * (x3 * x1529 - x3 * x1531 + x5 * x1537)
+        + x1548 * x1561
+        + x29 * x1550
+        + x29 * x1558
+        + x1549 * x1445
+        + x1549 * x1469
+        + x1550 * x1551
+        + x1558 * x1438
+        + x1561 * x1436
+        + x1573 * x8
+        + x1575 * x1425
+        + x1575 * x1459
+        + x90 * x1630
+        + x90 * x1635
+        + x90 * x1768
+        + x90 * x1770
+        + x140 * x1748
+        + x140 * x1749
+        + x1581 * x1802
+        + x1581 * x1803
+        - x1582 * (-x1577 + x1578 * x140 + x1579 * x1581)
+        + x1584 * x1424
+        + x1584 * x1427
+        - x1585 * (-x3 * x301 + x47 * x1581 + x140 * x102)
+        + x1589 * x1444
+        + x1589 * x1445
+        + x1591 * x1847
+        + x1595 * x1836
+        + x1597 * x1635
+        + x1597 * x1857
+        - x1600 * (x1578 * x1591 + x1579 * x1595 - x1599)
+        - x1600 * (x1588 * x294 + x1662 * x1699 + x1272 * x1700)
+        + x1603 * x1427
+        - x1604 * (-x3 * x1598 + x47 * x1595 + x102 * x1591)
+        - x1604 * (x126 * x1700 + x201 * x294 + x212 * x1699)
+        + x1608 * x1630
+        + x1608 * x1636
+        + x1608 * x1681
+        + x1608 * x1768
+        + x1608 * x1770
+        + x1608 * x1857
+        + x25 * x1708
+        + x1424 * x1425
+        + x1424 * x1661
+        + x1424 * x160
+        + x1424 * x1818
+        + x1424 * x1475
+        + x129 * x1710
+        + x129 * x1819
+        + x1425 * x1430
+        + x1425 * x1431
+        + x1630 * x1646
+        + x1630 * x1655
+        + x1630 * x1709
+        + x1630 * x1849
+        + x1630 * x1471
+        + x1635 * x1715
+        + x1636 * x1646
+        + x1636 * x1655
+        + x1636 * x1471
+        - 0.014980125 * x1410 * (x1416 + x1417)
+        + x1644 * x1685
+        + x1644 * (-x1592 - x1596)
+        + x1644 * (x1712 - x1714 + x476)
+        + x1645 * x50
+        + x1645 * x1685
+        + x1645 * x1477
+        + x1645 * (x395 + x396 - x1683)
+        + x1645 * (x1817 * x435 + x414 * x440 + x509)
+        + x1646 * x1681
+        + x1646 * x1768
+        + x1646 * x1770
+        + x1646 * x1857
+        + x1427 * x1428
+        + x1427 * x1701
+        + x1427 * x1446
+        + x1648 * x1654
+        + x1648 * x1657
+        + x1648 * x1675
+        + x1654 * x106
+        + x1654 * x1659
+        + x1654 * x1684
+        + x1654 * x1474
+        + x1654 * (-x41 * x386 + x41 * x1682 + x406)
+        + x1654 * (-x41 * x508 + x343 * x1817 + x322 * x414)
+        + x1655 * x1681
+        + x1655 * x1768
+        + x1655 * x1770
+        + x1655 * x1857
+        + x1656 * x1684
+        + x1656 * (-x1601 + x1602)
+        + x1656 * (-x41 * x1711 + x41 * x1713 + x485)
+        + x1657 * x106
+        + x1657 * x1659
+        + x1657 * x1474
+        + x50 * x1658
+        + x50 * x1698
+        + x1658 * x1477
+        + x106 * x1675
+        + x1659 * x1675
+        + x1430 * x160
+        + x200 * x1916
+        + x249 * x1902
+        + x249 * x2128
+        + x1431 * x1459
+        + x1660 * x1960
+        - x1663 * (x1588 * x200 + x249 * x1662 + x1660 * x1272)
+        - x1663 * (x1662 * x424 + x1817 * x1820 + x414 * x1821)
+        - x1664 * (x126 * x1660 + x200 * x201 + x249 * x212)
+        - x1664 * (x212 * x424 + x335 * x414 + x1817 * x354)
+        - x1433 * (-x3 * x16 + x3 * x17)
+        + 0.009765744929 * x1411 * x2**2
+        - 0.0044673088505 * x1411
+        + x1699 * x2009
+        + x1700 * x1998
+        + x294 * x2012
+        + x1709 * x1768
+        + x1715 * x1770
+        - x1441 * x196
+        + x1441 * (-x1437 - x1439)
+        + x49 * x1778
+        - x196 * x1443
+        - x196 * x1445
+        + x174 * x1816
+        + x1748 * x1751
+        + x1748 * x1754
+        + x1748 * x1757
+        + x1748 * x1772
+        + x1748 * (x290 + x291 + x292 + x293)
+        + x1749 * x1751
+        + x1749 * x1754
+        + x1749 * x1757
+        + x1749 * x1772
+        + x1749 * (x198 + x199)
+        + x1749 * (x1858 + x496)
+        + x1751 * x1847
+        + x1754 * x1847
+        + x1443 * x1468
+        + x1443 * (-x1530 + x1532 + x1538)
+        + x1757 * x1847
+        + x1444 * (x1578 * x294 + x314 * x1699 + x373 * x1700)
+        + x1444 * (x1588 * x1591 + x233 * x1595 + x1599)
+        + x1768 * x1849
+        + x1768 * x1471
+        + x1770 * x1471
+        + x1772 * x1847
+        - 0.018653 * x2 * (x1440 * x1451 - x1449 * x1456 + 0.0154502808 * x1454)
+        + x2 * (-x1495 * x1571 - x1503 * x1565 + x1576 - 0.001043 * x1454)
+        + x2 * (u2 * x1460 + u2 * x1461 - x1452 * x1462 - 0.001072 * x1454)
+        + x1445 * x1468
+        + x1445 * (x1578 * x200 + x249 * x314 + x1660 * x373)
+        + x1445 * (x314 * x424 + x1817 * x480 + x414 * x472)
+        + x1779 * x1802
+        + x1779 * x1803
+        + x1779 * x1836
+        + x1802 * x1804
+        + x1802 * x1807
+        + x1802 * x1808
+        + x1802 * (-x386 + x1682)
+        + x1802 * (-x115 * x1848 + x115 * x503 - x508)
+        + x1803 * x1804
+        + x1803 * x1807
+        + x1803 * x1808
+        + x1803 * (-x1711 + x1713)
+        + x1804 * x1836
+        + x1807 * x1836
+        + x1808 * x1836
+        - x1447 * (x3 * x1436 - x5 * x1438)
+        + x1817 * x2125
+        + x414 * x2083
+        + x424 * x1902
+        + x424 * x2128
+        + x1857 * x1471
+        + x128 * x1926
+        + x217 * x1978
+        + x279 * x1976
+        + x279 * x2158
+        + x1902 * x1903
+        + x1902 * x1904
+        + x1902 * x1905
+        + x1902 * x1906
+        + x1902 * x1917
+        + x1903 * x2009
+        + x1903 * x2128
+        + x1904 * x2009
+        + x1904 * x2128
+        + x1905 * x2009
+        + x1905 * x2128
+        + x1906 * x2009
+        + x1906 * x2128
+        + x1907 * x1916
+        + x1907 * x2012
+        + x1916 * x218
+        + x1916 * x1927
+        + x1916 * x1928
+        + x1916 * x1929
+        + x1916 * (-x1858 - x496)
+        + x218 * x2012
+        + x1917 * x2009
+        + x1917 * x2128
+        + x1927 * x2012
+        + x1928 * x2012
+        + x1929 * x2012
+        + x1930 * x1960
+        + x1930 * x1998
+        + x1468 * x1469
+        + x1960 * x1961
+        + x1960 * x1963
+        + x1960 * x1965
+        + x1960 * x1977
+        + x1960 * (-x1848 + x503)
+        + x1961 * x1998
+        + x1963 * x1998
+        + x1965 * x1998
+        + x1977 * x1998
+        + x337 * x2157
+        + x493 * x2153
+        + x2083 * (-x1510 * x335 + x1606 * x324)
+        + x2083 * (-x200 * x318 + x1660 * x316)
+        + x2083 * (-x15 * x335 + x1613 * x324 - x196 * x472)
+        + x2083 * (x17 * x333 + x196 * x470 + x160 * x324)
+        + x2083 * (x140 * x318 + x316 * x368 + x316 * x1964)
+        + x2083 * (x316 * x1962 + x322 * x1474 + x440 * x1477)
+        - x1415 * (x1437 + x1439)
+        - x1415 * (x1412 + x1414)
+        + x2125 * (-x1510 * x354 + x1606 * x345)
+        + x2125 * (-x200 * x316 - x1660 * x318)
+        + x2125 * (-x15 * x354 + x1613 * x345 - x196 * x480)
+        + x2125 * (x17 * x352 + x196 * x478 + x160 * x345)
+        + x2125 * (x140 * x316 - x318 * x368 - x318 * x1964)
+        + x2125 * (-x318 * x1962 + x343 * x1474 + x435 * x1477)
+        + (-x1412 + x1413) * (-x1418 * x1467 - x1440 * x1448 + x1453 * x1456 - x1466)
+    )
+    coriolis_term[..., 1] = (
+        x2180 * x1445
+        + x2180 * x1469
+        - x2181 * x2216
+        + x2181 * x2220
+        + x2181 * x1509
+        + x2181 * x1515
+        - x2182 * x1523
+        - x2182 * x1528
+        + x2182 * x1645
+        + x2182 * x1698
+        - x2183 * x1525
+        + x2183 * x1644
+        - x646 * x1523
+        + x646 * x1645
+        - x2184 * x1525
+        + x2184 * x1644
+        + x530 * x1630
+        + x530 * x1635
+        + x530 * x1768
+        + x530 * x1770
+        - x1483 * (-x2160 + x2161 + x2166)
+        + x534 * x1748
+        + x534 * x1749
+        + x2187 * x1802
+        + x2187 * x1803
+        + x2189 * x1543
+        + x2189 * x1545
+        + x2189 * x1424
+        + x2189 * x1427
+        + x763 * x1528
+        + x2190 * x1515
+        + x2190 * x1546
+        + x2191 * x1836
+        + x2193 * x1635
+        + x2193 * x1857
+        + x2196 * x1847
+        - x1485 * (x3 * x2165 + x3 * x2168 + x734 * x2167)
+        + x2199 * x1543
+        + x2199 * x1427
+        + x2200 * x1444
+        + x2200 * x1445
+        + x2202 * x1523
+        + x2202 * x1525
+        + x2205 * x1512
+        + x2205 * x1515
+        + x577 * x1916
+        + x2206 * x1902
+        + x2206 * x2128
+        + x2207 * x1960
+        + x2208 * x1545
+        + x2208 * x1424
+        + x2213 * x2009
+        + x2214 * x1998
+        + x685 * x2012
+        + x2215 * x1543
+        + x2215 * x1427
+        - x556 * x1630
+        - x556 * x1768
+        - x556 * x1770
+        - x556 * x1857
+        - x2217 * x1630
+        - x2217 * x1681
+        - x2217 * x1768
+        - x2217 * x1770
+        - x2217 * x1857
+        + x2218 * x1630
+        + x2218 * x1636
+        + x2218 * x1681
+        + x2218 * x1768
+        + x2218 * x1770
+        + x2218 * x1857
+        + x2219 * x1654
+        + x2219 * x1675
+        + x2221 * x1654
+        + x2221 * x1657
+        + x2221 * x1675
+        + x2226 * x1654
+        + x2226 * x1656
+        + x2227 * x1644
+        + x2227 * x1645
+        + x2228 * x1630
+        + x2228 * x1768
+        + x2229 * x1635
+        + x2229 * x1770
+        + x567 * x2083
+        + x568 * x2125
+        + x573 * x1902
+        + x573 * x2128
+        + x2230 * x1545
+        + x2230 * x1424
+        + x561 * x1748
+        + x561 * x1749
+        + x561 * x1847
+        + x2232 * x1748
+        + x2232 * x1749
+        + x2232 * x1847
+        + x564 * x1748
+        + x564 * x1749
+        + x564 * x1847
+        + x636 * x1749
+        + x2233 * x1630
+        + x2233 * x1768
+        + x565 * x1802
+        + x565 * x1803
+        + x565 * x1836
+        - x3 * x1568
+        + x3 * x1697
+        + x716 * x1748
+        + x2235 * x1802
+        + x2235 * x1803
+        + x2235 * x1836
+        + x2236 * x1802
+        + x2236 * x1803
+        + x2236 * x1836
+        + x625 * x1902
+        + x625 * x2009
+        + x625 * x2128
+        + x2237 * x1902
+        + x2237 * x2009
+        + x2237 * x2128
+        + x2238 * x1902
+        + x2238 * x2009
+        + x2238 * x2128
+        + x2239 * x1902
+        + x2239 * x2009
+        + x2239 * x2128
+        + x627 * x1916
+        + x627 * x2012
+        + x637 * x1916
+        + x637 * x2012
+        + x2240 * x1916
+        + x2240 * x2012
+        + x645 * x1916
+        + x645 * x2012
+        + x626 * x1960
+        + x626 * x1998
+        + x2241 * x1960
+        + x2241 * x1998
+        + x2243 * x1960
+        + x2243 * x1998
+        + x2244 * x1960
+        + x2244 * x1998
+        + x624 * x2083
+        + x623 * x2125
+        + x1509 * (x2173 - x2177)
+        + x1512 * (-x2194 + x2197 * x23 - x2198 * x23)
+        + x1512 * (x2213 * x210 + x2214 * x124 + x686 * x23)
+        + 0.84152 * x1513
+        + x1515 * (x578 * x23 + x2206 * x210 + x2207 * x124)
+        + x1515 * (x567 * x333 + x568 * x352 + x573 * x210)
+        + x1523 * (-x641 - x2210 + x2212)
+        + x1523 * (x567 * x329 + x568 * x348 - x639)
+        + x1525 * (x2203 + x2204)
+        + x1525 * (-x2223 + x2225 - x719)
+        - x5 * x1573
+        - x1539 * (x2174 - x2175 - x2178)
+        - x1542 * x628
+        + x1542 * x2179
+        - x1543 * x2159
+        + x1543 * x2171
+        - x1545 * x628
+        + x1545 * x2170
+        - x1547 * (x3 * x2173 - x3 * x2177 + x5 * x752)
+        - 0.328272 * x1559
+        + 0.328272 * x1562
+        + x1575 * x769
+        + x1578 * x1978
+        + 0.115871288 * x1418 * x1451
+        - x1418 * x1461
+        - 6.798123552e-07 * x1419
+        - x1582 * (-x2185 + x534 * x1578 + x2187 * x1579)
+        - x1585 * (-x531 * x3 + x534 * x102 + x2187 * x47)
+        + x1588 * x1816
+        + x233 * x1778
+        - x1600 * (x2191 * x1579 - x2195 + x2196 * x1578)
+        - x1600 * (x2213 * x1662 + x2214 * x1272 + x685 * x1588)
+        - x1604 * (x2191 * x47 - x2194 * x3 + x2196 * x102)
+        - x1604 * (x2213 * x212 + x2214 * x126 + x685 * x201)
+        - x1424 * x628
+        + x1424 * x2170
+        - 0.01275 * x1635 * x555
+        + x1644 * (-x2203 - x2204)
+        + x1644 * (x2223 - x2225 + x719)
+        + x1645 * (x641 + x2210 - x2212)
+        + x1645 * (x567 * x440 + x568 * x435 + x639)
+        - x1427 * x2159
+        + x1427 * x2171
+        + x1654 * x2164
+        + x1654 * (x578 - x2209 * x41 + x2211 * x41)
+        + x1654 * (x567 * x322 + x568 * x343 - x638 * x41)
+        + x1656 * (x2197 - x2198)
+        + x1656 * (x686 - x2222 * x41 + x2224 * x41)
+        + x1657 * x2164
+        - x1430 * x628
+        + x1430 * x2179
+        + x1431 * x769
+        - 0.17485254622664 * x1432
+        - x1663 * (x577 * x1588 + x2206 * x1662 + x2207 * x1272)
+        - x1663 * (x567 * x1821 + x568 * x1820 + x573 * x1662)
+        - x1664 * (x577 * x201 + x2206 * x212 + x2207 * x126)
+        - x1664 * (x567 * x335 + x568 * x354 + x573 * x212)
+        - x1433 * (x38 + 0.21038 * x734)
+        + x1675 * x2172
+        + x1681 * x2176
+        + x314 * x1976
+        + x314 * x2158
+        + x373 * x1926
+        + x1698 * x752
+        - x1708 * x555
+        + x1710 * x537
+        + x1749 * (x607 + x608)
+        + x1443 * (-x2174 + x2175 + x2178)
+        + x1444 * (x2191 * x233 + x2195 + x2196 * x1588)
+        + x1444 * (x2213 * x314 + x2214 * x373 + x685 * x1578)
+        + x1445 * (x577 * x1578 + x2206 * x314 + x2207 * x373)
+        + x1445 * (x567 * x472 + x568 * x480 + x573 * x314)
+        + x1802 * (-x2209 + x2211)
+        + x1802 * (-x638 - x616 * x115 + x617 * x115)
+        + x1803 * (-x2222 + x2224)
+        - x1447 * (0.117892 * x4 + 0.117892 * x734)
+        - x1448 * x1465
+        + 5.11984e-05 * x1451 * x1452
+        + x1819 * x537
+        + x1452 * x1464
+        + 0.002229538962064 * x1454
+        + x480 * x2153
+        + x472 * x2157
+        - x1456 * x1467
+        + x1916 * (-x607 - x608)
+        + x1960 * (-x616 + x617)
+        + x2083 * (x624 - x324 * x628)
+        + x2083 * (-x577 * x318 + x2207 * x316)
+        + x2083 * (x646 * x440 - x317 * x628 + x322 * x2164)
+        + x2083 * (x534 * x318 + x604 * x316 + x2242 * x316)
+        + x2125 * (x623 - x345 * x628)
+        + x2125 * (-x577 * x316 - x2207 * x318)
+        + x2125 * (x646 * x435 + x341 * x628 + x343 * x2164)
+        + x2125 * (x534 * x316 - x604 * x318 - x2242 * x318)
+    )
+    coriolis_term[..., 2] = (
+        -x1483 * (x2299 - x2300 + x2169)
+        - x1485 * (-x3 * x816 - x3 * x583 - 0.20843 * x537)
+        + x2216 * x2304
+        + 0.0255 * x2216
+        - 0.0255 * x2220
+        + x2245 * x1836
+        + x2246 * x1847
+        + x951 * x1698
+        + x960 * x1528
+        + x2247 * x1802
+        + x2247 * x1803
+        + x2248 * x1515
+        + x2248 * x1546
+        + x2254 * x1654
+        + x2254 * x1656
+        + x2256 * x1960
+        + x2256 * x1998
+        + x2258 * x1523
+        + x2258 * x1525
+        + x2259 * x1902
+        + x2259 * x2128
+        + x2260 * x1960
+        + x2261 * x1630
+        + x2261 * x1768
+        + x809 * x1916
+        + x2264 * x2009
+        + x2265 * x1998
+        + x2266 * x1635
+        + x2266 * x1770
+        + 0.0028268411472008 * x1496
+        + x2269 * x2125
+        + x2271 * x2083
+        + x2275 * x1644
+        + x2275 * x1645
+        + x2276 * x1902
+        + x2276 * x2009
+        + x2276 * x2128
+        - 0.0034328411472008 * x1497
+        + x794 * x1748
+        + x794 * x1749
+        + x794 * x1847
+        - x794 * x1916
+        - x794 * x2012
+        + x2278 * x1748
+        + x2278 * x1749
+        + x2278 * x1847
+        - x2279 * x1802
+        - x2279 * x1803
+        - x2279 * x1836
+        + x2280 * x1802
+        + x2280 * x1803
+        + x2280 * x1836
+        + x855 * x1749
+        + x2281 * x1635
+        + x2281 * x1857
+        + x849 * x1902
+        + x849 * x2009
+        + x849 * x2128
+        + x856 * x1960
+        + x856 * x1998
+        + x2282 * x1916
+        + x2282 * x2012
+        + x865 * x2125
+        + x866 * x2083
+        + x2289 * x1444
+        + x2289 * x1445
+        - 0.0028268411472008 * x1499
+        + x805 * x1902
+        + x805 * x2128
+        + x2290 * x1545
+        + x2290 * x1424
+        - 5.11984e-05 * x1500 * x1554
+        - 0.0077274676 * x1500 * x1560
+        + x893 * x2012
+        + x2291 * x1545
+        + x2291 * x1424
+        + x2292 * x1543
+        + x2292 * x1427
+        + x2293 * x1543
+        + x2293 * x1427
+        + x2296 * x1630
+        + x2296 * x1768
+        + x2301 * x1445
+        + x2301 * x1469
+        + x2302 * x1543
+        + x2302 * x1545
+        + x2302 * x1424
+        + x2302 * x1427
+        + 0.017767125 * x1502
+        + x2303 * x1902
+        + x2303 * x2009
+        + x2303 * x2128
+        + x877 * x1960
+        + x877 * x1998
+        + x2305 * x1512
+        + x2305 * x1515
+        + x924 * x1748
+        + x2306 * x1525
+        - x2306 * x1644
+        + x2307 * x1630
+        + x2307 * x1768
+        + x2307 * x1770
+        + x2307 * x1857
+        + x2308 * x1630
+        + x2308 * x1768
+        + x2308 * x1770
+        + 0.0037378477575 * x2309 * x2
+        + 0.0077274676 * x1505 * x1556
+        - 0.017767125 * x1508
+        + x1509 * (-x932 - x933)
+        + x1512 * (x2249 * x23 - x2250 * x23 - x2283)
+        + x1512 * (x2264 * x210 + x2265 * x124 + x894 * x23)
+        + x1515 * (x2259 * x210 + x2260 * x124 + x810 * x23)
+        + x1515 * (x2269 * x352 + x2271 * x333 + x805 * x210)
+        + 6.0358817728e-06 * x1516
+        - 1.30358817728e-05 * x1517
+        + 6.0358817728e-06 * x1518
+        + 5.11984e-05 * x1519 * x1556
+        + x1523 * x878
+        + x1523 * (-x860 - x2294 + x2295)
+        + x1523 * (x2269 * x348 + x2271 * x329 - x858)
+        + x1525 * (x2251 + x2252)
+        + x1525 * (-x2297 + x2298 - x927)
+        + 9.5498296875e-05 * x5 * x1410
+        - x1539 * (-x2285 - x2286 - x2287)
+        - x1547 * (-x3 * x932 - x3 * x933 + x951 * x5)
+        + x1576
+        - x1582 * (x2247 * x1579 - x2288 + x1578 * x954)
+        - x1585 * (x2247 * x47 - x953 * x45 + x102 * x954)
+        - x1600 * (x2245 * x1579 + x2246 * x1578 - x2284)
+        - x1600 * (x2264 * x1662 + x2265 * x1272 + x893 * x1588)
+        - x1604 * (-x3 * x2283 + x2245 * x47 + x2246 * x102)
+        - x1604 * (x2264 * x212 + x2265 * x126 + x893 * x201)
+        - x878 * x1645
+        + x1644 * (-x2251 - x2252)
+        + x1644 * (x2297 - x2298 + x927)
+        + x1645 * (x860 + x2294 - x2295)
+        + x1645 * (x2269 * x435 + x2271 * x440 + x858)
+        - 0.01275 * x1654 * x23
+        + x1654 * (-x2262 * x41 + x2263 * x41 + x810)
+        + x1654 * (x2269 * x343 + x2271 * x322 - x857 * x41)
+        + x1656 * (x2249 - x2250)
+        + x1656 * (x2267 * x41 - x2268 * x41 + x894)
+        + x118 * x1926
+        + x215 * x1976
+        + x215 * x2158
+        - x1663 * (x2259 * x1662 + x2260 * x1272 + x809 * x1588)
+        - x1663 * (x2269 * x1820 + x2271 * x1821 + x805 * x1662)
+        - x1664 * (x2259 * x212 + x2260 * x126 + x809 * x201)
+        - x1664 * (x2269 * x354 + x2271 * x335 + x805 * x212)
+        - 0.021381 * x1675 * x23
+        + 0.021381 * x1681 * x21
+        + x1708 * x21
+        + x1710 * x23
+        + x954 * x1748
+        + x954 * x1749
+        - x954 * x1916
+        - x954 * x2012
+        + x1441 * (-x767 + x768)
+        + x1749 * (x2273 + x2274)
+        + x1443 * x628
+        + x1443 * (x2285 + x2286 + x2287)
+        + x221 * x1778
+        + x1444 * x2159
+        + x1444 * (x2245 * x233 + x2246 * x1588 + x2284)
+        + x1444 * (x2264 * x314 + x2265 * x373 + x893 * x1578)
+        + x1445 * x628
+        + x1445 * (x2259 * x314 + x2260 * x373 + x809 * x1578)
+        + x1445 * (x2269 * x480 + x2271 * x472 + x805 * x314)
+        - x159 * x1816
+        + x159 * x1978
+        + x1802 * (-x2262 + x2263)
+        + x1802 * (-x2270 * x115 + x2272 * x115 - x857)
+        + x1803 * (x2267 - x2268)
+        - x1447 * (x1457 + x1458)
+        + x345 * x2153
+        + x324 * x2157
+        + x1819 * x23
+        - 0.0012075857869362 * x1454
+        + x1916 * (-x2273 - x2274)
+        + x1960 * (-x2270 + x2272)
+        + x2083 * (x866 - x878 * x440)
+        + x2083 * (x2260 * x316 - x809 * x318)
+        + x2083 * (x2255 * x316 + x881 * x326 + x882 * x320)
+        - x1415 * x769
+        + x2125 * (x865 - x878 * x435)
+        + x2125 * (-x2260 * x318 - x809 * x316)
+        + x2125 * (-x2255 * x318 + x881 * x320 - x882 * x326)
+    )
+    coriolis_term[..., 3] = (
+        -x646 * x1445
+        - x2184 * x1444
+        + x763 * x1443
+        - 0.08141975791312 * x35 * x2309
+        + x960 * x1542
+        + x960 * x1430
+        - 0.0859643660835216 * x1496
+        + 0.0942803660835216 * x1497
+        + 0.0859643660835216 * x1499
+        + x2306 * x1543
+        + x2306 * x1427
+        + x1045 * x1635
+        + x1045 * x1857
+        + x971 * x1654
+        + x971 * x1656
+        + x2312 * x1960
+        + x2313 * x2009
+        + x1052 * x1998
+        + x2315 * x1630
+        + x2315 * x1768
+        + x2316 * x1635
+        + x2316 * x1770
+        + x2318 * x2083
+        + x2320 * x2125
+        + x2325 * x1960
+        + x2325 * x1998
+        + x1066 * x1748
+        + x1050 * x2012
+        - x973 * x1902
+        - x973 * x2128
+        + x2326 * x1902
+        + x2326 * x2009
+        + x2326 * x2128
+        + x2327 * x1543
+        + x2327 * x1427
+        + x2328 * x1545
+        + x2328 * x1424
+        - x1076 * x1749
+        + x1076 * x1916
+        + x2329 * x1543
+        + x2329 * x1427
+        + x983 * x1902
+        + x983 * x2128
+        + x2330 * x1545
+        + x2330 * x1424
+        + x2332 * x1630
+        + x2332 * x1768
+        + x2335 * x1444
+        + x2335 * x1445
+        + x1509 * (x63 + x65)
+        + x2336 * x1543
+        + x2336 * x1545
+        + x2336 * x1424
+        + x2336 * x1427
+        + x2338 * x1512
+        + x2338 * x1515
+        - x2341 * x1748
+        - x2341 * x1749
+        + x2341 * x1916
+        + x2341 * x2012
+        + x2342 * x1802
+        + x2342 * x1803
+        - x2344 * x1630
+        - x2344 * x1635
+        - x2344 * x1768
+        - x2344 * x1770
+        + x2345 * x2346
+        + x2346 * x2347
+        - x2346 * x2349
+        - x2348 * x1902
+        - x2348 * x2128
+        + 0.41686 * x1512 * x23
+        + x1512 * (x1042 * x23 + x1043 * x23 - x1060)
+        + x1512 * (x2313 * x210 + x1052 * x124 + x1051 * x23)
+        + x1515 * x2167
+        + x1515 * (x970 * x122 + x2312 * x124 - x973 * x210)
+        + x1515 * (x2318 * x333 + x2320 * x352 + x983 * x210)
+        + x1523 * (-x1022 + x2339 + x2340)
+        + x1523 * (x2318 * x329 + x2320 * x348 - x1020)
+        + x1525 * (-x1067 - x2331 + x1069)
+        - x1539 * x752
+        + x1545 * x878
+        - x1547 * (x1533 + x1535)
+        + 0.387012824 * u1 * x1653
+        + 0.0702096356 * u1 * x1667
+        - 1.67436e-05 * u1 * x1677
+        - x41 * x1816
+        + 0.272313 * x41 * x1836
+        + x41 * x1978
+        - x43 * x1778
+        - 0.272313 * x43 * x1847
+        - x1582 * (x2333 - 0.10593 * x2343 + x137 * x1579)
+        - x1585 * (x527 * x21 - 0.10593 * x2350 + x47 * x137)
+        - x1600 * (-x2337 + x1085 * x1579 - 0.063883 * x2343)
+        - x1600 * (x2313 * x1662 + x1052 * x1272 + x1050 * x1588)
+        - x1604 * (-x3 * x1060 + x1085 * x47 - 0.063883 * x2350)
+        - x1604 * (x2313 * x212 + x1052 * x126 + x1050 * x201)
+        - 2.512544616e-07 * x1610
+        - 2.512544616e-07 * x1612
+        + x1424 * x878
+        + 1.67436e-05 * x1621 * x1673
+        + 0.387012824 * x1622 * x1642
+        - 0.387012824 * x1628 * x1640
+        - 0.0702096356 * x1628 * x1671
+        - 1.67436e-05 * x1628 * x1680
+        + 2.512544616e-07 * x1631
+        - 0.002080193929 * x1410 * x555
+        + 0.0702096356 * x1642 * x1673
+        + x1644 * (x1067 + x2331 - x1069)
+        + x1645 * (x1022 - x2339 - x2340)
+        + x1645 * (x2318 * x440 + x2320 * x435 + x1020)
+        + 0.0035207725448136 * x1649
+        - 0.0035207725448136 * x1650
+        - 0.0035207725448136 * x1651
+        + x1654 * (x2318 * x322 + x2320 * x343 - x1019 * x41)
+        + x1654 * (x2304 * x115 * x261 + x970 * x115 + x2314 * x41)
+        + x1656 * (x1042 + x1043)
+        + x1656 * (x1063 * x41 - x2317 * x41 + x1051)
+        - x1663 * (x2312 * x1272 - x973 * x1662 + x1076 * x1588)
+        - x1663 * (x2318 * x1821 + x2320 * x1820 + x983 * x1662)
+        - x1664 * (x2312 * x126 - x973 * x212 + x1076 * x201)
+        - x1664 * (x2318 * x335 + x2320 * x354 + x983 * x212)
+        + x1696
+        + x1749 * (x2322 + x2323)
+        + x1444 * (-0.063883 * x2334 + x2337 + x1085 * x233)
+        + x1444 * (x2313 * x314 + x1052 * x373 + x1050 * x1578)
+        + x1445 * (x2312 * x373 - x973 * x314 + x1076 * x1578)
+        + x1445 * (x2318 * x472 + x2320 * x480 + x983 * x314)
+        + x1802 * (x2310 * x115 + x2314)
+        + x1802 * (x2319 * x115 - x2321 * x115 - x1019)
+        + x1803 * (x1063 - x2317)
+        + x435 * x2153
+        + x440 * x2157
+        + x1916 * (-x2322 - x2323)
+        - x338 * x1926
+        + x1960 * (x2319 - x2321)
+        + x261 * x1976
+        + x261 * x2158
+        + x2083 * (-0.20843 * x319 + 0.20843 * x321)
+        + x2083 * (x2312 * x316 - 0.10593 * x347)
+        + x2083 * (-x1023 * x327 - 0.10593 * x319 + 0.10593 * x321)
+        + x2125 * (-0.20843 * x327 - 0.20843 * x342)
+        + x2125 * (-x2312 * x318 - 0.10593 * x328)
+        + x2125 * (x1023 * x319 - 0.10593 * x327 - 0.10593 * x342)
+    )
+    coriolis_term[..., 4] = (
+        -x530 * x1582
+        - x2193 * x1600
+        - x2304 * x1654
+        - x2304 * x1656
+        - x2308 * x1543
+        - x2308 * x1545
+        - x2308 * x1424
+        - x2308 * x1427
+        + x1045 * x1525
+        - x2344 * x1523
+        - x2344 * x1525
+        + x2344 * x1644
+        + x2344 * x1645
+        - 0.0003501 * x2345
+        - 0.00982505 * x2347
+        + 0.00982505 * x2349
+        + x1151 * x1748
+        + x2351 * x2083
+        + x2352 * x2125
+        + x1145 * x2012
+        - x1512 * x2373
+        + x1512 * (x41 * x694 - x43 * x131)
+        + x1512 * (-x1147 * x124 + x1146 * x23 + x1148 * x210)
+        + x2357 * x1543
+        + x2357 * x1427
+        + x2358 * x1444
+        + x2358 * x1445
+        + x1167 * x1749
+        - x1167 * x1916
+        + x2359 * x2125
+        - x2360 * x2083
+        + x1101 * x1902
+        + x1101 * x2128
+        + x2361 * x1545
+        + x2361 * x1424
+        + x2363 * x1630
+        + x2363 * x1768
+        + x2365 * x1545
+        + x2365 * x1424
+        + x2366 * x1543
+        + x2366 * x1427
+        + x2367 * x1822
+        + x2367 * x1830
+        + x2368 * x1902
+        + x2368 * x2128
+        + x2369 * x1837
+        + x2369 * x1843
+        + x2370 * x1840
+        - x1515 * x2373
+        + x1515 * (-x807 * x43 + x1023 * x210 - x1107 * x124)
+        + x1515 * (x2351 * x333 + x2352 * x352 + x1101 * x210)
+        - x2371 * x1789
+        - x2371 * x1794
+        - 0.000206331435 * x2372
+        + x1523 * (x1000 + x1012 - x1132)
+        + x1523 * (x2351 * x329 + x2352 * x348 - x1130)
+        + x1525 * (-x1159 - x1160 - x1161)
+        + 0.0063958392 * u2 * x1827
+        - x1585 * (-x45 * x528 + x1088)
+        - x1600 * (x1145 * x1588 - x1147 * x1272 + x1148 * x1662)
+        - x1604 * (x1145 * x201 - x1147 * x126 + x1148 * x212)
+        - x1604 * (x45 * x694 - x100 * x131 - x1853 - x1854)
+        + x1644 * (-x889 - x1044)
+        + x1644 * (x1159 + x1160 + x1161)
+        + x1645 * (x999 + x1013 + x1132)
+        + x1645 * (x2351 * x440 + x2352 * x435 + x1130)
+        - 6.03616743301967e-05 * x1649
+        + 6.03616743301967e-05 * x1650
+        + 6.03616743301967e-05 * x1651
+        + x1654 * (-x998 * x41 - x1110 * x41 - 0.10593 * x261)
+        + x1654 * (x2351 * x322 + x2352 * x343 - x1129 * x41)
+        + x1656 * (-x184 + x186)
+        + x1656 * (-x1153 * x41 - x1154 * x41 + x1146)
+        + x113 * x1926
+        + x115 * x1976
+        + x115 * x2158
+        - x1663 * (x1023 * x1662 - x1107 * x1272 - x1167 * x1588)
+        - x1663 * (x2351 * x1821 + x2352 * x1820 + x1101 * x1662)
+        - x1664 * (x1023 * x212 - x1107 * x126 - x1167 * x201)
+        - x1664 * (x2351 * x335 + x2352 * x354 + x1101 * x212)
+        - 4.33190623e-08 * x1717
+        + 4.33190623e-08 * x1718
+        - 4.33190623e-08 * x1720
+        - 0.000206331435 * x1737 * x1766
+        - 6.781e-07 * x1738 * x1835
+        + 0.000206331435 * x1746 * x1764
+        - 0.0063958392 * x1746 * x1832
+        + 6.781e-07 * x1746 * x1846
+        + x1749 * (x2355 + x2356)
+        + x1444 * (x1145 * x1578 - x1147 * x373 + 0.00965 * x2362)
+        + x1444 * (-x693 - x695 + x675 - x674)
+        + 0.0063958392 * x1766 * x1835
+        + x1445 * (-x1107 * x373 - x1167 * x1578 + 0.00017505 * x2362)
+        + x1445 * (x2351 * x472 + x2352 * x480 + x1101 * x314)
+        - 0.00038672870670405 * x1798
+        + 0.00038672870670405 * x1799
+        + 0.00038672870670405 * x1800
+        + x1802 * (-x998 - x1110)
+        + x1802 * (x2353 * x115 - x2354 * x115 - x1129)
+        + x1803 * (-x1153 - x1154)
+        + x1819
+        + x1916 * (-x2355 - x2356)
+        + x1960 * (x2353 - x2354)
+        + x2083 * (x1167 * x318 - x2360)
+        + x2125 * (x1167 * x316 + x2359)
+        - x1102 * x2153
+        + x1104 * x2157
+    )
+    coriolis_term[..., 5] = (
+        -x577 * x1663
+        - x685 * x1600
+        + x636 * x1445
+        + x716 * x1444
+        + 0.053028558 * u3 * x1957
+        + 0.0308420223 * u3 * x1983
+        + 6.781e-07 * u3 * x2008
+        + x855 * x1545
+        + x855 * x1424
+        + x924 * x1543
+        + x924 * x1427
+        + x2324 * x1654
+        + x1066 * x1644
+        + x1050 * x1525
+        + x1076 * x1523
+        - x1076 * x1645
+        + x1151 * x1635
+        + x1151 * x1770
+        + x1512 * (-x889 * x114 - 1e-06 * x116 - 0.045483 * x121 + x122 * x891)
+        + x1167 * x1630
+        + x1167 * x1768
+        + x2369 * x1999
+        + x2369 * x2004
+        + x2370 * x1855
+        + x2370 * x2006
+        + x1515 * (-x2364 + x137 * x122)
+        + x1515 * (x1177 * x210 + x1178 * x333 - x1179 * x352)
+        + 0.053028558 * x2372
+        + x1177 * x1902
+        + x1177 * x2128
+        + x1180 * x1545
+        + x1180 * x1424
+        + x2376 * x1630
+        + x2376 * x1768
+        + x2377 * x1945
+        + x2377 * x1948
+        + x2378 * x1986
+        + x2378 * x1992
+        + x2379 * x1981
+        + x2379 * x1989
+        + x1523 * (x1178 * x329 - x1179 * x348 - x1193)
+        + 0.053028558 * u2 * x1955
+        - x1604 * (x44 * x679 - x44 * x681 + 0.045483 * x125 + 1e-06 * x211)
+        + x1645 * (x1178 * x440 - x1179 * x435 + x1193)
+        + x1654 * (x1178 * x322 - x1179 * x343 - x1192 * x41)
+        + x1656 * (-x889 * x113 + x115 * x891)
+        + 0.10593 * x115 * x1802
+        - x1663 * (x1177 * x1662 + x1178 * x1821 - x1179 * x1820)
+        - x1664 * (0.10593 * x125 - x1909)
+        - x1664 * (x1177 * x212 + x1178 * x335 - x1179 * x354)
+        + x1445 * (x1177 * x314 + x1178 * x472 - x1179 * x480)
+        - 0.007020102849889 * x1798
+        + 0.007020102849889 * x1799
+        + 0.007020102849889 * x1800
+        + x1802 * (x2374 * x115 + x2375 * x115 - x1192)
+        + x1803 * (-x679 + x681)
+        - 0.135728 * x318 * x2125
+        - x318 * x2157
+        + 0.135728 * x316 * x2083
+        - x316 * x2153
+        + 6.543665e-09 * x1860
+        + 6.543665e-09 * x1862
+        - 6.781e-07 * x1890 * x1996
+        + 0.053028558 * x1891 * x1915
+        - 0.053028558 * x1900 * x1914
+        - 0.0308420223 * x1900 * x1994
+        + 6.781e-07 * x1900 * x2003
+        - 6.543665e-09 * x1908
+        + 0.0308420223 * x1915 * x1996
+        + 0.0003069081642729 * x1958
+        - 0.0003069081642729 * x1959
+        + x1960 * (x2374 + x2375)
+        + x1978
+        - 0.0003069081642729 * x2010
+    )
+    coriolis_term[..., 6] = (
+        -x573 * x1663
+        + x983 * x1523
+        + x1515 * (-x121 * x799 - x121 * x801 + 0.011402 * x332 - 0.000281 * x351)
+        + x1177 * x1749
+        + x1210 * x1630
+        + x1210 * x1768
+        + x1205 * x1545
+        + x1205 * x1424
+        + x2380 * x2044
+        + x2380 * x2064
+        + x2381 * x2031
+        + x2381 * x2057
+        + x2382 * x2018
+        + x2382 * x2039
+        - x2383 * x2103
+        - x2383 * x2118
+        - x2384 * x2093
+        - x2384 * x2115
+        - x2385 * x2087
+        - x2385 * x2100
+        + 0.0057078412 * u4 * x2025
+        - 0.0001406686 * u4 * x2092
+        + x1645 * (-x977 + x978 - x980 - x982)
+        + x1654 * (0.000281 * x327 + x326 * x979 - 0.011402 * x319 + x320 * x981)
+        - x1664
+        * (-0.011402 * x330 + 0.011402 * x334 + 0.000281 * x349 - 0.000281 * x353)
+        + x1445 * (-x569 + x570 - x571 + x572)
+        + x1802 * (x318 * x979 + x316 * x981)
+        + x1916 * (-x1175 + x1176)
+        - 6.5120333239e-05 * x1958
+        + 6.5120333239e-05 * x1959
+        + x1960 * (x799 + x801)
+        + 6.5120333239e-05 * x2010
+        - 0.0001700822520776 * x2014
+        + 0.0001700822520776 * x2015
+        + 0.0001700822520776 * x2017
+        - 0.0057078412 * x2065 * x2072
+        + 0.0057078412 * x2079 * x2081
+        + 4.1916429428e-06 * x2084
+        - 4.1916429428e-06 * x2085
+        + 4.1916429428e-06 * x2086
+        - 0.0001406686 * x2122
+        + 0.0001406686 * x2124
+        + x2158
+    )
+    gravity_term[..., 0] = gravity_acceleration * (
+        0.58632906 * x3 * x0**2 * x5
+        + x2443
+        * (
+            0.029798 * x2439 * x0
+            - 0.000281 * x2425
+            - 0.000281 * x2428
+            + 0.029798 * x2437
+        )
+        + x2453
+        * (-0.029798 * x2446 + x2040 * x2427 - 0.029798 * x2449 + 0.011402 * x2425)
+        + 1.8568 * x2387 * (0.006375 * x22 + 0.006375 * x2388)
+        - x2389 * (-x21 * x726 * x0 - 0.075478 * x22 - x51 * x724 + 1.8e-05 * x35)
+        + x2390 * (0.015006 * x22 + 0.015006 * x2388 - 1.8e-05 * x6)
+        + x2392 * (-0.015006 * x35 + 0.015006 * x36 + 0.075478 * x6)
+        + x2393 * (-0.006375 * x35 + 0.006375 * x36 + 0.20843 * x6)
+        + x2395 * (0.00017505 * x22 * x41 + x2394 * x1760)
+        - x8 * x39
+        - 2.787 * x8 * (-0.006375 * x2 + 0.21038 * x6)
+        - 1.1636 * x8 * (0.006641 * x2 + 0.117892 * x6)
+        + x2400 * (x22 * x137 + x2394 * x2396)
+        + x2402 * (x22 * x1085 + 1e-06 * x35 - 1e-06 * x36 + x2394 * x2401)
+        + x2408 * (-0.00017505 * x35 + 0.00017505 * x36 - x2396 * x2404 + x166)
+        + x2409 * (0.009432 * x35 - 0.009432 * x36 - x2401 * x2404 + 0.063883 * x98)
+        + x2411 * (-x22 * x186 - 0.009432 * x0 * x2394 - 1e-06 * x0 * x2404 + x2410)
+        + x2416 * (-x2396 * x2414 - 0.10593 * x2412)
+        + x2420 * (x1760 * x2414 + 0.00017505 * x2412)
+        + x2420
+        * (-x2439 * x2040 + 0.000281 * x2446 + 0.000281 * x2449 - 0.011402 * x2437)
+        + x2424 * (x2410 + 0.00965 * x2412 + 1e-06 * x2422 + 0.00965 * x2423)
+        - 1.8568 * x6 * (-0.20843 * x22 - x543 * x51)
+        + 1.1636 * x6 * (0.117892 * x8 - 4.4e-05 * x2)
+        + x2432
+        * (0.045483 * x98 + 0.045483 * x2422 - 0.00965 * x2425 - 0.00965 * x2428)
+        + x2433 * (-x1760 * x2427 + x2396 * x2421 + x166 - 0.00017505 * x2425)
+        + x2434 * (-0.045483 * x2412 - 0.045483 * x2423 - 1e-06 * x2425 - 1e-06 * x2428)
+        - x2386 * (-0.006641 * x8 - 4.4e-05 * x6)
+    )
+    gravity_term[..., 1] = gravity_acceleration * (
+        -(x3**2) * x2454
+        + x2443
+        * (-x100 * x2464 + 0.000281 * x2459 - 0.029798 * x470 - 0.029798 * x2462)
+        + x2453
+        * (x100 * x2465 - 0.011402 * x2459 + 0.029798 * x2461 + 0.029798 * x2463)
+        - x734 * x2454
+        - 0.387012824 * x734 * x51
+        - 0.0118371 * x555 * x2387
+        - x2389 * (1.8e-05 * x537 + 0.075478 * x555)
+        + x2390 * (-0.015006 * x555 - x726)
+        + x2392 * (-0.015006 * x537 + x724)
+        + x2393 * (-0.006375 * x537 + x543)
+        - 0.946998516 * x0
+        + x2395 * (-x527 - x528 * x99)
+        + x2400 * (-x532 - x2455 * x99)
+        + x2402 * (1e-06 * x537 - 0.063883 * x100 - 0.063883 * x23 * x99)
+        + 5.11984e-05 * x2
+        + x2408 * (-0.00017505 * x537 + x2457)
+        + x2409 * (x3 * x1085 + 0.009432 * x537 - 0.063883 * x194)
+        + x2411 * (x3 * x1044 + x694 * x99 + x2456)
+        + x39 * x5
+        + x2416 * (x532 * x115 + 0.10593 * x2458)
+        + x2420 * (-x527 * x115 - 0.00017505 * x2458)
+        + x2420
+        * (0.011402 * x470 - 0.000281 * x2461 + 0.011402 * x2462 - 0.000281 * x2463)
+        + x2424 * (x2456 - 0.00965 * x2458 - x2460 * x115)
+        + x2432 * (x3 * x891 - 0.045483 * x194 + 0.00965 * x2459 - x2460 * x113)
+        + x2433 * (-x527 * x113 + x2457 + 0.00017505 * x2459)
+        + x2434
+        * (
+            -1e-06 * x100 * x113
+            + 0.045483 * x100 * x115
+            + 0.045483 * x2458
+            + 1e-06 * x2459
+        )
+        - x2386 * (-4.4e-05 * x3 + 0.006641 * x5)
+    )
+    gravity_term[..., 2] = gravity_acceleration * (
+        x2443
+        * (-0.000281 * x122 + 0.000281 * x214 + 0.029798 * x317 + 0.029798 * x2436)
+        + 0.124859691 * x21 * x41 * x2399
+        + 0.387012824 * x21 * x6
+        + x2453
+        * (0.029798 * x341 - 0.029798 * x2445 + 0.011402 * x122 - 0.011402 * x214)
+        - 0.0257956812 * x23 * x2391
+        + 0.000206331435 * x2466 * x41
+        + 0.0257956812 * x2466
+        - x2389 * (-0.075478 * x21 + 1.8e-05 * x23)
+        + 0.0100396574 * x8
+        + x2402 * (x21 * x1085 + x131)
+        + x2408 * (-x528 + x781)
+        + x2409 * (x694 + 0.063883 * x159)
+        + x2411 * (-x21 * x186 + x2467)
+        + x2416 * (-x137 * x116 - 0.10593 * x114)
+        + x2420 * (0.00017505 * x114 + 0.00017505 * x117)
+        + x2420
+        * (-0.000281 * x341 + 0.000281 * x2445 - 0.011402 * x317 - 0.011402 * x2436)
+        + x2424 * (x2467 + 0.00965 * x114 + 0.00965 * x117)
+        - 5.11984e-05 * x6
+        + x2432 * (0.045483 * x159 - 0.00965 * x122 + 0.00965 * x214)
+        + x2433 * (x781 - 0.00017505 * x122 + 0.00017505 * x214)
+        + x2434 * (x889 * x121 - x891 * x116 - 0.045483 * x114 - 1e-06 * x122)
+    )
+    gravity_term[..., 3] = gravity_acceleration * (
+        x2443 * (-0.029798 * x328 - 0.000281 * x261 - 0.029798 * x326)
+        - 0.4572224596 * x22
+        + x2453 * (-0.029798 * x347 + 0.011402 * x261 + 0.029798 * x320)
+        + x338 * x2468
+        - 8.763003e-05 * x338 * x2419
+        + 1.67436e-05 * x35
+        - 1.67436e-05 * x36
+        - 0.000206331435 * x2387 * x43
+        - 0.4572224596 * x2388
+        + 0.1681787533 * x41 * x2407
+        - 0.1681787533 * x43 * x2399
+        + x2411 * (x1044 + x889)
+        + x2420 * (x979 * x319 + x981 * x327 - 0.000281 * x320 + 0.011402 * x326)
+        + x2424 * (x889 - 0.00965 * x338)
+        + x2432 * (x891 - 0.00965 * x261)
+        + x2433 * (-0.00017505 * x261 + x137)
+        + x2434 * (0.045483 * x338 - 1e-06 * x261)
+    )
+    gravity_term[..., 4] = gravity_acceleration * (
+        x2443 * (-x979 + x2022 * x316)
+        + x2453 * (x981 + x2022 * x318)
+        - x2468 * x113
+        + 6.781e-07 * x2397
+        - 6.781e-07 * x2398
+        + 0.006189507765 * x2405
+        + 0.006189507765 * x2406
+        + 0.00663129503 * x113 * x2419
+        - 0.00663129503 * x115 * x2431
+        + x2420 * (-x2464 * x318 - x2465 * x316)
+        + x2434 * (-0.045483 * x113 - 1e-06 * x115)
+    )
+    gravity_term[..., 5] = gravity_acceleration * (
+        -0.0149168788 * x2442 * x318
+        + 0.0149168788 * x2452 * x316
+        + 6.781e-07 * x2417
+        - 6.781e-07 * x2418
+        + x2420 * (-0.000281 * x316 + 0.011402 * x318)
+        + 0.0838705803 * x2429
+        + 0.0838705803 * x2430
+    )
+    gravity_term[..., 6] = gravity_acceleration * (
+        0.0001406686 * x2440
+        + 0.0001406686 * x2441
+        - 0.0057078412 * x2450
+        + 0.0057078412 * x2451
+    )
+
+
+_dynamics_terms_batch = types.FunctionType(
+    _dynamics_terms.__code__,
+    dict(_dynamics_terms.__globals__, math=_math),
+    _dynamics_terms.__name__,
+)
+
+
+@instrumented
+def dynamics_terms(joint_position, joint_velocity, out=None):
+    """The mass matrix, Coriolis and gravity terms in one call
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+    joint_velocity (array_like): The joint velocities of the robot [rad/s]
+    out (tuple): The (mass, coriolis, gravity) arrays of shapes (7, 7), (7,)
+                 and (7,) the terms are written into, allocated if omitted
+
+    Returns
+    -------
+    ndarray: The mass matrix of the robot
+    ndarray: The Coriolis term of the robot
+    ndarray: The gravity term of the robot
+
+    """
+
+    if out is None:
+        out = numpy.empty((7, 7)), numpy.empty(7), numpy.empty(7)
+    # The expressions run fastest on Python floats
+    _dynamics_terms(
+        numpy.asarray(joint_position, dtype=float).tolist(),
+        numpy.asarray(joint_velocity, dtype=float).tolist(),
+        *out,
+    )
+
+    return out
+
+
+@instrumented
+def dynamics_terms_batch(joint_position, joint_velocity, out=None):
+    """The mass matrix, Coriolis and gravity terms of a batch in one call
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+    joint_velocity (array_like): The joint velocities, shape (N, 7) [rad/s]
+    out (tuple): The (mass, coriolis, gravity) arrays of shapes (N, 7, 7),
+                 (N, 7) and (N, 7) the terms are written into, allocated if
+                 omitted
+
+    Returns
+    -------
+    ndarray: The mass matrices, shape (N, 7, 7)
+    ndarray: The Coriolis terms, shape (N, 7)
+    ndarray: The gravity terms, shape (N, 7)
+
+    """
+
+    joint_position = numpy.asarray(joint_position, dtype=float)
+    if out is None:
+        n_samples = joint_position.shape[0]
+        out = (
+            numpy.empty((n_samples, 7, 7)),
+            numpy.empty((n_samples, 7)),
+            numpy.empty((n_samples, 7)),
+        )
+    _dynamics_terms_batch(
+        joint_position.T, numpy.asarray(joint_velocity, dtype=float).T, *out
+    )
+
+    return out
@@ -0,0 +1,104 @@
+"""External end-effector wrench estimation from joint torques
+
+The external joint torques tau_ext = tau - (M qdd + C + g) are mapped to the
+end-effector wrench F with J^T F = tau_ext. Without damping, the minimum-norm
+least-squares solution is computed for a whole log at once from the
+pseudo-inverses of the Jacobians, which handle singular samples such as the
+zero configuration individually. With a positive damping, which keeps the
+estimate bounded near singularities, it comes from the normal equations
+
+    (J J^T + damping^2 I) F = J tau_ext
+
+Functions
+---------
+wrench_from_torques_batch(joint_position, external_torque, damping)
+external_wrench_batch(joint_position, joint_velocity, joint_acceleration, joint_torque, damping)
+
+"""
+
+import numpy as np
+from kinova_gen3.instrumentation import instrumented
+from kinova_gen3.kinematics.jacobian import jacobian_batch
+from kinova_gen3.dynamics.terms import dynamics_terms_batch
+from kinova_gen3.dynamics.coriolis import coriolis_batch
+from kinova_gen3.dynamics.gravity import gravity_batch
+
+# Singular values of the Jacobian below this fraction of the largest one are
+# treated as zero, the Jacobian is exactly singular at the zero configuration
+_SINGULAR_TOLERANCE = 1e-12
+
+
+@instrumented
+def wrench_from_torques_batch(joint_position, external_torque, damping=0.0):
+    """End-effector wrenches balancing external joint torques
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+    external_torque (array_like): The external joint torques, shape (N, 7) [Nm]
+    damping (float): The damping of the least-squares solution, added
+                     squared to J J^T [m, -]
+
+    Returns
+    -------
+    ndarray: The end-effector wrenches (force, moment) expressed in the base
+             frame, shape (N, 6) [N, Nm]
+
+    """
+
+    jac = jacobian_batch(joint_position)
+    external_torque = np.asarray(external_torque)[..., None]
+
+    if not damping:
+        pseudo_inverse = np.linalg.pinv(jac, rcond=_SINGULAR_TOLERANCE)
+        return (np.swapaxes(pseudo_inverse, -1, -2) @ external_torque)[..., 0]
+
+    normal_matrix = jac @ np.swapaxes(jac, -1, -2)
+    normal_matrix += damping**2 * np.eye(6)
+
+    return np.linalg.solve(normal_matrix, jac @ external_torque)[..., 0]
+
+
+@instrumented
+def external_wrench_batch(joint_position, joint_velocity, joint_acceleration,
+                          joint_torque, damping=0.0):
+    """End-effector wrenches from measured joint torques and states
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+    joint_velocity (array_like): The joint velocities, shape (N, 7) [rad/s]
+    joint_acceleration (array_like): The joint accelerations, shape (N, 7)
+                                     [rad/s^2], None for quasi-static motion
+    joint_torque (array_like): The measured joint torques, shape (N, 7) [Nm]
+    damping (float): The damping of the least-squares solution, added
+                     squared to J J^T [m, -]
+
+    Returns
+    -------
+    ndarray: The end-effector wrenches (force, moment) expressed in the base
+             frame, shape (N, 6) [N, Nm]
+
+    """
+
+    joint_torque = np.asarray(joint_torque)
+
+    # The mass matrix is only evaluated for the inertial term
+    if joint_acceleration is None:
+        external_torque = (
+            joint_torque
+            - coriolis_batch(joint_position, joint_velocity)
+            - gravity_batch(joint_position)
+        )
+    else:
+        mass, coriolis_term, gravity_term = dynamics_terms_batch(
+            joint_position, joint_velocity
+        )
+        external_torque = (
+            joint_torque
+            - coriolis_term
+            - gravity_term
+            - np.einsum("nij,nj->ni", mass, joint_acceleration)
+        )
+
+    return wrench_from_torques_batch(joint_position, external_torque, damping)
@@ -0,0 +1,218 @@
+"""Opt-in timing instrumentation of the kinematics and dynamics functions
+
+Every public function of the kinematics, dynamics and performance_criteria
+modules is wrapped with ``instrumented``. While instrumentation is disabled
+the wrapper only checks a flag before calling the function. When it is
+enabled, the wrapper records the number of calls and the cumulative and
+maximum duration of the function. Durations are inclusive, e.g. the time of
+``multicriteria_ik`` contains the time of the ``jacobian`` calls it makes.
+
+Counters are kept per thread and are only written by their own thread, so
+recording takes no lock. ``snapshot`` sums the counters of all threads.
+
+Instrumentation is enabled with ``enable()`` or by setting the environment
+variable KINOVA_GEN3_INSTRUMENTATION=1 before importing the package.
+
+Functions
+---------
+instrumented(function)
+enable()
+disable()
+is_enabled()
+reset()
+snapshot()
+prometheus_text()
+serve(port, address)
+
+"""
+
+import functools
+import os
+import threading
+import time
+
+_enabled = os.environ.get("KINOVA_GEN3_INSTRUMENTATION", "") not in ("", "0")
+
+# Counters of the current thread: function name -> [calls, total, max]
+_local = threading.local()
+
+# Counters of every thread that recorded a call, appended under the lock
+_registry = []
+_registry_lock = threading.Lock()
+
+
+def _thread_counters():
+    """Counters of the calling thread, registered on first use"""
+
+    try:
+        return _local.counters
+    except AttributeError:
+        counters = {}
+        with _registry_lock:
+            _registry.append(counters)
+        _local.counters = counters
+        return counters
+
+
+def instrumented(function):
+    """Decorator recording the calls and durations of a function
+
+    Arguments
+    ---------
+    function (callable): Function to instrument
+
+    Returns
+    -------
+    callable: Wrapper with the same signature as the function
+
+    """
+
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return function(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            counters = _thread_counters()
+            counter = counters.get(name)
+            if counter is None:
+                counters[name] = [1, duration, duration]
+            else:
+                counter[0] += 1
+                counter[1] += duration
+                if duration > counter[2]:
+                    counter[2] = duration
+
+    return wrapper
+
+
+def enable():
+    """Start recording calls of the instrumented functions"""
+
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording calls of the instrumented functions"""
+
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """Whether calls of the instrumented functions are recorded
+
+    Returns
+    -------
+    bool: True if instrumentation is enabled
+
+    """
+
+    return _enabled
+
+
+def reset():
+    """Clear the counters of all threads"""
+
+    with _registry_lock:
+        for counters in _registry:
+            counters.clear()
+
+
+def snapshot():
+    """Counters summed over all threads
+
+    Returns
+    -------
+    dict: Function name mapped to the number of calls and the cumulative and
+          maximum durations [s]
+
+    """
+
+    with _registry_lock:
+        registry = list(_registry)
+
+    totals = {}
+    for counters in registry:
+        for name, (calls, total, maximum) in list(counters.items()):
+            entry = totals.setdefault(
+                name, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            entry["calls"] += calls
+            entry["total_seconds"] += total
+            entry["max_seconds"] = max(entry["max_seconds"], maximum)
+
+    return totals
+
+
+def prometheus_text():
+    """Counters in the Prometheus text exposition format
+
+    Returns
+    -------
+    str: Calls, cumulative and maximum durations labelled by function
+
+    """
+
+    metrics = [
+        ("kinova_gen3_calls_total", "counter", "Number of calls", "calls"),
+        ("kinova_gen3_duration_seconds_total", "counter",
+         "Cumulative duration of the calls", "total_seconds"),
+        ("kinova_gen3_duration_seconds_max", "gauge",
+         "Maximum duration of a single call", "max_seconds"),
+    ]
+
+    totals = snapshot()
+    lines = []
+    for metric, kind, description, key in metrics:
+        lines.append("# HELP {} {}".format(metric, description))
+        lines.append("# TYPE {} {}".format(metric, kind))
+        for name in sorted(totals):
+            lines.append('{}{{function="{}"}} {!r}'.format(metric, name, totals[name][key]))
+
+    return "\n".join(lines) + "\n"
+
+
+def serve(port=9464, address="127.0.0.1"):
+    """Serve the Prometheus text from a background thread
+
+    Arguments
+    ---------
+    port (int): TCP port, 0 picks a free port
+    address (str): Address to bind, the loopback interface by default
+
+    Returns
+    -------
+    http.server.HTTPServer: The running server, stop it with ``shutdown()``
+
+    """
+
+    # Imported here so that importing the instrumented modules stays cheap
+    import http.server
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        """HTTP handler answering every GET with the Prometheus text"""
+
+        def do_GET(self):
+            body = prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.HTTPServer((address, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server
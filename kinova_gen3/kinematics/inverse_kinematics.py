@@ -11,10 +11,12 @@ multicriteria_ik_damped(joint_position, end_effector_vel)
 
 import numpy as np
 from .jacobian import jacobian
-from performance_criteria.manipulability import manipulability_gradient
-from performance_criteria.joint_limits import joint_limits_gradient
+from kinova_gen3.performance_criteria.manipulability import manipulability_gradient
+from kinova_gen3.performance_criteria.joint_limits import joint_limits_gradient
+from kinova_gen3.instrumentation import instrumented
 
 
+@instrumented
 def inverse_kinematics(joint_position, end_effector_vel):
     """Velocity level inverse kinematics of the robot
 
@@ -50,6 +52,7 @@ def _nullspace_projector(joint_position):
     )
 
 
+@instrumented
 def multicriteria_ik(joint_position, end_effector_vel):
     """Multicriteria Inverse Kinematics algorithm
 
@@ -85,6 +88,7 @@ def multicriteria_ik(joint_position, end_effector_vel):
     )
 
 
+@instrumented
 def inverse_kinematics_dls(joint_position, end_effector_vel, k=0.01):
     """Damped least squares solution for the velocity-level inverse kinematics
 
@@ -110,6 +114,7 @@ def inverse_kinematics_dls(joint_position, end_effector_vel, k=0.01):
     )
 
 
+@instrumented
 def multicriteria_ik_damped(joint_position, end_effector_vel):
     """Multicriteria Inverse Kinematics algorithm with damped least-sjoint_positionuares
 
@@ -3,14 +3,22 @@
 Functions
 ---------
 jacobian(q)
+jacobian_batch(q)
 jacobian_time_derivative(q, qp)
+jacobian_time_derivative_batch(q, qp)
+jacobian_hessian(q)
+jacobian_hessian_batch(q)
 
 """
 
+import inspect
 import math
 import numpy
+from kinova_gen3._batch import batched
+from kinova_gen3.instrumentation import instrumented
 
 
+@instrumented
 def jacobian(q):
     """The Jacobian of the Kinova Gen3 robot
 
@@ -271,6 +279,7 @@ def jacobian(q):
     return geometric_jacobian
 
 
+@instrumented
 def jacobian_time_derivative(q, qp):
     """The time derivative of the Jacobian of the Kinova Gen3 robot
 
@@ -875,3 +884,116 @@ def jacobian_time_derivative(q, qp):
     )
 
     return geometric_jacobian_derivative
+
+
+_jacobian_batch = batched(jacobian)
+
+
+@instrumented
+def jacobian_batch(q, dtype=None):
+    """The Jacobian of the Kinova Gen3 robot for a batch of configurations
+
+    Arguments
+    ---------
+    q (array_like): The joint angles of the robot, shape (N, 7)
+    dtype (data-type): The floating-point type of the evaluation, that of q
+                       if omitted. In float32 the entries deviate from
+                       float64 by less than 1e-6
+
+    Returns
+    -------
+    ndarray: The geometric Jacobian matrices expressed in the base frame,
+             shape (N, 6, 7)
+
+    """
+
+    return _jacobian_batch(q, dtype=dtype)
+
+
+_jacobian_time_derivative_batch = batched(jacobian_time_derivative)
+
+
+@instrumented
+def jacobian_time_derivative_batch(q, qp):
+    """The time derivative of the Jacobian for a batch of states
+
+    Arguments
+    ---------
+    q (array_like): The joint angles of the robot, shape (N, 7)
+    qp (array_like): The joint velocities of the robot, shape (N, 7)
+
+    Returns
+    -------
+    ndarray: The time derivatives of the geometric Jacobian matrices expressed
+             in the base frame, shape (N, 6, 7)
+
+    """
+
+    return _jacobian_time_derivative_batch(q, qp)
+
+
+def _jacobian_hessian(geometric_jacobian):
+    """Partial derivatives of (stacks of) geometric Jacobians of a serial chain
+
+    With the joint axes z_k and the linear velocity columns v_k of the
+    Jacobian, the derivatives of column k with respect to joint i are
+
+        i <= k:  dv_k/dq_i = z_i x v_k,  dz_k/dq_i = z_i x z_k
+        i >  k:  dv_k/dq_i = z_k x v_i,  dz_k/dq_i = 0
+
+    """
+
+    linear = numpy.swapaxes(geometric_jacobian[..., :3, :], -1, -2)
+    axes = numpy.swapaxes(geometric_jacobian[..., 3:, :], -1, -2)
+
+    # All products z_i x v_k and z_i x z_k, shape (..., 7, 7, 3)
+    axis_linear = numpy.cross(axes[..., :, None, :], linear[..., None, :, :])
+    axis_axis = numpy.cross(axes[..., :, None, :], axes[..., None, :, :])
+
+    upper = numpy.triu(numpy.ones((7, 7), dtype=bool))[:, :, None]
+    hessian = numpy.empty(geometric_jacobian.shape[:-2] + (7, 6, 7))
+    hessian[..., :3, :] = numpy.swapaxes(
+        numpy.where(upper, axis_linear, numpy.swapaxes(axis_linear, -2, -3)), -1, -2
+    )
+    hessian[..., 3:, :] = numpy.swapaxes(numpy.where(upper, axis_axis, 0.0), -1, -2)
+
+    return hessian
+
+
+@instrumented
+def jacobian_hessian(q):
+    """The derivatives of the Jacobian of the Kinova Gen3 robot
+
+    Computed from the Jacobian itself with the cross products of the joint
+    axes and the linear velocity columns of the serial chain.
+
+    Arguments
+    ---------
+    q (array_like): The joint angles of the robot
+
+    Returns
+    -------
+    ndarray: The derivatives dJ/dq_i of the geometric Jacobian stacked along
+             the first axis, shape (7, 6, 7)
+
+    """
+
+    return _jacobian_hessian(inspect.unwrap(jacobian)(q))
+
+
+@instrumented
+def jacobian_hessian_batch(q):
+    """The derivatives of the Jacobian for a batch of configurations
+
+    Arguments
+    ---------
+    q (array_like): The joint angles of the robot, shape (N, 7)
+
+    Returns
+    -------
+    ndarray: The derivatives dJ/dq_i of the geometric Jacobians stacked along
+             the second axis, shape (N, 7, 6, 7)
+
+    """
+
+    return _jacobian_hessian(_jacobian_batch(q))
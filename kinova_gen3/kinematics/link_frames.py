@@ -0,0 +1,107 @@
+"""Frames of the links of Kinova Gen3
+
+The frames are composed along the kinematic chain of the robot description,
+where every joint places its child link with a fixed translation and roll,
+followed by the rotation of the joint about its z axis. The last frame is the
+end effector and agrees with ``forward_kinematics``.
+
+Functions
+---------
+link_frames(joint_position)
+link_frames_batch(joint_position)
+
+"""
+
+import numpy as np
+from kinova_gen3.instrumentation import instrumented
+
+# Translations of the joints and of the end effector in their parent frames,
+# all without an x component [m]
+JOINT_TRANSLATIONS = np.array(
+    [
+        [0.0, 0.0, 0.15643],
+        [0.0, 0.005375, -0.12838],
+        [0.0, -0.21038, -0.006375],
+        [0.0, 0.006375, -0.21038],
+        [0.0, -0.20843, -0.006375],
+        [0.0, 0.00017505, -0.10593],
+        [0.0, -0.10593, -0.00017505],
+        [0.0, 0.0, -0.0615],
+    ]
+)
+
+# Rolls of the joints and of the end effector about their parent x axes, all
+# multiples of a quarter turn [rad]
+JOINT_ROLLS = np.array(
+    [np.pi, np.pi / 2, -np.pi / 2, np.pi / 2, -np.pi / 2, np.pi / 2, -np.pi / 2, np.pi]
+)
+
+
+def _link_frames(joint_position):
+    """Link frames along the leading axes of the joint angles"""
+
+    joint_position = np.asarray(joint_position, dtype=float)
+    batch_shape = joint_position.shape[:-1]
+
+    # Coordinates first, so that the arithmetic runs over contiguous batches
+    position = np.zeros((9, 3) + batch_shape)
+    columns = np.zeros((9, 3, 3) + batch_shape)
+    columns[0] = np.eye(3).reshape((3, 3) + (1,) * len(batch_shape))
+
+    cos = np.cos(np.moveaxis(joint_position, -1, 0))
+    sin = np.sin(np.moveaxis(joint_position, -1, 0))
+    roll_cos, roll_sin = np.rint(np.cos(JOINT_ROLLS)), np.rint(np.sin(JOINT_ROLLS))
+
+    # Columns of the parent frame, rolled about x and then rotated about z
+    x, y, z = columns[0]
+    for i in range(8):
+        position[i + 1] = (
+            position[i] + JOINT_TRANSLATIONS[i, 1] * y + JOINT_TRANSLATIONS[i, 2] * z
+        )
+        y, z = roll_cos[i] * y + roll_sin[i] * z, roll_cos[i] * z - roll_sin[i] * y
+        if i < 7:
+            x, y = cos[i] * x + sin[i] * y, cos[i] * y - sin[i] * x
+        columns[i + 1] = x, y, z
+
+    axes = len(batch_shape)
+
+    return (
+        np.moveaxis(position, (0, 1), (axes, axes + 1)),
+        np.moveaxis(columns, (0, 1, 2), (axes, axes + 2, axes + 1)),
+    )
+
+
+@instrumented
+def link_frames(joint_position):
+    """Frames of the base, the seven links and the end effector
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles of the robot [rad]
+
+    Returns
+    -------
+    ndarray: The origins of the frames, shape (9, 3) [m]
+    ndarray: The rotation matrices of the frames, shape (9, 3, 3)
+
+    """
+
+    return _link_frames(joint_position)
+
+
+@instrumented
+def link_frames_batch(joint_position):
+    """Frames of the base, the seven links and the end effector for a batch
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: The origins of the frames, shape (N, 9, 3) [m]
+    ndarray: The rotation matrices of the frames, shape (N, 9, 3, 3)
+
+    """
+
+    return _link_frames(joint_position)
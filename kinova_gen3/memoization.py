@@ -0,0 +1,113 @@
+"""Opt-in memoization of the kinematics and dynamics functions
+
+``memoized`` wraps a function of joint vectors with a bounded least recently
+used cache. The numeric arguments are quantized to a tolerance before they
+are used as the key, so configurations that agree to within the tolerance
+share one entry. Other arguments, e.g. an output format, enter the key
+unchanged and must be hashable. Two configurations closer than the tolerance can still fall on
+different sides of a quantization boundary and miss each other.
+
+Cached results are returned as read-only arrays shared between callers. The
+cache is protected by a lock, which is not held while a missing result is
+computed, so concurrent misses on the same key may compute it more than
+once.
+
+Functions
+---------
+memoized(function, tolerance, maxsize)
+
+"""
+
+import collections
+import functools
+import threading
+import numpy as np
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+def _freeze(value):
+    """Make the arrays of a result read-only, scalars are immutable already"""
+
+    for array in value if isinstance(value, tuple) else (value,):
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+
+    return value
+
+
+def _key_part(argument, tolerance):
+    """Quantized numeric arrays and scalars, any other argument unchanged"""
+
+    array = np.asarray(argument)
+    if array.dtype.kind not in "biuf":
+        return "value", argument
+
+    quantized = np.rint(array.astype(float) / tolerance).astype(np.int64)
+
+    return "array", quantized.shape, quantized.tobytes()
+
+
+def memoized(function, tolerance=1e-9, maxsize=1024):
+    """Wrap a function with a quantized least recently used cache
+
+    Arguments
+    ---------
+    function (callable): Function of joint vectors, e.g. ``mass_matrix``
+    tolerance (float): The quantization step of the arguments [rad, rad/s]
+    maxsize (int): The maximum number of cached results
+
+    Returns
+    -------
+    callable: Wrapper with the same signature as the function, with the
+              methods ``cache_info()`` returning the hits, misses, maximum
+              and current size, and ``cache_clear()``
+
+    """
+
+    if tolerance <= 0.0:
+        raise ValueError("The tolerance must be positive")
+
+    cache = collections.OrderedDict()
+    lock = threading.Lock()
+    counters = [0, 0]
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        key = tuple(_key_part(argument, tolerance) for argument in args) + tuple(
+            (name, _key_part(kwargs[name], tolerance)) for name in sorted(kwargs)
+        )
+
+        with lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+                counters[0] += 1
+                return value
+            counters[1] += 1
+
+        value = _freeze(function(*args, **kwargs))
+
+        with lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+
+        return value
+
+    def cache_info():
+        with lock:
+            return CacheInfo(counters[0], counters[1], maxsize, len(cache))
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            counters[:] = [0, 0]
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+
+    return wrapper
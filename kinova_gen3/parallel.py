@@ -0,0 +1,145 @@
+"""Process-pool evaluation of batched functions over large datasets
+
+The batched kinematics and dynamics functions run on a single core. This
+module shards (N, 7) inputs into contiguous chunks and evaluates them in a
+``multiprocessing`` pool. Inputs and outputs live in shared memory, so only
+chunk boundaries are sent to the workers, and every chunk writes into its own
+slice of the output, which keeps the result ordering deterministic.
+
+Functions
+---------
+parallel_evaluate(function, *arrays, workers=None, chunk_size=None)
+
+"""
+
+import math
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+import numpy
+
+# State of a worker process, set once by the pool initializer
+_worker = {}
+
+
+def _allocate(shape, dtype):
+    """Create a shared memory block and an array view on it"""
+
+    size = max(int(numpy.prod(shape)) * numpy.dtype(dtype).itemsize, 1)
+    block = shared_memory.SharedMemory(create=True, size=size)
+
+    return block, numpy.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _attach(specs):
+    """Attach to shared memory blocks described by (name, shape, dtype)"""
+
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    views = [
+        numpy.ndarray(shape, dtype=dtype, buffer=block.buf)
+        for block, (_, shape, dtype) in zip(blocks, specs)
+    ]
+
+    return blocks, views
+
+
+def _initialize(function, input_specs, output_specs):
+    """Pool initializer attaching the worker to the shared inputs and outputs"""
+
+    input_blocks, inputs = _attach(input_specs)
+    output_blocks, outputs = _attach(output_specs)
+
+    _worker["function"] = function
+    _worker["blocks"] = input_blocks + output_blocks
+    _worker["inputs"] = inputs
+    _worker["outputs"] = outputs
+
+
+def _evaluate_chunk(bounds):
+    """Evaluate one chunk of the inputs and write it into the outputs"""
+
+    start, stop = bounds
+    result = _worker["function"](*(array[start:stop] for array in _worker["inputs"]))
+
+    if not isinstance(result, tuple):
+        result = (result,)
+
+    for output, value in zip(_worker["outputs"], result):
+        output[start:stop] = value
+
+
+def parallel_evaluate(function, *arrays, workers=None, chunk_size=None):
+    """Evaluate a batched function over large inputs in a process pool
+
+    Arguments
+    ---------
+    function (callable): Module-level batched function, e.g. ``mass_matrix_batch``
+    *arrays (array_like): Inputs of the function sharing the leading length N
+    workers (int): Number of worker processes, defaults to the CPU count
+    chunk_size (int): Number of samples per task, defaults to an even split
+                      into four tasks per worker
+
+    Returns
+    -------
+    ndarray or tuple: The results of the function with a leading axis of
+                      length N, in the order of the inputs
+
+    """
+
+    arrays = [numpy.ascontiguousarray(array) for array in arrays]
+    n_samples = arrays[0].shape[0]
+
+    if any(array.shape[0] != n_samples for array in arrays):
+        raise ValueError("All inputs must have the same number of samples")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if chunk_size is None:
+        chunk_size = max(math.ceil(n_samples / (4 * workers)), 1)
+
+    # Evaluate the first sample locally to find the output shapes and types
+    probe = function(*(array[:1] for array in arrays))
+    is_tuple = isinstance(probe, tuple)
+    if not is_tuple:
+        probe = (probe,)
+
+    blocks = []
+    outputs = []
+    view = None
+    try:
+        input_specs = []
+        for array in arrays:
+            block, view = _allocate(array.shape, array.dtype)
+            view[...] = array
+            blocks.append(block)
+            input_specs.append((block.name, array.shape, array.dtype))
+
+        output_specs = []
+        for value in probe:
+            shape = (n_samples,) + value.shape[1:]
+            block, view = _allocate(shape, value.dtype)
+            blocks.append(block)
+            outputs.append(view)
+            output_specs.append((block.name, shape, value.dtype))
+
+        chunks = [
+            (start, min(start + chunk_size, n_samples))
+            for start in range(0, n_samples, chunk_size)
+        ]
+
+        with multiprocessing.Pool(
+            workers, _initialize, (function, input_specs, output_specs)
+        ) as pool:
+            pool.map(_evaluate_chunk, chunks)
+
+        results = tuple(output.copy() for output in outputs)
+    finally:
+        # Release the views before closing the blocks they point into
+        outputs.clear()
+        view = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return results if is_tuple else results[0]
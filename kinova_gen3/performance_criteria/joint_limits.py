@@ -3,14 +3,39 @@
 Functions
 ---------
 joint_limits(joint_position)
+joint_limits_batch(joint_position)
 joint_limits_gradient(joint_position)
 
 """
 
 import numpy as np
-from scipy.optimize import approx_fprime
+from kinova_gen3.instrumentation import instrumented
 
+# Joint position limits of the robot [rad]
+JOINT_POSITION_MIN = (
+    np.array([-180.0, -128.9, -180.0, -147.8, -180.0, -120.3, -180.0]) * np.pi / 180.0
+)
+JOINT_POSITION_MAX = (
+    np.array([180.0, 128.9, 180.0, 147.8, 180.0, 120.3, 180.0]) * np.pi / 180.0
+)
 
+
+def _joint_limits(joint_position):
+    """Joint limits cost along the last axis"""
+
+    joint_position_bar = (JOINT_POSITION_MIN + JOINT_POSITION_MAX) / 2
+
+    return (-1 / (2 * joint_position.shape[-1])) * np.sum(
+        (
+            (joint_position - joint_position_bar)
+            / (JOINT_POSITION_MAX - JOINT_POSITION_MIN)
+        )
+        ** 2,
+        axis=-1,
+    )
+
+
+@instrumented
 def joint_limits(joint_position):
     """Joint limits objective function
 
@@ -27,26 +52,27 @@ def joint_limits(joint_position):
 
     """
 
-    joint_position_min = (
-        np.array([-180.0, -128.9, -180.0, -147.8, -180.0, -120.3, -180.0])
-        * np.pi
-        / 180.0
-    )
-    joint_position_max = (
-        np.array([180.0, 128.9, 180.0, 147.8, 180.0, 120.3, 180.0]) * np.pi / 180.0
-    )
+    return _joint_limits(np.asarray(joint_position))
 
-    joint_position_bar = (joint_position_min + joint_position_max) / 2
 
-    return (-1 / (2 * joint_position.shape[0])) * np.sum(
-        (
-            (joint_position - joint_position_bar)
-            / (joint_position_max - joint_position_min)
-        )
-        ** 2
-    )
+@instrumented
+def joint_limits_batch(joint_position):
+    """Joint limits objective function for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): Joint positions of the robot, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: Cost of every configuration, shape (N,) [non-dimensional]
+
+    """
+
+    return _joint_limits(np.asarray(joint_position))
 
 
+@instrumented
 def joint_limits_gradient(joint_position):
     """Gradient of the joint limits objective function
 
@@ -63,4 +89,6 @@ def joint_limits_gradient(joint_position):
 
     """
 
+    from scipy.optimize import approx_fprime
+
     return approx_fprime(joint_position, joint_limits, np.sqrt(np.finfo(float).eps))
@@ -3,16 +3,18 @@
 Functions
 ---------
 manipulability(joint_position)
+manipulability_batch(joint_position)
 manipulability_gradient(joint_position)
 
 """
 
 import numpy as np
 from numpy.linalg import det
-from scipy.optimize import approx_fprime
-from kinova_gen3.kinematics.jacobian import jacobian
+from kinova_gen3.kinematics.jacobian import jacobian, jacobian_batch
+from kinova_gen3.instrumentation import instrumented
 
 
+@instrumented
 def manipulability(joint_position):
     """Manipulability objective function
 
@@ -31,6 +33,27 @@ def manipulability(joint_position):
     return np.log(det(jacobian(joint_position) @ jacobian(joint_position).transpose()))
 
 
+@instrumented
+def manipulability_batch(joint_position):
+    """Manipulability objective function for a batch of configurations
+
+    Arguments
+    ---------
+    joint_position (array_like): Joint positions of the robot, shape (N, 7) [rad]
+
+    Returns
+    -------
+    ndarray: Manipulability of every configuration, -inf at singularities,
+             shape (N,) [non-dimensional]
+
+    """
+
+    jac = jacobian_batch(joint_position)
+
+    return np.linalg.slogdet(jac @ np.swapaxes(jac, -1, -2))[1]
+
+
+@instrumented
 def manipulability_gradient(joint_position):
     """Gradient of the manipulability objective function
 
@@ -44,4 +67,7 @@ def manipulability_gradient(joint_position):
 
     """
 
+    # scipy is only loaded by the processes that need the gradient
+    from scipy.optimize import approx_fprime
+
     return approx_fprime(joint_position, manipulability, np.sqrt(np.finfo(float).eps))
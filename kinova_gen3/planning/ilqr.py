@@ -0,0 +1,246 @@
+"""Iterative LQR trajectory optimization for Kinova Gen3
+
+The state x = (q, qp) is advanced with the semi-implicit Euler step
+
+    qp' = qp + dt f(q, qp, tau),  q' = q + dt qp'
+
+and the quadratic cost
+
+    sum_t 1/2 (|q_t - q*|^2_Wq + |qp_t|^2_Wv + |tau_t - tau*|^2_Wtau)
+        + 1/2 w_f (|q_T - q*|^2 + |qp_T|^2)
+
+is minimised over the joint torques. The linearizations of the dynamics at
+all knots of the horizon come from one batched call of the exact forward
+dynamics derivatives per iteration. The backward pass uses a
+Levenberg-Marquardt regularisation of the value function and the forward
+pass a backtracking line search.
+
+Functions
+---------
+iterative_lqr(joint_position, joint_velocity, joint_torque, target_position, ...)
+
+"""
+
+import numpy as np
+from kinova_gen3.dynamics.terms import dynamics_terms
+from kinova_gen3.dynamics.gravity import gravity
+from kinova_gen3.dynamics.derivatives import forward_dynamics_derivatives_batch
+
+# Step sizes tried by the line search
+_LINE_SEARCH = 0.5 ** np.arange(10)
+
+# Bounds of the regularisation of the backward pass
+_REGULARIZATION_MIN = 1e-6
+_REGULARIZATION_MAX = 1e10
+
+
+def _rollout(joint_position, joint_velocity, joint_torque, time_step,
+             nominal_state=None, gains=None, offsets=None, alpha=1.0):
+    """Simulate the horizon, optionally with the affine policy of a backward pass"""
+
+    horizon = joint_torque.shape[0]
+    state = np.empty((horizon + 1, 14))
+    torque = np.empty_like(joint_torque)
+    state[0, :7] = joint_position
+    state[0, 7:] = joint_velocity
+
+    for t in range(horizon):
+        torque[t] = joint_torque[t]
+        if gains is not None:
+            torque[t] += alpha * offsets[t] + gains[t] @ (state[t] - nominal_state[t])
+
+        q, qp = state[t, :7], state[t, 7:]
+        mass, coriolis_term, gravity_term = dynamics_terms(q, qp)
+        acceleration = np.linalg.solve(mass, torque[t] - coriolis_term - gravity_term)
+        state[t + 1, 7:] = qp + time_step * acceleration
+        state[t + 1, :7] = q + time_step * state[t + 1, 7:]
+
+    return state, torque
+
+
+def _cost(state, torque, target_position, torque_reference, weights, final_weight):
+    position_weight, velocity_weight, torque_weight = weights
+    position_error = state[:, :7] - target_position
+    velocity = state[:, 7:]
+    torque_error = torque - torque_reference
+
+    return 0.5 * (
+        np.sum(position_weight * position_error[:-1] ** 2)
+        + np.sum(velocity_weight * velocity[:-1] ** 2)
+        + np.sum(torque_weight * torque_error**2)
+        + final_weight * (np.sum(position_error[-1] ** 2) + np.sum(velocity[-1] ** 2))
+    )
+
+
+def _linearize(state, torque, time_step):
+    """State and control matrices of the discrete dynamics at every knot"""
+
+    _, d_position, d_velocity, d_torque = forward_dynamics_derivatives_batch(
+        state[:-1, :7], state[:-1, 7:], torque
+    )
+
+    horizon = torque.shape[0]
+    identity = np.eye(7)
+    velocity_row = np.concatenate(
+        [time_step * d_position, identity + time_step * d_velocity], axis=-1
+    )
+
+    state_matrix = np.empty((horizon, 14, 14))
+    state_matrix[:, 7:] = velocity_row
+    state_matrix[:, :7] = time_step * velocity_row
+    state_matrix[:, :7, :7] += identity
+
+    control_matrix = np.empty((horizon, 14, 7))
+    control_matrix[:, 7:] = time_step * d_torque
+    control_matrix[:, :7] = time_step**2 * d_torque
+
+    return state_matrix, control_matrix
+
+
+def _backward_pass(state, torque, state_matrix, control_matrix, target_position,
+                   torque_reference, weights, final_weight, regularization):
+    """Feedback gains, feedforward offsets and the expected cost reduction terms
+
+    Returns None if a control Hessian is not positive definite.
+
+    """
+
+    position_weight, velocity_weight, torque_weight = weights
+    horizon = torque.shape[0]
+
+    state_weight = np.concatenate([position_weight, velocity_weight])
+    state_error = state.copy()
+    state_error[:, :7] -= target_position
+    torque_gradient = torque_weight * (torque - torque_reference)
+    torque_hessian = np.diag(torque_weight)
+
+    value_gradient = final_weight * state_error[-1]
+    value_hessian = final_weight * np.eye(14)
+
+    gains = np.empty((horizon, 7, 14))
+    offsets = np.empty((horizon, 7))
+    expected = np.zeros(2)
+
+    for t in range(horizon - 1, -1, -1):
+        a, b = state_matrix[t], control_matrix[t]
+
+        q_x = state_weight * state_error[t] + a.T @ value_gradient
+        q_u = torque_gradient[t] + b.T @ value_gradient
+        q_xx = np.diag(state_weight) + a.T @ value_hessian @ a
+        q_uu = torque_hessian + b.T @ value_hessian @ b
+        q_ux = b.T @ value_hessian @ a
+
+        # The gains come from the regularised terms, the value update from
+        # the exact ones
+        try:
+            cholesky_factor = np.linalg.cholesky(q_uu + regularization * b.T @ b)
+        except np.linalg.LinAlgError:
+            return None
+
+        solution = np.linalg.solve(
+            cholesky_factor.T,
+            np.linalg.solve(
+                cholesky_factor,
+                np.column_stack([q_u, q_ux + regularization * b.T @ a]),
+            ),
+        )
+        offsets[t] = -solution[:, 0]
+        gains[t] = -solution[:, 1:]
+
+        k, gain = offsets[t], gains[t]
+        expected += [k @ q_u, 0.5 * k @ q_uu @ k]
+
+        value_gradient = q_x + gain.T @ q_uu @ k + gain.T @ q_u + q_ux.T @ k
+        value_hessian = q_xx + gain.T @ q_uu @ gain + gain.T @ q_ux + q_ux.T @ gain
+        value_hessian = 0.5 * (value_hessian + value_hessian.T)
+
+    return gains, offsets, expected
+
+
+def iterative_lqr(joint_position, joint_velocity, joint_torque, target_position,
+                  time_step=0.01, position_weight=1.0, velocity_weight=0.1,
+                  torque_weight=1e-3, final_weight=100.0, torque_reference=None,
+                  max_iterations=50, tolerance=1e-6):
+    """Torque trajectory driving the robot to a target configuration
+
+    Arguments
+    ---------
+    joint_position (array_like): The initial joint angles [rad]
+    joint_velocity (array_like): The initial joint velocities [rad/s]
+    joint_torque (array_like): The initial guess of the joint torques, shape (T, 7) [Nm]
+    target_position (array_like): The target joint angles [rad]
+    time_step (float): The duration of a knot interval [s]
+    position_weight (array_like): The running weights of the joint angle
+                                  errors, scalar or one per joint
+    velocity_weight (array_like): The running weights of the joint
+                                  velocities, scalar or one per joint
+    torque_weight (array_like): The weights of the joint torque deviations,
+                                scalar or one per joint
+    final_weight (float): The weight of the final state error
+    torque_reference (array_like): The torques the deviations are measured
+                                   from [Nm], the gravity torques at the
+                                   target if omitted
+    max_iterations (int): The maximum number of iterations
+    tolerance (float): The relative cost reduction at which to stop
+
+    Returns
+    -------
+    ndarray: The joint angles at the knots, shape (T + 1, 7) [rad]
+    ndarray: The joint velocities at the knots, shape (T + 1, 7) [rad/s]
+    ndarray: The joint torques of the intervals, shape (T, 7) [Nm]
+    ndarray: The cost after every iteration, starting with the initial guess
+
+    """
+
+    target_position = np.asarray(target_position, dtype=float)
+    if torque_reference is None:
+        torque_reference = gravity(target_position)
+    weights = tuple(
+        np.broadcast_to(np.asarray(weight, dtype=float), (7,))
+        for weight in (position_weight, velocity_weight, torque_weight)
+    )
+    cost_arguments = (target_position, torque_reference, weights, final_weight)
+
+    state, torque = _rollout(
+        joint_position, joint_velocity, np.asarray(joint_torque, dtype=float), time_step
+    )
+    costs = [_cost(state, torque, *cost_arguments)]
+    regularization = 1.0
+
+    for _ in range(max_iterations):
+        state_matrix, control_matrix = _linearize(state, torque, time_step)
+
+        # Increase the regularisation until the backward pass succeeds
+        while True:
+            result = _backward_pass(state, torque, state_matrix, control_matrix,
+                                    *cost_arguments, regularization)
+            if result is not None:
+                break
+            regularization *= 10.0
+            if regularization > _REGULARIZATION_MAX:
+                raise RuntimeError("The backward pass cannot be regularised")
+        gains, offsets, expected = result
+
+        for alpha in _LINE_SEARCH:
+            new_state, new_torque = _rollout(
+                state[0, :7], state[0, 7:], torque, time_step, state, gains, offsets, alpha
+            )
+            new_cost = _cost(new_state, new_torque, *cost_arguments)
+            expected_reduction = -(alpha * expected[0] + alpha**2 * expected[1])
+            if new_cost < costs[-1] - 1e-4 * max(expected_reduction, 0.0):
+                break
+        else:
+            # No improvement along the search direction, regularise more
+            regularization *= 10.0
+            if regularization > _REGULARIZATION_MAX:
+                break
+            continue
+
+        converged = costs[-1] - new_cost < tolerance * costs[-1]
+        state, torque = new_state, new_torque
+        costs.append(new_cost)
+        regularization = max(regularization / 10.0, _REGULARIZATION_MIN)
+        if converged:
+            break
+
+    return state[:, :7], state[:, 7:], torque, np.array(costs)
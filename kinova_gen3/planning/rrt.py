@@ -0,0 +1,197 @@
+"""RRT-Connect motion planning in the joint space of Kinova Gen3
+
+Two trees grow from the start and the goal configuration in turns. An
+iteration extends one tree towards a batch of random samples, one step of at
+most ``step_size`` from the nearest node each, and then tries to connect the
+other tree to every new node with a straight edge. Where the whole edge is
+free the trees meet and the path is returned; otherwise the other tree grows
+to the last free state of the edge.
+
+Every edge is discretized at ``edge_resolution`` and all states of all edges
+of an iteration are validated in one call of the batched link kinematics,
+self-collision and obstacle distances. The trees are stored in arrays of
+nodes and parent indices, and the nearest nodes of a batch of samples are
+found with one vectorized distance computation.
+
+Functions
+---------
+rrt_connect(start_position, goal_position, environment, ...)
+
+"""
+
+import numpy as np
+from kinova_gen3.collision.self_collision import self_collision_distance_batch
+from kinova_gen3.performance_criteria.joint_limits import (
+    JOINT_POSITION_MIN,
+    JOINT_POSITION_MAX,
+)
+
+
+class _Tree:
+    """Array-backed tree of joint configurations"""
+
+    def __init__(self, root, capacity=1024):
+        self.nodes = np.empty((capacity, 7))
+        self.parents = np.empty(capacity, dtype=np.intp)
+        self.squared_norms = np.empty(capacity)
+        self.size = 0
+        self.add(root[None], np.array([-1]))
+
+    def add(self, nodes, parents):
+        """Append nodes and return their indices"""
+
+        end = self.size + nodes.shape[0]
+        if end > self.nodes.shape[0]:
+            capacity = max(2 * self.nodes.shape[0], end)
+            self.nodes = np.resize(self.nodes, (capacity, 7))
+            self.parents = np.resize(self.parents, capacity)
+            self.squared_norms = np.resize(self.squared_norms, capacity)
+
+        self.nodes[self.size : end] = nodes
+        self.parents[self.size : end] = parents
+        self.squared_norms[self.size : end] = np.einsum("ij,ij->i", nodes, nodes)
+        index = np.arange(self.size, end)
+        self.size = end
+
+        return index
+
+    def nearest(self, queries):
+        """Indices of the nodes nearest to every query"""
+
+        nodes = self.nodes[: self.size]
+        squared_distance = self.squared_norms[: self.size] - 2.0 * queries @ nodes.T
+
+        return np.argmin(squared_distance, axis=-1)
+
+    def path(self, index):
+        """Nodes from the root to a node"""
+
+        indices = []
+        while index >= 0:
+            indices.append(index)
+            index = self.parents[index]
+
+        return self.nodes[indices[::-1]]
+
+
+def _free_states(joint_position, environment, clearance):
+    """Whether configurations are within the limits and free of collisions"""
+
+    free = np.all(
+        (joint_position >= JOINT_POSITION_MIN) & (joint_position <= JOINT_POSITION_MAX),
+        axis=-1,
+    )
+    free &= self_collision_distance_batch(joint_position)[0] > clearance
+    if environment is not None:
+        free &= environment.distance_batch(joint_position)[0] > clearance
+
+    return free
+
+
+def _free_prefix(start, end, resolution, environment, clearance):
+    """Fraction of every straight edge that is free from its start
+
+    Returns
+    -------
+    ndarray: The largest validated fraction of every edge, 1 for free edges
+             and 0 where the first step is blocked, shape (B,)
+
+    """
+
+    length = np.max(np.abs(end - start), axis=-1)
+    n_states = max(int(np.ceil(length.max(initial=0.0) / resolution)), 1)
+    fraction = np.arange(1, n_states + 1) / n_states
+
+    states = start[:, None] + fraction[:, None] * (end - start)[:, None]
+    free = _free_states(states.reshape(-1, 7), environment, clearance)
+    free = free.reshape(start.shape[0], n_states)
+
+    # Index of the first blocked state, or all states if none is blocked
+    blocked = np.where(np.all(free, axis=-1), n_states, np.argmin(free, axis=-1))
+
+    return np.concatenate([[0.0], fraction])[blocked]
+
+
+def rrt_connect(
+    start_position,
+    goal_position,
+    environment=None,
+    clearance=0.0,
+    step_size=0.3,
+    edge_resolution=0.02,
+    batch_size=16,
+    max_iterations=1000,
+    seed=None,
+):
+    """Collision-free joint path between two configurations
+
+    Arguments
+    ---------
+    start_position (array_like): The start joint angles [rad]
+    goal_position (array_like): The goal joint angles [rad]
+    environment (Environment): The obstacles to avoid, none if omitted
+    clearance (float): The smallest distance kept between the links and to
+                       the obstacles [m]
+    step_size (float): The largest extension of a tree towards a sample,
+                       in every joint [rad]
+    edge_resolution (float): The largest joint step between validated
+                             states of an edge [rad]
+    batch_size (int): The number of samples drawn per iteration
+    max_iterations (int): The maximum number of iterations
+    seed (int): The seed of the random number generator
+
+    Returns
+    -------
+    ndarray: The waypoints from the start to the goal, with straight edges
+             in joint space, shape (K, 7) [rad], or None if no path was found
+
+    """
+
+    start_position = np.asarray(start_position, dtype=float)
+    goal_position = np.asarray(goal_position, dtype=float)
+    if not np.all(
+        _free_states(np.stack([start_position, goal_position]), environment, clearance)
+    ):
+        raise ValueError("The start and goal configurations must be free")
+
+    edge = (edge_resolution, environment, clearance)
+    if _free_prefix(start_position[None], goal_position[None], *edge)[0] == 1.0:
+        return np.stack([start_position, goal_position])
+
+    rng = np.random.default_rng(seed)
+    trees = (_Tree(start_position), _Tree(goal_position))
+
+    for iteration in range(max_iterations):
+        tree, other = trees[iteration % 2], trees[1 - iteration % 2]
+
+        # Extend the tree one step towards every sample
+        samples = rng.uniform(JOINT_POSITION_MIN, JOINT_POSITION_MAX, (batch_size, 7))
+        near = tree.nearest(samples)
+        offset = samples - tree.nodes[near]
+        scale = np.minimum(1.0, step_size / np.max(np.abs(offset), axis=-1))
+        target = tree.nodes[near] + scale[:, None] * offset
+
+        free = _free_prefix(tree.nodes[near], target, *edge) == 1.0
+        if not np.any(free):
+            continue
+        new = tree.add(target[free], near[free])
+
+        # Connect the other tree to the new nodes as far as the edges are free
+        other_near = other.nearest(tree.nodes[new])
+        reached = _free_prefix(other.nodes[other_near], tree.nodes[new], *edge)
+
+        connected = np.flatnonzero(reached == 1.0)
+        if connected.size:
+            k = connected[0]
+            path = np.concatenate([tree.path(new[k]), other.path(other_near[k])[::-1]])
+            return path if tree is trees[0] else path[::-1]
+
+        grown = reached > 0.0
+        other.add(
+            other.nodes[other_near[grown]]
+            + reached[grown, None]
+            * (tree.nodes[new[grown]] - other.nodes[other_near[grown]]),
+            other_near[grown],
+        )
+
+    return None
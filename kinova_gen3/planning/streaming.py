@@ -0,0 +1,251 @@
+"""Streaming of Cartesian trajectories to joint commands for Kinova Gen3
+
+A trajectory is processed lazily as a chain of generators, so that a long
+trajectory is never held in memory:
+
+    waypoints -> interpolate_poses -> stream_joint_commands -> robot
+
+``interpolate_poses`` moves along straight lines between the waypoint
+positions and along great arcs between their orientations (SLERP), with
+constant linear and angular speed on every segment, and yields a pose and its
+velocity at a fixed rate. ``stream_joint_commands`` follows these poses with
+closed-loop velocity inverse kinematics: the feedforward twist plus a gain
+times the pose error is mapped to joint velocities with a damped
+pseudo-inverse, and a nullspace motion improves the manipulability and keeps
+away from the joint limits as in ``multicriteria_ik``. The forward
+kinematics, the Jacobian and its derivatives are evaluated afresh at every
+step, and the gradients of the criteria are obtained from them in closed
+form. The commanded joint angles and velocities and the intermediate vectors
+are written into buffers allocated once and reused at every step.
+
+Quaternions are stored with the scalar last, (x, y, z, w).
+
+Functions
+---------
+slerp(start, end, fraction)
+interpolate_poses(waypoints, rate, linear_speed, angular_speed)
+stream_joint_commands(joint_position, poses, rate, gain, damping)
+
+"""
+
+import numpy as np
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics
+from kinova_gen3.kinematics.jacobian import jacobian, _jacobian_hessian
+from kinova_gen3.performance_criteria.joint_limits import (
+    JOINT_POSITION_MIN,
+    JOINT_POSITION_MAX,
+)
+
+# Weight of the manipulability against the joint limits and the gain of the
+# nullspace motion, as in multicriteria_ik
+_MANIPULABILITY_WEIGHT = 0.75
+_NULLSPACE_GAIN = 5.0
+
+# Gradient of the joint limits objective per offset from the middle of the
+# joint ranges
+_JOINT_LIMITS_SCALE = -1.0 / (7 * (JOINT_POSITION_MAX - JOINT_POSITION_MIN) ** 2)
+_JOINT_POSITION_MIDDLE = (JOINT_POSITION_MIN + JOINT_POSITION_MAX) / 2
+
+
+def _multiply(a, b):
+    """Hamilton product of quaternions"""
+
+    vector_a, scalar_a = a[:3], a[3]
+    vector_b, scalar_b = b[:3], b[3]
+
+    return np.concatenate(
+        [
+            scalar_a * vector_b + scalar_b * vector_a + np.cross(vector_a, vector_b),
+            [scalar_a * scalar_b - vector_a @ vector_b],
+        ]
+    )
+
+
+def _conjugate(quaternion):
+    return np.concatenate([-quaternion[:3], quaternion[3:]])
+
+
+def _rotation_vector(quaternion):
+    """Axis times angle of a rotation, taking the shorter way round"""
+
+    if quaternion[3] < 0.0:
+        quaternion = -quaternion
+    sine = np.linalg.norm(quaternion[:3])
+    angle = 2.0 * np.arctan2(sine, quaternion[3])
+
+    return quaternion[:3] * (angle / sine if sine > 1e-12 else 2.0)
+
+
+def slerp(start, end, fraction):
+    """Spherical linear interpolation of unit quaternions
+
+    Arguments
+    ---------
+    start (array_like): The quaternion at fraction 0, (x, y, z, w)
+    end (array_like): The quaternion at fraction 1, (x, y, z, w)
+    fraction (float): The position between the quaternions, in [0, 1]
+
+    Returns
+    -------
+    ndarray: The interpolated unit quaternion along the shorter arc
+
+    """
+
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    cosine = start @ end
+    if cosine < 0.0:
+        end, cosine = -end, -cosine
+
+    # Nearly equal orientations, where the weights of the arc lose precision
+    if cosine > 1.0 - 1e-12:
+        quaternion = start + fraction * (end - start)
+        return quaternion / np.linalg.norm(quaternion)
+
+    angle = np.arccos(cosine)
+
+    return (
+        np.sin((1.0 - fraction) * angle) * start + np.sin(fraction * angle) * end
+    ) / np.sin(angle)
+
+
+def interpolate_poses(waypoints, rate, linear_speed=0.1, angular_speed=0.5):
+    """End-effector poses between waypoints, sampled at a fixed rate
+
+    Every segment takes the time of its slower component, so the position or
+    the orientation moves at its maximum speed and the other follows. The
+    samples are spaced equally in time across the segments, starting one
+    period after the first waypoint, and the last one is at the last
+    waypoint. Without any motion, i.e. a single waypoint or identical ones,
+    the pose is held for one sample.
+
+    Arguments
+    ---------
+    waypoints (iterable): The (position, quaternion) pairs to pass, consumed
+                          lazily, [m] and (x, y, z, w)
+    rate (float): The number of samples per second [Hz]
+    linear_speed (float): The maximum speed of the position [m/s]
+    angular_speed (float): The maximum speed of the orientation [rad/s]
+
+    Yields
+    ------
+    ndarray: The position of the end effector [m]
+    ndarray: The orientation of the end effector, (x, y, z, w)
+    ndarray: The twist of the end effector, linear and angular velocity in
+             the base frame, shape (6,) [m/s, rad/s]
+
+    """
+
+    period = 1.0 / rate
+    waypoints = iter(waypoints)
+    try:
+        position, quaternion = (np.asarray(x, dtype=float) for x in next(waypoints))
+    except StopIteration:
+        return
+
+    # Time from the start of the current segment to the next sample
+    time = period
+    sampled = False
+
+    for next_position, next_quaternion in waypoints:
+        next_position = np.asarray(next_position, dtype=float)
+        next_quaternion = np.asarray(next_quaternion, dtype=float)
+        if quaternion @ next_quaternion < 0.0:
+            next_quaternion = -next_quaternion
+
+        displacement = next_position - position
+        rotation = _rotation_vector(_multiply(next_quaternion, _conjugate(quaternion)))
+        duration = max(
+            np.linalg.norm(displacement) / linear_speed,
+            np.linalg.norm(rotation) / angular_speed,
+        )
+
+        if duration > 0.0:
+            twist = np.concatenate([displacement, rotation]) / duration
+            # Samples within the segment, the last one at its end at the latest
+            while time <= duration + 1e-9 * period:
+                fraction = min(time / duration, 1.0)
+                yield (
+                    position + fraction * displacement,
+                    slerp(quaternion, next_quaternion, fraction),
+                    twist,
+                )
+                sampled = True
+                time += period
+            time -= duration
+
+        position, quaternion = next_position, next_quaternion
+
+    # The last waypoint, where the final period was cut short or nothing was
+    # sampled yet
+    if not sampled or time < (1.0 - 1e-9) * period:
+        yield position, quaternion, np.zeros(6)
+
+
+def stream_joint_commands(joint_position, poses, rate, gain=10.0, damping=0.01):
+    """Joint commands following a stream of end-effector poses
+
+    The returned arrays are buffers that are overwritten at the next step, so
+    they must be copied to be kept.
+
+    Arguments
+    ---------
+    joint_position (array_like): The joint angles at the start [rad]
+    poses (iterable): The (position, quaternion, twist) samples of the
+                      end-effector trajectory, e.g. from interpolate_poses
+    rate (float): The number of samples per second [Hz]
+    gain (float): The gain of the pose error feedback [1/s]
+    damping (float): The damping of the pseudo-inverse, added squared to
+                     J J^T [m, -]
+
+    Yields
+    ------
+    ndarray: The commanded joint angles [rad]
+    ndarray: The commanded joint velocities [rad/s]
+
+    """
+
+    period = 1.0 / rate
+    joint_position = np.array(joint_position, dtype=float)
+    joint_velocity = np.empty(7)
+    criteria = np.empty(7)
+    twist = np.empty(6)
+    projected = np.empty(6)
+    gram = np.empty((6, 6))
+
+    for position, quaternion, feedforward in poses:
+        pose = forward_kinematics(joint_position, output="pose")
+        geometric_jacobian = jacobian(joint_position)
+
+        # Commanded twist with the feedback of the pose error
+        np.subtract(position, pose[:3], out=twist[:3])
+        twist[3:] = _rotation_vector(_multiply(quaternion, _conjugate(pose[3:])))
+        twist *= gain
+        twist += feedforward
+
+        # Damped pseudo-inverse J^T (J J^T + d^2 I)^-1 = weighted^T
+        np.matmul(geometric_jacobian, geometric_jacobian.T, out=gram)
+        gram.flat[::7] += damping**2
+        weighted = np.linalg.solve(gram, geometric_jacobian)
+
+        # Gradients of the manipulability log det(J J^T) and the joint limits
+        np.einsum(
+            "kbj,bj->k", _jacobian_hessian(geometric_jacobian), weighted, out=criteria
+        )
+        criteria *= 2.0 * _MANIPULABILITY_WEIGHT
+        criteria += (
+            (1.0 - _MANIPULABILITY_WEIGHT)
+            * _JOINT_LIMITS_SCALE
+            * (joint_position - _JOINT_POSITION_MIDDLE)
+        )
+
+        # Task velocity plus the nullspace projection of the gradients
+        np.matmul(weighted.T, twist, out=joint_velocity)
+        np.matmul(geometric_jacobian, criteria, out=projected)
+        criteria -= weighted.T @ projected
+        criteria *= _NULLSPACE_GAIN
+        joint_velocity += criteria
+
+        joint_position += period * joint_velocity
+
+        yield joint_position, joint_velocity
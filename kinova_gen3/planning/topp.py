@@ -0,0 +1,207 @@
+"""Time-optimal path parameterization under torque and velocity limits
+
+The joint path q(s) is retimed with reachability analysis (TOPP-RA). With
+x = sdot^2 and u = sddot the joint torques along the path are
+
+    tau = a(s) u + b(s) x + c(s),
+    a = M q',  b = M q'' + C(q, q') q',  c = g(q)
+
+so the limits become linear constraints on (u, x) at every gridpoint. The
+dynamic terms of all gridpoints are evaluated in one batched call. A backward
+pass computes the controllable sets of x, each a two-variable linear program
+solved by enumerating the vertices of the constraint polygon, and a forward
+pass picks the largest admissible u at every gridpoint with interval
+operations.
+
+Functions
+---------
+time_optimal_parameterization(path, torque_limit, velocity_limit, gridpoints)
+
+"""
+
+import numpy as np
+from kinova_gen3.dynamics.terms import dynamics_terms_batch
+
+# Bounds on u and x keeping every linear program bounded
+_BOX = 1e9
+
+# Feasibility tolerance of the normalised constraints
+_TOLERANCE = 1e-9
+
+
+def _path_constraints(path, gridpoints, torque_limit, velocity_limit):
+    """Constraints G [u, x] <= h of all gridpoints, shapes (K, m, 2) and (K, m)"""
+
+    dq = np.gradient(path, gridpoints, axis=0, edge_order=2)
+    ddq = np.gradient(dq, gridpoints, axis=0, edge_order=2)
+
+    mass, coriolis_term, gravity_term = dynamics_terms_batch(path, dq)
+    a = np.einsum("kij,kj->ki", mass, dq)
+    b = np.einsum("kij,kj->ki", mass, ddq) + coriolis_term
+    c = gravity_term
+
+    n_points = path.shape[0]
+    rows = [
+        np.stack([a, b], axis=-1),
+        np.stack([-a, -b], axis=-1),
+        np.broadcast_to([[[1.0, 0.0], [-1.0, 0.0], [0.0, 1.0], [0.0, -1.0]]],
+                        (n_points, 4, 2)),
+    ]
+    bounds = [
+        torque_limit - c,
+        torque_limit + c,
+        np.broadcast_to([_BOX, _BOX, _BOX, 0.0], (n_points, 4)),
+    ]
+
+    if velocity_limit is not None:
+        with np.errstate(divide="ignore"):
+            x_max = np.min((velocity_limit / np.abs(dq)) ** 2, axis=1)
+        rows.append(np.broadcast_to([[[0.0, 1.0]]], (n_points, 1, 2)))
+        bounds.append(np.minimum(x_max, _BOX)[:, None])
+
+    g = np.concatenate(rows, axis=1)
+    h = np.concatenate(bounds, axis=1)
+
+    # Normalise the rows so that one tolerance fits all constraints
+    norm = np.linalg.norm(g, axis=-1)
+    norm[norm == 0.0] = 1.0
+
+    return g / norm[..., None], h / norm, dq, ddq
+
+
+def _linear_program(g, h, objective):
+    """Maximise objective . y subject to g y <= h over y in R^2
+
+    Returns the optimal y, or None if the constraints are infeasible.
+
+    """
+
+    i, j = np.triu_indices(h.shape[0], 1)
+    det = g[i, 0] * g[j, 1] - g[i, 1] * g[j, 0]
+    regular = np.abs(det) > 1e-12
+    i, j, det = i[regular], j[regular], det[regular]
+
+    # Intersections of every pair of constraint lines (Cramer's rule)
+    vertices = np.stack(
+        [
+            (h[i] * g[j, 1] - h[j] * g[i, 1]) / det,
+            (g[i, 0] * h[j] - g[j, 0] * h[i]) / det,
+        ],
+        axis=-1,
+    )
+
+    # Tolerance relative to the magnitude of the terms of every product
+    tolerance = _TOLERANCE * (1.0 + np.abs(h) + np.abs(vertices) @ np.abs(g).T)
+    feasible = np.all(vertices @ g.T <= h + tolerance, axis=1)
+    if not np.any(feasible):
+        return None
+
+    vertices = vertices[feasible]
+
+    return vertices[np.argmax(vertices @ objective)]
+
+
+def _controllable_interval(g, h, step, target):
+    """Interval of x from which the target interval is reachable in one step"""
+
+    # x + 2 step u must lie in the target interval
+    g = np.concatenate([g, [[2.0 * step, 1.0], [-2.0 * step, -1.0]]])
+    h = np.concatenate([h, [target[1], -target[0]]])
+
+    highest = _linear_program(g, h, np.array([0.0, 1.0]))
+    if highest is None:
+        return None
+    lowest = _linear_program(g, h, np.array([0.0, -1.0]))
+
+    return max(lowest[1], 0.0), highest[1]
+
+
+def _largest_control(g, h, x, step, target):
+    """Largest admissible u at a fixed x reaching the target interval"""
+
+    # Constraints on u alone: g_u u <= h - g_x x
+    g_u = np.concatenate([g[:, 0], [2.0 * step, -2.0 * step]])
+    rhs = np.concatenate([h - g[:, 1] * x, [target[1] - x, x - target[0]]])
+
+    tolerance = _TOLERANCE * np.maximum(1.0, np.abs(rhs))
+
+    return np.min((rhs + tolerance)[g_u > 0] / g_u[g_u > 0])
+
+
+def _control_interval(g, h, x):
+    """Interval of the admissible u at a fixed x, empty if lower > upper"""
+
+    g_u = g[:, 0]
+    rhs = h - g[:, 1] * x
+    bound = (rhs + _TOLERANCE * np.maximum(1.0, np.abs(rhs))) / np.where(
+        g_u == 0.0, 1.0, g_u
+    )
+
+    return np.max(bound[g_u < 0]), np.min(bound[g_u > 0])
+
+
+def time_optimal_parameterization(path, torque_limit, velocity_limit=None, gridpoints=None):
+    """Time-optimal retiming of a joint path starting and ending at rest
+
+    Arguments
+    ---------
+    path (array_like): The joint angles along the path, shape (K, 7) [rad]
+    torque_limit (array_like): The joint torque limits |tau| <= limit,
+                               scalar or one per joint [Nm]
+    velocity_limit (array_like): The joint velocity limits, scalar or one
+                                 per joint [rad/s], unlimited if omitted
+    gridpoints (array_like): The path parameter of the samples, shape (K,),
+                             defaults to K evenly spaced values in [0, 1]
+
+    Returns
+    -------
+    ndarray: The time at every sample, shape (K,) [s]
+    ndarray: The joint velocities at every sample, shape (K, 7) [rad/s]
+    ndarray: The joint accelerations at every sample, shape (K, 7) [rad/s^2]
+
+    """
+
+    path = np.asarray(path, dtype=float)
+    n_points = path.shape[0]
+    if gridpoints is None:
+        gridpoints = np.linspace(0.0, 1.0, n_points)
+    gridpoints = np.asarray(gridpoints, dtype=float)
+    steps = np.diff(gridpoints)
+
+    g, h, dq, ddq = _path_constraints(
+        path, gridpoints, np.asarray(torque_limit, dtype=float), velocity_limit
+    )
+
+    # Backward pass: controllable sets, the path ends at rest
+    controllable = np.zeros((n_points, 2))
+    for k in range(n_points - 2, -1, -1):
+        interval = _controllable_interval(g[k], h[k], steps[k], controllable[k + 1])
+        if interval is None or interval[0] > interval[1]:
+            raise ValueError("The path cannot be followed within the limits")
+        controllable[k] = interval
+
+    if controllable[0, 0] > 0.0:
+        raise ValueError("The path cannot start at rest within the limits")
+
+    # Forward pass: greedy largest acceleration, the path starts at rest
+    x = np.zeros(n_points)
+    u = np.zeros(n_points)
+    for k in range(n_points - 1):
+        u[k] = _largest_control(g[k], h[k], x[k], steps[k], controllable[k + 1])
+        x[k + 1] = np.clip(x[k] + 2.0 * steps[k] * u[k], *controllable[k + 1])
+
+    # The last gridpoint has no interval ahead, its acceleration is the one
+    # closest to the previous control that satisfies its own constraints
+    lower, upper = _control_interval(g[-1], h[-1], x[-1])
+    if lower > upper:
+        raise ValueError("The path cannot end at rest within the limits")
+    u[-1] = np.clip(u[-2], lower, upper)
+
+    sdot = np.sqrt(x)
+    durations = 2.0 * steps / (sdot[:-1] + sdot[1:])
+    time = np.concatenate([[0.0], np.cumsum(durations)])
+
+    joint_velocity = dq * sdot[:, None]
+    joint_acceleration = dq * u[:, None] + ddq * x[:, None]
+
+    return time, joint_velocity, joint_acceleration
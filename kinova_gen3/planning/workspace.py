@@ -0,0 +1,182 @@
+"""Reachability and dexterity map of the Kinova Gen3 workspace
+
+Joint configurations are sampled uniformly within the joint limits and
+evaluated in chunks with the batched forward kinematics, manipulability and
+joint limit scores. Every end-effector position falls into a voxel of a
+regular grid over a box around the reachable workspace, which records
+
+    count           the number of samples reaching the voxel
+    manipulability  the best manipulability of these samples
+    joint_limits    the best joint limit score of these samples
+
+The grid is a structured ``.npy`` file of 12 bytes per voxel, opened as a
+read-only memory map, and a query only computes the voxel index of a position
+and reads its record.
+
+Classes
+-------
+WorkspaceMap
+
+"""
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics_batch
+from kinova_gen3.performance_criteria.joint_limits import (
+    JOINT_POSITION_MIN,
+    JOINT_POSITION_MAX,
+    joint_limits_batch,
+)
+from kinova_gen3.performance_criteria.manipulability import manipulability_batch
+
+# Box around the reachable workspace, the arm reaches 0.91 m from the
+# shoulder at 0.28 m above the base [m]
+WORKSPACE_LOWER = np.array([-0.95, -0.95, -0.65])
+WORKSPACE_UPPER = np.array([0.95, 0.95, 1.25])
+
+# Record of a voxel
+VOXEL_DTYPE = np.dtype([("count", "<u4"), ("manipulability", "<f4"), ("joint_limits", "<f4")])
+
+# Record of the voxels that no sample reaches
+_UNREACHED = np.array((0, -np.inf, -np.inf), dtype=VOXEL_DTYPE)
+
+
+class WorkspaceMap:
+    """Memory-mapped voxel grid of reachability and dexterity
+
+    Attributes
+    ----------
+    grid (ndarray): The records of the voxels, shape (nx, ny, nz)
+    voxel_size (ndarray): The edge lengths of a voxel, shape (3,) [m]
+
+    Methods
+    -------
+    build(path, samples, voxel_size, chunk_size, seed)
+        Sample the joint space and write a map to disk
+    voxel_index(position)
+        The voxel of positions and whether they lie inside the grid
+    query(position)
+        The records of the voxels of positions
+    reachable(position)
+        Whether any sample reached the voxels of positions
+
+    """
+
+    def __init__(self, path):
+        """Open a map written by ``WorkspaceMap.build``
+
+        Arguments
+        ---------
+        path (str): The path of the map file
+
+        """
+
+        self.grid = np.load(path, mmap_mode="r")
+        self.voxel_size = (WORKSPACE_UPPER - WORKSPACE_LOWER) / self.grid.shape
+
+    @classmethod
+    def build(cls, path, samples=1000000, voxel_size=0.05, chunk_size=100000, seed=None):
+        """Sample the joint space and write a workspace map to disk
+
+        Arguments
+        ---------
+        path (str): The path of the map file to create
+        samples (int): The number of joint configurations to sample
+        voxel_size (float): The largest edge length of a voxel [m]
+        chunk_size (int): The number of configurations evaluated per batch
+        seed (int): The seed of the random number generator
+
+        Returns
+        -------
+        WorkspaceMap: The map opened from the new file
+
+        """
+
+        shape = tuple(int(n) for n in np.ceil((WORKSPACE_UPPER - WORKSPACE_LOWER) / voxel_size))
+        size = int(np.prod(shape))
+        rng = np.random.default_rng(seed)
+
+        count = np.zeros(size, dtype=np.uint32)
+        manipulability = np.full(size, -np.inf, dtype=np.float32)
+        joint_limit_score = np.full(size, -np.inf, dtype=np.float32)
+
+        for start in range(0, samples, chunk_size):
+            joint_position = rng.uniform(
+                JOINT_POSITION_MIN, JOINT_POSITION_MAX, (min(chunk_size, samples - start), 7)
+            )
+            position, _ = forward_kinematics_batch(joint_position)
+
+            index, inside = _voxel_index(position, shape)
+            flat = np.ravel_multi_index(tuple(np.moveaxis(index[inside], -1, 0)), shape)
+
+            count += np.bincount(flat, minlength=size).astype(np.uint32)
+            np.maximum.at(manipulability, flat, manipulability_batch(joint_position[inside]))
+            np.maximum.at(joint_limit_score, flat, joint_limits_batch(joint_position[inside]))
+
+        grid = open_memmap(path, mode="w+", dtype=VOXEL_DTYPE, shape=shape)
+        grid["count"] = count.reshape(shape)
+        grid["manipulability"] = manipulability.reshape(shape)
+        grid["joint_limits"] = joint_limit_score.reshape(shape)
+        grid.flush()
+        del grid
+
+        return cls(path)
+
+    def voxel_index(self, position):
+        """The voxels containing end-effector positions
+
+        Arguments
+        ---------
+        position (array_like): The positions, shape (..., 3) [m]
+
+        Returns
+        -------
+        ndarray: The voxel indices, clipped to the grid, shape (..., 3)
+        ndarray: Whether the positions lie inside the grid, shape (...)
+
+        """
+
+        return _voxel_index(position, self.grid.shape)
+
+    def query(self, position):
+        """The records of the voxels containing end-effector positions
+
+        Arguments
+        ---------
+        position (array_like): The positions, shape (..., 3) [m]
+
+        Returns
+        -------
+        ndarray: The records with the fields count, manipulability and
+                 joint_limits, shape (...), unreached outside the grid
+
+        """
+
+        index, inside = self.voxel_index(position)
+
+        return np.where(inside, self.grid[tuple(np.moveaxis(index, -1, 0))], _UNREACHED)
+
+    def reachable(self, position):
+        """Whether any sampled configuration reached the voxels of positions
+
+        Arguments
+        ---------
+        position (array_like): The positions, shape (..., 3) [m]
+
+        Returns
+        -------
+        ndarray: Reachability of every position, shape (...)
+
+        """
+
+        return self.query(position)["count"] > 0
+
+
+def _voxel_index(position, shape):
+    """Clipped voxel indices of positions and whether they lie in the grid"""
+
+    scaled = (np.asarray(position) - WORKSPACE_LOWER) / (WORKSPACE_UPPER - WORKSPACE_LOWER)
+    index = np.floor(scaled * shape).astype(np.intp)
+    inside = np.all((index >= 0) & (index < shape), axis=-1)
+
+    return np.clip(index, 0, np.array(shape) - 1), inside
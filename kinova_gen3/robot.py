@@ -0,0 +1,175 @@
+"""Kinova Gen3 robot with cached per-state evaluation
+
+Classes
+-------
+KinovaGen3
+
+"""
+
+import numpy as np
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics
+from kinova_gen3.kinematics.jacobian import jacobian, jacobian_time_derivative
+from kinova_gen3.dynamics.mass_matrix import mass_matrix
+from kinova_gen3.dynamics.coriolis import coriolis
+from kinova_gen3.dynamics.gravity import gravity
+
+
+class KinovaGen3:
+    """Kinematic and dynamic quantities of the robot for its current state
+
+    Every quantity is computed on first access and reused until the state
+    changes. Quantities that depend only on the joint positions survive a
+    change of the joint velocities. The returned arrays are read-only because
+    they are shared between the callers.
+
+    Attributes
+    ----------
+    joint_position (ndarray): The joint angles of the robot [rad]
+    joint_velocity (ndarray): The joint velocities of the robot [rad/s]
+    position (ndarray): The end-effector position [m]
+    rotation (ndarray): The rotation matrix of the end-effector
+    jacobian (ndarray): The geometric Jacobian matrix
+    jacobian_time_derivative (ndarray): The time derivative of the Jacobian
+    mass_matrix (ndarray): The mass matrix
+    coriolis (ndarray): The Coriolis term
+    gravity (ndarray): The gravity term
+    manipulability (float): The manipulability, computed from the cached
+                            Jacobian
+
+    Methods
+    -------
+    set_state(joint_position, joint_velocity)
+        Set the joint positions and velocities of the robot
+
+    """
+
+    def __init__(self, joint_position=None, joint_velocity=None):
+        """Create the robot, at rest in the zero configuration by default
+
+        Arguments
+        ---------
+        joint_position (array_like): The joint angles of the robot [rad]
+        joint_velocity (array_like): The joint velocities of the robot [rad/s]
+
+        """
+
+        self._joint_position = np.zeros(7)
+        self._joint_velocity = np.zeros(7)
+        self._joint_position.flags.writeable = False
+        self._joint_velocity.flags.writeable = False
+
+        # Quantities depending on the joint positions only, and on both
+        self._position_cache = {}
+        self._state_cache = {}
+
+        self.set_state(
+            self._joint_position if joint_position is None else joint_position,
+            self._joint_velocity if joint_velocity is None else joint_velocity,
+        )
+
+    def set_state(self, joint_position, joint_velocity=None):
+        """Set the joint positions and velocities of the robot
+
+        Cached quantities are dropped only if the values change.
+
+        Arguments
+        ---------
+        joint_position (array_like): The joint angles of the robot [rad]
+        joint_velocity (array_like): The joint velocities of the robot [rad/s],
+                                     unchanged if omitted
+
+        """
+
+        if not np.array_equal(joint_position, self._joint_position):
+            self._joint_position = np.array(joint_position, dtype=float)
+            self._joint_position.flags.writeable = False
+            self._position_cache.clear()
+            self._state_cache.clear()
+
+        if joint_velocity is not None and not np.array_equal(
+            joint_velocity, self._joint_velocity
+        ):
+            self._joint_velocity = np.array(joint_velocity, dtype=float)
+            self._joint_velocity.flags.writeable = False
+            self._state_cache.clear()
+
+    def _cached(self, cache, key, compute):
+        """Look up a quantity, computing and freezing it on a miss"""
+
+        value = cache.get(key)
+
+        if value is None:
+            value = compute()
+            for array in value if isinstance(value, tuple) else (value,):
+                array.flags.writeable = False
+            cache[key] = value
+
+        return value
+
+    @property
+    def joint_position(self):
+        return self._joint_position
+
+    @property
+    def joint_velocity(self):
+        return self._joint_velocity
+
+    @property
+    def position(self):
+        return self._forward_kinematics()[0]
+
+    @property
+    def rotation(self):
+        return self._forward_kinematics()[1]
+
+    def _forward_kinematics(self):
+        return self._cached(
+            self._position_cache,
+            "forward_kinematics",
+            lambda: forward_kinematics(self._joint_position),
+        )
+
+    @property
+    def jacobian(self):
+        return self._cached(
+            self._position_cache, "jacobian", lambda: jacobian(self._joint_position)
+        )
+
+    @property
+    def jacobian_time_derivative(self):
+        return self._cached(
+            self._state_cache,
+            "jacobian_time_derivative",
+            lambda: jacobian_time_derivative(self._joint_position, self._joint_velocity),
+        )
+
+    @property
+    def mass_matrix(self):
+        return self._cached(
+            self._position_cache, "mass_matrix", lambda: mass_matrix(self._joint_position)
+        )
+
+    @property
+    def coriolis(self):
+        return self._cached(
+            self._state_cache,
+            "coriolis",
+            lambda: coriolis(self._joint_position, self._joint_velocity),
+        )
+
+    @property
+    def gravity(self):
+        return self._cached(
+            self._position_cache, "gravity", lambda: gravity(self._joint_position)
+        )
+
+    @property
+    def manipulability(self):
+        value = self._position_cache.get("manipulability")
+
+        if value is None:
+            jacobian_matrix = self.jacobian
+            value = float(np.log(np.linalg.det(jacobian_matrix @ jacobian_matrix.T)))
+            self._position_cache["manipulability"] = value
+
+        return value
@@ -0,0 +1,89 @@
+'''Test the batched kinematics and dynamics of Kinova Gen3
+
+Classes
+-------
+TestBatch
+
+Functions
+---------
+test_kinematics_batch()
+test_dynamics_batch()
+test_float32()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics, forward_kinematics_batch
+from kinova_gen3.kinematics.jacobian import jacobian, jacobian_batch
+from kinova_gen3.kinematics.jacobian import jacobian_time_derivative, jacobian_time_derivative_batch
+from kinova_gen3.dynamics.mass_matrix import mass_matrix, mass_matrix_batch
+from kinova_gen3.dynamics.coriolis import coriolis, coriolis_batch
+from kinova_gen3.dynamics.gravity import gravity, gravity_batch
+
+
+class TestBatch(unittest.TestCase):
+    '''Unit test class comparing the batched functions with the single-configuration ones
+
+    Methods
+    -------
+    test_kinematics_batch()
+        Test the batched forward kinematics and Jacobians
+    test_dynamics_batch()
+        Test the batched mass matrix, Coriolis and gravity terms
+    test_float32()
+        Test the single-precision evaluation against the documented bounds
+
+    '''
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.joint_pos = rng.uniform(-np.pi, np.pi, (20, 7))
+        self.joint_vel = rng.normal(size=(20, 7))
+
+    def test_kinematics_batch(self):
+        '''Test the batched forward kinematics and Jacobians of Kinova Gen3'''
+
+        position, rotation = forward_kinematics_batch(self.joint_pos)
+
+        self.assertEqual(position.shape, (20, 3))
+        self.assertEqual(rotation.shape, (20, 3, 3))
+
+        for i, (q, qp) in enumerate(zip(self.joint_pos, self.joint_vel)):
+            npt.assert_allclose(position[i], forward_kinematics(q)[0])
+            npt.assert_allclose(rotation[i], forward_kinematics(q)[1])
+
+        npt.assert_allclose(jacobian_batch(self.joint_pos),
+                            [jacobian(q) for q in self.joint_pos])
+        npt.assert_allclose(jacobian_time_derivative_batch(self.joint_pos, self.joint_vel),
+                            [jacobian_time_derivative(q, qp)
+                             for q, qp in zip(self.joint_pos, self.joint_vel)])
+
+    def test_dynamics_batch(self):
+        '''Test the batched dynamics of Kinova Gen3'''
+
+        npt.assert_allclose(mass_matrix_batch(self.joint_pos),
+                            [mass_matrix(q) for q in self.joint_pos], atol=1e-15)
+        npt.assert_allclose(coriolis_batch(self.joint_pos, self.joint_vel),
+                            [coriolis(q, qp) for q, qp in zip(self.joint_pos, self.joint_vel)],
+                            atol=1e-15)
+        npt.assert_allclose(gravity_batch(self.joint_pos),
+                            [gravity(q) for q in self.joint_pos], atol=1e-15)
+
+    def test_float32(self):
+        '''Test that float32 evaluation stays within its documented error bounds'''
+
+        joint_pos = np.random.default_rng(1).uniform(-np.pi, np.pi, (2000, 7))
+
+        cases = [
+            (lambda q, dtype: forward_kinematics_batch(q, dtype=dtype)[0], 1e-6),
+            (lambda q, dtype: forward_kinematics_batch(q, dtype=dtype)[1], 1e-6),
+            (jacobian_batch, 1e-6),
+            (mass_matrix_batch, 1e-5),
+            (gravity_batch, 1e-4),
+        ]
+        for function, bound in cases:
+            single = function(joint_pos, np.float32)
+            self.assertEqual(single.dtype, np.float32)
+            npt.assert_allclose(single, function(joint_pos, None), rtol=0.0, atol=bound)
@@ -0,0 +1,57 @@
+'''Test the benchmark suite of Kinova Gen3
+
+Classes
+-------
+TestBenchmark
+
+Functions
+---------
+test_run_benchmarks()
+test_compare()
+
+'''
+
+import json
+import unittest
+from kinova_gen3.benchmark import compare, latency_cases, run_benchmarks
+
+
+class TestBenchmark(unittest.TestCase):
+    '''Unit test class for the benchmark suite
+
+    Methods
+    -------
+    test_run_benchmarks()
+        Test the structure of the benchmark results
+    test_compare()
+        Test the regression detection against a baseline
+
+    '''
+
+    def test_run_benchmarks(self):
+        '''Test that every case is measured and the results are serialisable'''
+
+        results = run_benchmarks(repeats=3, batch_size=8)
+
+        self.assertEqual(set(results['latency']), set(latency_cases()))
+        for latency in results['latency'].values():
+            self.assertLessEqual(latency['p50'], latency['p99'])
+            self.assertLessEqual(latency['p99'], latency['max'])
+        for throughput in results['throughput'].values():
+            self.assertGreater(throughput['samples_per_second'], 0)
+
+        json.dumps(results)
+
+    def test_compare(self):
+        '''Test the regression threshold'''
+
+        baseline = {'latency': {'gravity': {'p50': 1.0e-5}},
+                    'throughput': {'gravity_batch': {'samples_per_second': 1.0e6}}}
+
+        slower = {'latency': {'gravity': {'p50': 1.1e-5}, 'jacobian': {'p50': 1.0}},
+                  'throughput': {'gravity_batch': {'samples_per_second': 0.9e6}}}
+        self.assertEqual(compare(slower, baseline, threshold=0.2), [])
+
+        regressed = {'latency': {'gravity': {'p50': 1.5e-5}},
+                     'throughput': {'gravity_batch': {'samples_per_second': 0.5e6}}}
+        self.assertEqual(len(compare(regressed, baseline, threshold=0.2)), 2)
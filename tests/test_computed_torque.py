@@ -0,0 +1,80 @@
+'''Test the computed-torque controller of Kinova Gen3
+
+Classes
+-------
+TestComputedTorque
+
+Functions
+---------
+test_torque()
+test_timing_statistics()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.control.computed_torque import ComputedTorqueController
+from kinova_gen3.dynamics.mass_matrix import mass_matrix
+from kinova_gen3.dynamics.coriolis import coriolis
+from kinova_gen3.dynamics.gravity import gravity
+
+
+class TestComputedTorque(unittest.TestCase):
+    '''Unit test class for the computed-torque controller
+
+    Methods
+    -------
+    test_torque()
+        Test the control law
+    test_timing_statistics()
+        Test the timing statistics of the controller
+
+    '''
+
+    def setUp(self):
+        self.joint_pos = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+        self.joint_vel = np.array([0.2, -0.1, 0.3, 0.1, -0.4, 0.2, 0.5])
+        self.position_ref = self.joint_pos + 0.05
+        self.velocity_ref = np.full(7, 0.1)
+        self.acceleration_ref = np.linspace(-1.0, 1.0, 7)
+
+    def test_torque(self):
+        '''Test the computed torque against the control law'''
+
+        kp = np.arange(1.0, 8.0) * 100.0
+        controller = ComputedTorqueController(kp, 20.0)
+
+        torque = controller.torque(self.joint_pos, self.joint_vel, self.position_ref,
+                                   self.velocity_ref, self.acceleration_ref)
+
+        acceleration = (self.acceleration_ref + 20.0 * (self.velocity_ref - self.joint_vel)
+                        + kp * (self.position_ref - self.joint_pos))
+        npt.assert_allclose(torque,
+                            mass_matrix(self.joint_pos) @ acceleration
+                            + coriolis(self.joint_pos, self.joint_vel)
+                            + gravity(self.joint_pos), atol=1e-14)
+
+        # Without velocity and acceleration references
+        torque = controller.torque(self.joint_pos, self.joint_vel, self.joint_pos)
+        npt.assert_allclose(torque,
+                            mass_matrix(self.joint_pos) @ (-20.0 * self.joint_vel)
+                            + coriolis(self.joint_pos, self.joint_vel)
+                            + gravity(self.joint_pos), atol=1e-14)
+
+    def test_timing_statistics(self):
+        '''Test the timing statistics over a ring buffer of calls'''
+
+        controller = ComputedTorqueController(100.0, 20.0, budget=10.0, history=4)
+        self.assertEqual(controller.timing_statistics(), {'calls': 0})
+
+        for _ in range(6):
+            controller.torque(self.joint_pos, self.joint_vel, self.position_ref)
+
+        statistics = controller.timing_statistics()
+        self.assertEqual(statistics['calls'], 6)
+        self.assertLessEqual(statistics['p50'], statistics['max'])
+        self.assertEqual(statistics['over_budget'], 0.0)
+
+        controller.reset_timing()
+        self.assertEqual(controller.timing_statistics(), {'calls': 0})
@@ -0,0 +1,145 @@
+'''Test the dynamics derivatives of Kinova Gen3
+
+Classes
+-------
+TestForwardDynamicsDerivatives
+TestTermDerivatives
+
+Functions
+---------
+test_finite_differences()
+test_batch()
+test_cost()
+
+'''
+
+import dis
+import inspect
+import types
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.derivatives import (
+    forward_dynamics_derivatives, forward_dynamics_derivatives_batch)
+from kinova_gen3.dynamics.simulation import forward_dynamics_batch
+from kinova_gen3.dynamics.mass_matrix import (
+    mass_matrix, mass_matrix_derivative, mass_matrix_derivative_batch)
+from kinova_gen3.dynamics.gravity import (
+    gravity, gravity_derivative, gravity_derivative_batch)
+from kinova_gen3._dual import _transform
+
+
+def _operations(code):
+    '''Number of arithmetic operations and calls in a code object'''
+
+    return sum(1 for instruction in dis.get_instructions(code)
+               if instruction.opname.startswith(('BINARY_', 'UNARY_', 'CALL'))
+               and instruction.opname != 'BINARY_SUBSCR')
+
+
+class TestForwardDynamicsDerivatives(unittest.TestCase):
+    '''Unit test class for the forward dynamics derivatives
+
+    Methods
+    -------
+    test_finite_differences()
+        Compare the derivatives with central differences
+    test_batch()
+        Compare the batched derivatives with the single evaluation
+
+    '''
+
+    joint_pos = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+    joint_vel = np.array([0.2, -0.1, 0.3, 0.1, -0.4, 0.2, 0.5])
+    joint_torque = np.array([1.0, 2.0, 3.0, 1.0, 0.5, 0.2, 0.1])
+
+    def test_finite_differences(self):
+        '''Test the derivatives against central differences'''
+
+        arguments = [self.joint_pos, self.joint_vel, self.joint_torque]
+        acceleration, *derivatives = forward_dynamics_derivatives(*arguments)
+
+        npt.assert_allclose(
+            acceleration, forward_dynamics_batch(*(a[None] for a in arguments))[0],
+            atol=1e-10)
+
+        step = 1e-6
+        for k, derivative in enumerate(derivatives):
+            columns = []
+            for j in range(7):
+                plus = [a[None].copy() for a in arguments]
+                minus = [a[None].copy() for a in arguments]
+                plus[k][0, j] += step
+                minus[k][0, j] -= step
+                columns.append((forward_dynamics_batch(*plus)[0]
+                                - forward_dynamics_batch(*minus)[0]) / (2 * step))
+
+            finite_difference = np.stack(columns, axis=1)
+            npt.assert_allclose(derivative, finite_difference,
+                                atol=1e-8 * np.abs(derivative).max() + 1e-7)
+
+    def test_batch(self):
+        '''Test the batched derivatives against the single evaluation'''
+
+        rng = np.random.default_rng(0)
+        joint_pos, joint_vel, joint_torque = rng.uniform(-1.0, 1.0, (3, 4, 7))
+
+        batch = forward_dynamics_derivatives_batch(joint_pos, joint_vel, joint_torque)
+        for n in range(4):
+            single = forward_dynamics_derivatives(joint_pos[n], joint_vel[n], joint_torque[n])
+            for b, s in zip(batch, single):
+                npt.assert_allclose(b[n], s, rtol=1e-12, atol=1e-12)
+
+
+class TestTermDerivatives(unittest.TestCase):
+    '''Unit test class for the derivatives of the mass matrix and gravity term
+
+    Methods
+    -------
+    test_finite_differences()
+        Compare the derivatives with central differences
+    test_batch()
+        Compare the batched derivatives with the single evaluation
+    test_cost()
+        Test that the derivatives take fewer operations than eight evaluations
+
+    '''
+
+    joint_pos = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+
+    def test_finite_differences(self):
+        '''Test the derivatives against central differences'''
+
+        step = 1e-6
+        offsets = step * np.eye(7)
+
+        mass_fd = np.stack([(mass_matrix(self.joint_pos + d) - mass_matrix(self.joint_pos - d))
+                            / (2 * step) for d in offsets])
+        gravity_fd = np.stack([(gravity(self.joint_pos + d) - gravity(self.joint_pos - d))
+                               / (2 * step) for d in offsets], axis=1)
+
+        self.assertEqual(mass_matrix_derivative(self.joint_pos).shape, (7, 7, 7))
+        npt.assert_allclose(mass_matrix_derivative(self.joint_pos), mass_fd, atol=1e-8)
+        npt.assert_allclose(gravity_derivative(self.joint_pos), gravity_fd, atol=1e-7)
+
+    def test_batch(self):
+        '''Test the batched derivatives against the single evaluation'''
+
+        joint_pos = np.random.default_rng(1).uniform(-1.0, 1.0, (4, 7))
+
+        npt.assert_allclose(mass_matrix_derivative_batch(joint_pos),
+                            [mass_matrix_derivative(q) for q in joint_pos], atol=1e-14)
+        npt.assert_allclose(gravity_derivative_batch(joint_pos),
+                            [gravity_derivative(q) for q in joint_pos], atol=1e-13)
+
+    def test_cost(self):
+        '''Test the derivatives against the cost of forward differences'''
+
+        # Forward differences take the base evaluation and one per joint. The
+        # operations are counted, the timings are in kinova_gen3.benchmark
+        for function in [mass_matrix, gravity]:
+            function = inspect.unwrap(function)
+            derivative = next(constant for constant in _transform(function).co_consts
+                              if isinstance(constant, types.CodeType))
+            with self.subTest(function=function.__name__):
+                self.assertLess(_operations(derivative), 8 * _operations(function.__code__))
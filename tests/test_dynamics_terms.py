@@ -0,0 +1,67 @@
+'''Test the fused dynamic terms of Kinova Gen3
+
+Classes
+-------
+TestDynamicsTerms
+
+Functions
+---------
+test_dynamics_terms()
+test_dynamics_terms_batch()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.mass_matrix import mass_matrix, mass_matrix_batch
+from kinova_gen3.dynamics.coriolis import coriolis, coriolis_batch
+from kinova_gen3.dynamics.gravity import gravity, gravity_batch
+from kinova_gen3.dynamics.terms import dynamics_terms, dynamics_terms_batch
+
+
+class TestDynamicsTerms(unittest.TestCase):
+    '''Unit test class for the fused dynamic terms
+
+    Methods
+    -------
+    test_dynamics_terms()
+        Test the terms of a single configuration against the separate ones
+    test_dynamics_terms_batch()
+        Test the terms of a batch against the separate ones
+
+    '''
+
+    joint_pos = np.random.default_rng(8).uniform(-np.pi, np.pi, (5, 7))
+    joint_vel = np.random.default_rng(9).uniform(-1.0, 1.0, (5, 7))
+
+    def test_dynamics_terms(self):
+        '''Test the fused terms, allocated and written into given arrays'''
+
+        out = np.empty((7, 7)), np.empty(7), np.empty(7)
+
+        for q, qp in zip(self.joint_pos, self.joint_vel):
+            expected = mass_matrix(q), coriolis(q, qp), gravity(q)
+            for actual, reference in zip(dynamics_terms(q, qp), expected):
+                npt.assert_array_equal(actual, reference)
+
+            result = dynamics_terms(list(q), list(qp), out=out)
+            for actual, given, reference in zip(result, out, expected):
+                self.assertIs(actual, given)
+                npt.assert_array_equal(actual, reference)
+
+    def test_dynamics_terms_batch(self):
+        '''Test the fused terms of a batch, allocated and written into given arrays'''
+
+        expected = (mass_matrix_batch(self.joint_pos),
+                    coriolis_batch(self.joint_pos, self.joint_vel),
+                    gravity_batch(self.joint_pos))
+        for actual, reference in zip(dynamics_terms_batch(self.joint_pos, self.joint_vel),
+                                     expected):
+            npt.assert_array_equal(actual, reference)
+
+        out = np.empty((5, 7, 7)), np.empty((5, 7)), np.empty((5, 7))
+        result = dynamics_terms_batch(self.joint_pos, self.joint_vel, out=out)
+        for actual, given, reference in zip(result, out, expected):
+            self.assertIs(actual, given)
+            npt.assert_array_equal(actual, reference)
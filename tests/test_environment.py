@@ -0,0 +1,131 @@
+'''Test the obstacle distance queries of Kinova Gen3
+
+Classes
+-------
+TestEnvironment
+
+Functions
+---------
+test_brute_force()
+test_single()
+test_point_cloud()
+test_empty()
+test_outside()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.collision.environment import Environment
+from kinova_gen3.collision.self_collision import CAPSULE_RADII, capsule_segments_batch
+
+
+class TestEnvironment(unittest.TestCase):
+    '''Unit test class for the environment model
+
+    Methods
+    -------
+    test_brute_force()
+        Compare the clearances with a dense sampling of the capsules
+    test_single()
+        Compare the single query with the batched one
+    test_point_cloud()
+        Test the merging of a point cloud into voxel spheres
+    test_empty()
+        Test that an environment without obstacles reports the margin
+    test_outside()
+        Test capsules that enter the grid from outside
+
+    '''
+
+    rng = np.random.default_rng(0)
+    spheres = np.column_stack([rng.uniform(-0.8, 0.8, (30, 3)), rng.uniform(0.02, 0.1, 30)])
+    boxes = np.array([[0.0, 0.0, -0.06, 1.0, 1.0, 0.05],
+                      [0.5, 0.3, 0.2, 0.05, 0.2, 0.2],
+                      [-0.4, -0.5, 0.4, 0.1, 0.1, 0.3]])
+    joint_pos = np.array([0.0, 0.3, 0.0, 1.5, 0.0, 0.8, 0.0]) + np.cumsum(
+        rng.normal(0.0, 0.05, (40, 7)), axis=0)
+
+    def _brute_force(self, margin):
+        '''Clearances of the links from all obstacles at sampled capsule points'''
+
+        start, end = capsule_segments_batch(self.joint_pos)
+        fraction = np.linspace(0.0, 1.0, 2001)[:, None, None, None]
+        point = start[None, :, 1:] + fraction * (end - start)[None, :, 1:]
+
+        sphere = (np.linalg.norm(point[..., None, :] - self.spheres[:, :3], axis=-1)
+                  - self.spheres[:, 3])
+        excess = np.abs(point[..., None, :] - self.boxes[:, :3]) - self.boxes[:, 3:]
+        box = (np.linalg.norm(np.maximum(excess, 0.0), axis=-1)
+               + np.minimum(excess.max(axis=-1), 0.0))
+
+        distance = np.concatenate([sphere, box], axis=-1).min(axis=(0, -1))
+
+        return np.minimum(distance - CAPSULE_RADII[1:], margin)
+
+    def test_brute_force(self):
+        '''Test the clearances against all obstacles for several margins'''
+
+        for margin, cell_size in ((0.05, 0.1), (0.3, 0.07)):
+            environment = Environment(self.spheres, self.boxes, cell_size, margin)
+            distance, clearance = environment.distance_batch(self.joint_pos)
+
+            self.assertEqual(clearance.shape, (40, 7))
+            npt.assert_allclose(distance, clearance.min(axis=-1))
+            npt.assert_allclose(clearance, self._brute_force(margin), atol=1e-6)
+            self.assertTrue(np.any(distance < 0.0))
+            self.assertTrue(np.all(clearance <= margin))
+
+    def test_single(self):
+        '''Test the single query and the radius limit of the index'''
+
+        environment = Environment(self.spheres, self.boxes)
+        distance, clearance = environment.distance_batch(self.joint_pos[:3])
+        for i in range(3):
+            single = environment.distance(self.joint_pos[i])
+            self.assertEqual(single[0], distance[i])
+            npt.assert_array_equal(single[1], clearance[i])
+
+        with self.assertRaises(ValueError):
+            environment.capsule_distance(np.zeros(3), np.ones(3), 0.1)
+
+    def test_point_cloud(self):
+        '''Test that merged voxels never report more clearance than the points'''
+
+        points = self.rng.uniform([-0.6, -0.6, 0.0], [0.6, 0.6, 0.4], (3000, 3))
+        exact = Environment.from_point_cloud(points, radius=0.0, margin=0.1)
+        merged = Environment.from_point_cloud(points, radius=0.0, resolution=0.05,
+                                              margin=0.1)
+
+        self.assertLess(merged.spheres.shape[0], 3000)
+        npt.assert_allclose(merged.spheres[:, 3], 0.025 * np.sqrt(3.0))
+
+        exact_clearance = exact.distance_batch(self.joint_pos)[1]
+        merged_clearance = merged.distance_batch(self.joint_pos)[1]
+        self.assertTrue(np.all(merged_clearance <= exact_clearance + 1e-12))
+        self.assertTrue(np.all(merged_clearance >= exact_clearance - 0.05 * np.sqrt(3.0)))
+
+    def test_empty(self):
+        '''Test that nothing is found without obstacles'''
+
+        distance, clearance = Environment(margin=0.1).distance_batch(self.joint_pos)
+
+        npt.assert_array_equal(distance, 0.1)
+        npt.assert_array_equal(clearance, 0.1)
+
+    def test_outside(self):
+        '''Test that capsules starting outside the grid find the obstacles'''
+
+        environment = Environment(spheres=[[0.0, 0.0, 0.0, 0.1]], cell_size=0.1,
+                                  margin=0.05, max_radius=0.05)
+        end = np.linspace(-0.3, 0.0, 31)[:, None] * [1.0, 0.0, 0.0] + [0.0, 0.0, 0.02]
+        for start in ([-0.55, 0.0, 0.0], [-0.4, -0.5, 0.3], [0.0, 0.0, -0.9]):
+            distance = environment.capsule_distance(np.broadcast_to(start, end.shape),
+                                                    end, 0.05)
+            # Closest points of the segments to the center of the sphere
+            direction = end - start
+            fraction = np.clip(-(direction @ start) / np.sum(direction**2, axis=-1), 0, 1)
+            closest = start + fraction[:, None] * direction
+            exact = np.linalg.norm(closest, axis=-1) - 0.15
+            npt.assert_allclose(distance, np.minimum(exact, 0.05), atol=1e-6)
@@ -0,0 +1,69 @@
+'''Test the gravity lookup table of Kinova Gen3
+
+Classes
+-------
+TestGravityTable
+
+Functions
+---------
+test_error_bound()
+test_reopen()
+
+'''
+
+import os
+import tempfile
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.gravity import gravity, gravity_batch
+from kinova_gen3.dynamics.gravity_table import GravityTable
+
+
+class TestGravityTable(unittest.TestCase):
+    '''Unit test class for the gravity lookup table
+
+    Methods
+    -------
+    test_error_bound()
+        Test the interpolation error against the estimated bound
+    test_reopen()
+        Test that a table opened from disk gives the same values
+
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'gravity.npy')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_error_bound(self):
+        '''Test that the error stays within the bound for both precisions'''
+
+        joint_pos = np.random.default_rng(3).uniform(-2.0 * np.pi, 2.0 * np.pi, (5000, 7))
+        reference = gravity_batch(joint_pos)
+
+        for dtype in (np.float64, np.float32):
+            table = GravityTable.build(self.path, resolution=7, dtype=dtype)
+            error = np.abs(table.gravity_batch(joint_pos) - reference)
+            self.assertTrue(np.all(error <= table.error_bound))
+            npt.assert_allclose(table.gravity(joint_pos[0]), table.gravity_batch(joint_pos)[0])
+
+        # The grid points themselves are exact
+        grid_pos = np.array([0.3, -np.pi, np.pi / 3.0, 0.0, 2.0 * np.pi / 3.0, -np.pi / 3.0, 1.1])
+        table = GravityTable.build(self.path, resolution=7)
+        npt.assert_allclose(table.gravity(grid_pos), gravity(grid_pos), atol=1e-12)
+
+    def test_reopen(self):
+        '''Test that the table reopened from the file matches the built one'''
+
+        joint_pos = np.random.default_rng(4).uniform(-np.pi, np.pi, (10, 7))
+
+        built = GravityTable.build(self.path, resolution=5)
+        reopened = GravityTable(self.path)
+
+        self.assertEqual(reopened.resolution, 5)
+        npt.assert_array_equal(reopened.gravity_batch(joint_pos), built.gravity_batch(joint_pos))
+        npt.assert_array_equal(reopened.error_bound, built.error_bound)
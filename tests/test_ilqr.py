@@ -0,0 +1,46 @@
+'''Test the iterative LQR trajectory optimization of Kinova Gen3
+
+Classes
+-------
+TestIterativeLQR
+
+Functions
+---------
+test_reach_target()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.gravity import gravity
+from kinova_gen3.planning.ilqr import iterative_lqr
+
+
+class TestIterativeLQR(unittest.TestCase):
+    '''Unit test class for the iterative LQR solver
+
+    Methods
+    -------
+    test_reach_target()
+        Test the optimization of a point-to-point motion
+
+    '''
+
+    def test_reach_target(self):
+        '''Test that the optimized torques bring the robot to rest at the target'''
+
+        joint_pos = np.array([0.0, 0.3, 0.0, 1.5, 0.0, 0.8, 0.0])
+        target_pos = joint_pos + np.array([0.3, -0.2, 0.2, 0.2, 0.3, -0.2, 0.3])
+        initial_torque = np.tile(gravity(joint_pos), (30, 1))
+
+        positions, velocities, torques, costs = iterative_lqr(
+            joint_pos, np.zeros(7), initial_torque, target_pos, time_step=0.02,
+            max_iterations=20)
+
+        self.assertEqual(positions.shape, (31, 7))
+        self.assertEqual(torques.shape, (30, 7))
+        self.assertTrue(np.all(np.diff(costs) < 0.0))
+        npt.assert_allclose(positions[0], joint_pos)
+        npt.assert_allclose(positions[-1], target_pos, atol=2e-2)
+        npt.assert_allclose(velocities[-1], 0.0, atol=2e-2)
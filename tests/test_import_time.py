@@ -0,0 +1,74 @@
+'''Test the import time of the kinova_gen3 package
+
+Classes
+-------
+TestImportTime
+
+Functions
+---------
+test_lazy_package()
+test_deferred_scipy()
+test_import_time_budget()
+
+'''
+
+import subprocess
+import sys
+import unittest
+
+# Time allowed for loading every kinematics, dynamics and performance
+# criteria module once numpy is imported [s]
+IMPORT_TIME_BUDGET = 0.5
+
+
+def _run(code):
+    '''Run Python code in a fresh interpreter and return its output'''
+
+    return subprocess.run([sys.executable, '-c', code], check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+class TestImportTime(unittest.TestCase):
+    '''Unit test class for the import time of the package
+
+    Methods
+    -------
+    test_lazy_package()
+        Test that importing the package loads no submodule
+    test_deferred_scipy()
+        Test that scipy is only imported by the gradients
+    test_import_time_budget()
+        Test the time spent loading all modules
+
+    '''
+
+    def test_lazy_package(self):
+        '''Test that the package loads its submodules on first access'''
+
+        output = _run('import sys, kinova_gen3\n'
+                      'print("numpy" in sys.modules, "kinova_gen3.dynamics.mass_matrix" in sys.modules)\n'
+                      'kinova_gen3.mass_matrix\n'
+                      'print("kinova_gen3.dynamics.mass_matrix" in sys.modules)')
+
+        self.assertEqual(output.split(), ['False', 'False', 'True'])
+
+    def test_deferred_scipy(self):
+        '''Test that importing the inverse kinematics does not load scipy'''
+
+        output = _run('import sys, kinova_gen3.kinematics.inverse_kinematics\n'
+                      'print("scipy" in sys.modules)')
+
+        self.assertEqual(output, 'False')
+
+    def test_import_time_budget(self):
+        '''Test that loading all modules stays within the budget'''
+
+        output = _run('import time, numpy\n'
+                      'start = time.perf_counter()\n'
+                      'import kinova_gen3.kinematics.inverse_kinematics\n'
+                      'import kinova_gen3.dynamics.mass_matrix\n'
+                      'import kinova_gen3.dynamics.coriolis\n'
+                      'import kinova_gen3.dynamics.gravity\n'
+                      'print(time.perf_counter() - start)')
+
+        self.assertLess(float(output), IMPORT_TIME_BUDGET)
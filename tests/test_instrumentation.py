@@ -0,0 +1,92 @@
+'''Test the timing instrumentation of Kinova Gen3
+
+Classes
+-------
+TestInstrumentation
+
+Functions
+---------
+test_disabled()
+test_snapshot()
+test_prometheus()
+
+'''
+
+import threading
+import unittest
+import urllib.request
+import numpy as np
+from kinova_gen3 import instrumentation
+from kinova_gen3.dynamics.gravity import gravity
+from kinova_gen3.kinematics.jacobian import jacobian
+
+
+class TestInstrumentation(unittest.TestCase):
+    '''Unit test class for the timing instrumentation
+
+    Methods
+    -------
+    test_disabled()
+        Test that nothing is recorded while disabled
+    test_snapshot()
+        Test the counters summed over several threads
+    test_prometheus()
+        Test the Prometheus exporter
+
+    '''
+
+    def setUp(self):
+        instrumentation.reset()
+        self.joint_pos = np.zeros(7)
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled(self):
+        '''Test that calls are not recorded while disabled'''
+
+        instrumentation.disable()
+        gravity(self.joint_pos)
+
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_snapshot(self):
+        '''Test the call counts and durations over several threads'''
+
+        instrumentation.enable()
+
+        def work():
+            for _ in range(10):
+                gravity(self.joint_pos)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        jacobian(self.joint_pos)
+
+        counters = instrumentation.snapshot()
+        self.assertEqual(counters['gravity']['calls'], 40)
+        self.assertEqual(counters['jacobian']['calls'], 1)
+        self.assertGreater(counters['gravity']['total_seconds'], 0.0)
+        self.assertLessEqual(counters['gravity']['max_seconds'],
+                             counters['gravity']['total_seconds'])
+
+    def test_prometheus(self):
+        '''Test the Prometheus text served over HTTP'''
+
+        instrumentation.enable()
+        gravity(self.joint_pos)
+
+        server = instrumentation.serve(port=0)
+        try:
+            url = 'http://127.0.0.1:{}/metrics'.format(server.server_address[1])
+            text = urllib.request.urlopen(url).read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertIn('# TYPE kinova_gen3_calls_total counter', text)
+        self.assertIn('kinova_gen3_calls_total{function="gravity"} 1', text)
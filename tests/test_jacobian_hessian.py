@@ -0,0 +1,64 @@
+'''Test the Jacobian derivatives of Kinova Gen3
+
+Classes
+-------
+TestJacobianHessian
+
+Functions
+---------
+test_finite_differences()
+test_time_derivative()
+test_batch()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.kinematics.jacobian import (
+    jacobian, jacobian_time_derivative, jacobian_hessian, jacobian_hessian_batch)
+
+
+class TestJacobianHessian(unittest.TestCase):
+    '''Unit test class for the Jacobian derivatives
+
+    Methods
+    -------
+    test_finite_differences()
+        Compare the derivatives with central differences of the Jacobian
+    test_time_derivative()
+        Compare the contraction with the joint velocities with dJ/dt
+    test_batch()
+        Compare the batched derivatives with the single evaluation
+
+    '''
+
+    joint_pos = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+    joint_vel = np.array([0.2, -0.1, 0.3, 0.1, -0.4, 0.2, 0.5])
+
+    def test_finite_differences(self):
+        '''Test the derivatives against central differences'''
+
+        step = 1e-6
+        finite_difference = np.stack(
+            [(jacobian(self.joint_pos + d) - jacobian(self.joint_pos - d)) / (2 * step)
+             for d in step * np.eye(7)])
+
+        hessian = jacobian_hessian(self.joint_pos)
+        self.assertEqual(hessian.shape, (7, 6, 7))
+        npt.assert_allclose(hessian, finite_difference, atol=1e-9)
+
+    def test_time_derivative(self):
+        '''Test that sum_i dJ/dq_i qp_i equals the time derivative of J'''
+
+        npt.assert_allclose(
+            np.einsum('ijk,i->jk', jacobian_hessian(self.joint_pos), self.joint_vel),
+            jacobian_time_derivative(self.joint_pos, self.joint_vel), atol=1e-14)
+
+    def test_batch(self):
+        '''Test the batched derivatives against the single evaluation'''
+
+        joint_pos = np.random.default_rng(2).uniform(-np.pi, np.pi, (5, 7))
+
+        npt.assert_allclose(jacobian_hessian_batch(joint_pos),
+                            [jacobian_hessian(q) for q in joint_pos], atol=1e-15)
@@ -0,0 +1,74 @@
+'''Test the packed mass matrix of Kinova Gen3
+
+Classes
+-------
+TestMassMatrixPacked
+
+Functions
+---------
+test_unpack()
+test_consumers()
+test_not_positive_definite()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.mass_matrix import mass_matrix, mass_matrix_batch
+from kinova_gen3.dynamics.mass_matrix_packed import (
+    mass_matrix_packed, mass_matrix_packed_batch, unpack_mass_matrix, packed_cholesky,
+    packed_quadratic_form)
+
+
+class TestMassMatrixPacked(unittest.TestCase):
+    '''Unit test class for the packed mass matrix
+
+    Methods
+    -------
+    test_unpack()
+        Test the unpacked matrices against the full evaluation
+    test_consumers()
+        Test the Cholesky factors and quadratic forms of packed matrices
+    test_not_positive_definite()
+        Test that the factorisation rejects indefinite matrices
+
+    '''
+
+    joint_pos = np.random.default_rng(6).uniform(-np.pi, np.pi, (6, 7))
+    joint_vel = np.random.default_rng(7).uniform(-1.0, 1.0, (6, 7))
+
+    def test_unpack(self):
+        '''Test single and batched packed matrices against the full ones'''
+
+        self.assertEqual(mass_matrix_packed(self.joint_pos[0]).shape, (28,))
+        npt.assert_allclose(unpack_mass_matrix(mass_matrix_packed(self.joint_pos[0])),
+                            mass_matrix(self.joint_pos[0]), atol=1e-15)
+
+        packed = mass_matrix_packed_batch(self.joint_pos)
+        self.assertEqual(packed.shape, (6, 28))
+        npt.assert_allclose(unpack_mass_matrix(packed), mass_matrix_batch(self.joint_pos),
+                            atol=1e-15)
+
+    def test_consumers(self):
+        '''Test the packed Cholesky factors and inertia-weighted norms'''
+
+        packed = mass_matrix_packed_batch(self.joint_pos)
+        full = mass_matrix_batch(self.joint_pos)
+
+        npt.assert_allclose(packed_cholesky(packed), np.linalg.cholesky(full), atol=1e-13)
+        npt.assert_allclose(packed_cholesky(packed[0]), np.linalg.cholesky(full[0]), atol=1e-13)
+        npt.assert_allclose(packed_quadratic_form(packed, self.joint_vel),
+                            np.einsum('ni,nij,nj->n', self.joint_vel, full, self.joint_vel),
+                            rtol=1e-13)
+
+    def test_not_positive_definite(self):
+        '''Test the error on a batch with one indefinite matrix'''
+
+        packed = mass_matrix_packed_batch(self.joint_pos)
+        packed[3, 27] = -1.0
+
+        with self.assertRaises(np.linalg.LinAlgError):
+            packed_cholesky(packed)
+        with self.assertRaises(np.linalg.LinAlgError):
+            packed_cholesky(np.zeros(28))
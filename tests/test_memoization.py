@@ -0,0 +1,132 @@
+'''Test the memoization of the kinematics and dynamics functions
+
+Classes
+-------
+TestMemoized
+
+Functions
+---------
+test_hits_and_misses()
+test_eviction()
+test_threads()
+test_scalar()
+test_options()
+
+'''
+
+import threading
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.coriolis import coriolis
+from kinova_gen3.dynamics.mass_matrix import mass_matrix
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics
+from kinova_gen3.memoization import memoized
+from kinova_gen3.performance_criteria.joint_limits import joint_limits
+from kinova_gen3.performance_criteria.manipulability import manipulability
+
+
+class TestMemoized(unittest.TestCase):
+    '''Unit test class for the quantized least recently used cache
+
+    Methods
+    -------
+    test_hits_and_misses()
+        Test the lookup of equal and nearly equal configurations
+    test_eviction()
+        Test that the least recently used entry is evicted
+    test_threads()
+        Test the statistics under concurrent lookups
+    test_scalar()
+        Test functions returning scalars
+    test_options()
+        Test non-numeric positional and keyword arguments
+
+    '''
+
+    joint_pos = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+
+    def test_hits_and_misses(self):
+        '''Test that nearby configurations share an entry and far ones do not'''
+
+        cached = memoized(mass_matrix, tolerance=1e-6)
+
+        first = cached(self.joint_pos)
+        npt.assert_array_equal(first, mass_matrix(self.joint_pos))
+        self.assertIs(cached(self.joint_pos + 1e-9), first)
+        self.assertFalse(first.flags.writeable)
+        cached(self.joint_pos + 1e-3)
+        self.assertEqual(cached.cache_info(), (1, 2, 1024, 2))
+
+        # Results of several outputs and arguments
+        position, rotation = memoized(forward_kinematics)(self.joint_pos)
+        self.assertFalse(rotation.flags.writeable)
+        cached_coriolis = memoized(coriolis)
+        cached_coriolis(self.joint_pos, self.joint_pos)
+        cached_coriolis(self.joint_pos, -self.joint_pos)
+        self.assertEqual(cached_coriolis.cache_info().misses, 2)
+
+        cached.cache_clear()
+        self.assertEqual(cached.cache_info(), (0, 0, 1024, 0))
+
+    def test_eviction(self):
+        '''Test that the cache keeps the most recently used entries'''
+
+        cached = memoized(mass_matrix, maxsize=2)
+        a, b, c = self.joint_pos, self.joint_pos + 0.1, self.joint_pos + 0.2
+
+        cached(a)
+        cached(b)
+        cached(a)
+        cached(c)
+        self.assertEqual(cached.cache_info().currsize, 2)
+
+        cached(a)
+        self.assertEqual(cached.cache_info().hits, 2)
+        cached(b)
+        self.assertEqual(cached.cache_info().misses, 4)
+
+    def test_threads(self):
+        '''Test that every concurrent lookup is counted once'''
+
+        cached = memoized(mass_matrix, maxsize=8)
+        configurations = self.joint_pos + 0.1 * np.arange(4)[:, None]
+
+        def lookup():
+            for _ in range(25):
+                for q in configurations:
+                    cached(q)
+
+        threads = [threading.Thread(target=lookup) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cached.cache_info()
+        self.assertEqual(info.hits + info.misses, 400)
+        self.assertEqual(info.currsize, 4)
+
+    def test_scalar(self):
+        '''Test the caching of the scalar performance criteria'''
+
+        for function in (manipulability, joint_limits):
+            cached = memoized(function)
+
+            self.assertEqual(cached(self.joint_pos), function(self.joint_pos))
+            self.assertEqual(cached(self.joint_pos), function(self.joint_pos))
+            self.assertEqual(cached.cache_info()[:2], (1, 1))
+
+    def test_options(self):
+        '''Test that the output format is passed on and part of the key'''
+
+        cached = memoized(forward_kinematics)
+
+        pose = cached(self.joint_pos, output='pose')
+        npt.assert_array_equal(pose, forward_kinematics(self.joint_pos, output='pose'))
+        self.assertIs(cached(self.joint_pos + 1e-12, output='pose'), pose)
+        npt.assert_array_equal(cached(self.joint_pos, 'quaternion'),
+                               forward_kinematics(self.joint_pos, 'quaternion'))
+        position, rotation = cached(self.joint_pos)
+        npt.assert_array_equal(rotation, forward_kinematics(self.joint_pos)[1])
+        self.assertEqual(cached.cache_info()[:2], (1, 3))
@@ -0,0 +1,56 @@
+'''Test the generalized-momentum observer of Kinova Gen3
+
+Classes
+-------
+TestMomentumObserver
+
+Functions
+---------
+test_external_torque()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.gravity import gravity_batch
+from kinova_gen3.dynamics.momentum_observer import MomentumObserver, momentum_residuals
+from kinova_gen3.dynamics.simulation import Simulator
+
+
+class TestMomentumObserver(unittest.TestCase):
+    '''Unit test class for the generalized-momentum observer
+
+    Methods
+    -------
+    test_external_torque()
+        Test the estimation of a constant external torque
+
+    '''
+
+    def test_external_torque(self):
+        '''Test the online and offline estimates of a constant external torque'''
+
+        joint_pos = np.array([[0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2]])
+        external_torque = np.array([0.0, 2e-4, 0.0, -1e-4, 0.0, 5e-5, 0.0])
+        time_step = 1e-3
+
+        # The motors compensate gravity while the external torque acts on the robot
+        simulator = Simulator(joint_pos, time_step=time_step)
+        _, positions, velocities = simulator.run(
+            0.08, controller=lambda t, q, qp: gravity_batch(q) + external_torque,
+            record_every=1)
+        positions, velocities = positions[:, 0], velocities[:, 0]
+        motor_torque = gravity_batch(positions)
+
+        observer = MomentumObserver(gain=100.0, threshold=1e-4, time_step=time_step)
+        online = np.array([observer.update(q, qp, tau).copy()
+                           for q, qp, tau in zip(positions, velocities, motor_torque)])
+        offline = momentum_residuals(positions, velocities, motor_torque, 100.0, time_step)
+
+        npt.assert_allclose(online, offline, atol=1e-12)
+        npt.assert_allclose(online[-1], external_torque, atol=5e-6)
+        self.assertTrue(observer.collision)
+
+        observer.reset()
+        self.assertFalse(observer.collision)
@@ -0,0 +1,59 @@
+'''Test the operational space dynamics of Kinova Gen3
+
+Classes
+-------
+TestOperationalSpace
+
+Functions
+---------
+test_operational_space()
+test_operational_space_batch()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.operational_space import operational_space, operational_space_batch
+from kinova_gen3.dynamics.mass_matrix import mass_matrix
+from kinova_gen3.kinematics.jacobian import jacobian
+
+
+class TestOperationalSpace(unittest.TestCase):
+    '''Unit test class for the operational space dynamics
+
+    Methods
+    -------
+    test_operational_space()
+        Test the terms against their definitions
+    test_operational_space_batch()
+        Test the batched terms
+
+    '''
+
+    def setUp(self):
+        self.joint_pos = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+
+    def test_operational_space(self):
+        '''Test the operational space terms against their definitions'''
+
+        inertia, pseudoinverse, projector = operational_space(self.joint_pos)
+
+        jac = jacobian(self.joint_pos)
+        mass_inv = np.linalg.inv(mass_matrix(self.joint_pos))
+        expected_inertia = np.linalg.inv(jac @ mass_inv @ jac.T)
+
+        npt.assert_allclose(inertia, expected_inertia, rtol=1e-8)
+        npt.assert_allclose(pseudoinverse, mass_inv @ jac.T @ expected_inertia, rtol=1e-8, atol=1e-10)
+        npt.assert_allclose(jac @ pseudoinverse, np.eye(6), atol=1e-10)
+        npt.assert_allclose(projector @ pseudoinverse, 0.0, atol=1e-10)
+        npt.assert_allclose(projector @ projector, projector, atol=1e-10)
+
+    def test_operational_space_batch(self):
+        '''Test the batched operational space terms'''
+
+        joint_pos = np.random.default_rng(3).uniform(-1.0, 1.0, (4, 7))
+
+        for batch, single in zip(operational_space_batch(joint_pos),
+                                 zip(*[operational_space(q) for q in joint_pos])):
+            npt.assert_allclose(batch, single, rtol=1e-10, atol=1e-12)
@@ -0,0 +1,54 @@
+'''Test the process-pool evaluation of batched functions
+
+Classes
+-------
+TestParallel
+
+Functions
+---------
+test_parallel_evaluate()
+test_parallel_evaluate_tuple()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.parallel import parallel_evaluate
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics_batch
+from kinova_gen3.dynamics.coriolis import coriolis_batch
+
+
+class TestParallel(unittest.TestCase):
+    '''Unit test class for the process-pool evaluation
+
+    Methods
+    -------
+    test_parallel_evaluate()
+        Test sharding a two-input function across workers
+    test_parallel_evaluate_tuple()
+        Test sharding a function returning several arrays
+
+    '''
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.joint_pos = rng.uniform(-np.pi, np.pi, (101, 7))
+        self.joint_vel = rng.normal(size=(101, 7))
+
+    def test_parallel_evaluate(self):
+        '''Test the ordering and values of a sharded evaluation'''
+
+        result = parallel_evaluate(coriolis_batch, self.joint_pos, self.joint_vel,
+                                   workers=2, chunk_size=10)
+
+        npt.assert_array_equal(result, coriolis_batch(self.joint_pos, self.joint_vel))
+
+    def test_parallel_evaluate_tuple(self):
+        '''Test a sharded evaluation with several outputs'''
+
+        position, rotation = parallel_evaluate(forward_kinematics_batch, self.joint_pos,
+                                               workers=2, chunk_size=7)
+
+        npt.assert_array_equal(position, forward_kinematics_batch(self.joint_pos)[0])
+        npt.assert_array_equal(rotation, forward_kinematics_batch(self.joint_pos)[1])
@@ -0,0 +1,149 @@
+'''Test the output formats of the forward kinematics of Kinova Gen3
+
+Classes
+-------
+TestPoseFormats
+
+Functions
+---------
+test_homogeneous()
+test_quaternion()
+test_out()
+test_invalid_out()
+test_invalid()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics, forward_kinematics_batch
+
+
+def _rotation_from_quaternion(quaternion):
+    '''Rotation matrices of unit quaternions (x, y, z, w)'''
+
+    x, y, z, w = np.moveaxis(quaternion, -1, 0)
+
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)], -1),
+        np.stack([2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)], -1),
+        np.stack([2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)], -1),
+    ], -2)
+
+
+class TestPoseFormats(unittest.TestCase):
+    '''Unit test class for the pose formats of the forward kinematics
+
+    Methods
+    -------
+    test_homogeneous()
+        Test the homogeneous transformations against the rotation matrices
+    test_quaternion()
+        Test the quaternions, including half turns where w vanishes
+    test_out()
+        Test the batched evaluation into preallocated arrays
+    test_invalid_out()
+        Test the rejection of preallocated arrays not matching the results
+    test_invalid()
+        Test the rejection of an unknown format
+
+    '''
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.joint_pos = rng.uniform(-np.pi, np.pi, (200, 7))
+        # The zero configuration and half turns about z, y and x, where every
+        # component of the quaternion is the largest in turn
+        self.joint_pos[:4] = 0.0
+        self.joint_pos[1, 6] = np.pi
+        self.joint_pos[2, 1] = np.pi
+        self.joint_pos[3, [1, 6]] = np.pi
+        self.position, self.rotation = forward_kinematics_batch(self.joint_pos)
+
+    def test_homogeneous(self):
+        '''Test the blocks of the homogeneous transformations'''
+
+        transform = forward_kinematics_batch(self.joint_pos, output='homogeneous')
+
+        self.assertEqual(transform.shape, (200, 4, 4))
+        npt.assert_array_equal(transform[:, :3, :3], self.rotation)
+        npt.assert_array_equal(transform[:, :3, 3], self.position)
+        npt.assert_array_equal(transform[:, 3], np.tile([0.0, 0.0, 0.0, 1.0], (200, 1)))
+        npt.assert_array_equal(forward_kinematics(self.joint_pos[5], 'homogeneous'),
+                               transform[5])
+
+    def test_quaternion(self):
+        '''Test that the quaternions reproduce the rotation matrices'''
+
+        quaternion = forward_kinematics_batch(self.joint_pos, output='quaternion')
+        pose = forward_kinematics_batch(self.joint_pos, output='pose')
+
+        npt.assert_allclose(np.linalg.norm(quaternion, axis=-1), 1.0, atol=1e-15)
+        self.assertTrue(np.all(quaternion[:, 3] >= 0.0))
+        npt.assert_allclose(_rotation_from_quaternion(quaternion), self.rotation,
+                            atol=1e-14)
+        npt.assert_array_equal(pose, np.hstack([self.position, quaternion]))
+        npt.assert_allclose(np.abs(quaternion[:4]), np.array([[0, 0, 0, 1], [0, 0, 1, 0],
+                                                              [0, 1, 0, 0], [1, 0, 0, 0]]),
+                            atol=1e-6)
+
+        for i in range(5):
+            npt.assert_allclose(forward_kinematics(self.joint_pos[i], 'quaternion'),
+                                quaternion[i], atol=1e-15)
+            npt.assert_allclose(forward_kinematics(self.joint_pos[i], 'pose'),
+                                pose[i], atol=1e-15)
+
+    def test_out(self):
+        '''Test that the results are written into the given arrays'''
+
+        pose = np.empty((200, 7))
+        self.assertIs(forward_kinematics_batch(self.joint_pos, output='pose', out=pose),
+                      pose)
+        npt.assert_array_equal(pose, forward_kinematics_batch(self.joint_pos, output='pose'))
+
+        position, rotation = np.empty((200, 3)), np.empty((200, 3, 3))
+        result = forward_kinematics_batch(self.joint_pos, out=(position, rotation))
+        self.assertIs(result[0], position)
+        self.assertIs(result[1], rotation)
+        npt.assert_array_equal(position, self.position)
+        npt.assert_array_equal(rotation, self.rotation)
+
+        transform = np.empty((200, 4, 4), dtype=np.float32)
+        forward_kinematics_batch(self.joint_pos, dtype=np.float32, output='homogeneous',
+                                 out=transform)
+        npt.assert_allclose(transform[:, :3, :3], self.rotation, atol=1e-6)
+
+    def test_invalid_out(self):
+        '''Test that mismatched arrays raise errors before anything is written'''
+
+        position, rotation = np.zeros((200, 3)), np.zeros((200, 3, 3))
+        invalid = [
+            # A single array for two results
+            ('matrix', position),
+            # An extra array
+            ('matrix', (position, rotation, np.zeros((200, 3)))),
+            ('pose', (np.zeros((200, 7)), position)),
+            # Wrong shapes
+            ('matrix', (np.zeros((200, 3)), np.zeros((200, 3, 4)))),
+            ('pose', np.zeros((100, 7))),
+            ('homogeneous', np.zeros(200 * 16)),
+            # A non-contiguous array
+            ('quaternion', np.zeros((200, 8))[:, ::2]),
+            ('pose', [[0.0] * 7] * 200),
+        ]
+
+        for output, out in invalid:
+            with self.subTest(output=output):
+                with self.assertRaises(ValueError):
+                    forward_kinematics_batch(self.joint_pos, output=output, out=out)
+        npt.assert_array_equal(position, 0.0)
+        npt.assert_array_equal(rotation, 0.0)
+
+    def test_invalid(self):
+        '''Test that an unknown format raises an error'''
+
+        with self.assertRaises(ValueError):
+            forward_kinematics(self.joint_pos[0], 'euler')
+        with self.assertRaises(ValueError):
+            forward_kinematics_batch(self.joint_pos, output='euler')
@@ -0,0 +1,77 @@
+'''Test the cached evaluation of the KinovaGen3 class
+
+Classes
+-------
+TestRobot
+
+Functions
+---------
+test_quantities()
+test_cache_invalidation()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3 import KinovaGen3
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics
+from kinova_gen3.kinematics.jacobian import jacobian, jacobian_time_derivative
+from kinova_gen3.dynamics.mass_matrix import mass_matrix
+from kinova_gen3.dynamics.coriolis import coriolis
+from kinova_gen3.dynamics.gravity import gravity
+from kinova_gen3.performance_criteria.manipulability import manipulability
+
+
+class TestRobot(unittest.TestCase):
+    '''Unit test class for the KinovaGen3 class
+
+    Methods
+    -------
+    test_quantities()
+        Test the cached quantities against the functions
+    test_cache_invalidation()
+        Test when the cached quantities are recomputed
+
+    '''
+
+    def setUp(self):
+        self.joint_pos = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+        self.joint_vel = np.array([0.2, -0.1, 0.3, 0.1, -0.4, 0.2, 0.5])
+
+    def test_quantities(self):
+        '''Test the cached quantities of the robot'''
+
+        robot = KinovaGen3(self.joint_pos, self.joint_vel)
+
+        npt.assert_array_equal(robot.position, forward_kinematics(self.joint_pos)[0])
+        npt.assert_array_equal(robot.rotation, forward_kinematics(self.joint_pos)[1])
+        npt.assert_array_equal(robot.jacobian, jacobian(self.joint_pos))
+        npt.assert_array_equal(robot.jacobian_time_derivative,
+                               jacobian_time_derivative(self.joint_pos, self.joint_vel))
+        npt.assert_array_equal(robot.mass_matrix, mass_matrix(self.joint_pos))
+        npt.assert_array_equal(robot.coriolis, coriolis(self.joint_pos, self.joint_vel))
+        npt.assert_array_equal(robot.gravity, gravity(self.joint_pos))
+        self.assertAlmostEqual(robot.manipulability, manipulability(self.joint_pos))
+
+    def test_cache_invalidation(self):
+        '''Test that the cache is only dropped when the state changes'''
+
+        robot = KinovaGen3(self.joint_pos, self.joint_vel)
+        mass = robot.mass_matrix
+        coriolis_term = robot.coriolis
+
+        self.assertIs(robot.mass_matrix, mass)
+        self.assertFalse(mass.flags.writeable)
+
+        robot.set_state(self.joint_pos.copy(), self.joint_vel.copy())
+        self.assertIs(robot.mass_matrix, mass)
+        self.assertIs(robot.coriolis, coriolis_term)
+
+        robot.set_state(self.joint_pos, 2 * self.joint_vel)
+        self.assertIs(robot.mass_matrix, mass)
+        self.assertIsNot(robot.coriolis, coriolis_term)
+
+        robot.set_state(-self.joint_pos)
+        self.assertIsNot(robot.mass_matrix, mass)
+        npt.assert_array_equal(robot.mass_matrix, mass_matrix(-self.joint_pos))
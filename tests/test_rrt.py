@@ -0,0 +1,79 @@
+'''Test the RRT-Connect planner of Kinova Gen3
+
+Classes
+-------
+TestRRTConnect
+
+Functions
+---------
+test_direct()
+test_obstacle()
+test_invalid()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.collision.environment import Environment
+from kinova_gen3.collision.self_collision import self_collision_distance_batch
+from kinova_gen3.planning.rrt import rrt_connect
+
+
+class TestRRTConnect(unittest.TestCase):
+    '''Unit test class for the RRT-Connect planner
+
+    Methods
+    -------
+    test_direct()
+        Test that a free straight edge is returned as it is
+    test_obstacle()
+        Test a path around a pillar blocking the straight edge
+    test_invalid()
+        Test the rejection of a start configuration in collision
+
+    '''
+
+    start = np.array([-1.0, 0.6, 0.0, 1.6, 0.0, 0.8, 0.0])
+    goal = np.array([1.0, 0.6, 0.0, 1.6, 0.0, 0.8, 0.0])
+    environment = Environment(boxes=[[0.0, 0.0, -0.06, 1.0, 1.0, 0.05],
+                                     [0.55, 0.0, 0.3, 0.05, 0.05, 0.3]])
+
+    def _dense(self, path, resolution=0.005):
+        '''States along the edges of a path'''
+
+        states = [path[:1]]
+        for start, end in zip(path[:-1], path[1:]):
+            n_states = int(np.ceil(np.max(np.abs(end - start)) / resolution))
+            fraction = np.arange(1, n_states + 1)[:, None] / n_states
+            states.append(start + fraction * (end - start))
+
+        return np.concatenate(states)
+
+    def test_direct(self):
+        '''Test the straight edge without obstacles'''
+
+        path = rrt_connect(self.start, self.goal)
+
+        npt.assert_array_equal(path, [self.start, self.goal])
+
+    def test_obstacle(self):
+        '''Test that the path avoids the pillar for several seeds'''
+
+        blocked = self._dense(np.stack([self.start, self.goal]))
+        self.assertLess(self.environment.distance_batch(blocked)[0].min(), 0.0)
+
+        for seed in range(3):
+            path = rrt_connect(self.start, self.goal, self.environment, seed=seed)
+
+            npt.assert_array_equal(path[0], self.start)
+            npt.assert_array_equal(path[-1], self.goal)
+            states = self._dense(path)
+            self.assertGreater(self.environment.distance_batch(states)[0].min(), -1e-3)
+            self.assertGreater(self_collision_distance_batch(states)[0].min(), -1e-3)
+
+    def test_invalid(self):
+        '''Test that a start in collision with the table is rejected'''
+
+        with self.assertRaises(ValueError):
+            rrt_connect([0.0, 1.9, 0.0, 1.0, 0.0, 1.0, 0.0], self.goal, self.environment)
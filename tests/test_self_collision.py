@@ -0,0 +1,111 @@
+'''Test the capsule self-collision model of Kinova Gen3
+
+Classes
+-------
+TestSelfCollision
+
+Functions
+---------
+test_link_frames()
+test_segment_closest_points()
+test_distance()
+test_gradient()
+test_batch()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.collision.geometry import segment_closest_points
+from kinova_gen3.collision.self_collision import (
+    CAPSULE_PAIRS, self_collision_distance, self_collision_distance_batch)
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics
+from kinova_gen3.kinematics.link_frames import link_frames, link_frames_batch
+
+
+class TestSelfCollision(unittest.TestCase):
+    '''Unit test class for the self-collision distance
+
+    Methods
+    -------
+    test_link_frames()
+        Compare the last link frame with the forward kinematics
+    test_segment_closest_points()
+        Compare the closest points with a dense sampling of the segments
+    test_distance()
+        Test the distance of an upright and a folded configuration
+    test_gradient()
+        Compare the gradient with central differences
+    test_batch()
+        Compare the batched distances with the single evaluation
+
+    '''
+
+    joint_pos = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+
+    def test_link_frames(self):
+        '''Test that the kinematic chain ends at the end-effector pose'''
+
+        for joint_pos in np.random.default_rng(0).uniform(-np.pi, np.pi, (5, 7)):
+            position, rotation = link_frames(joint_pos)
+            ee_position, ee_rotation = forward_kinematics(joint_pos)
+            npt.assert_allclose(position[-1], ee_position, atol=1e-15)
+            npt.assert_allclose(rotation[-1], ee_rotation, atol=1e-15)
+
+        npt.assert_allclose(position[1], [0.0, 0.0, 0.15643])
+        self.assertEqual(link_frames_batch(np.zeros((3, 7)))[1].shape, (3, 9, 3, 3))
+
+    def test_segment_closest_points(self):
+        '''Test the closest points against sampled points of the segments'''
+
+        rng = np.random.default_rng(1)
+        segments = rng.normal(size=(50, 4, 3))
+        segments[:10, 1] = segments[:10, 0] + 1e-3 * (segments[:10, 3] - segments[:10, 2])
+        segments[10:15, 3] = segments[10:15, 2]
+
+        point_a, point_b = segment_closest_points(*np.moveaxis(segments, 1, 0))
+        distance = np.linalg.norm(point_a - point_b, axis=-1)
+
+        fraction = np.linspace(0.0, 1.0, 201)[:, None]
+        for i, (start_a, end_a, start_b, end_b) in enumerate(segments):
+            sample_a = start_a + fraction * (end_a - start_a)
+            sample_b = start_b + fraction * (end_b - start_b)
+            sampled = np.linalg.norm(sample_a[:, None] - sample_b[None], axis=-1).min()
+            self.assertLessEqual(distance[i], sampled + 1e-12)
+            self.assertGreater(distance[i], sampled - 1e-2)
+
+    def test_distance(self):
+        '''Test that the upright arm is free and the folded arm collides'''
+
+        distance, _, pair_distance = self_collision_distance(np.zeros(7))
+        self.assertGreater(distance, 0.0)
+        self.assertEqual(pair_distance.shape, (len(CAPSULE_PAIRS),))
+        self.assertEqual(distance, pair_distance.min())
+
+        folded = np.array([0.0, 0.0, 0.0, 2.58, 0.0, 2.1, 0.0])
+        self.assertLess(self_collision_distance(folded)[0], 0.0)
+
+    def test_gradient(self):
+        '''Test the gradient against central differences'''
+
+        step = 1e-6
+        finite_difference = [
+            (self_collision_distance(self.joint_pos + d)[0]
+             - self_collision_distance(self.joint_pos - d)[0]) / (2 * step)
+            for d in step * np.eye(7)]
+
+        npt.assert_allclose(self_collision_distance(self.joint_pos)[1], finite_difference,
+                            atol=1e-8)
+
+    def test_batch(self):
+        '''Test the batched distances against the single evaluation'''
+
+        joint_pos = np.random.default_rng(2).uniform(-np.pi, np.pi, (5, 7))
+        distance, gradient, pair_distance = self_collision_distance_batch(joint_pos)
+
+        for i, q in enumerate(joint_pos):
+            single = self_collision_distance(q)
+            self.assertAlmostEqual(distance[i], single[0], places=14)
+            npt.assert_allclose(gradient[i], single[1], atol=1e-14)
+            npt.assert_allclose(pair_distance[i], single[2], atol=1e-14)
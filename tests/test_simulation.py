@@ -0,0 +1,77 @@
+'''Test the batched simulation of Kinova Gen3
+
+Classes
+-------
+TestSimulation
+
+Functions
+---------
+test_forward_dynamics_batch()
+test_gravity_compensation()
+test_integrators()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.mass_matrix import mass_matrix
+from kinova_gen3.dynamics.coriolis import coriolis
+from kinova_gen3.dynamics.gravity import gravity, gravity_batch
+from kinova_gen3.dynamics.simulation import Simulator, forward_dynamics_batch
+
+
+class TestSimulation(unittest.TestCase):
+    '''Unit test class for the batched simulation
+
+    Methods
+    -------
+    test_forward_dynamics_batch()
+        Test the batched joint accelerations
+    test_gravity_compensation()
+        Test that gravity-compensated robots stay at rest
+    test_integrators()
+        Test the agreement of the integrators and the recording
+
+    '''
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.joint_pos = rng.uniform(-1.0, 1.0, (5, 7))
+        self.joint_vel = rng.uniform(-0.5, 0.5, (5, 7))
+        self.joint_torque = rng.uniform(-0.01, 0.01, (5, 7))
+
+    def test_forward_dynamics_batch(self):
+        '''Test the batched forward dynamics against the single-configuration terms'''
+
+        acceleration = forward_dynamics_batch(self.joint_pos, self.joint_vel, self.joint_torque)
+
+        for i in range(5):
+            q, qp, tau = self.joint_pos[i], self.joint_vel[i], self.joint_torque[i]
+            npt.assert_allclose(mass_matrix(q) @ acceleration[i],
+                                tau - coriolis(q, qp) - gravity(q), atol=1e-12)
+
+    def test_gravity_compensation(self):
+        '''Test that robots at rest stay at rest under gravity compensation'''
+
+        simulator = Simulator(self.joint_pos, method='rk4')
+        simulator.run(0.005, controller=lambda t, q, qp: gravity_batch(q))
+
+        npt.assert_allclose(simulator.joint_position, self.joint_pos, atol=1e-12)
+        npt.assert_allclose(simulator.joint_velocity, 0.0, atol=1e-10)
+
+    def test_integrators(self):
+        '''Test that both integrators agree and the recording is decimated'''
+
+        euler = Simulator(self.joint_pos, self.joint_vel, time_step=2e-4)
+        rk4 = Simulator(self.joint_pos, self.joint_vel, time_step=1e-3, method='rk4')
+
+        euler.run(0.01, joint_torque=self.joint_torque)
+        times, positions, velocities = rk4.run(0.01, joint_torque=self.joint_torque,
+                                               record_every=2)
+
+        npt.assert_allclose(euler.joint_position, rk4.joint_position, atol=1e-4)
+        npt.assert_allclose(times, [0.0, 0.002, 0.004, 0.006, 0.008, 0.01])
+        self.assertEqual(positions.shape, (6, 5, 7))
+        npt.assert_array_equal(positions[0], self.joint_pos)
+        npt.assert_array_equal(velocities[-1], rk4.joint_velocity)
@@ -0,0 +1,135 @@
+'''Test the streaming of Cartesian trajectories of Kinova Gen3
+
+Classes
+-------
+TestStreaming
+
+Functions
+---------
+test_slerp()
+test_interpolation()
+test_hold()
+test_lazy()
+test_tracking()
+
+'''
+
+import itertools
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics
+from kinova_gen3.planning.streaming import (slerp, interpolate_poses,
+                                            stream_joint_commands)
+
+
+class TestStreaming(unittest.TestCase):
+    '''Unit test class for the streaming pipeline
+
+    Methods
+    -------
+    test_slerp()
+        Test the endpoints, norm and constant speed of the interpolation
+    test_interpolation()
+        Test the timing and the endpoints of the interpolated poses
+    test_hold()
+        Test that waypoints without motion hold the pose for one sample
+    test_lazy()
+        Test that an endless stream of waypoints is consumed lazily
+    test_tracking()
+        Test that the joint commands follow the interpolated poses
+
+    '''
+
+    start_pos = np.array([0.0, 0.4, 0.0, 1.5, 0.0, 0.9, 0.0])
+    joint_pos = start_pos + np.array([[0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                                      [0.3, 0.2, -0.2, -0.3, 0.2, 0.3, 0.4],
+                                      [-0.2, 0.4, 0.1, 0.1, -0.3, -0.2, -0.4]])
+
+    def _waypoints(self):
+        '''End-effector poses of the joint configurations'''
+
+        return [(pose[:3], pose[3:]) for pose in
+                (forward_kinematics(q, output='pose') for q in self.joint_pos)]
+
+    def test_slerp(self):
+        '''Test the interpolation between two orientations'''
+
+        start = np.array([0.0, 0.0, 0.0, 1.0])
+        end = np.array([0.0, 0.0, np.sin(0.6), np.cos(0.6)])
+
+        npt.assert_allclose(slerp(start, end, 0.0), start, atol=1e-15)
+        npt.assert_allclose(slerp(start, end, 1.0), end, atol=1e-15)
+        npt.assert_allclose(slerp(start, end, 0.25),
+                            [0.0, 0.0, np.sin(0.15), np.cos(0.15)])
+        # Opposite signs describe the same rotation
+        npt.assert_allclose(slerp(start, -end, 0.25), slerp(start, end, 0.25))
+        self.assertAlmostEqual(np.linalg.norm(slerp(start, start, 0.5)), 1.0)
+
+    def test_interpolation(self):
+        '''Test the number of samples, their speed and the final pose'''
+
+        waypoints = self._waypoints()
+        rate, linear_speed, angular_speed = 100.0, 0.1, 0.5
+        poses = list(interpolate_poses(waypoints, rate, linear_speed,
+                                       angular_speed))
+
+        positions = np.array([pose[0] for pose in poses])
+        quaternions = np.array([pose[1] for pose in poses])
+        twists = np.array([pose[2] for pose in poses])
+
+        npt.assert_allclose(np.linalg.norm(quaternions, axis=-1), 1.0)
+        npt.assert_allclose(positions[-1], waypoints[-1][0])
+        npt.assert_allclose(np.abs(quaternions[-1] @ waypoints[-1][1]), 1.0)
+        self.assertTrue(np.all(np.linalg.norm(twists[:, :3], axis=-1)
+                               <= linear_speed + 1e-12))
+        self.assertTrue(np.all(np.linalg.norm(twists[:, 3:], axis=-1)
+                               <= angular_speed + 1e-12))
+
+        # The samples are one period apart along every segment
+        steps = np.linalg.norm(np.diff(positions[:-1], axis=0), axis=-1)
+        self.assertTrue(np.all(steps <= linear_speed / rate + 1e-12))
+
+    def test_hold(self):
+        '''Test a single waypoint and identical waypoints'''
+
+        position, quaternion = self._waypoints()[1]
+
+        for count in [1, 3]:
+            poses = list(interpolate_poses([(position, quaternion)] * count, 100.0))
+
+            self.assertEqual(len(poses), 1)
+            npt.assert_array_equal(poses[0][0], position)
+            npt.assert_array_equal(poses[0][1], quaternion)
+            npt.assert_array_equal(poses[0][2], np.zeros(6))
+        self.assertEqual(list(interpolate_poses([], 100.0)), [])
+
+    def test_lazy(self):
+        '''Test the interpolation of an endless stream of waypoints'''
+
+        quaternion = np.array([0.0, 0.0, 0.0, 1.0])
+        waypoints = (([0.4 + 0.01 * (k % 2), 0.0, 0.4], quaternion)
+                     for k in itertools.count())
+        poses = list(itertools.islice(interpolate_poses(waypoints, 100.0), 50))
+
+        self.assertEqual(len(poses), 50)
+
+    def test_tracking(self):
+        '''Test the tracking error and the reuse of the command buffers'''
+
+        waypoints = self._waypoints()
+        poses = list(interpolate_poses(waypoints, 100.0))
+        commands = stream_joint_commands(self.start_pos, iter(poses), 100.0)
+
+        buffers = None
+        for (position, quaternion, _), (joint_pos, joint_vel) in zip(poses,
+                                                                     commands):
+            if buffers is None:
+                buffers = joint_pos, joint_vel
+            self.assertIs(joint_pos, buffers[0])
+            self.assertIs(joint_vel, buffers[1])
+
+            actual = forward_kinematics(joint_pos, output='pose')
+            self.assertLess(np.linalg.norm(actual[:3] - position), 5e-3)
+            self.assertGreater(np.abs(actual[3:] @ quaternion),
+                               np.cos(5e-3))
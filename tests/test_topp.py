@@ -0,0 +1,90 @@
+'''Test the time-optimal path parameterization
+
+Classes
+-------
+TestTopp
+
+Functions
+---------
+test_torque_limits()
+test_velocity_limits()
+test_moving_end()
+test_infeasible()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.terms import dynamics_terms_batch
+from kinova_gen3.planning.topp import time_optimal_parameterization
+
+
+class TestTopp(unittest.TestCase):
+    '''Unit test class for the time-optimal path parameterization
+
+    Methods
+    -------
+    test_torque_limits()
+        Test that the retimed path saturates but respects the torque limits
+    test_velocity_limits()
+        Test that the velocity limits are respected
+    test_moving_end()
+        Test the last sample of a path whose tangent does not vanish there
+    test_infeasible()
+        Test that an infeasible path is rejected
+
+    '''
+
+    def setUp(self):
+        start = np.array([0.1, 0.4, -0.3, 1.2, 0.5, -0.7, 0.2])
+        end = start + np.array([0.5, -0.3, 0.4, 0.2, -0.6, 0.3, 0.8])
+        s = np.linspace(0.0, 1.0, 100)
+        self.path = start + (end - start) * (3 * s**2 - 2 * s**3)[:, None]
+        self.torque_limit = np.array([39.0, 39.0, 39.0, 39.0, 9.0, 9.0, 9.0])
+
+    def test_torque_limits(self):
+        '''Test the torques along the retimed path'''
+
+        time, joint_vel, joint_acc = time_optimal_parameterization(self.path, self.torque_limit)
+
+        mass, coriolis_term, gravity_term = dynamics_terms_batch(self.path, joint_vel)
+        torque = np.einsum('kij,kj->ki', mass, joint_acc) + coriolis_term + gravity_term
+        usage = np.max(np.abs(torque) / self.torque_limit, axis=1)
+
+        self.assertTrue(np.all(np.diff(time) > 0))
+        npt.assert_allclose(joint_vel[[0, -1]], 0.0, atol=1e-12)
+        self.assertLess(usage.max(), 1.0 + 1e-6)
+        # Time optimality: a torque limit is active almost everywhere
+        self.assertGreater(np.mean(usage > 0.99), 0.9)
+
+    def test_velocity_limits(self):
+        '''Test the joint velocities under velocity limits'''
+
+        time, joint_vel, _ = time_optimal_parameterization(self.path, self.torque_limit,
+                                                           velocity_limit=0.5)
+
+        self.assertLess(np.abs(joint_vel).max(), 0.5 + 1e-9)
+        self.assertGreater(np.abs(joint_vel).max(), 0.5 - 1e-3)
+        self.assertGreater(time[-1],
+                           time_optimal_parameterization(self.path, self.torque_limit)[0][-1])
+
+    def test_moving_end(self):
+        '''Test the torque limits at the end of a curved path'''
+
+        rng = np.random.default_rng(0)
+        start, direction, bump = rng.uniform(-1.0, 1.0, (3, 7))
+        s = np.linspace(0.0, 1.0, 50)[:, None]
+        path = start + direction * s + 0.3 * bump * np.sin(np.pi * s)
+
+        _, joint_vel, joint_acc = time_optimal_parameterization(path, self.torque_limit)
+
+        mass, coriolis_term, gravity_term = dynamics_terms_batch(path, joint_vel)
+        torque = np.einsum('kij,kj->ki', mass, joint_acc) + coriolis_term + gravity_term
+        self.assertLess(np.max(np.abs(torque) / self.torque_limit), 1.0 + 1e-6)
+
+    def test_infeasible(self):
+        '''Test that a path requiring more torque than available is rejected'''
+
+        with self.assertRaises(ValueError):
+            time_optimal_parameterization(self.path, 1.0)
@@ -0,0 +1,105 @@
+'''Test the workspace map of Kinova Gen3
+
+Classes
+-------
+TestWorkspaceMap
+
+Functions
+---------
+test_samples()
+test_query()
+test_reopen()
+
+'''
+
+import os
+import tempfile
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.kinematics.forward_kinematics import forward_kinematics_batch
+from kinova_gen3.performance_criteria.joint_limits import (
+    JOINT_POSITION_MIN,
+    JOINT_POSITION_MAX,
+    joint_limits_batch,
+)
+from kinova_gen3.performance_criteria.manipulability import manipulability_batch
+from kinova_gen3.planning.workspace import WorkspaceMap
+
+
+class TestWorkspaceMap(unittest.TestCase):
+    '''Unit test class for the workspace map
+
+    Methods
+    -------
+    test_samples()
+        Test that every sample is counted once
+    test_query()
+        Test the records against the best scores of the samples
+    test_reopen()
+        Test that a map opened from disk gives the same records
+
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'workspace.npy')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_samples(self):
+        '''Test that the whole workspace lies inside the grid'''
+
+        workspace = WorkspaceMap.build(self.path, samples=20000, voxel_size=0.1,
+                                       chunk_size=3000, seed=0)
+
+        self.assertEqual(workspace.grid.shape, (19, 19, 19))
+        self.assertEqual(workspace.grid['count'].sum(), 20000)
+
+        reached = workspace.grid['count'] > 0
+        self.assertTrue(np.all(np.isfinite(workspace.grid['joint_limits'][reached])))
+        self.assertTrue(np.all(workspace.grid['manipulability'][~reached] == -np.inf))
+
+    def test_query(self):
+        '''Test that a voxel records the best scores of the samples in it'''
+
+        workspace = WorkspaceMap.build(self.path, samples=2000, voxel_size=0.1,
+                                       chunk_size=2000, seed=1)
+
+        # A single chunk draws the same samples as the generator seeded alike
+        joint_pos = np.random.default_rng(1).uniform(JOINT_POSITION_MIN, JOINT_POSITION_MAX,
+                                                     (2000, 7))
+        position, _ = forward_kinematics_batch(joint_pos)
+        records = workspace.query(position)
+        self.assertEqual(records.shape, (2000,))
+        self.assertTrue(np.all(workspace.reachable(position)))
+
+        record = workspace.query(position[0])
+        self.assertEqual(record.shape, ())
+        self.assertEqual(record, records[0])
+
+        for field, score in (('manipulability', manipulability_batch(joint_pos)),
+                             ('joint_limits', joint_limits_batch(joint_pos))):
+            score = score.astype(np.float32)
+            self.assertTrue(np.all(records[field] >= score))
+            index, _ = workspace.voxel_index(position)
+            flat = np.ravel_multi_index(tuple(index.T), workspace.grid.shape)
+            best = np.full(workspace.grid.size, -np.inf, dtype=np.float32)
+            np.maximum.at(best, flat, score)
+            npt.assert_array_equal(workspace.grid[field].ravel(), best)
+
+        # Positions outside the grid or beyond the reach are never reached
+        outside = workspace.query([[0.0, 0.0, 3.0], [-2.0, 0.0, 0.0]])
+        npt.assert_array_equal(outside['count'], 0)
+        npt.assert_array_equal(outside['manipulability'], -np.inf)
+        self.assertFalse(workspace.reachable([0.0, 0.0, -0.6]))
+
+    def test_reopen(self):
+        '''Test that the map reopened from the file matches the built one'''
+
+        built = WorkspaceMap.build(self.path, samples=5000, voxel_size=0.2, seed=2)
+        reopened = WorkspaceMap(self.path)
+
+        npt.assert_array_equal(reopened.voxel_size, built.voxel_size)
+        npt.assert_array_equal(reopened.grid, built.grid)
@@ -0,0 +1,84 @@
+'''Test the external wrench estimation of Kinova Gen3
+
+Classes
+-------
+TestWrenchEstimation
+
+Functions
+---------
+test_external_wrench_batch()
+test_singular()
+test_damping()
+
+'''
+
+import numpy as np
+import numpy.testing as npt
+import unittest
+from kinova_gen3.dynamics.mass_matrix import mass_matrix
+from kinova_gen3.dynamics.coriolis import coriolis
+from kinova_gen3.dynamics.gravity import gravity
+from kinova_gen3.dynamics.wrench_estimation import external_wrench_batch, wrench_from_torques_batch
+from kinova_gen3.kinematics.jacobian import jacobian
+
+
+class TestWrenchEstimation(unittest.TestCase):
+    '''Unit test class for the external wrench estimation
+
+    Methods
+    -------
+    test_external_wrench_batch()
+        Test the recovery of known wrenches
+    test_singular()
+        Test a batch with a sample at the zero configuration
+    test_damping()
+        Test the damped estimate at a singular configuration
+
+    '''
+
+    def test_external_wrench_batch(self):
+        '''Test the recovery of known wrenches from joint torques'''
+
+        rng = np.random.default_rng(4)
+        joint_pos = rng.uniform(-1.0, 1.0, (6, 7))
+        joint_vel = rng.uniform(-0.5, 0.5, (6, 7))
+        joint_acc = rng.uniform(-1.0, 1.0, (6, 7))
+        wrench = rng.normal(size=(6, 6))
+
+        joint_torque = np.array([mass_matrix(q) @ qdd + coriolis(q, qp) + gravity(q)
+                                 + jacobian(q).T @ f
+                                 for q, qp, qdd, f in zip(joint_pos, joint_vel, joint_acc, wrench)])
+
+        npt.assert_allclose(external_wrench_batch(joint_pos, joint_vel, joint_acc, joint_torque),
+                            wrench, atol=1e-8)
+
+        # Quasi-static motion without the inertial term
+        joint_torque -= np.array([mass_matrix(q) @ qdd for q, qdd in zip(joint_pos, joint_acc)])
+        npt.assert_allclose(external_wrench_batch(joint_pos, joint_vel, None, joint_torque),
+                            wrench, atol=1e-8)
+
+    def test_singular(self):
+        '''Test that a singular sample leaves the rest of the batch exact'''
+
+        rng = np.random.default_rng(5)
+        joint_pos = rng.uniform(-1.0, 1.0, (4, 7))
+        joint_pos[2] = 0.0
+        wrench = rng.normal(size=(4, 6))
+        # At the zero configuration only the part of the wrench in the row
+        # space of the Jacobian transpose is observable
+        wrench[2] = np.linalg.pinv(jacobian(joint_pos[2]).T) @ jacobian(joint_pos[2]).T @ wrench[2]
+        external_torque = np.array([jacobian(q).T @ f for q, f in zip(joint_pos, wrench)])
+
+        npt.assert_allclose(wrench_from_torques_batch(joint_pos, external_torque), wrench,
+                            atol=1e-8)
+
+    def test_damping(self):
+        '''Test that damping bounds the estimate at a singularity'''
+
+        joint_pos = np.zeros((1, 7))
+        external_torque = np.full((1, 7), 1e-3)
+
+        wrench = wrench_from_torques_batch(joint_pos, external_torque, damping=0.05)
+
+        self.assertTrue(np.all(np.isfinite(wrench)))
+        self.assertLess(np.abs(wrench).max(), 1.0)
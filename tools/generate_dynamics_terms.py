@@ -0,0 +1,225 @@
+"""Generate the fused evaluation of the dynamic terms from the separate ones
+
+The body of ``_dynamics_terms`` in kinova_gen3/dynamics/terms.py is derived
+from the bodies of ``mass_matrix``, ``coriolis`` and ``gravity`` in the
+modules of the same names:
+
+1. the statements of the three functions are concatenated, the temporaries
+   renamed so that they do not clash,
+2. a temporary whose expression was already computed, up to the order of the
+   operands of a sum or product, is replaced by the earlier one, so the
+   sines, cosines and common subexpressions are computed once,
+3. the entries of the assembled arrays are written into the output arrays
+   instead, indexed as ``array[..., i, j]`` so that the same code fills a
+   single set of terms or a batch of them.
+
+Reordering the two operands of a single sum or product does not change its
+floating-point result, so the fused terms equal the separate ones exactly.
+Everything outside the body of the function is left as it is. The result is
+formatted with black, as the rest of the package.
+
+Run from the root of the repository with
+
+    python tools/generate_dynamics_terms.py
+
+Functions
+---------
+fused_body(sources)
+generate(sources, terms_path)
+
+"""
+
+import ast
+import collections
+import pathlib
+import re
+import black
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+DYNAMICS = ROOT / "kinova_gen3" / "dynamics"
+# Source module, generated function and the output array it assembles
+SOURCES = [
+    (DYNAMICS / "mass_matrix.py", "mass_matrix", "mass"),
+    (DYNAMICS / "coriolis.py", "coriolis", "coriolis_term"),
+    (DYNAMICS / "gravity.py", "gravity", "gravity_term"),
+]
+TERMS_PATH = DYNAMICS / "terms.py"
+
+_COMMUTATIVE = (ast.Add, ast.Mult)
+
+
+def _function(tree, name):
+    return next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name == name
+    )
+
+
+def _key(node):
+    """Hashable form of an expression, up to commutation of binary operands"""
+
+    if isinstance(node, ast.BinOp):
+        operands = (_key(node.left), _key(node.right))
+        if isinstance(node.op, _COMMUTATIVE):
+            operands = tuple(sorted(operands, key=repr))
+        return (type(node.op).__name__,) + operands
+    if isinstance(node, ast.UnaryOp):
+        return (type(node.op).__name__, _key(node.operand))
+    if isinstance(node, ast.Call):
+        return ("Call", ast.dump(node.func)) + tuple(_key(arg) for arg in node.args)
+    if isinstance(node, ast.Name):
+        return ("Name", node.id)
+    if isinstance(node, ast.Constant):
+        return ("Constant", repr(node.value))
+
+    return ast.dump(node)
+
+
+class _Renamer(ast.NodeTransformer):
+    """Replace the names of a function by their names in the fused one"""
+
+    def __init__(self, names):
+        self.names = names
+
+    def visit_Name(self, node):
+        if node.id in self.names:
+            return ast.Name(id=self.names[node.id], ctx=node.ctx)
+        return node
+
+
+def _entries(assembly):
+    """Entries of a numpy.array assembly with their indices, in row-major order"""
+
+    flatten = isinstance(assembly.func, ast.Attribute) and (
+        assembly.func.attr == "flatten"
+    )
+    if flatten:
+        assembly = assembly.func.value
+    rows = assembly.args[0].elts
+
+    for i, row in enumerate(rows):
+        if isinstance(row, ast.List):
+            for j, entry in enumerate(row.elts):
+                yield ((i * len(row.elts) + j,) if flatten else (i, j)), entry
+        else:
+            yield (i,), row
+
+
+class _Fusion:
+    """Statements of the fused function, with every expression computed once"""
+
+    def __init__(self):
+        self.body = []
+        self.temporaries = {}
+        self.defined = set()
+        self.count = 0
+
+    def intern(self, value, identifier=None):
+        """Name of a temporary holding an expression, assigned if new"""
+
+        if isinstance(value, ast.Name):
+            return value.id
+        key = _key(value)
+        if key not in self.temporaries:
+            if identifier is None or re.fullmatch(r"x\d+", identifier):
+                identifier = "x{}".format(self.count)
+                self.count += 1
+            if identifier in self.defined:
+                raise ValueError("{} is defined twice".format(identifier))
+            self.defined.add(identifier)
+            self.body.append(
+                ast.Assign(
+                    targets=[ast.Name(id=identifier, ctx=ast.Store())], value=value
+                )
+            )
+            self.temporaries[key] = identifier
+
+        return self.temporaries[key]
+
+    def write(self, array, index, value):
+        """Write an entry into an output array"""
+
+        indices = [ast.Constant(value=Ellipsis)] + [ast.Constant(value=i) for i in index]
+        target = ast.Subscript(
+            value=ast.Name(id=array, ctx=ast.Load()),
+            slice=ast.Tuple(elts=indices, ctx=ast.Load()),
+            ctx=ast.Store(),
+        )
+        self.body.append(ast.Assign(targets=[target], value=value))
+
+
+def fused_body(sources):
+    """Statements of the fused dynamic terms, from the separate functions
+
+    Arguments
+    ---------
+    sources (list): The (source, function name, output name) triples of the
+                    separate functions, in the order they are fused
+
+    Returns
+    -------
+    str: The body of _dynamics_terms after its docstring, unformatted
+
+    """
+
+    fusion = _Fusion()
+    outputs = []
+
+    for source, name, output in sources:
+        names = {}
+        renamer = _Renamer(names)
+        for statement in _function(ast.parse(source), name).body[1:]:
+            if isinstance(statement, ast.Return):
+                continue
+            identifier = statement.targets[0].id
+            value = renamer.visit(statement.value)
+            if identifier == output:
+                outputs.append((output, list(_entries(value))))
+            else:
+                names[identifier] = fusion.intern(value, identifier)
+
+    # Entries appearing more than once, e.g. by symmetry, are computed once
+    counts = collections.Counter(
+        _key(entry) for _, entries in outputs for _, entry in entries
+    )
+    for output, entries in outputs:
+        for index, entry in entries:
+            if counts[_key(entry)] > 1 or _key(entry) in fusion.temporaries:
+                entry = ast.Name(id=fusion.intern(entry), ctx=ast.Load())
+            fusion.write(output, index, entry)
+
+    statements = (ast.fix_missing_locations(statement) for statement in fusion.body)
+
+    return "\n".join("    " + ast.unparse(statement) for statement in statements) + "\n"
+
+
+def generate(sources=SOURCES, terms_path=TERMS_PATH):
+    """Rewrite the body of _dynamics_terms from the separate functions
+
+    Arguments
+    ---------
+    sources (list): The (path, function name, output name) triples of the
+                    separate functions
+    terms_path (path): The module of the fused terms, rewritten
+
+    """
+
+    terms_source = pathlib.Path(terms_path).read_text()
+    lines = terms_source.splitlines(keepends=True)
+    function = _function(ast.parse(terms_source), "_dynamics_terms")
+
+    body = fused_body(
+        [(pathlib.Path(path).read_text(), name, output) for path, name, output in sources]
+    )
+    source = "".join(
+        lines[: function.body[1].lineno - 1] + [body] + lines[function.end_lineno :]
+    )
+
+    pathlib.Path(terms_path).write_text(
+        black.format_str(source, mode=black.Mode(line_length=88))
+    )
+
+
+if __name__ == "__main__":
+    generate()
@@ -0,0 +1,137 @@
+"""Generate the packed mass matrix expressions from the full ones
+
+The body of ``mass_matrix_packed`` in kinova_gen3/dynamics/mass_matrix_packed.py
+is derived from the body of ``mass_matrix`` in kinova_gen3/dynamics/mass_matrix.py:
+
+1. the upper-triangle entries of the assembled matrix are kept in row-major
+   order and the lower-triangle ones are dropped,
+2. the temporaries that none of the kept entries depends on, directly or
+   through other temporaries, are removed,
+3. the remaining statements are copied verbatim, with the comments and blank
+   lines between them, and the packed array is assembled from the kept
+   entries.
+
+Everything outside the body of the function, i.e. the module docstring, the
+constants and the other functions, is left as it is. The result is formatted
+with black, as the rest of the package.
+
+Run from the root of the repository with
+
+    python tools/generate_mass_matrix_packed.py
+
+Functions
+---------
+packed_body(source)
+generate(full_path, packed_path)
+
+"""
+
+import ast
+import pathlib
+import black
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+FULL_PATH = ROOT / "kinova_gen3" / "dynamics" / "mass_matrix.py"
+PACKED_PATH = ROOT / "kinova_gen3" / "dynamics" / "mass_matrix_packed.py"
+
+
+def _function(tree, name):
+    return next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name == name
+    )
+
+
+def _names(node):
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+def _body_start(function):
+    """Line number of the first statement after the docstring"""
+
+    return function.body[1].lineno
+
+
+def packed_body(source):
+    """Statements of the packed mass matrix, from the source of the full one
+
+    Arguments
+    ---------
+    source (str): The source of kinova_gen3/dynamics/mass_matrix.py
+
+    Returns
+    -------
+    str: The body of mass_matrix_packed after its docstring, unformatted
+
+    """
+
+    lines = source.splitlines()
+    function = _function(ast.parse(source), "mass_matrix")
+    statements = function.body[1:]
+    assembly = next(
+        statement
+        for statement in statements
+        if isinstance(statement, ast.Assign) and statement.targets[0].id == "mass"
+    )
+
+    # Upper-triangle entries in row-major order
+    rows = assembly.value.args[0].elts
+    entries = [row.elts[j] for i, row in enumerate(rows) for j in range(i, 7)]
+
+    # Temporaries the kept entries depend on, in a backward pass
+    needed = set().union(*(_names(entry) for entry in entries))
+    assignments = [
+        statement
+        for statement in statements[: statements.index(assembly)]
+        if isinstance(statement, ast.Assign)
+    ]
+    for statement in reversed(assignments):
+        if statement.targets[0].id in needed:
+            needed |= _names(statement.value)
+
+    # Copy the kept statements with the comments and blank lines around them
+    removed = set()
+    for statement in assignments:
+        if statement.targets[0].id not in needed:
+            removed.update(range(statement.lineno, statement.end_lineno + 1))
+    kept = [
+        lines[number - 1]
+        for number in range(_body_start(function), assembly.lineno)
+        if number not in removed
+    ]
+
+    packed = ",\n".join(ast.get_source_segment(source, entry) for entry in entries)
+    kept.append("    mass_packed = numpy.array([{}])".format(packed))
+    kept.append("")
+    kept.append("    return mass_packed")
+
+    return "\n".join(kept) + "\n"
+
+
+def generate(full_path=FULL_PATH, packed_path=PACKED_PATH):
+    """Rewrite the body of mass_matrix_packed from mass_matrix
+
+    Arguments
+    ---------
+    full_path (path): The module of the full mass matrix
+    packed_path (path): The module of the packed mass matrix, rewritten
+
+    """
+
+    packed_source = pathlib.Path(packed_path).read_text()
+    lines = packed_source.splitlines(keepends=True)
+    function = _function(ast.parse(packed_source), "mass_matrix_packed")
+
+    body = packed_body(pathlib.Path(full_path).read_text())
+    source = "".join(
+        lines[: _body_start(function) - 1] + [body] + lines[function.end_lineno :]
+    )
+
+    pathlib.Path(packed_path).write_text(
+        black.format_str(source, mode=black.Mode(line_length=88))
+    )
+
+
+if __name__ == "__main__":
+    generate()